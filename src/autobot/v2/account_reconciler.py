@@ -0,0 +1,184 @@
+"""Coalesced post-fill account reconciliation.
+
+Every fill used to make its signal handler await ``get_balance()`` and then
+``get_trade_balance("EUR")`` before returning, so a burst of fills across
+instances issued two private REST calls per fill and held each handler on the
+fill path until both answered.
+
+:class:`AccountReconciler` is shared by the handlers of one order executor.  A
+fill only posts a hint; hints are debounced, and one balance / trade-balance
+fetch per window serves every pending drift check.  ``debounce_s`` is the quiet
+period that closes a window and ``max_delay_s`` bounds how long a hint can wait
+while fills keep arriving.  The checks themselves, and therefore the kill
+switch decisions, stay with the handlers; a handler that needs its check now
+(an anomalous fill) posts its hint and calls :meth:`AccountReconciler.flush`.
+A failed fetch re-queues every check and retries after ``retry_s``.
+:meth:`AccountReconciler.close` flushes what is still pending before it
+stops, so a shutdown right after a fill still runs that fill's check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """Exchange balances fetched once for a reconciliation window."""
+
+    balance: Dict[str, Any] = field(default_factory=dict)
+    trade_balance: Optional[Dict[str, Any]] = None
+    fetched_at: float = 0.0
+
+
+ReconcileCheck = Callable[[AccountSnapshot], Awaitable[None]]
+
+
+async def fetch_account_snapshot(order_executor: Any) -> AccountSnapshot:
+    balance = await order_executor.get_balance()
+    trade_balance = await order_executor.get_trade_balance("EUR")
+    return AccountSnapshot(
+        balance=balance if isinstance(balance, dict) else {},
+        trade_balance=trade_balance if isinstance(trade_balance, dict) else None,
+        fetched_at=time.time(),
+    )
+
+
+class AccountReconciler:
+    """Debounce fill hints into one account fetch and run every pending check on it."""
+
+    def __init__(
+        self,
+        order_executor: Any,
+        *,
+        debounce_s: float = 0.25,
+        max_delay_s: float = 2.0,
+        retry_s: float = 2.0,
+    ) -> None:
+        self.order_executor = order_executor
+        self.debounce_s = max(0.0, float(debounce_s))
+        self.max_delay_s = max(self.debounce_s, float(max_delay_s))
+        self.retry_s = max(0.1, float(retry_s))
+        # Keyed by id(owner); the owner is kept so its id cannot be reused while pending.
+        self._pending: Dict[int, Tuple[Any, ReconcileCheck]] = {}
+        self._first_hint_at: Optional[float] = None
+        self._last_hint_at = 0.0
+        self._retry_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self.fetch_count = 0
+        self.checks_run = 0
+        self.last_snapshot: Optional[AccountSnapshot] = None
+        self.last_error: Optional[str] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def post_fill(self, owner: Any, check: ReconcileCheck) -> None:
+        """Queue ``check`` for the next window; repeated hints of one owner coalesce."""
+        now = time.monotonic()
+        self._pending[id(owner)] = (owner, check)
+        if self._first_hint_at is None:
+            self._first_hint_at = now
+        self._last_hint_at = now
+        self._ensure_task()
+
+    async def flush(self) -> Optional[AccountSnapshot]:
+        """Fetch the account now and run every pending check against that snapshot."""
+        pending, self._pending = self._pending, {}
+        self._first_hint_at = None
+        if not pending:
+            return None
+        try:
+            snapshot = await fetch_account_snapshot(self.order_executor)
+        except asyncio.CancelledError:
+            self._requeue(pending)
+            raise
+        except Exception as exc:
+            logger.exception(
+                "❌ Réconciliation compte: lecture des soldes impossible, %d contrôles remis en file",
+                len(pending),
+            )
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            self._requeue(pending)
+            return None
+        self.fetch_count += 1
+        self.last_snapshot = snapshot
+        self.last_error = None
+        for _owner, check in pending.values():
+            try:
+                await check(snapshot)
+            except Exception:
+                logger.exception("❌ Réconciliation compte: contrôle en échec")
+            self.checks_run += 1
+        return snapshot
+
+    async def close(self, timeout_s: float = 5.0) -> None:
+        """Stop the background task, then run one final flush of pending checks."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._pending:
+            try:
+                await asyncio.wait_for(self.flush(), timeout_s)
+            except asyncio.TimeoutError:
+                self.last_error = "TimeoutError: final flush"
+        if self._pending:
+            logger.warning(
+                "⚠️ Réconciliation compte: %d contrôles abandonnés à l'arrêt (%s)",
+                len(self._pending), self.last_error,
+            )
+        self._pending.clear()
+        self._first_hint_at = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "debounce_s": self.debounce_s,
+            "max_delay_s": self.max_delay_s,
+            "pending": len(self._pending),
+            "fetch_count": self.fetch_count,
+            "checks_run": self.checks_run,
+            "last_fetched_at": self.last_snapshot.fetched_at if self.last_snapshot else None,
+            "last_error": self.last_error,
+        }
+
+    def _ensure_task(self) -> None:
+        if self._closed:
+            return
+        task = self._task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._task = asyncio.create_task(self._run(), name="account-reconciler")
+
+    def _requeue(self, pending: Dict[int, Tuple[Any, ReconcileCheck]]) -> None:
+        # Hints posted during the failed fetch carry the newer check.
+        for key, entry in pending.items():
+            self._pending.setdefault(key, entry)
+        now = time.monotonic()
+        if self._first_hint_at is None:
+            self._first_hint_at = now
+        self._retry_at = now + self.retry_s
+        self._ensure_task()
+
+    async def _run(self) -> None:
+        while self._pending:
+            first = self._first_hint_at if self._first_hint_at is not None else time.monotonic()
+            deadline = min(self._last_hint_at + self.debounce_s, first + self.max_delay_s)
+            deadline = max(deadline, self._retry_at)
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            await self.flush()
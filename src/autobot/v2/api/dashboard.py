@@ -696,6 +696,10 @@ def _acknowledge_runtime_kill_switches(orchestrator: Any, operator_id: str) -> i
         if callable(acknowledge):
             acknowledge(operator_id)
             acknowledged += 1
+    # Shard workers have no local kill switch; their orders were halted by emergency_stop_all.
+    acknowledge_shards = getattr(orchestrator, "acknowledge_shard_orders", None)
+    if callable(acknowledge_shards) and acknowledge_shards(operator_id):
+        acknowledged += 1
     return acknowledged
 
 
@@ -2244,7 +2248,7 @@ async def get_pattern_learning(
         raise HTTPException(status_code=503, detail="Orchestrateur non disponible")
 
     try:
-        from ..pattern_learning import PatternLearningEngine
+        from ..pattern_learning import shared_pattern_learner
         from ..persistence import get_persistence
 
         status = orchestrator.get_status()
@@ -2252,9 +2256,9 @@ async def get_pattern_learning(
         persistence = getattr(orchestrator, "persistence", None) or getattr(orchestrator, "_persistence", None) or get_persistence()
         if persistence is None:
             raise HTTPException(status_code=503, detail="Persistance non disponible")
-        engine = PatternLearningEngine()
-        outcomes = await persistence.get_signal_outcomes(limit=engine.config.max_outcomes)
-        snapshot = engine.build_snapshot(outcomes)
+        learner = shared_pattern_learner(persistence)
+        await learner.catch_up(persistence)
+        snapshot = learner.snapshot()
         snapshot["mode"] = "paper" if paper_mode else "live_observe_only"
         snapshot["paper_mode"] = paper_mode
         snapshot["runtime"] = {
@@ -4422,6 +4426,39 @@ async def get_kill_switch_status(request: Request, authorized: bool = Depends(ve
     }
 
 
+@app.get("/api/hot-path/latency")
+async def get_hot_path_latency(request: Request, authorized: bool = Depends(verify_token)):
+    """Per-stage hot-path latency percentiles (stage, symbol and strategy)."""
+    orchestrator = request.app.state.orchestrator
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrateur non disponible")
+    exporter = getattr(orchestrator, "hot_path_latency_exporter", None)
+    if exporter is None:
+        raise HTTPException(status_code=404, detail="Hot-path latency export not configured")
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "latency": exporter.last_snapshot or exporter.snapshot(),
+    }
+
+
+@app.get("/api/shards")
+async def get_shard_health(request: Request, authorized: bool = Depends(verify_token)):
+    """Per-shard health of the multi-process runtime (workers, backlog, lag)."""
+    orchestrator = request.app.state.orchestrator
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrateur non disponible")
+    runtime = getattr(orchestrator, "sharded_runtime", None)
+    if runtime is None:
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "sharded_runtime": {"running": False, "workers": 0, "shards": []},
+        }
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "sharded_runtime": runtime.health(),
+    }
+
+
 @app.post("/api/kill-switch/acknowledge")
 async def acknowledge_kill_switch(
     payload: KillSwitchAcknowledgeRequest,
@@ -2,44 +2,19 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .consolidated_review import build_consolidated_profitability_review
+from .decision_journal import iter_journal_records
 
 
 def _read_journal_rows(journal_path: str, window_hours: Optional[int]) -> List[Dict[str, Any]]:
-    path = Path(journal_path)
-    if not path.exists():
-        return []
-
     cutoff = None
     now = datetime.now(timezone.utc).timestamp()
     if window_hours is not None and int(window_hours) > 0:
         cutoff = now - int(window_hours) * 3600
-
-    rows: List[Dict[str, Any]] = []
-    for raw in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        raw = raw.strip()
-        if not raw:
-            continue
-        try:
-            rec = json.loads(raw)
-        except Exception:
-            continue
-        if cutoff is not None:
-            ts = str(rec.get("timestamp") or "")
-            if ts:
-                try:
-                    d = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    if d.timestamp() < cutoff:
-                        continue
-                except Exception:
-                    pass
-        rows.append(rec)
-    return rows
+    return list(iter_journal_records(journal_path, since=cutoff))
 
 
 def _health_level(total_trades: int, net_pnl: float, guard_events: int, rejected_total: int) -> str:
@@ -0,0 +1,154 @@
+"""
+Sharded Replay Benchmark — throughput of ShardedRuntime vs worker count.
+
+Replays synthetic ticks for a set of symbols through ``ShardedRuntime`` and
+measures how many ticks per second the workers absorb.  The per-tick
+handler burns a fixed amount of CPU (an EMA ladder) to stand in for
+strategy evaluation, so throughput should scale almost linearly with the
+number of workers as long as each worker gets its own core.
+
+    python -m autobot.v2.benchmarks.sharded_replay --workers 1 2 4 --ticks 40000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+from autobot.v2.sharded_runtime import ShardedRuntime, ShardSpec
+from autobot.v2.websocket_client import TickerData
+
+logger = logging.getLogger("Benchmark")
+
+HANDLER = "autobot.v2.benchmarks.sharded_replay:build_replay_handler"
+_WORK_ENV = "SHARDED_REPLAY_WORK"
+
+
+class ReplayHandler:
+    """CPU-bound stand-in for the instances of one shard."""
+
+    def __init__(self, spec: ShardSpec, work: int) -> None:
+        self.spec = spec
+        self.work = work
+        self.ema: Dict[str, float] = {}
+        self.ticks = 0
+
+    def on_tick(self, tick: TickerData):
+        value = self.ema.get(tick.symbol, tick.price)
+        for _ in range(self.work):
+            value += 0.05 * (tick.price - value)
+        self.ema[tick.symbol] = value
+        self.ticks += 1
+        if self.ticks % 1000 == 0:
+            return [("state", {"shard_id": self.spec.shard_id, "ticks": self.ticks})]
+        return None
+
+
+def build_replay_handler(spec: ShardSpec) -> ReplayHandler:
+    return ReplayHandler(spec, int(os.getenv(_WORK_ENV, "200")))
+
+
+def _wait_until_processed(runtime: ShardedRuntime, expected: int, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        runtime.poll_events(timeout=0.02)
+        health = runtime.health()
+        if sum(s["processed"] for s in health["shards"]) >= expected:
+            return True
+    return False
+
+
+def _wait_for_heartbeat(runtime: ShardedRuntime, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        runtime.poll_events(timeout=0.02)
+        if all(s["heartbeat_age_s"] is not None for s in runtime.health()["shards"]):
+            return True
+    return False
+
+
+def run_replay(
+    workers: int,
+    *,
+    ticks: int = 20_000,
+    symbols: Optional[Sequence[str]] = None,
+    work: int = 200,
+    cores: Optional[Sequence[int]] = None,
+    timeout: float = 120.0,
+) -> Dict[str, float]:
+    """
+    Replay *ticks* synthetic ticks through *workers* shards.
+
+    Returns ``{"workers", "ticks", "seconds", "ticks_per_s"}``; the clock
+    starts after every worker has reported in and stops once every tick has
+    been processed.
+    """
+    symbols = list(symbols or [f"SYM{i}/EUR" for i in range(32)])
+    os.environ[_WORK_ENV] = str(work)
+    runtime = ShardedRuntime(
+        symbols,
+        HANDLER,
+        workers=workers,
+        cores=cores,
+        ring_size=65536,
+        heartbeat_interval=0.05,
+    )
+    runtime.start()
+    try:
+        if not _wait_for_heartbeat(runtime, timeout):
+            raise RuntimeError("shard workers did not start")
+        now = datetime.now(timezone.utc)
+        batch = [
+            TickerData(symbol=symbol, price=100.0 + i, bid=99.5 + i, ask=100.5 + i,
+                       volume_24h=1000.0, timestamp=now)
+            for i, symbol in enumerate(symbols)
+        ]
+        started = time.perf_counter()
+        sent = 0
+        while sent < ticks:
+            for tick in batch:
+                runtime.publish(tick)
+            sent += len(batch)
+            # Producer pacing: never lap the slowest shard's ring.
+            while max(s["backlog"] for s in runtime.health()["shards"]) > 32_768:
+                runtime.poll_events(timeout=0.001)
+        if not _wait_until_processed(runtime, sent, timeout):
+            raise RuntimeError("replay did not complete in time")
+        seconds = time.perf_counter() - started
+    finally:
+        runtime.stop()
+    return {
+        "workers": float(workers),
+        "ticks": float(sent),
+        "seconds": seconds,
+        "ticks_per_s": sent / seconds,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--ticks", type=int, default=40_000)
+    parser.add_argument("--work", type=int, default=200)
+    parser.add_argument("--pin", action="store_true", help="pin shard i to core i")
+    args = parser.parse_args(argv)
+
+    baseline: Optional[float] = None
+    for workers in args.workers:
+        cores = list(range(workers)) if args.pin else None
+        result = run_replay(workers, ticks=args.ticks, work=args.work, cores=cores)
+        baseline = baseline or result["ticks_per_s"] / workers
+        logger.info(
+            "workers=%d  %.0f ticks/s  speedup=%.2fx (ideal %dx)",
+            workers, result["ticks_per_s"], result["ticks_per_s"] / baseline, workers,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
@@ -133,6 +133,8 @@ def _build_parser() -> argparse.ArgumentParser:
     import_kraken_ohlcvt_archive.add_argument("--max-archive-bytes", type=int, default=8 * 1024 * 1024 * 1024)
     import_kraken_ohlcvt_archive.add_argument("--max-selected-uncompressed-bytes", type=int, default=2 * 1024 * 1024 * 1024)
     import_kraken_ohlcvt_archive.add_argument("--max-rows-per-member", type=int, default=500_000)
+    import_kraken_ohlcvt_archive.add_argument("--workers", type=int, default=1, help="Member import processes; each reopens the archive")
+    import_kraken_ohlcvt_archive.add_argument("--max-member-buffer-bytes", type=int, default=256 * 1024 * 1024)
     import_kraken_ohlcvt_archive.set_defaults(handler=_cmd_import_kraken_ohlcvt_archive)
 
     collect_research_daily = subparsers.add_parser(
@@ -674,6 +676,11 @@ def _build_parser() -> argparse.ArgumentParser:
     data_capability_scan.add_argument("--data-roots", required=True, help="Comma-separated data/report roots to scan")
     data_capability_scan.add_argument("--memory-path", default="data/research/alpha_research_memory.sqlite3")
     data_capability_scan.add_argument("--output-dir", default="reports/research")
+    data_capability_scan.add_argument(
+        "--scan-cache",
+        default=None,
+        help="Optional JSON cache of per-file scan summaries; unchanged files are not re-read",
+    )
     data_capability_scan.set_defaults(handler=_cmd_data_capability_scan)
 
     research_retry_eligibility = subparsers.add_parser(
@@ -1652,6 +1659,12 @@ def _add_high_conviction_discovery_args(parser: argparse.ArgumentParser) -> None
         default=None,
         help="Optional high-conviction-swing JSON report used to compare against current grid/micro signals",
     )
+    parser.add_argument(
+        "--scenario-workers",
+        type=int,
+        default=1,
+        help="Processes used to evaluate the scenario grid; 1 keeps evaluation in-process",
+    )
     _add_cost_profile_args(parser, include_latency=True)
 
 
@@ -1889,6 +1902,8 @@ def _cmd_import_kraken_ohlcvt_archive(args: argparse.Namespace) -> int:
             max_archive_bytes=args.max_archive_bytes,
             max_selected_uncompressed_bytes=args.max_selected_uncompressed_bytes,
             max_rows_per_member=args.max_rows_per_member,
+            workers=args.workers,
+            max_member_buffer_bytes=args.max_member_buffer_bytes,
         )
     )
     _print_json(result.to_dict())
@@ -2471,6 +2486,7 @@ def _cmd_high_conviction_discovery(args: argparse.Namespace) -> int:
                 candidate_max_drawdown_bps=args.candidate_max_drawdown_bps,
                 comparison_micro_report_path=micro_report,
                 cost_config=_cost_config_from_args(args),
+                scenario_workers=args.scenario_workers,
             )
         ),
         Path(args.output_dir),
@@ -3534,6 +3550,7 @@ def _cmd_data_capability_scan(args: argparse.Namespace) -> int:
             state_db=Path(args.state_db) if args.state_db else None,
             data_roots=tuple(Path(path) for path in _csv_tuple(args.data_roots, "--data-roots")),
             memory_path=Path(args.memory_path),
+            scan_cache=Path(args.scan_cache) if args.scan_cache else None,
         ),
         Path(args.output_dir),
     )
@@ -8,45 +8,19 @@ Combines:
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .decision_journal import build_rejected_opportunity_report
+from .decision_journal import build_rejected_opportunity_report, iter_journal_records
 from .persistence import StatePersistence
 
 
 def _read_decision_rows(journal_path: str, window_hours: Optional[int] = None) -> List[Dict[str, Any]]:
-    path = Path(journal_path)
-    if not path.exists():
-        return []
-
     cutoff = None
     now = datetime.now(timezone.utc).timestamp()
     if window_hours is not None and int(window_hours) > 0:
         cutoff = now - int(window_hours) * 3600
-
-    rows: List[Dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            rec = json.loads(line)
-        except Exception:
-            continue
-        if cutoff is not None:
-            ts = str(rec.get("timestamp") or "")
-            if ts:
-                try:
-                    dts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    if dts.timestamp() < cutoff:
-                        continue
-                except Exception:
-                    pass
-        rows.append(rec)
-    return rows
+    return list(iter_journal_records(journal_path, since=cutoff))
 
 
 def build_consolidated_profitability_review(
@@ -6,13 +6,20 @@ Default-safe behavior: disabled unless explicitly enabled by feature flag.
 
 from __future__ import annotations
 
-import json
+import gzip
+import logging
 import os
+import shutil
 import threading
+import time
 from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
 
 REJECTION_REASON_RANKING_BELOW_THRESHOLD = "ranking_below_threshold"
 REJECTION_REASON_SCALABILITY_GUARD_BLOCK = "scalability_guard_block"
@@ -28,6 +35,14 @@ class DecisionJournal:
 
     Records only major decisions. Each record keeps a stable schema to support
     post-run analytics and operator review.
+
+    ``log`` only enqueues the record in a bounded ring; a background writer
+    thread serializes batches with orjson and appends them to ``path``. When
+    the ring is full the oldest pending record is dropped and counted, so the
+    decision cycle never blocks on disk. The active file rotates by size and
+    UTC day into gzip segments next to it (see :func:`iter_journal_records`).
+    Context values are shallow-copied; callers must not mutate nested objects
+    after logging.
     """
 
     def __init__(
@@ -36,27 +51,104 @@ class DecisionJournal:
         journal_path: str,
         runtime_context: Optional[Dict[str, Any]] = None,
         flush_every: int = 1,
+        *,
+        max_pending: int = 10_000,
+        rotate_max_bytes: int = 64 * 1024 * 1024,
+        rotate_daily: bool = True,
     ) -> None:
         self.enabled = bool(enabled)
         self.path = Path(journal_path)
         self.runtime_context = dict(runtime_context or {})
         self.flush_every = max(1, int(flush_every))
+        self.max_pending = max(1, int(max_pending))
+        self.rotate_max_bytes = max(0, int(rotate_max_bytes))
+        self.rotate_daily = bool(rotate_daily)
 
         self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: Deque[Tuple[float, Dict[str, Any]]] = deque()
+        self._closing = False
+        self._busy = False
+        self._flush_requested = False
         self._buffered = 0
-        self._fh = None
+        self._fh: Optional[BinaryIO] = None
+        self._segment_bytes = 0
+        self._segment_day: Optional[str] = None
+        self._writer: Optional[threading.Thread] = None
+        self._stats: Dict[str, Any] = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "serialize_errors": 0,
+            "write_errors": 0,
+            "rotations": 0,
+            "compress_errors": 0,
+            "batches": 0,
+            "max_lag_ms": 0.0,
+            "last_batch_lag_ms": 0.0,
+        }
 
         if self.enabled:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            self._fh = self.path.open("a", encoding="utf-8")
+            self._fh = self.path.open("ab")
+            self._segment_bytes = self._fh.tell()
+            if self._segment_bytes > 0:
+                mtime = datetime.fromtimestamp(self.path.stat().st_mtime, timezone.utc)
+                self._segment_day = mtime.date().isoformat()
+            self._writer = threading.Thread(
+                target=self._run_writer,
+                name="decision-journal-writer",
+                daemon=True,
+            )
+            self._writer.start()
 
     def close(self) -> None:
+        """Drain pending records, flush and close the active file."""
+
+        with self._wakeup:
+            self._closing = True
+            self._wakeup.notify_all()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        self._writer = None
         with self._lock:
             if self._fh is not None:
                 self._fh.flush()
                 self._fh.close()
                 self._fh = None
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record logged so far is written and flushed."""
+
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        with self._wakeup:
+            if self._writer is None:
+                return not self._pending
+            self._flush_requested = True
+            self._wakeup.notify_all()
+            while self._pending or self._busy or self._flush_requested:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0.0:
+                    return False
+                if self._writer is None or not self._writer.is_alive():
+                    return False
+                self._wakeup.wait(remaining)
+        return True
+
+    def get_status(self) -> Dict[str, Any]:
+        """Writer counters: pending ring depth, drops, lag and rotations."""
+
+        with self._lock:
+            status = dict(self._stats)
+            status["pending"] = len(self._pending)
+            status["max_pending"] = self.max_pending
+            oldest = self._pending[0][0] if self._pending else None
+        status["lag_ms"] = round((time.monotonic() - oldest) * 1000.0, 3) if oldest is not None else 0.0
+        status["enabled"] = self.enabled
+        status["path"] = str(self.path)
+        return status
+
     def log(
         self,
         *,
@@ -67,15 +159,15 @@ class DecisionJournal:
         context: Optional[Dict[str, Any]] = None,
         session_id: Optional[str] = None,
     ) -> bool:
-        """Write one decision record (append-only JSONL).
+        """Queue one decision record (append-only JSONL).
 
-        Returns True when written, False when disabled.
+        Returns True when accepted, False when disabled or closed.
         """
-        if not self.enabled or self._fh is None:
+        if not self.enabled or self._writer is None:
             return False
 
         rec = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "decision_type": str(decision_type),
             "source": str(source),
             "symbols": [str(s) for s in (symbols or [])],
@@ -86,14 +178,239 @@ class DecisionJournal:
         if session_id:
             rec["session_id"] = str(session_id)
 
-        line = json.dumps(rec, ensure_ascii=False, separators=(",", ":"))
+        with self._wakeup:
+            if self._closing:
+                return False
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self._stats["dropped"] += 1
+            self._pending.append((time.monotonic(), rec))
+            self._stats["enqueued"] += 1
+            if len(self._pending) == 1:
+                self._wakeup.notify()
+        return True
+
+    # ------------------------------------------------------------------
+    # Background writer
+    # ------------------------------------------------------------------
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._pending and not self._closing and not self._flush_requested:
+                    self._wakeup.wait()
+                batch = list(self._pending)
+                self._pending.clear()
+                force_flush = self._closing or self._flush_requested
+                self._flush_requested = False
+                self._busy = True
+            try:
+                self._write_batch(batch, force_flush=force_flush)
+            except Exception:
+                logger.exception("Decision journal writer failed; %d record(s) lost", len(batch))
+                with self._lock:
+                    self._stats["write_errors"] += len(batch)
+            finally:
+                with self._wakeup:
+                    self._busy = False
+                    done = self._closing and not self._pending
+                    self._wakeup.notify_all()
+            if done:
+                return
+
+    def _write_batch(self, batch: List[Tuple[float, Dict[str, Any]]], *, force_flush: bool) -> None:
+        now = time.monotonic()
+        lines: List[bytes] = []
+        days: List[str] = []
+        errors = 0
+        for _, rec in batch:
+            ts = rec["timestamp"]
+            rec["timestamp"] = ts.isoformat()
+            try:
+                lines.append(orjson.dumps(rec, default=str, option=_ORJSON_OPTIONS) + b"\n")
+            except (TypeError, orjson.JSONEncodeError):
+                errors += 1
+                continue
+            days.append(ts.date().isoformat())
+        written = 0
+        write_errors = 0
+        for line, day in zip(lines, days):
+            try:
+                self._rotate_if_needed(day, len(line))
+                fh = self._fh
+                if fh is None:
+                    raise OSError("decision journal file is closed")
+                fh.write(line)
+                self._segment_bytes += len(line)
+                self._segment_day = day
+                written += 1
+            except (OSError, ValueError):
+                write_errors += 1
         with self._lock:
-            self._fh.write(line + "\n")
-            self._buffered += 1
-            if self._buffered >= self.flush_every:
-                self._fh.flush()
+            self._buffered += written
+            fh = self._fh
+            if fh is not None and (self._buffered >= self.flush_every or force_flush):
+                try:
+                    fh.flush()
+                except (OSError, ValueError):
+                    write_errors += 1
                 self._buffered = 0
-        return True
+            stats = self._stats
+            stats["written"] += written
+            stats["serialize_errors"] += errors
+            stats["write_errors"] += write_errors
+            if batch:
+                lag_ms = round((now - batch[0][0]) * 1000.0, 3)
+                stats["batches"] += 1
+                stats["last_batch_lag_ms"] = lag_ms
+                stats["max_lag_ms"] = max(float(stats["max_lag_ms"]), lag_ms)
+
+    def _rotate_if_needed(self, day: str, incoming_bytes: int) -> None:
+        if self._segment_bytes <= 0:
+            return
+        by_day = self.rotate_daily and self._segment_day is not None and day != self._segment_day
+        by_size = self.rotate_max_bytes > 0 and self._segment_bytes + incoming_bytes > self.rotate_max_bytes
+        if not (by_day or by_size):
+            return
+        with self._lock:
+            fh = self._fh
+            if fh is None:
+                return
+            fh.flush()
+            fh.close()
+            self._fh = None
+        segment = _next_segment_path(self.path, datetime.now(timezone.utc))
+        staged = segment.with_suffix("")
+        try:
+            os.replace(self.path, staged)
+        finally:
+            # Keep appending to the active path even when the rename failed.
+            with self._lock:
+                self._fh = self.path.open("ab")
+                self._segment_bytes = self._fh.tell()
+                self._buffered = 0
+        with self._lock:
+            self._stats["rotations"] += 1
+        try:
+            _compress_segment(staged, segment)
+        except OSError as exc:
+            # The staged plain segment stays readable by journal_segments().
+            logger.warning("Decision journal segment compression failed for %s: %s", staged, exc)
+            with self._lock:
+                self._stats["compress_errors"] += 1
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+_SEGMENT_STAMP_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+def _next_segment_path(path: Path, closed_at: datetime) -> Path:
+    """Return ``<stem>.<closed_at>.<n><suffix>.gz`` for a rotated segment.
+
+    ``closed_at`` bounds every record in the segment from above, so readers
+    can skip whole segments that end before their window.
+    """
+
+    stamp = closed_at.strftime(_SEGMENT_STAMP_FORMAT)
+    index = 0
+    while True:
+        candidate = path.with_name(f"{path.stem}.{stamp}.{index:04d}{path.suffix}.gz")
+        if not candidate.exists() and not candidate.with_suffix("").exists():
+            return candidate
+        index += 1
+
+
+def _compress_segment(source: Path, target: Path) -> None:
+    tmp = target.with_name(target.name + ".tmp")
+    with source.open("rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    os.replace(tmp, target)
+    source.unlink()
+
+
+def journal_segments(journal_path: str, *, since: Optional[float] = None) -> List[Path]:
+    """Rotated segments of ``journal_path`` (oldest first), then the active file.
+
+    Segments closed before the ``since`` epoch timestamp are skipped without
+    being opened.
+    """
+
+    path = Path(journal_path)
+    segments: List[Tuple[str, int, Path]] = []
+    if path.parent.exists():
+        prefix = f"{path.stem}."
+        for candidate in path.parent.iterdir():
+            name = candidate.name
+            if not name.startswith(prefix):
+                continue
+            if name.endswith(f"{path.suffix}.gz"):
+                body = name[len(prefix) : -len(f"{path.suffix}.gz")]
+            elif name.endswith(path.suffix) and candidate != path:
+                # A segment staged for compression when the writer stopped.
+                body = name[len(prefix) : -len(path.suffix)]
+            else:
+                continue
+            stamp, _, index = body.partition(".")
+            try:
+                closed_at = datetime.strptime(stamp, _SEGMENT_STAMP_FORMAT).replace(tzinfo=timezone.utc)
+                order = int(index)
+            except ValueError:
+                continue
+            if since is not None and closed_at.timestamp() < since:
+                continue
+            segments.append((stamp, order, candidate))
+    ordered = [segment for _, _, segment in sorted(segments)]
+    if path.exists():
+        ordered.append(path)
+    return ordered
+
+
+def iter_journal_lines(journal_path: str, *, since: Optional[float] = None) -> Iterator[bytes]:
+    """Yield raw non-empty JSONL lines from every segment, oldest first."""
+
+    for segment in journal_segments(journal_path, since=since):
+        opener = gzip.open if segment.suffix == ".gz" else open
+        try:
+            with opener(segment, "rb") as fh:
+                for raw in fh:
+                    raw = raw.strip()
+                    if raw:
+                        yield raw
+        except (OSError, EOFError):
+            continue
+
+
+def iter_journal_records(
+    journal_path: str,
+    *,
+    since: Optional[float] = None,
+    contains: Optional[bytes] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield decoded journal records from rotated segments and the active file.
+
+    ``contains`` is a cheap byte pre-filter applied before decoding; records
+    older than ``since`` (epoch seconds) are skipped. Undecodable lines are
+    ignored, matching the tolerant readers this replaces.
+    """
+
+    for raw in iter_journal_lines(journal_path, since=since):
+        if contains is not None and contains not in raw:
+            continue
+        try:
+            rec = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            continue
+        if not isinstance(rec, dict):
+            continue
+        if since is not None:
+            ts = str(rec.get("timestamp") or "")
+            if ts:
+                try:
+                    if datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp() < since:
+                        continue
+                except ValueError:
+                    pass
+        yield rec
 
 
 def journal_from_env() -> DecisionJournal:
@@ -106,12 +423,23 @@ def journal_from_env() -> DecisionJournal:
     }
     path = os.getenv("DECISION_JOURNAL_PATH", "data/decision_journal.jsonl")
     flush_every = int(os.getenv("DECISION_JOURNAL_FLUSH_EVERY", "1"))
+    max_pending = int(os.getenv("DECISION_JOURNAL_MAX_PENDING", "10000"))
+    rotate_max_bytes = int(os.getenv("DECISION_JOURNAL_ROTATE_MAX_BYTES", str(64 * 1024 * 1024)))
+    rotate_daily = os.getenv("DECISION_JOURNAL_ROTATE_DAILY", "true").strip().lower() in {"1", "true", "yes", "on"}
     context = {
         "deployment_stage": os.getenv("DEPLOYMENT_STAGE", "paper"),
         "paper_trading": os.getenv("PAPER_TRADING", "false").strip().lower() in {"1", "true", "yes", "on"},
         "pid": os.getpid(),
     }
-    return DecisionJournal(enabled=enabled, journal_path=path, runtime_context=context, flush_every=flush_every)
+    return DecisionJournal(
+        enabled=enabled,
+        journal_path=path,
+        runtime_context=context,
+        flush_every=flush_every,
+        max_pending=max_pending,
+        rotate_max_bytes=rotate_max_bytes,
+        rotate_daily=rotate_daily,
+    )
 
 
 def build_rejected_opportunity_report(
@@ -127,58 +455,27 @@ def build_rejected_opportunity_report(
         cutoff = now.timestamp() - (int(window_hours) * 3600)
     records_limit = max(0, int(max_records))
 
-    path = Path(journal_path)
-    if not path.exists():
-        return {
-            "generated_at": now.isoformat(),
-            "window_hours": int(window_hours) if window_hours is not None else None,
-            "total_rejections": 0,
-            "by_reason": {},
-            "by_symbol": {},
-            "reason_symbol": {},
-            "records": [],
-        }
-
     by_reason: Dict[str, int] = {}
     by_symbol: Dict[str, int] = {}
     reason_symbol: Dict[str, int] = {}
     total_rejections = 0
     records = deque(maxlen=records_limit if records_limit > 0 else None)
 
-    with path.open(encoding="utf-8", errors="ignore") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except Exception:
-                continue
-            if rec.get("decision_type") != "rejected_opportunity":
-                continue
-            ts = str(rec.get("timestamp") or "")
-            include = True
-            if cutoff is not None and ts:
-                try:
-                    dts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    include = dts.timestamp() >= cutoff
-                except Exception:
-                    include = True
-            if not include:
-                continue
+    for rec in iter_journal_records(journal_path, since=cutoff, contains=b"rejected_opportunity"):
+        if rec.get("decision_type") != "rejected_opportunity":
+            continue
+        total_rejections += 1
+        reasons = rec.get("reasons") or []
+        reason = str(reasons[0]) if reasons else "unknown"
+        symbols = rec.get("symbols") or []
+        symbol = str(symbols[0]) if symbols else "UNKNOWN"
+        by_reason[reason] = by_reason.get(reason, 0) + 1
+        by_symbol[symbol] = by_symbol.get(symbol, 0) + 1
+        key = f"{reason}::{symbol}"
+        reason_symbol[key] = reason_symbol.get(key, 0) + 1
 
-            total_rejections += 1
-            reasons = rec.get("reasons") or []
-            reason = str(reasons[0]) if reasons else "unknown"
-            symbols = rec.get("symbols") or []
-            symbol = str(symbols[0]) if symbols else "UNKNOWN"
-            by_reason[reason] = by_reason.get(reason, 0) + 1
-            by_symbol[symbol] = by_symbol.get(symbol, 0) + 1
-            key = f"{reason}::{symbol}"
-            reason_symbol[key] = reason_symbol.get(key, 0) + 1
-
-            if records_limit > 0:
-                records.append(rec)
+        if records_limit > 0:
+            records.append(rec)
 
     return {
         "generated_at": now.isoformat(),
@@ -8,10 +8,14 @@ later measure whether a guard protected capital or blocked useful edge.
 from __future__ import annotations
 
 import os
+import time
 import uuid
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from .pattern_learning import fold_new_signal_outcomes
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -331,25 +335,54 @@ def _classify(status: str, net_return_bps: float, config: DecisionLearningConfig
     return "flat"
 
 
+def _parse_price_samples(price_samples: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    parsed: list[dict[str, Any]] = []
+    for sample in price_samples or []:
+        ts = _parse_dt(sample.get("observed_at"))
+        price = _safe_float(sample.get("price"))
+        if ts is None or price is None:
+            continue
+        parsed.append({"timestamp": ts, "price": float(price)})
+    parsed.sort(key=lambda item: item["timestamp"])
+    return parsed
+
+
+class PricePath:
+    """Time-ordered price samples of one symbol, sliced per decision window.
+
+    Built once per refresh from a merged query so each pending decision
+    resolves its path with two bisections instead of its own database read.
+    """
+
+    def __init__(self, price_samples: Iterable[Mapping[str, Any]]) -> None:
+        self._samples = _parse_price_samples(price_samples)
+        self._times = [item["timestamp"] for item in self._samples]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def window(self, start: datetime, end: datetime) -> list[dict[str, Any]]:
+        return self._samples[bisect_left(self._times, start) : bisect_right(self._times, end)]
+
+
 def _samples_after_decision(
     row: Mapping[str, Any],
     price_samples: Iterable[Mapping[str, Any]],
     *,
     horizon_minutes: int,
+    price_path: Optional[PricePath] = None,
 ) -> tuple[list[dict[str, Any]], Optional[str]]:
     created = _parse_dt(row.get("created_at"))
     if created is None:
         return [], "missing_decision_timestamp"
     end = created + timedelta(minutes=max(1, int(horizon_minutes)))
-    selected: list[dict[str, Any]] = []
-    for sample in price_samples or []:
-        ts = _parse_dt(sample.get("observed_at"))
-        price = _safe_float(sample.get("price"))
-        if ts is None or price is None:
-            continue
-        if created <= ts <= end:
-            selected.append({"timestamp": ts, "price": float(price)})
-    selected.sort(key=lambda item: item["timestamp"])
+    if price_path is not None:
+        return price_path.window(created, end), None
+    selected = [
+        sample
+        for sample in _parse_price_samples(price_samples)
+        if created <= sample["timestamp"] <= end
+    ]
     return selected, None
 
 
@@ -359,6 +392,7 @@ def _evaluate_triple_barrier(
     price_samples: Iterable[Mapping[str, Any]],
     horizon_minutes: int,
     config: DecisionLearningConfig,
+    price_path: Optional[PricePath] = None,
 ) -> tuple[Optional[dict[str, Any]], Optional[str]]:
     side = _extract_side(row)
     if side != "buy":
@@ -366,7 +400,12 @@ def _evaluate_triple_barrier(
     reference_price = _extract_reference_price(row)
     if reference_price is None:
         return None, "missing_reference_price"
-    selected, reason = _samples_after_decision(row, price_samples, horizon_minutes=horizon_minutes)
+    selected, reason = _samples_after_decision(
+        row,
+        price_samples,
+        horizon_minutes=horizon_minutes,
+        price_path=price_path,
+    )
     if reason is not None:
         return None, reason
     if len(selected) < config.min_path_samples:
@@ -449,12 +488,14 @@ def build_outcome_for_decision(
     price_samples: Iterable[Mapping[str, Any]] = (),
     horizon_minutes: int,
     config: DecisionLearningConfig,
+    price_path: Optional[PricePath] = None,
 ) -> tuple[Optional[dict[str, Any]], Optional[str]]:
     path_outcome, path_reason = _evaluate_triple_barrier(
         row,
         price_samples=price_samples,
         horizon_minutes=horizon_minutes,
         config=config,
+        price_path=price_path,
     )
     if path_outcome is not None:
         return path_outcome, None
@@ -569,6 +610,53 @@ def trusted_outcome_rows(
     return trusted, ignored
 
 
+_PRICE_SAMPLE_QUERY_LIMIT = 10_000
+_EMPTY_PRICE_PATH = PricePath(())
+
+
+def _alias_key(symbol: Any) -> tuple[str, ...]:
+    return tuple(sorted(_symbol_aliases(symbol)))
+
+
+async def _read_price_samples(
+    persistence: Any,
+    symbols: list[str],
+    start_at: datetime,
+    end_at: datetime,
+    page_size: int,
+) -> tuple[list[Mapping[str, Any]], int]:
+    """Page through ``[start_at, end_at]`` so a merged slice is never truncated.
+
+    Pages are ordered by ``(observed_at, id)``; the next page restarts at the
+    last timestamp read and drops the rows of that timestamp already returned.
+    Returns the samples and the number of queries issued.
+    """
+    samples: list[Mapping[str, Any]] = []
+    cursor_at = start_at.isoformat()
+    seen_at_cursor: set[Any] = set()
+    queries = 0
+    while True:
+        page = await persistence.get_market_price_samples(
+            symbols=symbols,
+            start_at=cursor_at,
+            end_at=end_at.isoformat(),
+            limit=page_size,
+        )
+        queries += 1
+        fresh = [
+            row
+            for row in page or []
+            if not (str(row.get("observed_at")) == cursor_at and row.get("id") in seen_at_cursor)
+        ]
+        samples.extend(fresh)
+        if len(page or []) < page_size or not fresh:
+            return samples, queries
+        last_at = str(fresh[-1].get("observed_at"))
+        if last_at != cursor_at:
+            cursor_at, seen_at_cursor = last_at, set()
+        seen_at_cursor.update(row.get("id") for row in fresh if str(row.get("observed_at")) == last_at)
+
+
 class DecisionLearningEngine:
     def __init__(self, config: Optional[DecisionLearningConfig] = None) -> None:
         self.config = config or DecisionLearningConfig.from_env()
@@ -608,12 +696,16 @@ class DecisionLearningEngine:
             )
 
         price_by_symbol = build_price_map(instances_list)
-        refreshed = 0
         skipped: dict[str, int] = {}
+        latency_ms: dict[str, float] = {}
+        query_count = 0
         oldest_created_at = (
             datetime.now(timezone.utc)
             - timedelta(hours=max(1, int(self.config.price_retention_hours)))
         ).isoformat()
+
+        phase_started = time.perf_counter()
+        candidates_by_horizon: list[tuple[int, list[Mapping[str, Any]]]] = []
         for horizon in self.config.horizons_minutes:
             candidates = await persistence.get_decision_outcome_candidates(
                 horizon_minutes=horizon,
@@ -621,30 +713,46 @@ class DecisionLearningEngine:
                 oldest_created_at=oldest_created_at,
                 missing_source="decision_learning_triple_barrier",
             )
+            query_count += 1
+            candidates_by_horizon.append((horizon, list(candidates or [])))
+        latency_ms["candidates"] = (time.perf_counter() - phase_started) * 1000.0
+
+        phase_started = time.perf_counter()
+        price_paths, price_queries = await self._load_price_paths(persistence, candidates_by_horizon)
+        query_count += price_queries
+        latency_ms["price_samples"] = (time.perf_counter() - phase_started) * 1000.0
+
+        phase_started = time.perf_counter()
+        outcomes: list[dict[str, Any]] = []
+        for horizon, candidates in candidates_by_horizon:
             for row in candidates:
-                price_samples = []
-                created = _parse_dt(row.get("created_at"))
-                if created is not None and hasattr(persistence, "get_market_price_samples"):
-                    end = created + timedelta(minutes=max(1, int(horizon)))
-                    price_samples = await persistence.get_market_price_samples(
-                        symbols=sorted(_symbol_aliases(row.get("symbol"))),
-                        start_at=created.isoformat(),
-                        end_at=end.isoformat(),
-                        limit=10_000,
-                    )
                 outcome, reason = build_outcome_for_decision(
                     row,
                     price_by_symbol=price_by_symbol,
-                    price_samples=price_samples,
+                    price_path=price_paths.get(_alias_key(row.get("symbol")), _EMPTY_PRICE_PATH),
                     horizon_minutes=horizon,
                     config=self.config,
                 )
                 if outcome is None:
                     skipped[str(reason or "unknown")] = skipped.get(str(reason or "unknown"), 0) + 1
                     continue
-                written = await persistence.upsert_signal_outcome(**outcome)
-                if written:
+                outcomes.append(outcome)
+        latency_ms["labelling"] = (time.perf_counter() - phase_started) * 1000.0
+
+        phase_started = time.perf_counter()
+        refreshed = 0
+        if outcomes and hasattr(persistence, "upsert_signal_outcomes"):
+            refreshed = int(await persistence.upsert_signal_outcomes(outcomes) or 0)
+            query_count += 1
+        else:
+            for outcome in outcomes:
+                if await persistence.upsert_signal_outcome(**outcome):
                     refreshed += 1
+                query_count += 1
+        if refreshed and hasattr(persistence, "get_signal_outcomes_after"):
+            await fold_new_signal_outcomes(persistence)
+        latency_ms["write"] = (time.perf_counter() - phase_started) * 1000.0
+        latency_ms["total"] = sum(latency_ms.values())
 
         recent = await persistence.get_signal_outcomes(limit=self.config.recent_limit)
         trusted, ignored = trusted_outcome_rows(
@@ -658,12 +766,51 @@ class DecisionLearningEngine:
             "price_samples_recorded": samples_recorded,
             "price_samples_purged": samples_purged,
             "skipped": skipped,
+            "pending_candidates": sum(len(candidates) for _horizon, candidates in candidates_by_horizon),
+            "query_count": query_count,
+            "latency_ms": {key: round(value, 3) for key, value in latency_ms.items()},
             "summary": summarize_outcomes(trusted),
             "legacy_proxy_outcomes_ignored": len(ignored),
             "legacy_proxy_summary": summarize_outcomes(ignored),
             "recent": recent,
         }
 
+    async def _load_price_paths(
+        self,
+        persistence: Any,
+        candidates_by_horizon: Sequence[tuple[int, Sequence[Mapping[str, Any]]]],
+    ) -> tuple[dict[tuple[str, ...], PricePath], int]:
+        """Read one merged price slice per symbol covering every pending window."""
+        if not hasattr(persistence, "get_market_price_samples"):
+            return {}, 0
+        windows: dict[tuple[str, ...], tuple[datetime, datetime]] = {}
+        for horizon, candidates in candidates_by_horizon:
+            for row in candidates:
+                created = _parse_dt(row.get("created_at"))
+                if created is None:
+                    continue
+                end = created + timedelta(minutes=max(1, int(horizon)))
+                key = _alias_key(row.get("symbol"))
+                start_at, end_at = windows.get(key, (created, end))
+                windows[key] = (min(start_at, created), max(end_at, end))
+        interval = max(1, int(self.config.price_sample_interval_seconds))
+        paths: dict[tuple[str, ...], PricePath] = {}
+        queries = 0
+        for key, (start_at, end_at) in windows.items():
+            # Runtime sampling keeps one price per symbol and bucket, so one
+            # page usually covers the slice; denser or backfilled tables page.
+            buckets = int((end_at - start_at).total_seconds()) // interval + 2
+            samples, issued = await _read_price_samples(
+                persistence,
+                list(key),
+                start_at,
+                end_at,
+                page_size=max(_PRICE_SAMPLE_QUERY_LIMIT, buckets * max(1, len(key))),
+            )
+            paths[key] = PricePath(samples)
+            queries += issued
+        return paths, queries
+
     async def snapshot(self, *, persistence: Any) -> dict[str, Any]:
         recent = await persistence.get_signal_outcomes(limit=self.config.recent_limit)
         trusted, ignored = trusted_outcome_rows(
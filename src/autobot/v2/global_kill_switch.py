@@ -3,15 +3,19 @@ from __future__ import annotations
 import logging
 import os
 import sqlite3
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from time import sleep
-from typing import Callable, Optional, TypeVar
+from time import monotonic, sleep
+from typing import Callable, ContextManager, Optional, TypeVar
+
+from .sqlite_access import SQLitePragmas, is_sqlite_busy_error, shared_sqlite_pool
 
 
 logger = logging.getLogger(__name__)
 _T = TypeVar("_T")
+_FileStamp = tuple[int, int, int]
 
 
 class GlobalKillSwitchStoreError(RuntimeError):
@@ -30,7 +34,13 @@ class GlobalKillState:
 
 
 class GlobalKillSwitchStore:
-    """Cross-process kill-switch state persistence with fail-closed reads."""
+    """Cross-process kill-switch state persistence with fail-closed reads.
+
+    Healthy reads are cached in memory and served again while the database
+    and WAL files are unchanged and the cache is younger than
+    ``cache_ttl_seconds``.  Local writes invalidate the cache, unhealthy
+    states are never cached, and ``cache_ttl_seconds=0`` disables caching.
+    """
 
     def __init__(
         self,
@@ -40,6 +50,8 @@ class GlobalKillSwitchStore:
         retry_attempts: int = 3,
         retry_delay_seconds: float = 0.05,
         sleeper: Callable[[float], None] = sleep,
+        cache_ttl_seconds: float = 0.25,
+        clock: Callable[[], float] = monotonic,
     ) -> None:
         self.db_path = Path(
             db_path
@@ -47,12 +59,31 @@ class GlobalKillSwitchStore:
         )
         if sqlite_timeout_seconds <= 0.0 or retry_attempts < 1 or retry_delay_seconds < 0.0:
             raise ValueError("invalid global kill-switch SQLite retry configuration")
+        if cache_ttl_seconds < 0.0:
+            raise ValueError("invalid global kill-switch cache configuration")
         self._sqlite_timeout_seconds = float(sqlite_timeout_seconds)
         self._busy_timeout_ms = max(1, int(self._sqlite_timeout_seconds * 1000))
         self._retry_attempts = int(retry_attempts)
         self._retry_delay_seconds = float(retry_delay_seconds)
         self._sleeper = sleeper
+        self._cache_ttl_seconds = float(cache_ttl_seconds)
+        self._clock = clock
+        self._wal_path = self.db_path.with_name(f"{self.db_path.name}-wal")
+        self._cache_lock = threading.Lock()
+        self._cached_state: Optional[GlobalKillState] = None
+        self._cached_stamp: Optional[tuple[_FileStamp, Optional[_FileStamp]]] = None
+        self._cached_at = 0.0
+        self._cache_generation = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # The store is read on the order and scalability paths, so it keeps a
+        # persistent per-thread connection instead of reconnecting per read.
+        self._pool = shared_sqlite_pool(
+            self.db_path,
+            timeout_seconds=self._sqlite_timeout_seconds,
+            pragmas=SQLitePragmas.from_env(busy_timeout_ms=self._busy_timeout_ms, journal_mode=None),
+        )
         self._init_db()
 
     def _init_db(self) -> None:
@@ -87,6 +118,52 @@ class GlobalKillSwitchStore:
     def get(self) -> GlobalKillState:
         """Read the global state; unreadable persistence means globally tripped."""
 
+        # Stamp before reading: a commit racing with the read changes the
+        # files after this point, so the next call misses and re-reads.
+        stamp = self._file_stamp() if self._cache_ttl_seconds > 0.0 else None
+        now = self._clock()
+        with self._cache_lock:
+            cached = self._cached_state
+            if (
+                cached is not None
+                and stamp is not None
+                and stamp == self._cached_stamp
+                and now - self._cached_at < self._cache_ttl_seconds
+            ):
+                self._cache_hits += 1
+                return replace(cached)
+            self._cache_misses += 1
+            generation = self._cache_generation
+        state = self._read_state()
+        with self._cache_lock:
+            # A local write landing during the read bumps the generation; the
+            # state read may predate it, so it is returned but not cached.
+            if state.storage_healthy and stamp is not None and generation == self._cache_generation:
+                self._cached_state = replace(state)
+                self._cached_stamp = stamp
+                self._cached_at = now
+            elif not state.storage_healthy:
+                self._cached_state = None
+        return state
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached state so the next :meth:`get` reads SQLite."""
+
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cached_state = None
+            self._cached_stamp = None
+
+    def cache_metrics(self) -> dict[str, float | int | bool]:
+        with self._cache_lock:
+            return {
+                "enabled": self._cache_ttl_seconds > 0.0,
+                "ttl_seconds": self._cache_ttl_seconds,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            }
+
+    def _read_state(self) -> GlobalKillState:
         try:
             row = self._run_sqlite(self._read_persisted_state, operation_name="read")
         except GlobalKillSwitchStoreError as exc:
@@ -143,6 +220,8 @@ class GlobalKillSwitchStore:
         except GlobalKillSwitchStoreError as exc:
             logger.critical("Global kill-switch trip persistence failed; local halt remains active: %s", exc)
             return False
+        finally:
+            self.invalidate_cache()
 
     def acknowledge_recovery(self, operator_id: str) -> None:
         """Clear persistence only when its write is confirmed; never fail open."""
@@ -161,7 +240,27 @@ class GlobalKillSwitchStore:
                 )
                 conn.commit()
 
-        self._run_sqlite(acknowledge, operation_name="acknowledge")
+        try:
+            self._run_sqlite(acknowledge, operation_name="acknowledge")
+        finally:
+            self.invalidate_cache()
+
+    def _file_stamp(self) -> Optional[tuple[_FileStamp, Optional[_FileStamp]]]:
+        """Identity of the database and WAL files, or ``None`` when unknown."""
+
+        try:
+            db_stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        try:
+            wal_stat = os.stat(self._wal_path)
+        except FileNotFoundError:
+            wal_stamp = None
+        except OSError:
+            return None
+        else:
+            wal_stamp = (wal_stat.st_ino, wal_stat.st_size, wal_stat.st_mtime_ns)
+        return (db_stat.st_ino, db_stat.st_size, db_stat.st_mtime_ns), wal_stamp
 
     def _read_persisted_state(self) -> tuple[object, object, object, object, object] | None:
         with self._connect() as conn:
@@ -169,17 +268,15 @@ class GlobalKillSwitchStore:
                 "SELECT tripped, reason_code, reason, tripped_at, recovery_required FROM global_kill_state WHERE id=1"
             ).fetchone()
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(str(self.db_path), timeout=self._sqlite_timeout_seconds)
-        connection.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
-        return connection
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return self._pool.transaction()
 
     def _run_sqlite(self, operation: Callable[[], _T], *, operation_name: str = "") -> _T:
         for attempt in range(1, self._retry_attempts + 1):
             try:
                 return operation()
             except sqlite3.OperationalError as exc:
-                if not _is_transient_lock(exc) or attempt >= self._retry_attempts:
+                if not is_sqlite_busy_error(exc) or attempt >= self._retry_attempts:
                     raise GlobalKillSwitchStoreError(
                         f"global kill-switch {operation_name or 'database'} operation failed: {type(exc).__name__}"
                     ) from exc
@@ -189,9 +286,3 @@ class GlobalKillSwitchStore:
                     f"global kill-switch {operation_name or 'database'} operation failed: {type(exc).__name__}"
                 ) from exc
         raise AssertionError("unreachable SQLite retry state")
-
-
-def _is_transient_lock(error: sqlite3.OperationalError) -> bool:
-    message = str(error).lower()
-    return "locked" in message or "busy" in message
-
@@ -20,6 +20,15 @@ Latency tracking:
     ``start_tick()`` / ``record_tick()``.  ``stats`` sorts a copy of the
     sample array (cold path — allocation allowed).
 
+Stage breakdown:
+    ``optimizer.stages`` is a :class:`StageLatencyRecorder`.  Hot-path code
+    takes a monotonic-ns mark and calls ``lap(stage, mark, symbol, strategy)``
+    at the end of each stage; the returned timestamp is the next stage's
+    mark.  Each lap lands in a fixed-memory log-linear
+    :class:`LatencyHistogram` for the stage, the stage × symbol and the
+    stage × strategy.  :class:`HotPathLatencyExporter` snapshots them from the
+    cold path to a JSON file and to the dashboard.
+
 Usage::
 
     optimizer = HotPathOptimizer()
@@ -30,6 +39,10 @@ Usage::
     process(data)
     optimizer.record_tick(t0)
 
+    # Per stage:
+    mark = optimizer.stages.lap("decode", t0, symbol="XBT/EUR")
+    mark = optimizer.stages.lap("dispatch", mark, symbol="XBT/EUR")
+
     # From cold path (periodic):
     optimizer.force_gc()                # collect without re-enabling auto-GC
 
@@ -45,13 +58,235 @@ from __future__ import annotations
 
 import array
 import gc
+import json
+import logging
+import os
 import time
-from typing import Dict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+__all__ = [
+    "HotPathLatencyExporter",
+    "HotPathOptimizer",
+    "LatencyHistogram",
+    "StageLatencyRecorder",
+    "get_hot_path_optimizer",
+]
 
-__all__ = ["HotPathOptimizer", "get_hot_path_optimizer"]
+logger = logging.getLogger(__name__)
 
 _DEFAULT_SAMPLES: int = 4096  # Must be power of 2
 
+# Log-linear histogram layout: 2**_SUB_BITS linear sub-buckets per power of
+# two (≤ 6.25 % relative error), values clamped at 2**_MAX_BITS ns (~18 min).
+_SUB_BITS: int = 4
+_SUB_COUNT: int = 1 << _SUB_BITS
+_MAX_BITS: int = 40
+_HISTOGRAM_BUCKETS: int = _SUB_COUNT * (_MAX_BITS - _SUB_BITS + 1)
+_DIMENSION_KEY_LIMIT: int = 256   # Distinct symbols / strategies tracked per stage
+_OTHER_KEY: str = "__other__"
+_SNAPSHOT_QUANTILES: Tuple[Tuple[str, float], ...] = (
+    ("p50_ns", 0.50),
+    ("p90_ns", 0.90),
+    ("p99_ns", 0.99),
+    ("p999_ns", 0.999),
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory log-linear latency histogram (HDR-style), in nanoseconds.
+
+    Values below ``2 * 2**_SUB_BITS`` get exact buckets; above that each
+    power of two is split into ``2**_SUB_BITS`` linear sub-buckets.  The
+    bucket array is allocated once, so :meth:`record` never allocates.
+    """
+
+    __slots__ = ("_counts", "count", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self._counts: array.array = array.array("q", bytes(8 * _HISTOGRAM_BUCKETS))
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+
+    @staticmethod
+    def bucket_index(value_ns: int) -> int:
+        if value_ns < 2 * _SUB_COUNT:
+            return value_ns if value_ns > 0 else 0
+        shift = value_ns.bit_length() - _SUB_BITS - 1
+        if shift > _MAX_BITS - _SUB_BITS - 1:
+            return _HISTOGRAM_BUCKETS - 1
+        return ((shift + 1) << _SUB_BITS) + (value_ns >> shift) - _SUB_COUNT
+
+    @staticmethod
+    def bucket_upper_ns(index: int) -> int:
+        """Largest value that lands in bucket *index*."""
+        if index < 2 * _SUB_COUNT:
+            return index
+        shift = (index >> _SUB_BITS) - 1
+        return ((_SUB_COUNT + (index & (_SUB_COUNT - 1)) + 1) << shift) - 1
+
+    def record(self, value_ns: int) -> None:
+        # bucket_index() inlined: this runs several times per tick.
+        if value_ns < 2 * _SUB_COUNT:
+            index = value_ns if value_ns > 0 else 0
+        else:
+            shift = value_ns.bit_length() - _SUB_BITS - 1
+            if shift > _MAX_BITS - _SUB_BITS - 1:
+                index = _HISTOGRAM_BUCKETS - 1
+            else:
+                index = ((shift + 1) << _SUB_BITS) + (value_ns >> shift) - _SUB_COUNT
+        self._counts[index] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile_ns(self, quantile: float) -> int:
+        """Upper bound of the bucket holding the *quantile* sample."""
+        if self.count == 0:
+            return 0
+        rank = max(1, int(quantile * self.count + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            if bucket_count:
+                seen += bucket_count
+                if seen >= rank:
+                    return min(self.bucket_upper_ns(index), self.max_ns)
+        return self.max_ns
+
+    def snapshot(self) -> Dict[str, int]:
+        payload = {
+            "count": self.count,
+            "avg_ns": self.total_ns // self.count if self.count else 0,
+            "max_ns": self.max_ns,
+        }
+        for name, quantile in _SNAPSHOT_QUANTILES:
+            payload[name] = self.percentile_ns(quantile)
+        return payload
+
+    def reset(self) -> None:
+        counts = self._counts
+        for index in range(len(counts)):
+            counts[index] = 0
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+
+class StageLatencyRecorder:
+    """
+    Per-stage latency histograms broken down by symbol and by strategy.
+
+    ``lap`` costs two dict lookups and up to three histogram records.  The
+    number of symbols and strategies tracked per stage is capped at
+    ``key_limit``; further keys share an ``__other__`` histogram so memory
+    stays bounded.  Set ``enabled = False`` to turn every lap into a single
+    ``perf_counter_ns`` call.
+
+    Thread safety:
+        Single-threaded asyncio, like :class:`HotPathOptimizer`.
+    """
+
+    __slots__ = ("enabled", "key_limit", "_stages", "_by_symbol", "_by_strategy")
+
+    def __init__(self, *, key_limit: int = _DIMENSION_KEY_LIMIT, enabled: bool = True) -> None:
+        self.enabled = bool(enabled)
+        self.key_limit = max(1, int(key_limit))
+        self._stages: Dict[str, LatencyHistogram] = {}
+        self._by_symbol: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._by_strategy: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    @staticmethod
+    def mark() -> int:
+        """Monotonic timestamp in nanoseconds (start of the first stage)."""
+        return time.perf_counter_ns()
+
+    def lap(
+        self,
+        stage: str,
+        start_ns: int,
+        symbol: Optional[str] = None,
+        strategy: Optional[str] = None,
+    ) -> int:
+        """
+        Record ``now - start_ns`` for *stage* and return ``now``.
+
+        The return value is the mark for the next stage, so consecutive
+        stages cost one clock read each.
+        """
+        now = time.perf_counter_ns()
+        if not self.enabled:
+            return now
+        elapsed = now - start_ns
+        histogram = self._stages.get(stage)
+        if histogram is None:
+            histogram = self._stages[stage] = LatencyHistogram()
+        histogram.record(elapsed)
+        if symbol is not None:
+            self._dimension(self._by_symbol, stage, symbol).record(elapsed)
+        if strategy is not None:
+            self._dimension(self._by_strategy, stage, strategy).record(elapsed)
+        return now
+
+    def record(
+        self,
+        stage: str,
+        elapsed_ns: int,
+        symbol: Optional[str] = None,
+        strategy: Optional[str] = None,
+    ) -> None:
+        """Record an already measured duration (e.g. a queue wait)."""
+        if not self.enabled:
+            return
+        histogram = self._stages.get(stage)
+        if histogram is None:
+            histogram = self._stages[stage] = LatencyHistogram()
+        histogram.record(elapsed_ns)
+        if symbol is not None:
+            self._dimension(self._by_symbol, stage, symbol).record(elapsed_ns)
+        if strategy is not None:
+            self._dimension(self._by_strategy, stage, strategy).record(elapsed_ns)
+
+    def _dimension(
+        self,
+        table: Dict[str, Dict[str, LatencyHistogram]],
+        stage: str,
+        key: str,
+    ) -> LatencyHistogram:
+        per_stage = table.get(stage)
+        if per_stage is None:
+            per_stage = table[stage] = {}
+        histogram = per_stage.get(key)
+        if histogram is None:
+            if len(per_stage) >= self.key_limit:
+                key = _OTHER_KEY
+                histogram = per_stage.get(key)
+            if histogram is None:
+                histogram = per_stage[key] = LatencyHistogram()
+        return histogram
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Percentiles per stage, stage × symbol and stage × strategy (cold path)."""
+        return {
+            "stages": {stage: hist.snapshot() for stage, hist in sorted(self._stages.items())},
+            "by_symbol": {
+                stage: {key: hist.snapshot() for key, hist in sorted(per_stage.items())}
+                for stage, per_stage in sorted(self._by_symbol.items())
+            },
+            "by_strategy": {
+                stage: {key: hist.snapshot() for key, hist in sorted(per_stage.items())}
+                for stage, per_stage in sorted(self._by_strategy.items())
+            },
+        }
+
+    def reset(self) -> None:
+        self._stages.clear()
+        self._by_symbol.clear()
+        self._by_strategy.clear()
+
 
 class HotPathOptimizer:
     """
@@ -77,6 +312,7 @@ class HotPathOptimizer:
         "_tick_count",
         "_total_ns",
         "_max_ns",
+        "stages",
     )
 
     def __init__(self, max_samples: int = _DEFAULT_SAMPLES) -> None:
@@ -102,6 +338,7 @@ class HotPathOptimizer:
         self._tick_count: int = 0
         self._total_ns: int = 0
         self._max_ns: int = 0
+        self.stages: StageLatencyRecorder = StageLatencyRecorder()
 
     # ------------------------------------------------------------------
     # GC control
@@ -223,6 +460,7 @@ class HotPathOptimizer:
         self._tick_count = 0
         self._total_ns = 0
         self._max_ns = 0
+        self.stages.reset()
 
     # ------------------------------------------------------------------
     # Repr
@@ -237,6 +475,45 @@ class HotPathOptimizer:
         )
 
 
+# ---------------------------------------------------------------------------
+# Cold-path exporter
+# ---------------------------------------------------------------------------
+
+
+class HotPathLatencyExporter:
+    """
+    Periodic snapshot of an optimizer's tick and stage latencies.
+
+    :meth:`export` is meant for ``ColdPathScheduler.schedule_periodic``: it
+    builds the snapshot, keeps it in :attr:`last_snapshot` for the dashboard
+    and atomically rewrites *path* as JSON.
+    """
+
+    def __init__(self, optimizer: HotPathOptimizer, path: str | Path) -> None:
+        self.optimizer = optimizer
+        self.path = Path(path)
+        self.last_snapshot: Optional[Dict[str, Any]] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "tick": self.optimizer.stats,
+            **self.optimizer.stages.snapshot(),
+        }
+
+    def export(self) -> Dict[str, Any]:
+        snapshot = self.snapshot()
+        self.last_snapshot = snapshot
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(snapshot, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.warning("Hot-path latency export to %s failed: %s", self.path, exc)
+        return snapshot
+
+
 # ---------------------------------------------------------------------------
 # Module-level singleton
 # ---------------------------------------------------------------------------
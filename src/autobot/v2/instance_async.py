@@ -624,9 +624,14 @@ class TradingInstanceAsync:
         self._price_history.append((data.timestamp, data.price))
         self._last_price_at = data.timestamp
 
+        if opt is not None:
+            stage_start = opt.stages.lap("instance_prepare", t0, data.symbol)
+
         if self._strategy is not None and self.status == InstanceStatus.RUNNING:
             # Strategy.on_price is sync (CPU-bound, no I/O)
             self._strategy.on_price(data.price)
+            if opt is not None:
+                opt.stages.lap("strategy_on_price", stage_start, data.symbol, self.config.strategy)
 
         if opt is not None:
             opt.record_tick(t0)
@@ -5,6 +5,8 @@ import threading
 import time
 from pathlib import Path
 
+from .sqlite_access import SQLitePragmas, is_sqlite_busy_error, shared_sqlite_pool
+
 
 class NonceManager:
     """Process-safe monotonic nonce generator shared through SQLite."""
@@ -17,6 +19,11 @@ class NonceManager:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        self._pool = shared_sqlite_pool(
+            self.db_path,
+            timeout_seconds=self._BUSY_TIMEOUT_SECONDS,
+            pragmas=SQLitePragmas.from_env(busy_timeout_ms=int(self._BUSY_TIMEOUT_SECONDS * 1000)),
+        )
         self._init_db()
 
     def _init_db(self) -> None:
@@ -24,9 +31,7 @@ class NonceManager:
             self._retry_busy(self._init_db_once)
 
     def _init_db_once(self) -> None:
-        with sqlite3.connect(str(self.db_path), timeout=self._BUSY_TIMEOUT_SECONDS) as conn:
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute(f"PRAGMA busy_timeout={int(self._BUSY_TIMEOUT_SECONDS * 1000)}")
+        with self._pool.transaction() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS nonce_state (
@@ -40,8 +45,7 @@ class NonceManager:
 
     @staticmethod
     def _is_busy_error(exc: sqlite3.OperationalError) -> bool:
-        message = str(exc).lower()
-        return "database is locked" in message or "database is busy" in message
+        return is_sqlite_busy_error(exc)
 
     def _retry_busy(self, operation):
         """Retry only bounded, transient SQLite writer contention.
@@ -51,14 +55,13 @@ class NonceManager:
         nonce range, while a finite backoff keeps exchange execution from
         waiting forever on a damaged database.
         """
-        for attempt in range(self._BUSY_RETRY_COUNT + 1):
-            try:
-                return operation()
-            except sqlite3.OperationalError as exc:
-                if not self._is_busy_error(exc) or attempt >= self._BUSY_RETRY_COUNT:
-                    raise
-                time.sleep(self._BUSY_RETRY_BASE_SECONDS * (2 ** attempt))
-        raise RuntimeError("unreachable SQLite retry state")
+        return self._pool.run_with_busy_retries(
+            operation,
+            label="nonce reservation",
+            retries=self._BUSY_RETRY_COUNT,
+            base_delay_seconds=self._BUSY_RETRY_BASE_SECONDS,
+            sleeper=time.sleep,
+        )
 
     def next_nonce(self, api_key_id: str) -> int:
         low, _high = self.reserve_range(api_key_id, block_size=1)
@@ -80,8 +83,7 @@ class NonceManager:
 
     def _reserve_range_once(self, api_key_id: str, block_size: int) -> tuple[int, int]:
         now_ms = int(time.time() * 1000)
-        with sqlite3.connect(str(self.db_path), timeout=self._BUSY_TIMEOUT_SECONDS) as conn:
-            conn.execute(f"PRAGMA busy_timeout={int(self._BUSY_TIMEOUT_SECONDS * 1000)}")
+        with self._pool.transaction() as conn:
             conn.execute("BEGIN IMMEDIATE")
             row = conn.execute(
                 "SELECT last_nonce FROM nonce_state WHERE api_key_id = ?",
@@ -18,6 +18,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
 import os
 import uuid
 from datetime import datetime, timezone
@@ -46,8 +47,11 @@ from .validator import ValidatorEngine, ValidationResult, ValidationStatus
 from .instance_config import InstanceConfig
 from .risk_manager import get_risk_manager
 from .persistence import close_persistence, get_persistence
-from .hot_path_optimizer import HotPathOptimizer, get_hot_path_optimizer
+from .hot_path_optimizer import HotPathLatencyExporter, HotPathOptimizer, get_hot_path_optimizer
 from .cold_path_scheduler import ColdPathScheduler, get_cold_path_scheduler
+from .setup_gate_publisher import SetupGatePublisher
+from .account_reconciler import AccountReconciler
+from .sharded_runtime import ShardEvent, ShardedRuntime
 from .module_manager import ModuleManager
 from .modules.trailing_stop_atr import TrailingStopATR
 from .modules.black_swan import BlackSwanCatcher
@@ -188,6 +192,12 @@ from .runtime_execution_mode import (
 
 logger = logging.getLogger(__name__)
 
+# Worker ``state`` events are persisted with exactly these fields.
+_SHARD_STATE_REQUIRED = frozenset(
+    {"instance_id", "status", "current_capital", "allocated_capital", "win_count", "loss_count"}
+)
+_SHARD_STATE_FIELDS = _SHARD_STATE_REQUIRED | {"initial_capital"}
+
 
 def _env_bool(name: str, default: bool) -> bool:
     value = os.getenv(name, str(default)).strip().lower()
@@ -254,6 +264,17 @@ def _env_int(name: str, default: int, minimum: int | None = None) -> int:
     return value
 
 
+def _setup_gate_publish_interval() -> float:
+    """Publish period of the setup gate; defaults to the grid verdict TTL it replaces.
+
+    With a publisher the grids no longer cache their own verdict, so
+    ``SETUP_OPTIMIZER_EXECUTION_GATE_TTL_SECONDS`` bounds the age of the
+    published one unless ``SETUP_GATE_PUBLISH_SECONDS`` is set explicitly.
+    """
+    ttl = min(3600.0, _env_float("SETUP_OPTIMIZER_EXECUTION_GATE_TTL_SECONDS", 60.0, 1.0))
+    return _env_float("SETUP_GATE_PUBLISH_SECONDS", ttl, 1.0)
+
+
 def _apply_force_enable_all_hardening_flags(hardening_flags: Dict[str, bool]) -> None:
     if _env_bool("AUTOBOT_FORCE_ENABLE_ALL", False):
         for flag in (
@@ -349,6 +370,17 @@ class OrchestratorAsync:
             "source_status": "not_loaded",
         }
 
+        # Post-fill balance reconciliation shared by every signal handler: fills
+        # post hints and one balance fetch per debounce window serves them all.
+        self.account_reconciler: Optional[AccountReconciler] = None
+        if _env_bool("ACCOUNT_RECONCILE_COALESCE", True):
+            self.account_reconciler = AccountReconciler(
+                self.order_executor,
+                debounce_s=_env_float("ACCOUNT_RECONCILE_DEBOUNCE_SECONDS", 0.25, minimum=0.0),
+                max_delay_s=_env_float("ACCOUNT_RECONCILE_MAX_DELAY_SECONDS", 2.0, minimum=0.0),
+                retry_s=_env_float("ACCOUNT_RECONCILE_RETRY_SECONDS", 2.0, minimum=0.1),
+            )
+
         # Stop-loss manager (async)
         self.stop_loss_manager = StopLossManagerAsync(self.order_executor)
 
@@ -362,6 +394,19 @@ class OrchestratorAsync:
         # P4: Hot/Cold path separation
         self.hot_optimizer: HotPathOptimizer = get_hot_path_optimizer()
         self.cold_scheduler: ColdPathScheduler = get_cold_path_scheduler()
+        self.hot_path_latency_exporter = HotPathLatencyExporter(
+            self.hot_optimizer,
+            os.getenv("HOT_PATH_LATENCY_EXPORT_PATH", "data/hot_path_latency.json"),
+        )
+        # Grid setup-optimizer gates, recomputed on the cold path and read by
+        # strategies from an immutable snapshot.
+        self.setup_gate_publisher = SetupGatePublisher(
+            self,
+            schedule=lambda coro: self.cold_scheduler.schedule(coro, name="setup-gate-refresh"),
+        )
+        # P5: Optional multi-process shards (SHARDED_RUNTIME_WORKERS > 0)
+        self.sharded_runtime: Optional[ShardedRuntime] = None
+        self._shard_orders_halted = False
 
         # Consumer tasks — one asyncio.Task per instance (queue consumption)
         # In P3 these are owned by TradingInstanceAsync._queue_consumer_task;
@@ -938,6 +983,10 @@ class OrchestratorAsync:
             logger.warning(f"⚠️ Limite instances: {max_instances_cap}")
             return None
 
+        if self.sharded_runtime is not None and self.sharded_runtime.hosts(config.symbol):
+            logger.warning(f"⚠️ {config.symbol} hébergé par un shard worker -- instance locale refusée")
+            return None
+
         instance_id = str(uuid.uuid4())[:8]
         instance = TradingInstanceAsync(
             instance_id=instance_id,
@@ -4103,6 +4152,17 @@ class OrchestratorAsync:
             interval=60.0,
             name="leverage-downgrade",
         )
+        # P4: Per-stage latency percentiles, exported off the hot path
+        self.cold_scheduler.schedule_periodic(
+            self.hot_path_latency_exporter.export,
+            interval=_env_float("HOT_PATH_LATENCY_EXPORT_SECONDS", 60.0, 1.0),
+            name="hot-path-latency-export",
+        )
+        self.cold_scheduler.schedule_periodic(
+            self.setup_gate_publisher.refresh_async,
+            interval=_setup_gate_publish_interval(),
+            name="setup-gate-publisher",
+        )
         if self._order_book_recovery_enabled:
             self.cold_scheduler.schedule_periodic(
                 self._recover_invalid_order_books,
@@ -4200,10 +4260,145 @@ class OrchestratorAsync:
         for inst in list(self._instances.values()):
             await inst.start()
 
+        await self._start_sharded_runtime()
+
         # Main loop
         self._main_task = asyncio.create_task(self._main_loop())
         logger.info("✅ OrchestratorAsync démarré (P4: hot/cold path actif)")
 
+    async def _start_sharded_runtime(self) -> None:
+        """Spawn CPU-pinned shard workers when SHARDED_RUNTIME_WORKERS > 0."""
+        workers = _env_int("SHARDED_RUNTIME_WORKERS", 0, 0)
+        if workers <= 0:
+            return
+        handler = os.getenv("SHARDED_RUNTIME_HANDLER", "").strip()
+        if not handler:
+            logger.warning(
+                "SHARDED_RUNTIME_WORKERS=%d ignored: SHARDED_RUNTIME_HANDLER is not set", workers
+            )
+            return
+        # A symbol is owned by exactly one path: a local instance or a shard.
+        # Running both would process every tick twice and let both emit orders.
+        local_symbols = {
+            str(getattr(inst.config, "symbol", "")).upper() for inst in self._instances.values()
+        }
+        symbols: List[str] = []
+        for symbol in os.getenv("SHARDED_RUNTIME_SYMBOLS", "").split(","):
+            symbol = symbol.strip()
+            if not symbol:
+                continue
+            if symbol.upper() in local_symbols:
+                logger.warning("Sharded runtime: %s already has a local instance, not sharded", symbol)
+                continue
+            symbols.append(symbol)
+        if not symbols:
+            logger.warning("Sharded runtime disabled: no SHARDED_RUNTIME_SYMBOLS without a local instance")
+            return
+        logger.warning("🧪 Sharded runtime expérimental activé: %d workers, %s", workers, ",".join(symbols))
+        cores = [
+            int(core) for core in os.getenv("SHARDED_RUNTIME_CORES", "").split(",") if core.strip().isdigit()
+        ]
+        runtime = ShardedRuntime(symbols, handler, workers=workers, cores=cores or None)
+        await asyncio.to_thread(runtime.start)
+        await runtime.attach(self.ring_dispatcher)
+        self.sharded_runtime = runtime
+        self.background_tasks.start(
+            {"shard_events": lambda: runtime.run_event_pump(self._handle_shard_event)}
+        )
+
+    def _shard_order_block_reason(self, instance_id: Optional[str]) -> Optional[str]:
+        """Kill-switch and risk gate applied to worker orders, as to local signals."""
+        if self.safety_guard.emergency_mode:
+            return "emergency_mode"
+        if self._shard_orders_halted:
+            return "emergency_stop_all"
+        if self._global_kill_store is None:
+            return "global_kill_switch_unavailable"
+        try:
+            state = self._global_kill_store.get()
+        except Exception as exc:
+            logger.error("Kill switch illisible, ordre shard bloqué: %s", exc)
+            return "global_kill_switch_unavailable"
+        if state.tripped:
+            return f"kill_switch_active:{state.reason_code or 'unknown'}"
+        if instance_id and not self.risk.can_emit_trade_action(instance_id):
+            return "trade_action_throttled"
+        return None
+
+    def _shard_state_fields(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate a worker ``state`` payload against ``save_instance_state``.
+
+        Raises:
+            ValueError: On unknown or missing fields, bad types, or an
+                instance id owned by a local instance.
+        """
+        unknown = set(payload) - _SHARD_STATE_FIELDS
+        if unknown:
+            raise ValueError(f"unknown fields {sorted(unknown)}")
+        missing = _SHARD_STATE_REQUIRED - set(payload)
+        if missing:
+            raise ValueError(f"missing fields {sorted(missing)}")
+        instance_id = payload["instance_id"]
+        if not isinstance(instance_id, str) or not instance_id.strip():
+            raise ValueError("instance_id must be a non-empty string")
+        if instance_id in self._instances:
+            raise ValueError(f"instance_id {instance_id} belongs to a local instance")
+        if not isinstance(payload["status"], str) or not payload["status"]:
+            raise ValueError("status must be a non-empty string")
+        fields: Dict[str, Any] = {"instance_id": instance_id, "status": payload["status"]}
+        for name in ("current_capital", "allocated_capital", "initial_capital"):
+            value = payload.get(name)
+            if value is None and name == "initial_capital":
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+                raise ValueError(f"{name} must be a finite number")
+            fields[name] = float(value)
+        for name in ("win_count", "loss_count"):
+            value = payload[name]
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise ValueError(f"{name} must be a non-negative integer")
+            fields[name] = value
+        return fields
+
+    async def _handle_shard_event(self, event: ShardEvent) -> None:
+        """Single ordered sink for shard output: orders → router, state → persistence."""
+        payload = event.payload
+        if event.kind == "order":
+            order = payload["order"]
+            instance_id = payload.get("instance_id")
+            blocked = self._shard_order_block_reason(instance_id)
+            if blocked is not None:
+                logger.error(
+                    "🛑 Ordre shard %d bloqué (%s): %s %s",
+                    event.shard_id, blocked, order.get("type"), order.get("symbol"),
+                )
+                return
+            router = await get_order_router()
+            result = await router.submit(order, instance_id=instance_id)
+            if result.success:
+                if instance_id:
+                    self._mark_trade_action(instance_id)
+            else:
+                logger.warning(
+                    "❌ Ordre shard %d rejeté: %s %s — %s",
+                    event.shard_id, order.get("type"), order.get("symbol"), result.error,
+                )
+        elif event.kind == "state":
+            try:
+                fields = self._shard_state_fields(payload)
+            except ValueError as exc:
+                logger.warning("État shard %d ignoré: %s", event.shard_id, exc)
+                return
+            await get_persistence().save_instance_state(**fields)
+        elif event.kind == "error":
+            logger.warning(
+                "Shard %d handler error on %s: %s",
+                event.shard_id, payload.get("symbol"), payload.get("error"),
+            )
+        else:
+            logger.debug("Shard %d event %s ignored", event.shard_id, event.kind)
+
     async def _connect_ring_dispatcher_with_retry(self) -> None:
         max_attempts = max(1, int(os.getenv("WS_CONNECT_RETRIES", "6")))
         delay_s = max(0.5, float(os.getenv("WS_CONNECT_RETRY_DELAY_S", "5.0")))
@@ -4404,6 +4599,10 @@ class OrchestratorAsync:
             self._rebalance_task = None
             self._auto_evolution_task = None
 
+            if self.sharded_runtime is not None:
+                self.sharded_runtime.detach()
+                await asyncio.to_thread(self.sharded_runtime.stop)
+
             for inst in list(self._instances.values()):
                 await inst.stop()  # Each instance drains its queue + cancels consumer task
 
@@ -4420,6 +4619,8 @@ class OrchestratorAsync:
             await self.module_manager.stop()
             self.decision_journal.close()
 
+            if self.account_reconciler is not None:
+                await self.account_reconciler.close()
             await self.order_executor.close()
 
             # P4: Stop cold scheduler then re-enable GC
@@ -4438,6 +4639,8 @@ class OrchestratorAsync:
 
     async def emergency_stop_all(self) -> None:
         logger.error("🚨🚨🚨 EMERGENCY STOP ALL!")
+        # Shard workers are not instances: their orders are refused instead.
+        self._shard_orders_halted = True
         stopped = 0
         for inst in list(self._instances.values()):
             try:
@@ -4449,10 +4652,30 @@ class OrchestratorAsync:
         if self._on_alert:
             self._on_alert("EMERGENCY_STOP_ALL", None)
 
+    def acknowledge_shard_orders(self, operator_id: str) -> bool:
+        """Re-arm worker orders halted by :meth:`emergency_stop_all` after a kill-switch acknowledgement."""
+        if not self._shard_orders_halted:
+            return False
+        self._shard_orders_halted = False
+        logger.warning("✅ Ordres shard réarmés par %s", operator_id)
+        return True
+
     # ------------------------------------------------------------------
     # Status
     # ------------------------------------------------------------------
 
+    def _account_reconciler_status(self) -> Dict[str, Any]:
+        if self.account_reconciler is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.account_reconciler.status()}
+
+    def _decision_journal_status(self) -> Dict[str, Any]:
+        journal_status = getattr(self.decision_journal, "get_status", None)
+        status = dict(journal_status()) if callable(journal_status) else {}
+        status["enabled"] = bool(self._decision_journal_enabled)
+        status["path"] = str(getattr(self.decision_journal, "path", ""))
+        return status
+
     def get_status(self) -> Dict:
         status = {
             "running": self.running,
@@ -4470,15 +4693,13 @@ class OrchestratorAsync:
                 "trade_action_min_interval_s": self.trade_action_min_interval_s,
                 "max_repeated_auto_actions": self.max_repeated_auto_actions,
             },
+            "account_reconciler": self._account_reconciler_status(),
             "module_backoff": dict(self._module_backoff),
             "pair_risk_state": {
                 k: v for k, v in list(self._pair_risk_state.items())[:20]
             },
             "hardening_flags": dict(self.hardening_flags),
-            "decision_journal": {
-                "enabled": bool(self._decision_journal_enabled),
-                "path": str(getattr(self.decision_journal, "path", "")),
-            },
+            "decision_journal": self._decision_journal_status(),
             "decision_policy": dict(self.decision_policy),
             "loop_metrics_ms": dict(self._loop_metrics),
             "decision_stats": dict(self._decision_stats),
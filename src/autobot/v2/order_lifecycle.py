@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Iterable, Mapping, Optional
 
 
 TERMINAL_ORDER_STATUSES = frozenset({"FILLED", "CANCELED", "REJECTED", "EXPIRED"})
@@ -13,6 +13,9 @@ _STATUS_ALIASES = {
     "CANCELLED": "CANCELED",
 }
 
+# Statuses the non-terminal ``orders`` query excludes; it compares them verbatim.
+_CLOSED_ROW_STATUSES = frozenset({"FILLED", "CANCELED", "CANCELLED", "REJECTED", "EXPIRED"})
+
 _ALLOWED_TRANSITIONS = {
     "NEW": frozenset({"SENT", "CANCELED", "REJECTED"}),
     "SENT": frozenset({"ACK", "CANCELED", "REJECTED", "EXPIRED", "UNKNOWN"}),
@@ -54,3 +57,58 @@ def is_allowed_order_transition(from_status: object, to_status: object) -> bool:
         return False
     return normalized_to in _ALLOWED_TRANSITIONS[normalized_from]
 
+
+def is_active_order_row(status: object, terminal_at: object = None) -> bool:
+    """Return whether an ``orders`` row is one the non-terminal query selects."""
+
+    return status is not None and status not in _CLOSED_ROW_STATUSES and terminal_at is None
+
+
+class ActiveOrderIndex:
+    """Non-terminal persisted orders by client order id and ``(symbol, side)``.
+
+    It holds exactly the rows the non-terminal ``orders`` query returns, so a
+    duplicate-order check is a dictionary lookup instead of a table scan.  The
+    order repository builds it once and updates it with every order write.
+    """
+
+    def __init__(self, rows: Iterable[Mapping[str, Any]] = ()) -> None:
+        self._orders: dict[str, tuple[Any, Any]] = {}
+        self._by_market: dict[tuple[Any, Any], set[str]] = {}
+        for row in rows:
+            self.record(
+                row.get("client_order_id"),
+                row.get("symbol"),
+                row.get("side"),
+                row.get("status"),
+                row.get("terminal_at"),
+            )
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, client_order_id: object) -> bool:
+        return client_order_id in self._orders
+
+    def record(self, client_order_id: str, symbol: Any, side: Any, status: object, terminal_at: object = None) -> None:
+        """Store the persisted state of one created or rewritten order row."""
+
+        self.discard(client_order_id)
+        if is_active_order_row(status, terminal_at):
+            self._orders[client_order_id] = (symbol, side)
+            self._by_market.setdefault((symbol, side), set()).add(client_order_id)
+
+    def discard(self, client_order_id: str) -> None:
+        market = self._orders.pop(client_order_id, None)
+        if market is None:
+            return
+        orders = self._by_market[market]
+        orders.discard(client_order_id)
+        if not orders:
+            del self._by_market[market]
+
+    def has_active(self, symbol: Any, side: Any) -> bool:
+        return (symbol, side) in self._by_market
+
+    def active_orders(self, symbol: Any, side: Any) -> frozenset[str]:
+        return frozenset(self._by_market.get((symbol, side), ()))
@@ -36,6 +36,7 @@ from enum import IntEnum
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
 
 from .order_executor_async import OrderExecutorAsync, OrderResult, OrderSide
+from .hot_path_optimizer import get_hot_path_optimizer
 from .modules.rate_limit_optimizer import CallPriority
 from .runtime_execution_mode import observation_only_runtime
 from .speculative_order_cache import SpeculativeOrderCache
@@ -372,6 +373,7 @@ class OrderRouter:
         # Stats
         self._stats = RouterStats()
         self._stats_lock = asyncio.Lock()
+        self._stage_latency = get_hot_path_optimizer().stages
         
         # Callbacks
         self._on_order_executed: Optional[Callable[[OrderRequest, OrderResult], None]] = None
@@ -662,8 +664,15 @@ class OrderRouter:
                         await asyncio.sleep(wait_needed)
                 
                 # Exécuter l'ordre
+                symbol = request.params.get("symbol")
+                strategy = request.params.get("strategy_id")
+                self._stage_latency.record(
+                    "router_queue_wait", int(wait_time_ms * 1_000_000), symbol, strategy
+                )
                 start_time = time.monotonic()
+                stage_start = self._stage_latency.mark()
                 result = await self._execute_request(request)
+                self._stage_latency.lap("router_execute", stage_start, symbol, strategy)
                 execution_time_ms = (time.monotonic() - start_time) * 1000
                 
                 # Mettre à jour les stats
@@ -172,6 +172,11 @@ class PersistedOrderStateMachine:
         return await self.transition(client_order_id, "UNKNOWN", reason, **kwargs)
 
     async def is_duplicate_active(self, symbol: str, side: str) -> bool:
+        reader = getattr(self._persistence, "active_order_index", None)
+        if callable(reader):
+            index = await reader()
+            if index is not None:
+                return index.has_active(symbol, side)
         for row in await self.recover_non_terminal():
             if row.get("symbol") == symbol and row.get("side") == side:
                 return True
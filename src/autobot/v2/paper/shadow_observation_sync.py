@@ -26,6 +26,12 @@ from autobot.v2.research.high_conviction_portfolio import (
     write_high_conviction_portfolio_report,
 )
 from autobot.v2.research.trade_journal import TradeRecord
+from autobot.v2.sqlite_access import (
+    SQLitePragmas,
+    busy_retry_delay_seconds,
+    is_sqlite_busy_error,
+    shared_sqlite_pool,
+)
 from autobot.v2.paper.opportunity_score_v2 import (
     FORBIDDEN_SCORE_V2_CONTAINER_KEYS,
     FORBIDDEN_SCORE_V2_KEYS,
@@ -182,10 +188,16 @@ def sync_shadow_paper_observations(
     registry_payload = load_registry(config.registry_path)
     generated_at = config.generated_at.isoformat()
 
-    state_conn = sqlite3.connect(config.state_db_path, timeout=SHADOW_SYNC_SQLITE_BUSY_TIMEOUT_SECONDS)
-    state_conn.row_factory = sqlite3.Row
-    try:
-        state_conn.execute(f"PRAGMA busy_timeout={int(SHADOW_SYNC_SQLITE_BUSY_TIMEOUT_SECONDS * 1000)}")
+    state_pool = shared_sqlite_pool(
+        config.state_db_path,
+        timeout_seconds=SHADOW_SYNC_SQLITE_BUSY_TIMEOUT_SECONDS,
+        pragmas=SQLitePragmas.from_env(
+            busy_timeout_ms=int(SHADOW_SYNC_SQLITE_BUSY_TIMEOUT_SECONDS * 1000),
+            journal_mode=None,
+        ),
+        row_factory=sqlite3.Row,
+    )
+    with state_pool.checkout() as state_conn:
         _run_state_write_with_retry(
             state_conn,
             "ensure_trade_ledger_schema",
@@ -224,8 +236,6 @@ def sync_shadow_paper_observations(
             source_results.append(_unsynced_source_result(registry_payload, source))
         accumulation = _build_accumulation(state_conn, now=config.generated_at)
         score_coverage = _build_score_coverage(state_conn)
-    finally:
-        state_conn.close()
 
     report = ShadowPaperObservationSyncReport(
         run_id=config.resolved_run_id,
@@ -286,9 +296,13 @@ def _sync_source(
             warnings=("source_db_missing",),
         )
 
-    source_conn = sqlite3.connect(source_path)
-    source_conn.row_factory = sqlite3.Row
-    try:
+    source_pool = shared_sqlite_pool(
+        source_path,
+        timeout_seconds=5.0,
+        pragmas=SQLitePragmas.from_env(busy_timeout_ms=5_000, journal_mode=None),
+        row_factory=sqlite3.Row,
+    )
+    with source_pool.checkout() as source_conn:
         if not _table_exists(source_conn, source["table"]):
             return ShadowSyncSourceResult(
                 strategy_id=strategy_id,
@@ -299,8 +313,6 @@ def _sync_source(
                 warnings=("source_table_missing",),
             )
         rows = _select_shadow_source_rows(source_conn, source["table"])
-    finally:
-        source_conn.close()
 
     reason_counts: dict[str, int] = defaultdict(int)
     inserted = 0
@@ -713,8 +725,7 @@ def _select_shadow_source_rows(conn: sqlite3.Connection, table: str) -> list[sql
 
 
 def _is_sqlite_busy_error(exc: sqlite3.OperationalError) -> bool:
-    message = str(exc).lower()
-    return "database is locked" in message or "database is busy" in message
+    return is_sqlite_busy_error(exc)
 
 
 def _run_state_write_with_retry(
@@ -753,7 +764,7 @@ def _run_state_write_with_retry(
                 raise sqlite3.OperationalError(
                     f"shadow sync rollback failed after {label}: {type(rollback_exc).__name__}"
                 ) from rollback_exc
-            sleeper(retry_base_delay_seconds * (2**attempt))
+            sleeper(busy_retry_delay_seconds(retry_base_delay_seconds, attempt))
     raise AssertionError("shadow sync SQLite retry loop exhausted unexpectedly")
 
 
@@ -0,0 +1,248 @@
+"""Sliding-window buy counters for the paper symbol concentration guard.
+
+The guard used to open a SQLite connection for every buy signal and group the
+whole ``trade_ledger`` by symbol behind a ``julianday()`` filter that no index
+can serve, all on the event loop.  :class:`SymbolBuyWindow` keeps the same
+per-symbol counts in memory: it is seeded from the ledger once, then fed by
+``StatePersistence.append_trade_ledger`` for every buy leg it inserts, and
+entries fall out as the window slides.
+
+Other writers, such as the shadow observation sync in another process, insert
+ledger rows without going through this process.  The window keeps the highest
+ledger ``rowid`` it has read as a watermark; :meth:`SymbolBuyWindow.refresh`
+reads the rows above it when the database or its WAL file changed on disk, and
+rows at or below it are never counted twice.  The catch-up is a cold-path
+read: callers claim it at most once per ``catch_up_seconds`` through
+:meth:`SymbolBuyWindow.claim_catch_up` and run it off the event loop, while
+this process's own buys reach the window directly through ``record()``.
+
+Windows are shared per state database and window length through
+:func:`shared_buy_window`, so every instance and signal handler of the process
+reads and feeds the same counters.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from bisect import insort
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+_SEED_SQL = """
+    SELECT rowid, symbol, created_at
+    FROM trade_ledger
+    WHERE rowid > ? AND rowid <= ?
+      AND lower(side) = 'buy'
+      AND julianday(replace(substr(created_at, 1, 19), 'T', ' '))
+          >= julianday('now', ?)
+    ORDER BY created_at
+"""
+
+_FileSignature = Tuple[Tuple[int, int], ...]
+
+_CATCH_UP_SECONDS = 30.0
+
+_WINDOWS: Dict[Tuple[str, float], "SymbolBuyWindow"] = {}
+_WINDOWS_LOCK = threading.Lock()
+
+
+def ledger_epoch(created_at: str) -> Optional[float]:
+    """Parse a ledger ``created_at`` the way the SQL filter reads it.
+
+    Only the first 19 characters are used and they are taken as UTC, which is
+    what ``julianday(replace(substr(created_at, 1, 19), 'T', ' '))`` does.
+    """
+    try:
+        parsed = datetime.strptime(str(created_at)[:19].replace("T", " "), "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=timezone.utc).timestamp()
+
+
+class SymbolBuyWindow:
+    """Buy legs per symbol over the trailing ``window_seconds``.
+
+    Appends come from the persistence layer and reads from signal handlers,
+    possibly on different threads, so every operation takes a short lock.
+    """
+
+    def __init__(self, window_seconds: float, catch_up_seconds: float = _CATCH_UP_SECONDS) -> None:
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        self.window_seconds = float(window_seconds)
+        self.catch_up_seconds = max(0.0, float(catch_up_seconds))
+        self.seeded = False
+        self.watermark = 0
+        self._events: Deque[Tuple[float, str]] = deque()
+        self._counts: Dict[str, int] = {}
+        # Ledger ids above the watermark already counted through record().
+        self._recorded: Set[int] = set()
+        self._signature: Optional[_FileSignature] = None
+        self._catch_up_claimed_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def seed(self, db_path: Union[str, Path]) -> bool:
+        """Load the buys of the current window from ``trade_ledger`` once.
+
+        Returns ``False`` while the ledger table does not exist yet; the next
+        call tries again.  Query errors propagate to the caller.
+        """
+        return self._read_ledger(db_path)
+
+    def refresh(self, db_path: Union[str, Path]) -> bool:
+        """Seed the window, or count ledger rows written since the last read.
+
+        The ledger is only queried when the database or its WAL file changed
+        on disk since the previous read, so an idle ledger costs two ``stat``
+        calls.  Returns ``False`` while the ledger table does not exist yet.
+        """
+        signature = _file_signature(db_path)
+        with self._lock:
+            if self.seeded and signature == self._signature:
+                return True
+        if not self._read_ledger(db_path):
+            return False
+        with self._lock:
+            self._signature = signature
+        return True
+
+    def claim_catch_up(self, now: Optional[float] = None) -> bool:
+        """Return ``True`` for one caller per ``catch_up_seconds`` once seeded.
+
+        The caller that wins runs :meth:`refresh` off the event loop; everyone
+        else keeps reading the in-memory counts.
+        """
+        at = time.monotonic() if now is None else now
+        with self._lock:
+            if not self.seeded or at - self._catch_up_claimed_at < self.catch_up_seconds:
+                return False
+            self._catch_up_claimed_at = at
+            return True
+
+    def record(self, symbol: str, created_at: str, ledger_id: Optional[int] = None) -> None:
+        """Count one buy leg appended to the ledger.
+
+        Ignored until the window is seeded, and for ids at or below the
+        watermark: the ledger reads count those rows themselves.
+        """
+        at = ledger_epoch(created_at)
+        if at is None:
+            return
+        with self._lock:
+            if not self.seeded:
+                return
+            if ledger_id is not None:
+                if ledger_id <= self.watermark or ledger_id in self._recorded:
+                    return
+                self._recorded.add(ledger_id)
+            self._add(str(symbol or "").upper(), at)
+
+    def counts(self, now: Optional[float] = None) -> Tuple[Dict[str, int], int]:
+        """Return ``(buys by symbol, total buys)`` inside the window."""
+        cutoff = (time.time() if now is None else now) - self.window_seconds
+        with self._lock:
+            events = self._events
+            while events and events[0][0] < cutoff:
+                _, symbol = events.popleft()
+                remaining = self._counts[symbol] - 1
+                if remaining:
+                    self._counts[symbol] = remaining
+                else:
+                    del self._counts[symbol]
+            return dict(self._counts), len(events)
+
+    def _read_ledger(self, db_path: Union[str, Path]) -> bool:
+        with self._lock:
+            after = self.watermark
+        with sqlite3.connect(str(db_path), timeout=2.0) as conn:
+            table_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='trade_ledger'"
+            ).fetchone()
+            if not table_exists:
+                return False
+            # Rows committed after this read are above the new watermark and
+            # are picked up by record() or the next refresh.
+            upto = int(conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM trade_ledger").fetchone()[0])
+            rows: List[Tuple[int, str, str]] = conn.execute(
+                _SEED_SQL, (after, upto, f"-{self.window_seconds / 60.0} minutes")
+            ).fetchall()
+        with self._lock:
+            for ledger_id, symbol, created_at in rows:
+                if ledger_id <= self.watermark or ledger_id in self._recorded:
+                    continue
+                at = ledger_epoch(created_at)
+                if at is not None:
+                    self._add(str(symbol or "").upper(), at)
+            if upto > self.watermark:
+                self.watermark = upto
+                self._recorded = {ledger_id for ledger_id in self._recorded if ledger_id > upto}
+            if not self.seeded:
+                self._catch_up_claimed_at = time.monotonic()
+            self.seeded = True
+        return True
+
+    def _add(self, symbol: str, at: float) -> None:
+        if self._events and at < self._events[-1][0]:
+            # Rows from other writers can be older than the newest event.
+            insort(self._events, (at, symbol))
+        else:
+            self._events.append((at, symbol))
+        self._counts[symbol] = self._counts.get(symbol, 0) + 1
+
+
+def _file_signature(db_path: Union[str, Path]) -> _FileSignature:
+    signature = []
+    for path in (str(db_path), f"{db_path}-wal"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signature.append((0, 0))
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _db_key(db_path: Union[str, Path]) -> str:
+    return os.path.abspath(str(db_path))
+
+
+def shared_buy_window(db_path: Union[str, Path], window_seconds: float) -> SymbolBuyWindow:
+    """Return the process-wide window for ``db_path`` and ``window_seconds``."""
+    key = (_db_key(db_path), float(window_seconds))
+    with _WINDOWS_LOCK:
+        window = _WINDOWS.get(key)
+        if window is None:
+            window = _WINDOWS[key] = SymbolBuyWindow(window_seconds)
+        return window
+
+
+def record_ledger_buy(
+    db_path: Union[str, Path],
+    symbol: Optional[str],
+    side: Optional[str],
+    created_at: str,
+    ledger_id: Optional[int] = None,
+) -> None:
+    """Feed one inserted ``trade_ledger`` leg to every window of its database."""
+    if str(side or "").lower() != "buy":
+        return
+    db_key = _db_key(db_path)
+    with _WINDOWS_LOCK:
+        windows = [window for (path, _), window in _WINDOWS.items() if path == db_key]
+    for window in windows:
+        window.record(str(symbol or ""), created_at, ledger_id)
+
+
+def reset_buy_windows() -> None:
+    """Forget every shared window (tests and state database swaps)."""
+    with _WINDOWS_LOCK:
+        _WINDOWS.clear()
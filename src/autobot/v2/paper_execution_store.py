@@ -0,0 +1,436 @@
+"""Buffered SQLite persistence for the paper trading executor.
+
+``PaperTradingExecutor`` used to open a connection, ``INSERT OR REPLACE`` and
+commit for every fill, and to reconnect for every status lookup, all from the
+event loop.  :class:`PaperExecutionStore` moves the writes to one writer
+thread that owns a long-lived pooled connection and commits queued fills and
+cancellations in periodic batches.  Open orders and the most recent trades are
+kept in an in-memory index so status lookups never touch SQLite.
+
+Aggregating reads (balance, closed orders, summary) first wait for the queue
+to drain so they keep read-your-writes semantics, then run on the caller's
+pooled connection; async callers go through :meth:`PaperExecutionStore.read`,
+which does both in a worker thread.  ``close`` drains the queue, and an
+``atexit`` hook drains every store still open when the interpreter exits.
+
+A batch that fails to commit stays queued and is retried.  Until it lands
+the store is failed: new writes and flushes raise
+:class:`PaperExecutionStoreError`, so the index never runs ahead of disk
+silently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from .sqlite_access import SQLitePragmas, shared_sqlite_pool
+
+
+logger = logging.getLogger(__name__)
+
+TRADE_COLUMNS: Tuple[str, ...] = (
+    "id", "txid", "symbol", "side", "volume", "price", "fees", "timestamp", "status",
+    "userref", "liquidity", "strategy_id", "timeframe", "signal_source", "decision_id",
+    "signal_id", "regime", "slippage_bps", "gross_pnl", "net_pnl",
+)
+_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO trades ({', '.join(TRADE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in TRADE_COLUMNS)})"
+)
+_CANCEL_TXID_SQL = "UPDATE trades SET status = 'cancelled' WHERE txid = ? AND status = 'pending'"
+_CANCEL_USERREF_SQL = "UPDATE trades SET status = 'cancelled' WHERE userref = ? AND status = 'pending'"
+_CANCEL_ALL_SQL = "UPDATE trades SET status = 'cancelled' WHERE status = 'pending'"
+
+_LIVE_STORES: "weakref.WeakSet[PaperExecutionStore]" = weakref.WeakSet()
+
+# One queued write: the SQL statement and its parameters.  Consecutive
+# operations with the same statement are sent in one ``executemany``.
+_Operation = Tuple[str, Tuple[Any, ...]]
+
+T = TypeVar("T")
+
+
+class PaperExecutionStoreError(RuntimeError):
+    """Queued paper trade writes could not be committed to SQLite."""
+
+
+class PaperExecutionStore:
+    """Write-behind trade store with an in-memory order index.
+
+    ``record`` and the ``cancel_*`` methods only update the index and enqueue
+    the write; they never block on disk.  The index belongs to the thread that
+    drives the executor (the event loop) and is not locked.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        flush_interval_seconds: float = 0.05,
+        max_batch_size: int = 512,
+        recent_trade_limit: int = 4096,
+        timeout_seconds: float = 30.0,
+        retry_interval_seconds: float = 1.0,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.flush_interval_seconds = max(0.0, float(flush_interval_seconds))
+        self.retry_interval_seconds = max(0.01, float(retry_interval_seconds))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.recent_trade_limit = max(1, int(recent_trade_limit))
+        self._pool = shared_sqlite_pool(
+            self.db_path,
+            timeout_seconds=timeout_seconds,
+            pragmas=SQLitePragmas.from_env(busy_timeout_ms=max(1, int(timeout_seconds * 1000))),
+        )
+
+        self._open_orders: Dict[str, Tuple[Any, ...]] = {}
+        self._recent: "OrderedDict[str, Tuple[Any, ...]]" = OrderedDict()
+        self._latest_by_userref: Dict[int, str] = {}
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: Deque[Tuple[float, _Operation]] = deque()
+        self._closing = False
+        self._busy = False
+        self._flush_requested = False
+        self._failure: Optional[BaseException] = None
+        self._stats: Dict[str, Any] = {
+            "enqueued": 0,
+            "written": 0,
+            "write_errors": 0,
+            "retries": 0,
+            "batches": 0,
+            "max_batch_size": 0,
+            "max_lag_ms": 0.0,
+            "index_hits": 0,
+            "index_misses": 0,
+        }
+        self._load_open_orders()
+        self._writer: Optional[threading.Thread] = threading.Thread(
+            target=self._run_writer,
+            name="paper-execution-writer",
+            daemon=True,
+        )
+        self._writer.start()
+        _LIVE_STORES.add(self)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(self, row: Tuple[Any, ...]) -> None:
+        """Index one trade row (``TRADE_COLUMNS`` order) and queue its upsert."""
+
+        self._raise_if_failed()
+        txid = row[1]
+        if row[8] == "pending":
+            self._open_orders[txid] = row
+        else:
+            self._open_orders.pop(txid, None)
+        self._remember(row)
+        self._enqueue((_UPSERT_SQL, row))
+
+    def cancel_order(self, txid: str) -> None:
+        self._raise_if_failed()
+        row = self._open_orders.pop(txid, None)
+        if row is not None:
+            self._remember(_with_status(row, "cancelled"))
+        self._enqueue((_CANCEL_TXID_SQL, (txid,)))
+
+    def cancel_all_orders(self, userref: Optional[int] = None) -> None:
+        self._raise_if_failed()
+        for txid, row in list(self._open_orders.items()):
+            if userref and row[9] != userref:
+                continue
+            del self._open_orders[txid]
+            self._remember(_with_status(row, "cancelled"))
+        if userref:
+            self._enqueue((_CANCEL_USERREF_SQL, (userref,)))
+        else:
+            self._enqueue((_CANCEL_ALL_SQL, ()))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every write queued so far is committed.
+
+        Raises :class:`PaperExecutionStoreError` while a failed batch is
+        still waiting to be retried.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        with self._wakeup:
+            self._raise_if_failed_locked()
+            if not self._pending and not self._busy:
+                return True
+            if self._writer is None or not self._writer.is_alive():
+                return not self._pending
+            self._flush_requested = True
+            self._wakeup.notify_all()
+            while self._pending or self._busy or self._flush_requested:
+                self._raise_if_failed_locked()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0.0:
+                    return False
+                if self._writer is None or not self._writer.is_alive():
+                    return False
+                self._wakeup.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Commit every queued write and stop the writer thread.
+
+        Raises :class:`PaperExecutionStoreError` if the final commit fails.
+        """
+
+        with self._wakeup:
+            self._closing = True
+            self._wakeup.notify_all()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        self._writer = None
+        _LIVE_STORES.discard(self)
+        self._raise_if_failed()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def read(self, query: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``query`` on a drained store from a worker thread (async callers)."""
+
+        return await asyncio.to_thread(self._read, query)
+
+    async def get_async(self, txid: str) -> Optional[Tuple[Any, ...]]:
+        """:meth:`get` that leaves the event loop only on an index miss."""
+
+        row = self._open_orders.get(txid) or self._recent.get(txid)
+        if row is not None:
+            self._count("index_hits")
+            return row
+        return await asyncio.to_thread(self.get, txid)
+
+    async def latest_for_userref_async(self, userref: int) -> Optional[Tuple[Any, ...]]:
+        txid = self._latest_by_userref.get(userref)
+        row = self._recent.get(txid) if txid is not None else None
+        if row is not None:
+            self._count("index_hits")
+            return row
+        return await asyncio.to_thread(self.latest_for_userref, userref)
+
+    def get(self, txid: str) -> Optional[Tuple[Any, ...]]:
+        """Return the trade row for ``txid`` from the index, then SQLite."""
+
+        row = self._open_orders.get(txid) or self._recent.get(txid)
+        if row is not None:
+            self._count("index_hits")
+            return row
+        self._count("index_misses")
+        with self.reader() as conn:
+            return conn.execute("SELECT * FROM trades WHERE txid = ?", (txid,)).fetchone()
+
+    def latest_for_userref(self, userref: int) -> Optional[Tuple[Any, ...]]:
+        txid = self._latest_by_userref.get(userref)
+        row = self._recent.get(txid) if txid is not None else None
+        if row is not None:
+            self._count("index_hits")
+            return row
+        self._count("index_misses")
+        with self.reader() as conn:
+            return conn.execute(
+                """
+                SELECT * FROM trades
+                WHERE userref = ?
+                ORDER BY datetime(timestamp) DESC
+                LIMIT 1
+                """,
+                (userref,),
+            ).fetchone()
+
+    def open_orders(self) -> List[Tuple[Any, ...]]:
+        return list(self._open_orders.values())
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Drain queued writes, then borrow this thread's pooled connection."""
+
+        self.flush()
+        with self._pool.checkout() as conn:
+            yield conn
+
+    def get_status(self) -> Dict[str, Any]:
+        """Writer and index counters for monitoring."""
+
+        with self._lock:
+            status = dict(self._stats)
+            status["pending"] = len(self._pending)
+            oldest = self._pending[0][0] if self._pending else None
+        status["lag_ms"] = round((time.monotonic() - oldest) * 1000.0, 3) if oldest is not None else 0.0
+        status["open_orders"] = len(self._open_orders)
+        status["indexed_trades"] = len(self._recent)
+        status["closed"] = self._writer is None
+        status["failed"] = self._failure is not None
+        return status
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _load_open_orders(self) -> None:
+        with self._pool.checkout() as conn:
+            rows = conn.execute(
+                "SELECT * FROM trades WHERE status = 'pending' ORDER BY datetime(timestamp)"
+            ).fetchall()
+        for row in rows:
+            row = tuple(row[: len(TRADE_COLUMNS)])
+            self._open_orders[row[1]] = row
+            self._remember(row)
+
+    def _remember(self, row: Tuple[Any, ...]) -> None:
+        txid = row[1]
+        self._recent[txid] = row
+        self._recent.move_to_end(txid)
+        if row[9] is not None:
+            self._latest_by_userref[row[9]] = txid
+        while len(self._recent) > self.recent_trade_limit:
+            evicted, evicted_row = self._recent.popitem(last=False)
+            if self._latest_by_userref.get(evicted_row[9]) == evicted:
+                del self._latest_by_userref[evicted_row[9]]
+
+    def _enqueue(self, operation: _Operation) -> None:
+        with self._wakeup:
+            if self._writer is None:
+                closed = True
+            else:
+                closed = False
+                self._pending.append((time.monotonic(), operation))
+                self._stats["enqueued"] += 1
+                if len(self._pending) == 1 or len(self._pending) >= self.max_batch_size:
+                    self._wakeup.notify_all()
+        if closed:
+            # Late writes after close() (e.g. a reused singleton) go straight
+            # to SQLite rather than being dropped.
+            self._commit([operation])
+
+    def _read(self, query: Callable[[sqlite3.Connection], T]) -> T:
+        with self.reader() as conn:
+            return query(conn)
+
+    def _raise_if_failed(self) -> None:
+        with self._lock:
+            self._raise_if_failed_locked()
+
+    def _raise_if_failed_locked(self) -> None:
+        failure = self._failure
+        if failure is not None:
+            raise PaperExecutionStoreError(
+                f"paper execution store {self.db_path}: {len(self._pending)} write(s) not committed "
+                f"({type(failure).__name__}: {failure})"
+            ) from failure
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._pending and not self._closing and not self._flush_requested:
+                    self._wakeup.wait()
+                # Let fills accumulate for one interval so a burst commits in
+                # a single transaction.
+                deadline = time.monotonic() + self.flush_interval_seconds
+                while (
+                    not self._closing
+                    and not self._flush_requested
+                    and len(self._pending) < self.max_batch_size
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0.0:
+                        break
+                    self._wakeup.wait(remaining)
+                batch = list(self._pending)
+                self._pending.clear()
+                self._flush_requested = False
+                self._busy = True
+            failed = False
+            try:
+                if batch:
+                    self._commit([operation for _, operation in batch])
+                    lag_ms = (time.monotonic() - batch[0][0]) * 1000.0
+                    with self._lock:
+                        self._failure = None
+                        self._stats["written"] += len(batch)
+                        self._stats["batches"] += 1
+                        self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(batch))
+                        self._stats["max_lag_ms"] = round(max(self._stats["max_lag_ms"], lag_ms), 3)
+            except Exception as exc:
+                failed = True
+                with self._lock:
+                    # Keep the batch at the head of the queue and fail the
+                    # store until a retry commits it; close() reports it.
+                    self._stats["write_errors"] += len(batch)
+                    self._pending.extendleft(reversed(batch))
+                    self._failure = exc
+                    if self._closing:
+                        logger.critical(
+                            "Paper execution writer failed while closing; %d write(s) not committed",
+                            len(self._pending),
+                        )
+                    else:
+                        logger.exception(
+                            "Paper execution writer failed; %d write(s) kept for retry", len(batch)
+                        )
+            finally:
+                with self._wakeup:
+                    self._busy = False
+                    done = self._closing and (failed or not self._pending)
+                    self._wakeup.notify_all()
+            if done:
+                self._pool.close_thread_connection()
+                return
+            if failed:
+                with self._wakeup:
+                    self._wakeup.wait_for(lambda: self._closing, self.retry_interval_seconds)
+                    self._stats["retries"] += 1
+
+    def _commit(self, operations: List[_Operation]) -> None:
+        def write() -> None:
+            with self._pool.transaction() as conn:
+                index = 0
+                while index < len(operations):
+                    sql = operations[index][0]
+                    end = index + 1
+                    while end < len(operations) and operations[end][0] == sql:
+                        end += 1
+                    conn.executemany(sql, [params for _, params in operations[index:end]])
+                    index = end
+
+        self._pool.run_with_busy_retries(
+            write,
+            label="paper_execution_store",
+            retries=5,
+            base_delay_seconds=0.05,
+        )
+
+
+def _with_status(row: Tuple[Any, ...], status: str) -> Tuple[Any, ...]:
+    return row[:8] + (status,) + row[9:]
+
+
+@atexit.register
+def _drain_live_stores() -> None:
+    for store in list(_LIVE_STORES):
+        try:
+            store.close()
+        except Exception:  # pragma: no cover - interpreter shutdown
+            logger.exception("Failed to drain paper execution store %s", store.db_path)
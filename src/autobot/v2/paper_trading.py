@@ -39,6 +39,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable, Coroutine
 
 from .order_executor import OrderResult, OrderSide, OrderStatus, OrderType
+from .paper_execution_store import PaperExecutionStore
 from .runtime_execution_mode import reject_paper_execution_component
 from .strategy_runtime_policy import canonical_order_append_block_reason
 
@@ -95,6 +96,10 @@ class PaperTradingExecutor:
     
     Au lieu d'appeler Kraken, simule l'exécution immédiate au prix du marché
     et persiste les trades dans SQLite pour analyse.
+
+    Les écritures passent par un :class:`PaperExecutionStore` (thread
+    d'écriture, transactions groupées) afin de ne jamais bloquer la boucle
+    asyncio ; appeler ``close()`` garantit que tout est committé.
     """
     
     def __init__(
@@ -151,6 +156,10 @@ class PaperTradingExecutor:
         self._on_trade_executed: Optional[Callable[[PaperTrade], None]] = None
         
         self._init_db()
+        self._store = PaperExecutionStore(
+            self.db_path,
+            flush_interval_seconds=_env_float("PAPER_STORE_FLUSH_INTERVAL_SECONDS", 0.05, 0.0, 5.0),
+        )
         logger.info(
             "PaperTradingExecutor initialised (capital=%.2f EUR, maker=%.2fbps, taker=%.2fbps, maker_realism=%s)",
             initial_capital,
@@ -889,23 +898,15 @@ class PaperTradingExecutor:
         }
 
     def _save_trade(self, trade: PaperTrade):
-        """Sauvegarde un trade dans SQLite."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO trades 
-                (id, txid, symbol, side, volume, price, fees, timestamp, status, userref, liquidity,
-                 strategy_id, timeframe, signal_source, decision_id, signal_id, regime,
-                 slippage_bps, gross_pnl, net_pnl)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade.id, trade.txid, trade.symbol, trade.side,
-                trade.volume, trade.price, trade.fees, trade.timestamp,
-                trade.status, trade.userref, trade.liquidity,
-                trade.strategy_id, trade.timeframe, trade.signal_source,
-                trade.decision_id, trade.signal_id, trade.regime,
-                trade.slippage_bps, trade.gross_pnl, trade.net_pnl,
-            ))
-            conn.commit()
+        """Indexe le trade et met son écriture SQLite en file (non bloquant)."""
+        self._store.record((
+            trade.id, trade.txid, trade.symbol, trade.side,
+            trade.volume, trade.price, trade.fees, trade.timestamp,
+            trade.status, trade.userref, trade.liquidity,
+            trade.strategy_id, trade.timeframe, trade.signal_source,
+            trade.decision_id, trade.signal_id, trade.regime,
+            trade.slippage_bps, trade.gross_pnl, trade.net_pnl,
+        ))
     
     # ------------------------------------------------------------------
     # Gestion des ordres (pour compatibilité API)
@@ -913,70 +914,40 @@ class PaperTradingExecutor:
     
     async def get_order_status(self, txid: str) -> Optional[OrderStatus]:
         """Récupère le statut d'un ordre paper."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                "SELECT * FROM trades WHERE txid = ?", (txid,)
-            ).fetchone()
-            
-            if not row:
-                return None
-            
-            return OrderStatus(
-                txid=row[1],  # txid
-                status=row[8],  # status
-                volume=row[4],  # volume
-                volume_exec=row[4] if row[8] == "filled" else 0.0,
-                price=row[5],
-                avg_price=row[5],
-                fee=row[6],
-            )
+        row = await self._store.get_async(txid)
+        if not row:
+            return None
+
+        return OrderStatus(
+            txid=row[1],  # txid
+            status=row[8],  # status
+            volume=row[4],  # volume
+            volume_exec=row[4] if row[8] == "filled" else 0.0,
+            price=row[5],
+            avg_price=row[5],
+            fee=row[6],
+        )
 
     async def get_open_orders(self) -> Dict[str, dict]:
         """Récupère les ordres paper encore ouverts, au format Kraken-like."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
-                "SELECT * FROM trades WHERE status = 'pending'"
-            ).fetchall()
-            return {row[1]: self._row_to_kraken_order(row) for row in rows}
+        return {row[1]: self._row_to_kraken_order(row) for row in self._store.open_orders()}
 
     async def find_order_by_userref(self, userref: int) -> Optional[tuple[str, dict]]:
         """Find a paper order by userref across pending and filled rows."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                """
-                SELECT * FROM trades
-                WHERE userref = ?
-                ORDER BY datetime(timestamp) DESC
-                LIMIT 1
-                """,
-                (userref,),
-            ).fetchone()
-            if not row:
-                return None
-            return row[1], self._row_to_kraken_order(row)
+        row = await self._store.latest_for_userref_async(userref)
+        if not row:
+            return None
+        return row[1], self._row_to_kraken_order(row)
     
     async def cancel_order(self, txid: str) -> bool:
         """Annule un ordre paper pending."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "UPDATE trades SET status = 'cancelled' WHERE txid = ? AND status = 'pending'",
-                (txid,)
-            )
-            conn.commit()
-            return True
+        self._store.cancel_order(txid)
+        return True
     
     async def cancel_all_orders(self, userref: Optional[int] = None) -> bool:
         """Annule tous les ordres paper pending."""
-        with sqlite3.connect(self.db_path) as conn:
-            if userref:
-                conn.execute(
-                    "UPDATE trades SET status = 'cancelled' WHERE userref = ? AND status = 'pending'",
-                    (userref,)
-                )
-            else:
-                conn.execute("UPDATE trades SET status = 'cancelled' WHERE status = 'pending'")
-            conn.commit()
-            return True
+        self._store.cancel_all_orders(userref)
+        return True
     
     # ------------------------------------------------------------------
     # Reconciliation helpers (compatibilité)
@@ -996,49 +967,49 @@ class PaperTradingExecutor:
             query += " AND symbol = ?"
             params.append(symbol)
         
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(query, params).fetchall()
-            
-            result = {}
-            for row in rows:
-                txid = row[1]
-                order = self._row_to_kraken_order(row)
-                order.update({
-                    "symbol": row[2],
-                    "side": row[3],
-                    "volume": row[4],
-                    "fees": row[6],
-                    "timestamp": row[7],
-                })
-                result[txid] = order
-            return result
+        rows = await self._store.read(lambda conn: conn.execute(query, params).fetchall())
+
+        result = {}
+        for row in rows:
+            txid = row[1]
+            order = self._row_to_kraken_order(row)
+            order.update({
+                "symbol": row[2],
+                "side": row[3],
+                "volume": row[4],
+                "fees": row[6],
+                "timestamp": row[7],
+            })
+            result[txid] = order
+        return result
     
     async def get_balance(self) -> Dict[str, float]:
         """Calcule le solde simulé basé sur les trades."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute("SELECT * FROM trades WHERE status = 'filled'").fetchall()
-            
-            eur_balance = self.initial_capital
-            asset_balances: Dict[str, float] = {}
-            
-            for row in rows:
-                side = row[3]
-                volume = row[4]
-                price = row[5]
-                fees = row[6]
-                
-                notional = volume * price
-                
-                if side == "buy":
-                    eur_balance -= notional + fees
-                    asset = self._asset_for_symbol(row[2])
-                    asset_balances[asset] = asset_balances.get(asset, 0.0) + volume
-                else:  # sell
-                    eur_balance += notional - fees
-                    asset = self._asset_for_symbol(row[2])
-                    asset_balances[asset] = asset_balances.get(asset, 0.0) - volume
-            
-            return {"ZEUR": eur_balance, **asset_balances}
+        rows = await self._store.read(
+            lambda conn: conn.execute("SELECT * FROM trades WHERE status = 'filled'").fetchall()
+        )
+
+        eur_balance = self.initial_capital
+        asset_balances: Dict[str, float] = {}
+
+        for row in rows:
+            side = row[3]
+            volume = row[4]
+            price = row[5]
+            fees = row[6]
+
+            notional = volume * price
+
+            if side == "buy":
+                eur_balance -= notional + fees
+                asset = self._asset_for_symbol(row[2])
+                asset_balances[asset] = asset_balances.get(asset, 0.0) + volume
+            else:  # sell
+                eur_balance += notional - fees
+                asset = self._asset_for_symbol(row[2])
+                asset_balances[asset] = asset_balances.get(asset, 0.0) - volume
+
+        return {"ZEUR": eur_balance, **asset_balances}
     
     async def get_trade_balance(self, asset: str = "EUR") -> Dict[str, float]:
         """Retourne le trade balance simulé."""
@@ -1050,10 +1021,10 @@ class PaperTradingExecutor:
         for paper_asset, qty in balance.items():
             if paper_asset == "ZEUR" or qty == 0:
                 continue
-            symbol = self._last_filled_symbol_for_asset(paper_asset) or self._symbol_for_asset(paper_asset)
+            symbol = await self._last_filled_symbol_for_asset(paper_asset) or self._symbol_for_asset(paper_asset)
             price = await self._get_current_price(symbol)
             if price is None:
-                price = self._last_filled_price_for_symbol(symbol)
+                price = await self._last_filled_price_for_symbol(symbol)
             if price is None and self.allow_synthetic_price_fallback:
                 price = self._fallback_price_for_symbol(symbol)
             if price is None:
@@ -1070,10 +1041,10 @@ class PaperTradingExecutor:
             "margin": eur + asset_value,
         }
 
-    def _last_filled_price_for_symbol(self, symbol: str) -> Optional[float]:
+    async def _last_filled_price_for_symbol(self, symbol: str) -> Optional[float]:
         normalized = self._normalize_symbol(symbol)
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        rows = await self._store.read(
+            lambda conn: conn.execute(
                 """
                 SELECT symbol, price
                 FROM trades
@@ -1081,6 +1052,7 @@ class PaperTradingExecutor:
                 ORDER BY datetime(timestamp) DESC
                 """
             ).fetchall()
+        )
         for row_symbol, price in rows:
             if self._normalize_symbol(str(row_symbol or "")) != normalized:
                 continue
@@ -1092,10 +1064,10 @@ class PaperTradingExecutor:
                 return value
         return None
 
-    def _last_filled_symbol_for_asset(self, asset: str) -> Optional[str]:
+    async def _last_filled_symbol_for_asset(self, asset: str) -> Optional[str]:
         normalized_asset = self._asset_for_symbol(asset)
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        rows = await self._store.read(
+            lambda conn: conn.execute(
                 """
                 SELECT symbol
                 FROM trades
@@ -1103,6 +1075,7 @@ class PaperTradingExecutor:
                 ORDER BY datetime(timestamp) DESC
                 """
             ).fetchall()
+        )
 
         for (symbol,) in rows:
             candidate = str(symbol or "")
@@ -1116,7 +1089,7 @@ class PaperTradingExecutor:
     
     def get_trade_summary(self) -> Dict[str, Any]:
         """Retourne un résumé des trades paper."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._store.reader() as conn:
             total = conn.execute("SELECT COUNT(*) FROM trades WHERE status = 'filled'").fetchone()[0]
             
             buys = conn.execute(
@@ -1170,11 +1143,12 @@ class PaperTradingExecutor:
                 "maker_maker_round_trip_fee_bps": self.maker_fee_rate * 20000.0,
                 "maker_realism_enabled": self.maker_realism_enabled,
                 "db_path": str(self.db_path),
+                "store": self._store.get_status(),
             }
     
     async def close(self):
-        """Cleanup (pour compatibilité)."""
-        pass
+        """Committe les écritures en attente et arrête le thread d'écriture."""
+        await asyncio.to_thread(self._store.close)
 
 
 # =============================================================================
@@ -3,15 +3,28 @@
 This module is intentionally observe-only by default. It groups labelled
 decision outcomes into interpretable buckets so AUTOBOT can see which market
 contexts have historically reached take-profit, stop-loss, or expired.
+
+The dashboard used to reload the latest ``max_outcomes`` outcomes and regroup
+them from scratch on every request.  :class:`IncrementalPatternLearner` keeps
+the same window in memory and folds each new or re-labelled outcome into
+per-pattern counters, catching up from a ``(evaluated_at, id)`` watermark, so a
+snapshot only costs the rows written since the previous one.  Sums are exact
+(Shewchuk partials), which makes its snapshots identical to a full rebuild by
+:meth:`PatternLearningEngine.build_snapshot` over the same rows.
 """
 
 from __future__ import annotations
 
+import math
 import os
-from dataclasses import dataclass
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Iterable, Mapping, Optional
 
+TRIPLE_BARRIER_SOURCE = "decision_learning_triple_barrier"
+
 
 def _env_bool(name: str, default: bool) -> bool:
     raw = os.getenv(name)
@@ -199,6 +212,113 @@ class PatternLearningConfig:
         }
 
 
+class _ExactSum:
+    """Running float sum kept exact as Shewchuk partials, so removals cancel."""
+
+    __slots__ = ("_partials",)
+
+    def __init__(self) -> None:
+        self._partials: list[float] = []
+
+    def add(self, value: float) -> None:
+        partials = self._partials
+        index = 0
+        for other in partials:
+            if abs(value) < abs(other):
+                value, other = other, value
+            high = value + other
+            low = other - (high - value)
+            if low:
+                partials[index] = low
+                index += 1
+            value = high
+        partials[index:] = [value]
+
+    def value(self) -> float:
+        return math.fsum(self._partials)
+
+
+@dataclass(frozen=True)
+class _FoldedRow:
+    """What one outcome contributes to each of its patterns."""
+
+    patterns: tuple[tuple[str, str, dict[str, Any]], ...]
+    net_return_bps: float
+    gross_return_bps: float
+    verdict: str
+    source: str
+    symbol: str
+
+
+@dataclass
+class _PatternStats:
+    pattern_id: str
+    group: str
+    features: dict[str, Any]
+    samples: int = 0
+    counts: dict[str, int] = field(default_factory=lambda: {"good": 0, "bad": 0, "neutral": 0})
+    net_sum: _ExactSum = field(default_factory=_ExactSum)
+    gross_sum: _ExactSum = field(default_factory=_ExactSum)
+    sources: dict[str, int] = field(default_factory=dict)
+    symbols: dict[str, int] = field(default_factory=dict)
+    members: set[Any] = field(default_factory=set)
+    newest: Any = None
+
+    def add(self, member: Any, row: _FoldedRow) -> None:
+        self.samples += 1
+        self.counts[row.verdict] += 1
+        self.net_sum.add(row.net_return_bps)
+        self.gross_sum.add(row.gross_return_bps)
+        self.sources[row.source] = self.sources.get(row.source, 0) + 1
+        self.symbols[row.symbol] = self.symbols.get(row.symbol, 0) + 1
+        self.members.add(member)
+        if self.newest is None or member > self.newest:
+            self.newest = member
+
+    def remove(self, member: Any, row: _FoldedRow) -> None:
+        self.samples -= 1
+        self.counts[row.verdict] -= 1
+        self.net_sum.add(-row.net_return_bps)
+        self.gross_sum.add(-row.gross_return_bps)
+        _decrement(self.sources, row.source)
+        _decrement(self.symbols, row.symbol)
+        self.members.discard(member)
+        if member == self.newest:
+            self.newest = max(self.members) if self.members else None
+
+
+def _decrement(counts: dict[str, int], key: str) -> None:
+    remaining = counts[key] - 1
+    if remaining:
+        counts[key] = remaining
+    else:
+        del counts[key]
+
+
+class _PatternSet:
+    """Pattern statistics over a set of outcomes, each identified by a sortable member key."""
+
+    def __init__(self) -> None:
+        self.patterns: dict[str, _PatternStats] = {}
+        self.rows = 0
+
+    def add(self, member: Any, row: _FoldedRow) -> None:
+        self.rows += 1
+        for key, group, features in row.patterns:
+            stats = self.patterns.get(key)
+            if stats is None:
+                stats = self.patterns[key] = _PatternStats(key, group, features)
+            stats.add(member, row)
+
+    def remove(self, member: Any, row: _FoldedRow) -> None:
+        self.rows -= 1
+        for key, _group, _features in row.patterns:
+            stats = self.patterns[key]
+            stats.remove(member, row)
+            if not stats.samples:
+                del self.patterns[key]
+
+
 class PatternLearningEngine:
     """Aggregate post-decision outcomes into interpretable pattern statistics."""
 
@@ -209,15 +329,27 @@ class PatternLearningEngine:
         rows = [row for row in outcomes or [] if isinstance(row, Mapping)]
         ignored_proxy_outcomes = 0
         if self.config.prefer_triple_barrier:
-            triple_rows = [row for row in rows if str(row.get("source") or "") == "decision_learning_triple_barrier"]
+            triple_rows = [row for row in rows if str(row.get("source") or "") == TRIPLE_BARRIER_SOURCE]
             if triple_rows:
                 ignored_proxy_outcomes = len(rows) - len(triple_rows)
                 rows = triple_rows
             elif not self.config.allow_proxy_fallback:
                 ignored_proxy_outcomes = len(rows)
                 rows = []
-        patterns = self._patterns(rows)
-        ranked = sorted(patterns.values(), key=lambda item: (item["confidence"], item["samples"]), reverse=True)
+        patterns = _PatternSet()
+        for index, row in enumerate(rows):
+            # Earlier rows rank newer, like the DESC order of the outcome query.
+            patterns.add(-index, self._fold_row(row))
+        return self._snapshot(patterns, outcomes_used=len(rows), ignored_proxy_outcomes=ignored_proxy_outcomes)
+
+    def _snapshot(self, patterns: "_PatternSet", *, outcomes_used: int, ignored_proxy_outcomes: int) -> dict[str, Any]:
+        # Ties keep the order in which a full pass first meets each pattern:
+        # newest outcome first, then the group order within that outcome.
+        group_rank = {name: rank for rank, (name, _parts) in enumerate(self._groups({}))}
+        ordered = sorted(patterns.patterns.values(), key=lambda stats: group_rank.get(stats.group, 0))
+        ordered.sort(key=lambda stats: stats.newest, reverse=True)
+        items = [self._pattern_item(stats) for stats in ordered]
+        ranked = sorted(items, key=lambda item: (item["confidence"], item["samples"]), reverse=True)
         reliable = [row for row in ranked if row["samples"] >= self.config.min_samples]
         positive = [row for row in reliable if row["status"] == "positive_pattern"]
         negative = [row for row in reliable if row["status"] == "negative_pattern"]
@@ -227,7 +359,7 @@ class PatternLearningEngine:
             "mode": "observe_only" if self.config.observe_only else "score_ready",
             "config": self.config.to_dict(),
             "summary": {
-                "outcomes_used": len(rows),
+                "outcomes_used": outcomes_used,
                 "legacy_proxy_outcomes_ignored": ignored_proxy_outcomes,
                 "patterns": len(ranked),
                 "reliable_patterns": len(reliable),
@@ -245,40 +377,54 @@ class PatternLearningEngine:
             },
         }
 
-    def _patterns(self, rows: list[Mapping[str, Any]]) -> dict[str, dict[str, Any]]:
-        patterns: dict[str, dict[str, Any]] = {}
-        for row in rows:
-            features = extract_pattern_features(row)
-            groups = self._groups(features)
-            for group_name, parts in groups:
-                key = "|".join([group_name, *[f"{name}={features.get(name)}" for name in parts]])
-                item = patterns.setdefault(
-                    key,
-                    {
-                        "pattern_id": key,
-                        "group": group_name,
-                        "features": {name: features.get(name) for name in parts},
-                        "samples": 0,
-                        "good": 0,
-                        "bad": 0,
-                        "neutral": 0,
-                        "avg_net_return_bps": 0.0,
-                        "avg_gross_return_bps": 0.0,
-                        "sources": {},
-                        "symbols": {},
-                    },
+    def _fold_row(self, row: Mapping[str, Any]) -> "_FoldedRow":
+        features = extract_pattern_features(row)
+        net = _safe_float(row.get("net_return_bps"))
+        label = str(row.get("outcome_label") or "")
+        barrier = str(features.get("barrier") or "")
+        if self._is_good(label, barrier, net):
+            verdict = "good"
+        elif self._is_bad(label, barrier, net):
+            verdict = "bad"
+        else:
+            verdict = "neutral"
+        return _FoldedRow(
+            patterns=tuple(
+                (
+                    "|".join([group_name, *[f"{name}={features.get(name)}" for name in parts]]),
+                    group_name,
+                    {name: features.get(name) for name in parts},
                 )
-                self._add_row(item, row, features)
-        for item in patterns.values():
-            samples = max(1, int(item["samples"]))
-            item["avg_net_return_bps"] = round(float(item["avg_net_return_bps"]) / samples, 3)
-            item["avg_gross_return_bps"] = round(float(item["avg_gross_return_bps"]) / samples, 3)
-            item["win_rate"] = round(float(item["good"]) / samples, 4)
-            item["loss_rate"] = round(float(item["bad"]) / samples, 4)
-            item["confidence"] = self._confidence(item)
-            item["status"] = self._status(item)
-            item["reason"] = self._reason(item)
-        return patterns
+                for group_name, parts in self._groups(features)
+            ),
+            net_return_bps=net,
+            gross_return_bps=_safe_float(row.get("gross_return_bps")),
+            verdict=verdict,
+            source=str(row.get("source") or "unknown"),
+            symbol=str(row.get("symbol") or "UNKNOWN"),
+        )
+
+    def _pattern_item(self, stats: "_PatternStats") -> dict[str, Any]:
+        samples = max(1, int(stats.samples))
+        item: dict[str, Any] = {
+            "pattern_id": stats.pattern_id,
+            "group": stats.group,
+            "features": dict(stats.features),
+            "samples": stats.samples,
+            "good": stats.counts["good"],
+            "bad": stats.counts["bad"],
+            "neutral": stats.counts["neutral"],
+            "avg_net_return_bps": round(stats.net_sum.value() / samples, 3),
+            "avg_gross_return_bps": round(stats.gross_sum.value() / samples, 3),
+            "sources": dict(stats.sources),
+            "symbols": dict(stats.symbols),
+        }
+        item["win_rate"] = round(float(item["good"]) / samples, 4)
+        item["loss_rate"] = round(float(item["bad"]) / samples, 4)
+        item["confidence"] = self._confidence(item)
+        item["status"] = self._status(item)
+        item["reason"] = self._reason(item)
+        return item
 
     @staticmethod
     def _groups(features: Mapping[str, Any]) -> list[tuple[str, tuple[str, ...]]]:
@@ -290,25 +436,6 @@ class PatternLearningEngine:
             ("health_context", ("engine", "health_status", "opportunity_reason")),
         ]
 
-    def _add_row(self, item: dict[str, Any], row: Mapping[str, Any], features: Mapping[str, Any]) -> None:
-        net = _safe_float(row.get("net_return_bps"))
-        gross = _safe_float(row.get("gross_return_bps"))
-        label = str(row.get("outcome_label") or "")
-        barrier = str(features.get("barrier") or "")
-        item["samples"] += 1
-        item["avg_net_return_bps"] += net
-        item["avg_gross_return_bps"] += gross
-        if self._is_good(label, barrier, net):
-            item["good"] += 1
-        elif self._is_bad(label, barrier, net):
-            item["bad"] += 1
-        else:
-            item["neutral"] += 1
-        source = str(row.get("source") or "unknown")
-        symbol = str(row.get("symbol") or "UNKNOWN")
-        item["sources"][source] = item["sources"].get(source, 0) + 1
-        item["symbols"][symbol] = item["symbols"].get(symbol, 0) + 1
-
     def _is_good(self, label: str, barrier: str, net_return_bps: float) -> bool:
         return (
             label in {"accepted_positive", "missed_profit"}
@@ -353,3 +480,140 @@ class PatternLearningEngine:
         if status == "negative_pattern":
             return "historically_reached_loss_barrier_or_negative_net"
         return "mixed_or_not_statistically_clear"
+
+
+class IncrementalPatternLearner:
+    """Pattern statistics over the latest ``max_outcomes`` outcomes, kept up to date.
+
+    The window mirrors ``get_signal_outcomes(limit=max_outcomes)``: outcomes
+    ranked by ``(evaluated_at, id)``.  Upserts stamp ``evaluated_at`` with the
+    labelling time, so new and re-labelled outcomes both show up past the
+    watermark; a version older than the one already folded is ignored.
+    Folding and snapshots take a short lock because the dashboard and the
+    decision-learning refresh run on different event loops.
+    """
+
+    CATCH_UP_BATCH = 500
+
+    def __init__(self, config: Optional[PatternLearningConfig] = None) -> None:
+        self.engine = PatternLearningEngine(config)
+        self.config = self.engine.config
+        self._lock = threading.Lock()
+        self._all = _PatternSet()
+        self._triple = _PatternSet()
+        self._members: dict[int, tuple[tuple[str, int], bool, _FoldedRow]] = {}
+        self._order: list[tuple[str, int]] = []
+        self._watermark: Optional[tuple[str, int]] = None
+
+    @property
+    def watermark(self) -> Optional[tuple[str, int]]:
+        return self._watermark
+
+    async def catch_up(self, persistence: Any) -> int:
+        """Fold outcomes written since the watermark; the first call loads the window."""
+        folded = 0
+        if self._watermark is None:
+            rows = await persistence.get_signal_outcomes(limit=self.config.max_outcomes)
+            with self._lock:
+                folded += sum(self._fold(row) for row in reversed(rows))
+                if self._watermark is None:
+                    self._watermark = ("", 0)
+        while True:
+            evaluated_at, row_id = self._watermark
+            rows = await persistence.get_signal_outcomes_after(
+                evaluated_at=evaluated_at,
+                row_id=row_id,
+                limit=self.CATCH_UP_BATCH,
+            )
+            with self._lock:
+                folded += sum(self._fold(row) for row in rows)
+            if len(rows) < self.CATCH_UP_BATCH:
+                return folded
+
+    def fold(self, row: Mapping[str, Any]) -> bool:
+        """Fold one ``signal_outcomes`` row (with ``id``); returns whether the window changed."""
+        with self._lock:
+            return self._fold(row)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            total = self._all.rows
+            triple = self._triple.rows
+            if self.config.prefer_triple_barrier:
+                if triple:
+                    return self.engine._snapshot(self._triple, outcomes_used=triple, ignored_proxy_outcomes=total - triple)
+                if not self.config.allow_proxy_fallback:
+                    return self.engine._snapshot(_PatternSet(), outcomes_used=0, ignored_proxy_outcomes=total)
+            return self.engine._snapshot(self._all, outcomes_used=total, ignored_proxy_outcomes=0)
+
+    def _fold(self, row: Mapping[str, Any]) -> bool:
+        if not isinstance(row, Mapping):
+            return False
+        try:
+            row_id = int(row.get("id"))
+        except (TypeError, ValueError):
+            return False
+        member = (str(row.get("evaluated_at") or ""), row_id)
+        if self._watermark is None or member > self._watermark:
+            self._watermark = member
+        previous = self._members.get(row_id)
+        if previous is not None:
+            if member <= previous[0]:
+                return False
+            self._discard(row_id)
+        elif len(self._order) >= self.config.max_outcomes:
+            if member < self._order[0]:
+                return False
+            self._discard(self._order[0][1])
+        folded = self.engine._fold_row(row)
+        is_triple = str(row.get("source") or "") == TRIPLE_BARRIER_SOURCE
+        self._all.add(member, folded)
+        if is_triple:
+            self._triple.add(member, folded)
+        self._members[row_id] = (member, is_triple, folded)
+        insort(self._order, member)
+        return True
+
+    def _discard(self, row_id: int) -> None:
+        member, is_triple, folded = self._members.pop(row_id)
+        del self._order[bisect_left(self._order, member)]
+        self._all.remove(member, folded)
+        if is_triple:
+            self._triple.remove(member, folded)
+
+
+_LEARNERS: dict[tuple[str, PatternLearningConfig], IncrementalPatternLearner] = {}
+_LEARNERS_LOCK = threading.Lock()
+
+
+def _persistence_key(persistence: Any) -> str:
+    db_path = getattr(persistence, "db_path", None)
+    return os.path.abspath(str(db_path)) if db_path else f"id:{id(persistence)}"
+
+
+def shared_pattern_learner(persistence: Any, config: Optional[PatternLearningConfig] = None) -> IncrementalPatternLearner:
+    """Return the process-wide learner for ``persistence``'s database and ``config``."""
+    config = config or PatternLearningConfig.from_env()
+    key = (_persistence_key(persistence), config)
+    with _LEARNERS_LOCK:
+        learner = _LEARNERS.get(key)
+        if learner is None:
+            learner = _LEARNERS[key] = IncrementalPatternLearner(config)
+        return learner
+
+
+async def fold_new_signal_outcomes(persistence: Any) -> int:
+    """Bring the learners already serving ``persistence``'s database up to date."""
+    db_key = _persistence_key(persistence)
+    with _LEARNERS_LOCK:
+        learners = [learner for (path, _), learner in _LEARNERS.items() if path == db_key]
+    folded = 0
+    for learner in learners:
+        folded += await learner.catch_up(persistence)
+    return folded
+
+
+def reset_pattern_learners() -> None:
+    """Forget every shared learner (tests and state database swaps)."""
+    with _LEARNERS_LOCK:
+        _LEARNERS.clear()
@@ -23,7 +23,14 @@ from .strategy_runtime_policy import (
     normalize_execution_mode,
     official_paper_strategy_block_reason,
 )
-from .order_lifecycle import TERMINAL_ORDER_STATUSES, is_allowed_order_transition, normalize_order_status
+from .order_lifecycle import (
+    TERMINAL_ORDER_STATUSES,
+    ActiveOrderIndex,
+    is_allowed_order_transition,
+    normalize_order_status,
+)
+from .paper_buy_window import record_ledger_buy
+from .sqlite_access import SQLitePragmas, busy_retry_delay_seconds, is_sqlite_busy_error
 
 logger = logging.getLogger(__name__)
 
@@ -104,17 +111,17 @@ class _PersistenceRepositoryBase:
                     timeout=self._busy_timeout_ms / 1000.0,
                 )
                 self._conn.row_factory = aiosqlite.Row
-                await self._conn.execute("PRAGMA journal_mode=WAL")
-                await self._conn.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
-                await self._conn.execute("PRAGMA synchronous=NORMAL")
+                pragmas = SQLitePragmas.from_env(
+                    busy_timeout_ms=self._busy_timeout_ms,
+                    synchronous="NORMAL",
+                )
+                for statement in pragmas.statements():
+                    await self._conn.execute(statement)
             return self._conn
 
     @staticmethod
     def _is_busy_error(exc: Exception) -> bool:
-        if not isinstance(exc, sqlite3.OperationalError):
-            return False
-        message = str(exc).lower()
-        return "database is locked" in message or "database is busy" in message
+        return is_sqlite_busy_error(exc)
 
     async def _with_write_retries(self, label: str, operation):
         last_exc: Optional[Exception] = None
@@ -142,7 +149,7 @@ class _PersistenceRepositoryBase:
                     if not retryable:
                         raise
                     last_exc = exc
-                    delay = (self._retry_base_delay_ms / 1000.0) * (2 ** attempt)
+                    delay = busy_retry_delay_seconds(self._retry_base_delay_ms / 1000.0, attempt)
                     logger.warning(
                         "SQLite busy during %s; retry %s/%s in %.3fs",
                         label,
@@ -184,6 +191,26 @@ class _PersistenceRepositoryBase:
 class OrderRepository(_PersistenceRepositoryBase):
     """Order lifecycle persistence (orders + transitions)."""
 
+    # Built on first use, then updated by every order write under the write
+    # lock, right after its commit: never behind the table.
+    _active_orders: Optional[ActiveOrderIndex] = None
+
+    async def active_order_index(self) -> Optional[ActiveOrderIndex]:
+        """Return the in-memory index of non-terminal orders.
+
+        ``None`` means the orders table could not be read; callers must then
+        fall back to a scan rather than trust an empty index.
+        """
+
+        if self._active_orders is None:
+            async with self._write_lock:
+                if self._active_orders is None:
+                    recovery = await self.get_non_terminal_orders_for_recovery()
+                    if not recovery.available:
+                        return None
+                    self._active_orders = ActiveOrderIndex(recovery.orders)
+        return self._active_orders
+
     async def upsert_order(
         self,
         client_order_id: str,
@@ -238,7 +265,17 @@ class OrderRepository(_PersistenceRepositoryBase):
                         requested_qty, status, userref, now, now,
                     ),
                 )
+                stored = None
+                if self._active_orders is not None:
+                    # A conflicting row keeps its status: index what is stored.
+                    async with conn.execute(
+                        "SELECT status, terminal_at FROM orders WHERE client_order_id = ?",
+                        (client_order_id,),
+                    ) as cursor:
+                        stored = await cursor.fetchone()
                 await conn.commit()
+                if self._active_orders is not None and stored is not None:
+                    self._active_orders.record(client_order_id, symbol, side, stored[0], stored[1])
                 return True
 
             return await self._with_write_retries("upsert_order", _write)
@@ -433,6 +470,8 @@ class OrderRepository(_PersistenceRepositoryBase):
                     (client_order_id, from_status, normalized_to_status, reason, source, payload_json, now),
                 )
                 await conn.commit()
+                if self._active_orders is not None and normalized_to_status in TERMINAL_ORDER_STATUSES:
+                    self._active_orders.discard(client_order_id)
                 return True
 
             return await self._with_write_retries("transition_order_state", _write)
@@ -1252,6 +1291,14 @@ class StatePersistence:
         await self.initialize()
         return await self.orders.get_non_terminal_orders()
 
+    async def active_order_index(self) -> Optional[ActiveOrderIndex]:
+        try:
+            await self.initialize()
+        except Exception as exc:
+            logger.error("Active order index unavailable: %s", type(exc).__name__)
+            return None
+        return await self.orders.active_order_index()
+
     async def get_non_terminal_orders_for_recovery(self) -> NonTerminalOrderRecovery:
         try:
             await self.initialize()
@@ -1533,13 +1580,17 @@ class StatePersistence:
             ]
             query = f"INSERT OR IGNORE INTO trade_ledger ({', '.join(cols)}) VALUES ({', '.join(['?']*len(cols))})"
 
-            async def _write() -> bool:
+            async def _write() -> Optional[int]:
                 conn = await self.orders.get_conn()
                 cursor = await conn.execute(query, tuple(vals))
                 await conn.commit()
-                return int(cursor.rowcount or 0) > 0
+                return cursor.lastrowid if int(cursor.rowcount or 0) > 0 else None
 
-            return await self.orders._with_write_retries("append_trade_ledger", _write)
+            ledger_id = await self.orders._with_write_retries("append_trade_ledger", _write)
+            if ledger_id is None:
+                return False
+            record_ledger_buy(self.db_path, kwargs.get("symbol"), kwargs.get("side"), now, ledger_id)
+            return True
         except Exception as e:
             logger.exception(f"❌ Erreur append_trade_ledger: {e}")
             return False
@@ -1724,78 +1775,92 @@ class StatePersistence:
             logger.exception(f"Erreur get_decision_outcome_candidates: {e}")
             return []
 
+    _SIGNAL_OUTCOME_COLUMNS = (
+        "outcome_id",
+        "decision_ledger_id",
+        "decision_event_id",
+        "decision_id",
+        "signal_id",
+        "instance_id",
+        "symbol",
+        "strategy",
+        "engine",
+        "side",
+        "original_status",
+        "rejection_reason",
+        "reference_price",
+        "evaluation_price",
+        "gross_return_bps",
+        "estimated_cost_bps",
+        "net_return_bps",
+        "horizon_minutes",
+        "outcome_label",
+        "source",
+        "payload_json",
+        "decision_created_at",
+        "evaluated_at",
+        "created_at",
+    )
+
+    @classmethod
+    def _signal_outcome_upsert_query(cls) -> str:
+        cols = cls._SIGNAL_OUTCOME_COLUMNS
+        assignments = ", ".join(
+            f"{col}=excluded.{col}"
+            for col in cols
+            if col not in {"outcome_id", "decision_ledger_id", "horizon_minutes", "created_at"}
+        )
+        return (
+            f"INSERT INTO signal_outcomes ({', '.join(cols)}) "
+            f"VALUES ({', '.join(['?'] * len(cols))}) "
+            "ON CONFLICT(decision_ledger_id, horizon_minutes) DO UPDATE SET "
+            f"{assignments}"
+        )
+
+    @staticmethod
+    def _signal_outcome_values(kwargs: Dict[str, Any], now: str) -> tuple[Any, ...]:
+        payload = kwargs.get("payload_json")
+        if payload is None:
+            payload = kwargs.get("payload")
+        if payload is not None and not isinstance(payload, str):
+            payload = orjson.dumps(payload).decode("utf-8")
+        return (
+            kwargs.get("outcome_id"),
+            int(kwargs.get("decision_ledger_id")),
+            kwargs.get("decision_event_id"),
+            kwargs.get("decision_id"),
+            kwargs.get("signal_id"),
+            kwargs.get("instance_id"),
+            kwargs.get("symbol"),
+            kwargs.get("strategy"),
+            kwargs.get("engine"),
+            kwargs.get("side"),
+            kwargs.get("original_status"),
+            kwargs.get("rejection_reason"),
+            float(kwargs.get("reference_price")),
+            float(kwargs.get("evaluation_price")),
+            float(kwargs.get("gross_return_bps")),
+            float(kwargs.get("estimated_cost_bps")),
+            float(kwargs.get("net_return_bps")),
+            int(kwargs.get("horizon_minutes")),
+            kwargs.get("outcome_label"),
+            kwargs.get("source", "decision_learning"),
+            payload,
+            kwargs.get("decision_created_at"),
+            kwargs.get("evaluated_at") or now,
+            kwargs.get("created_at") or now,
+        )
+
     async def upsert_signal_outcome(self, **kwargs) -> bool:
         await self.initialize()
         now = datetime.now(timezone.utc).isoformat()
         try:
-            payload = kwargs.get("payload_json")
-            if payload is None:
-                payload = kwargs.get("payload")
-            if payload is not None and not isinstance(payload, str):
-                payload = orjson.dumps(payload).decode("utf-8")
-            cols = [
-                "outcome_id",
-                "decision_ledger_id",
-                "decision_event_id",
-                "decision_id",
-                "signal_id",
-                "instance_id",
-                "symbol",
-                "strategy",
-                "engine",
-                "side",
-                "original_status",
-                "rejection_reason",
-                "reference_price",
-                "evaluation_price",
-                "gross_return_bps",
-                "estimated_cost_bps",
-                "net_return_bps",
-                "horizon_minutes",
-                "outcome_label",
-                "source",
-                "payload_json",
-                "decision_created_at",
-                "evaluated_at",
-                "created_at",
-            ]
-            vals = [
-                kwargs.get("outcome_id"),
-                int(kwargs.get("decision_ledger_id")),
-                kwargs.get("decision_event_id"),
-                kwargs.get("decision_id"),
-                kwargs.get("signal_id"),
-                kwargs.get("instance_id"),
-                kwargs.get("symbol"),
-                kwargs.get("strategy"),
-                kwargs.get("engine"),
-                kwargs.get("side"),
-                kwargs.get("original_status"),
-                kwargs.get("rejection_reason"),
-                float(kwargs.get("reference_price")),
-                float(kwargs.get("evaluation_price")),
-                float(kwargs.get("gross_return_bps")),
-                float(kwargs.get("estimated_cost_bps")),
-                float(kwargs.get("net_return_bps")),
-                int(kwargs.get("horizon_minutes")),
-                kwargs.get("outcome_label"),
-                kwargs.get("source", "decision_learning"),
-                payload,
-                kwargs.get("decision_created_at"),
-                kwargs.get("evaluated_at") or now,
-                kwargs.get("created_at") or now,
-            ]
-            assignments = ", ".join(f"{col}=excluded.{col}" for col in cols if col not in {"outcome_id", "decision_ledger_id", "horizon_minutes", "created_at"})
-            query = (
-                f"INSERT INTO signal_outcomes ({', '.join(cols)}) "
-                f"VALUES ({', '.join(['?'] * len(cols))}) "
-                "ON CONFLICT(decision_ledger_id, horizon_minutes) DO UPDATE SET "
-                f"{assignments}"
-            )
+            vals = self._signal_outcome_values(kwargs, now)
+            query = self._signal_outcome_upsert_query()
 
             async def _write() -> bool:
                 conn = await self.orders.get_conn()
-                await conn.execute(query, tuple(vals))
+                await conn.execute(query, vals)
                 await conn.commit()
                 return True
 
@@ -1803,6 +1868,31 @@ class StatePersistence:
         except Exception as e:
             logger.exception(f"Erreur upsert_signal_outcome: {e}")
             return False
+
+    async def upsert_signal_outcomes(self, outcomes: List[Dict[str, Any]]) -> int:
+        """Write many outcome labels in one transaction; returns rows written."""
+        await self.initialize()
+        now = datetime.now(timezone.utc).isoformat()
+        rows: List[tuple[Any, ...]] = []
+        for outcome in outcomes:
+            try:
+                rows.append(self._signal_outcome_values(outcome, now))
+            except (TypeError, ValueError) as e:
+                logger.warning(f"upsert_signal_outcomes: outcome ignore ({e})")
+        if not rows:
+            return 0
+        query = self._signal_outcome_upsert_query()
+        try:
+            async def _write() -> int:
+                conn = await self.orders.get_conn()
+                await conn.executemany(query, rows)
+                await conn.commit()
+                return len(rows)
+
+            return await self.orders._with_write_retries("upsert_signal_outcomes", _write)
+        except Exception as e:
+            logger.exception(f"Erreur upsert_signal_outcomes: {e}")
+            return 0
 
     async def get_signal_outcomes(
         self,
@@ -1832,23 +1922,51 @@ class StatePersistence:
             conn = await self.orders.get_conn()
             async with conn.execute(query, tuple(args)) as cursor:
                 rows = await cursor.fetchall()
-            results: List[Dict[str, Any]] = []
-            for row in rows:
-                item = dict(row)
-                payload_raw = item.get("payload_json")
-                if isinstance(payload_raw, (str, bytes)):
-                    try:
-                        item["payload"] = orjson.loads(payload_raw)
-                    except Exception:
-                        item["payload"] = None
-                else:
-                    item["payload"] = None
-                results.append(item)
-            return results
+            return self._signal_outcome_rows(rows)
         except Exception as e:
             logger.exception(f"Erreur get_signal_outcomes: {e}")
             return []
 
+    async def get_signal_outcomes_after(
+        self,
+        *,
+        evaluated_at: str,
+        row_id: int,
+        limit: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """Outcomes written or re-labelled past the ``(evaluated_at, id)`` watermark, oldest first."""
+        await self.initialize()
+        query = (
+            "SELECT * FROM signal_outcomes "
+            "WHERE evaluated_at >= ? AND (evaluated_at > ? OR id > ?) "
+            "ORDER BY evaluated_at ASC, id ASC "
+            "LIMIT ?"
+        )
+        try:
+            conn = await self.orders.get_conn()
+            async with conn.execute(query, (evaluated_at, evaluated_at, int(row_id), max(1, int(limit)))) as cursor:
+                rows = await cursor.fetchall()
+            return self._signal_outcome_rows(rows)
+        except Exception as e:
+            logger.exception(f"Erreur get_signal_outcomes_after: {e}")
+            return []
+
+    @staticmethod
+    def _signal_outcome_rows(rows: Any) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        for row in rows:
+            item = dict(row)
+            payload_raw = item.get("payload_json")
+            if isinstance(payload_raw, (str, bytes)):
+                try:
+                    item["payload"] = orjson.loads(payload_raw)
+                except Exception:
+                    item["payload"] = None
+            else:
+                item["payload"] = None
+            results.append(item)
+        return results
+
     async def append_market_price_samples(self, samples: List[Dict[str, Any]]) -> int:
         await self.initialize()
         if not samples:
@@ -75,6 +75,7 @@ __all__ = [
     "RegimeBaselineResult",
     "GridResearchConfig",
     "GridResearchSignalGenerator",
+    "GridSweepResult",
     "MeanReversionResearchConfig",
     "MeanReversionResearchSignalGenerator",
     "ResearchStrategyInstance",
@@ -126,6 +127,8 @@ __all__ = [
     "render_decision_trace_audit_report",
     "render_cost_parity_audit_report",
     "run_validation",
+    "run_grid_backtest_sweep",
+    "sweep_grid_signals",
     "build_relative_value_report",
     "build_strategy_orchestrator_report",
     "build_strategy_edge_improvement_report",
@@ -332,6 +335,8 @@ _LAZY_EXPORTS = {
     ),
     "GridResearchConfig": ("strategy_signal_generators", "GridResearchConfig"),
     "GridResearchSignalGenerator": ("strategy_signal_generators", "GridResearchSignalGenerator"),
+    "GridSweepResult": ("strategy_signal_generators", "GridSweepResult"),
+    "sweep_grid_signals": ("strategy_signal_generators", "sweep_grid_signals"),
     "MeanReversionResearchConfig": ("strategy_signal_generators", "MeanReversionResearchConfig"),
     "MeanReversionResearchSignalGenerator": (
         "strategy_signal_generators",
@@ -347,6 +352,7 @@ _LAZY_EXPORTS = {
     "ValidationRunnerConfig": ("validation_runner", "ValidationRunnerConfig"),
     "ValidationRunnerResult": ("validation_runner", "ValidationRunnerResult"),
     "run_validation": ("validation_runner", "run_validation"),
+    "run_grid_backtest_sweep": ("validation_runner", "run_grid_backtest_sweep"),
     "enrich_bars_with_regime_context": ("regime_context", "enrich_bars_with_regime_context"),
     "WalkForwardConfig": ("walk_forward", "WalkForwardConfig"),
     "WalkForwardDecision": ("walk_forward", "WalkForwardDecision"),
@@ -375,6 +375,9 @@ class AlphaSchedulerConfig:
     # Bind scheduler readiness and any recommended runner command to this exact
     # manifest instead of recursively mixing the complete archive.
     canonical_snapshot_manifest: Path | None = None
+    # Optional per-file summary cache for the capability scan.  It only holds
+    # derived file statistics, never research memory or scheduler state.
+    capability_scan_cache_path: Path | None = None
     knowledge_base_path: Path = Path("docs/research/alpha_knowledge_base.json")
     templates_path: Path = Path("docs/research/strategy_templates.json")
     hypotheses_path: Path = Path("docs/research/alpha_hypotheses.json")
@@ -619,6 +622,7 @@ def build_alpha_hypothesis_scheduler_report(config: AlphaSchedulerConfig) -> Alp
         data_roots=capability_data_paths,
         state_db=config.state_db,
         memory_path=config.memory_path,
+        scan_cache=config.capability_scan_cache_path,
     )
     derivatives_feature_snapshot = _derivatives_feature_snapshot_state(
         config.derivatives_feature_snapshot_manifest
@@ -26,7 +26,7 @@ from .high_conviction_discovery import (
     _discover_setups,
     _group_by_symbol_timeframe,
     _load_ohlcv_bars,
-    _run_discovery_scenario,
+    _run_discovery_scenarios,
     _with_resampled_4h,
 )
 from .high_conviction_walk_forward import _deduplicate_bars
@@ -399,7 +399,7 @@ def _run_volatility_breakout(
         DiscoveryScenario(500.0, 2.0, 72.0, "fixed_tp_sl"),
         DiscoveryScenario(500.0, 3.0, 72.0, "fixed_tp_sl"),
     )[: config.max_variants]
-    results = [_run_discovery_scenario(discovery_config, scenario, setups, dict(groups)) for scenario in variants]
+    results = list(_run_discovery_scenarios(discovery_config, variants, setups, dict(groups)))
     variant_rows = tuple(row.to_dict() for row in results)
     best = _best_variant(variant_rows)
     best_label = best.get("scenario", {}).get("label") if best else None
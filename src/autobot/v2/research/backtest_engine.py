@@ -320,7 +320,7 @@ class BacktestEngine:
         baselines = self._baselines(ordered_bars, strategy_trade_count=len(journal.records))
         comparison_baseline = max(baselines, key=lambda baseline: baseline.total_return_pct)
         metrics = self.metrics_engine.calculate(
-            journal.records,
+            journal.batch(),
             initial_capital_eur=self.config.initial_capital_eur,
             baseline_name=comparison_baseline.name,
             baseline_return_pct=comparison_baseline.total_return_pct,
@@ -2,15 +2,25 @@
 
 This runner orchestrates public OHLCV and public spread/depth collection. It is
 deliberately isolated from paper/live runtime and cannot create orders.
+
+The daily job is declared as a small stage graph.  Independent OHLCV fetches
+run concurrently under a per-source request interval, canonicalization starts
+as soon as the OHLCV stage lands while the long microstructure recorder is
+still sampling, and deterministic stages record an input fingerprint so a
+rerun of the same ``run_id`` reuses unchanged work instead of recomputing it.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Mapping, Sequence
 
 from .data_readiness_dashboard import build_data_readiness_dashboard, write_data_readiness_dashboard
 from .historical_data_collector import (
@@ -18,6 +28,7 @@ from .historical_data_collector import (
     HistoricalDataCollectorConfig,
     OHLCFetcher,
     collect_historical_ohlcv,
+    fetch_kraken_ohlc_page,
 )
 from .kraken_symbol_mapping import (
     AssetPairsFetcher,
@@ -32,6 +43,7 @@ from .spread_depth_recorder import (
     DepthFetcher,
     SpreadDepthRecorderConfig,
     SpreadDepthRecorderResult,
+    SourceRateLimiter,
     record_spread_depth,
 )
 from .symbol_normalization import normalize_research_symbol
@@ -214,10 +226,15 @@ class DailyResearchDataCollectionConfig:
     ohlcv_fail_on_gaps: bool = False
     ohlcv_export_csv: bool = True
     ohlcv_export_parquet: bool = False
+    ohlcv_max_concurrency: int = 4
+    ohlcv_min_request_interval_seconds: float = 1.0
     microstructure_depth_count: int = 10
     microstructure_sample_interval_seconds: float = 60.0
     microstructure_samples_per_run: int = 60
     microstructure_max_runtime_seconds: float | None = None
+    microstructure_max_concurrency: int = 8
+    microstructure_min_request_interval_seconds: float = 1.0
+    microstructure_request_burst: int = 8
     high_conviction_walk_forward: DailyHighConvictionWalkForwardConfig = DailyHighConvictionWalkForwardConfig()
     strategy_orchestrator: DailyStrategyOrchestratorConfig = DailyStrategyOrchestratorConfig()
     strategy_edge_review: DailyStrategyEdgeReviewConfig = DailyStrategyEdgeReviewConfig()
@@ -243,6 +260,10 @@ class DailyResearchDataCollectionConfig:
             raise ValueError("timeframes must not be empty")
         if self.ohlcv_max_pages <= 0:
             raise ValueError("ohlcv.max_pages must be positive")
+        if self.ohlcv_max_concurrency <= 0:
+            raise ValueError("ohlcv.max_concurrency must be positive")
+        if self.ohlcv_min_request_interval_seconds < 0.0:
+            raise ValueError("ohlcv.min_request_interval_seconds cannot be negative")
         if self.microstructure_depth_count <= 0:
             raise ValueError("microstructure.depth_count must be positive")
         if self.microstructure_samples_per_run <= 0:
@@ -251,6 +272,12 @@ class DailyResearchDataCollectionConfig:
             raise ValueError("microstructure.sample_interval_seconds cannot be negative")
         if self.microstructure_max_runtime_seconds is not None and self.microstructure_max_runtime_seconds <= 0.0:
             raise ValueError("microstructure.max_runtime_seconds must be positive when configured")
+        if self.microstructure_max_concurrency <= 0:
+            raise ValueError("microstructure.max_concurrency must be positive")
+        if self.microstructure_min_request_interval_seconds < 0.0:
+            raise ValueError("microstructure.min_request_interval_seconds cannot be negative")
+        if self.microstructure_request_burst <= 0:
+            raise ValueError("microstructure.request_burst must be positive")
         self.high_conviction_walk_forward.validate()
         self.strategy_orchestrator.validate()
         self.strategy_edge_review.validate()
@@ -276,6 +303,22 @@ class DailyCollectionOperation:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class DailyCollectionStageMetric:
+    """Wall time, artifact size and reuse of one stage of the daily graph."""
+
+    stage: str
+    status: str
+    wall_time_seconds: float
+    output_bytes: int = 0
+    input_fingerprint: str | None = None
+    units: int = 1
+    reused_units: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
 @dataclass(frozen=True)
 class DailyResearchDataCollectionResult:
     run_id: str
@@ -292,6 +335,7 @@ class DailyResearchDataCollectionResult:
     canonical_manifest_path: str | None = None
     feature_snapshot_manifest_path: str | None = None
     verified_feature_vector_publication_path: str | None = None
+    stage_metrics: tuple[DailyCollectionStageMetric, ...] = ()
     manifest_path: str | None = None
     markdown_report_path: str | None = None
     live_promotion_allowed: bool = False
@@ -320,6 +364,7 @@ class DailyResearchDataCollectionResult:
             "canonical_manifest_path": self.canonical_manifest_path,
             "feature_snapshot_manifest_path": self.feature_snapshot_manifest_path,
             "verified_feature_vector_publication_path": self.verified_feature_vector_publication_path,
+            "stage_metrics": [item.to_dict() for item in self.stage_metrics],
             "manifest_path": self.manifest_path,
             "markdown_report_path": self.markdown_report_path,
             "live_promotion_allowed": self.live_promotion_allowed,
@@ -367,6 +412,8 @@ def load_daily_research_data_collection_config(path: str | Path) -> DailyResearc
         ohlcv_fail_on_gaps=bool(ohlcv.get("fail_on_gaps", False)),
         ohlcv_export_csv=bool(ohlcv.get("export_csv", True)),
         ohlcv_export_parquet=bool(ohlcv.get("export_parquet", False)),
+        ohlcv_max_concurrency=int(_yaml_value_or_default(ohlcv, "max_concurrency", 4)),
+        ohlcv_min_request_interval_seconds=float(_yaml_value_or_default(ohlcv, "min_request_interval_seconds", 1.0)),
         microstructure_depth_count=int(_yaml_value_or_default(microstructure, "depth_count", 10)),
         microstructure_sample_interval_seconds=float(
             _yaml_value_or_default(microstructure, "sample_interval_seconds", 60.0)
@@ -377,6 +424,11 @@ def load_daily_research_data_collection_config(path: str | Path) -> DailyResearc
             if microstructure.get("max_runtime_seconds") not in (None, "")
             else None
         ),
+        microstructure_max_concurrency=int(_yaml_value_or_default(microstructure, "max_concurrency", 8)),
+        microstructure_min_request_interval_seconds=float(
+            _yaml_value_or_default(microstructure, "min_request_interval_seconds", 1.0)
+        ),
+        microstructure_request_burst=int(_yaml_value_or_default(microstructure, "request_burst", 8)),
         high_conviction_walk_forward=DailyHighConvictionWalkForwardConfig(
             enabled=bool(high_conviction.get("enabled", False)),
             output_dir=Path(str(high_conviction.get("output_dir") or "reports/research/high_conviction_walk_forward")),
@@ -465,144 +517,158 @@ def run_daily_research_data_collection(
     run_ohlcv_dir = config.output_dirs.ohlcv / run_id
     run_micro_dir = config.output_dirs.microstructure / run_id
     run_report_dir.mkdir(parents=True, exist_ok=True)
-    operations: list[DailyCollectionOperation] = []
-    ohlcv_csv_paths: list[str] = []
     preflight = _preflight_active_symbols(config, asset_pairs_fetcher=asset_pairs_fetcher)
     symbol_mappings = preflight.mapping_by_symbol()
     collection_symbols = preflight.resolved_symbols
-
-    for symbol in collection_symbols:
-        for timeframe in config.timeframes:
-            op = _collect_one_ohlcv(
-                run_id=run_id,
-                symbol=symbol,
-                timeframe=timeframe,
-                output_dir=run_ohlcv_dir,
-                config=config,
-                fetcher=ohlc_fetcher,
-                symbol_mappings=symbol_mappings,
-            )
-            operations.append(op)
-            if op.status == "ok" and op.output_path:
-                ohlcv_csv_paths.append(op.output_path)
+    fingerprints = _StageFingerprintStore(run_report_dir / f"{run_id}_stage_fingerprints.json")
+    # The OHLC and depth stages run concurrently against the same Kraken
+    # public host, so they draw from one per-IP budget.
+    public_limiter = _public_source_limiter(config)
+    limited_ohlc_fetcher = _rate_limited_ohlc_fetcher(ohlc_fetcher or fetch_kraken_ohlc_page, public_limiter)
+
+    def ohlcv_stage(_upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        return _collect_daily_ohlcv(
+            run_id=run_id,
+            symbols=collection_symbols,
+            output_dir=run_ohlcv_dir,
+            config=config,
+            fetcher=limited_ohlc_fetcher,
+            symbol_mappings=symbol_mappings,
+            fingerprints=fingerprints,
+        )
 
     # Canonical OHLCV and its point-in-time feature bundle are the critical
-    # output of this daily job.  Materialize them before the deliberately
-    # long-running microstructure recorder so a later depth timeout, API
-    # issue, or resource failure cannot discard the already-collected market
-    # bars or defer their research evidence by an hour.
-    canonical_manifest_path, feature_snapshot_manifest_path, verified_feature_vector_publication_path = (
-        _materialize_daily_canonical_features(
+    # output of this daily job.  They only depend on the OHLCV stage, so they
+    # are materialized while the deliberately long-running microstructure
+    # recorder is still sampling: a later depth timeout, API issue, or
+    # resource failure cannot discard the already-collected market bars or
+    # defer their research evidence by an hour.
+    def canonical_stage(upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        return _materialize_daily_canonical_stage(
             config=config,
             run_id=run_id,
-            ohlcv_csv_paths=tuple(ohlcv_csv_paths),
+            ohlcv_csv_paths=upstream["ohlcv"].value,
             symbol_mappings=symbol_mappings,
-            operations=operations,
+            fingerprints=fingerprints,
         )
-    )
 
-    micro_result: SpreadDepthRecorderResult | None = None
-    micro_profile_path: str | None = None
-    try:
-        micro_result = record_spread_depth(
-            SpreadDepthRecorderConfig(
-                run_id=f"{run_id}_spread_depth",
-                symbols=collection_symbols,
-                output_dir=run_micro_dir,
-                depth_count=config.microstructure_depth_count,
-                samples=config.microstructure_samples_per_run,
-                sleep_seconds=config.microstructure_sample_interval_seconds,
-                max_runtime_seconds=config.microstructure_max_runtime_seconds,
-                export_csv=True,
-                continue_on_error=True,
-            ),
+    def spread_depth_stage(_upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        return _record_daily_spread_depth(
+            run_id=run_id,
+            symbols=collection_symbols,
+            output_dir=run_micro_dir,
+            config=config,
             fetcher=depth_fetcher,
             symbol_mappings=symbol_mappings,
-        )
-        operations.append(
-            DailyCollectionOperation(
-                operation_type="spread_depth",
-                symbol=None,
-                timeframe=None,
-                status="ok" if not micro_result.errors and not micro_result.stop_reason else "partial",
-                row_count=len(micro_result.snapshots),
-                output_path=micro_result.csv_path,
-                markdown_report_path=micro_result.markdown_report_path,
-                error=_spread_depth_operation_note(micro_result),
-            )
-        )
-    except Exception as exc:
-        operations.append(
-            DailyCollectionOperation(
-                operation_type="spread_depth",
-                symbol=None,
-                timeframe=None,
-                status="error",
-                error=str(exc),
-            )
+            rate_limiter=public_limiter,
         )
 
-    profiles = ()
-    if micro_result and micro_result.csv_path:
+    def microstructure_profile_stage(upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        micro_result: SpreadDepthRecorderResult | None = upstream["spread_depth"].value
+        if not micro_result or not micro_result.csv_path:
+            return _DailyStageOutcome(value=((), None))
         profile_report = write_microstructure_profile_report(
             build_microstructure_profile((micro_result.csv_path,), run_id=f"{run_id}_microstructure_profile"),
             run_report_dir,
         )
-        profiles = profile_report.profiles
-        micro_profile_path = profile_report.markdown_report_path
+        return _DailyStageOutcome(value=(profile_report.profiles, profile_report.markdown_report_path))
 
-    dashboard_path = None
-    if ohlcv_csv_paths:
+    def dashboard_stage(upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        ohlcv_csv_paths = upstream["ohlcv"].value
+        if not ohlcv_csv_paths:
+            return _DailyStageOutcome()
         dashboard = write_data_readiness_dashboard(
             build_data_readiness_dashboard(
                 run_id=run_id,
-                dataset_paths=ohlcv_csv_paths,
-                microstructure_profiles=profiles,
+                dataset_paths=list(ohlcv_csv_paths),
+                microstructure_profiles=upstream["microstructure_profile"].value[0],
             ),
             run_report_dir,
         )
-        dashboard_path = dashboard.markdown_report_path
+        return _DailyStageOutcome(value=dashboard.markdown_report_path)
 
-    high_conviction_path = _run_high_conviction_walk_forward(
-        config=config,
-        run_id=run_id,
-        symbols=collection_symbols,
-        operations=operations,
-    )
-    strategy_orchestrator_path = _run_strategy_orchestrator(
-        config=config,
-        run_id=run_id,
-        symbols=collection_symbols,
-        operations=operations,
-        microstructure_profiles=profiles,
-    )
-    strategy_edge_review_path = _run_strategy_edge_review(
-        config=config,
-        run_id=run_id,
-        operations=operations,
+    def high_conviction_stage(_upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        return _appending_stage(
+            _run_high_conviction_walk_forward,
+            config=config,
+            run_id=run_id,
+            symbols=collection_symbols,
+        )
+
+    def strategy_orchestrator_stage(upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        return _appending_stage(
+            _run_strategy_orchestrator,
+            config=config,
+            run_id=run_id,
+            symbols=collection_symbols,
+            microstructure_profiles=upstream["microstructure_profile"].value[0],
+        )
+
+    def strategy_edge_review_stage(upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        return _appending_stage(
+            _run_strategy_edge_review,
+            prior_operations=(
+                *upstream["high_conviction_walk_forward"].operations,
+                *upstream["strategy_orchestrator"].operations,
+            ),
+            config=config,
+            run_id=run_id,
+        )
+
+    def shadow_sync_stage(upstream: Mapping[str, _DailyStageOutcome]) -> _DailyStageOutcome:
+        return _appending_stage(
+            _run_shadow_observation_sync,
+            config=config,
+            run_id=run_id,
+            ohlcv_csv_paths=upstream["ohlcv"].value,
+        )
+
+    stages = (
+        _DailyStage("ohlcv", ohlcv_stage),
+        _DailyStage("canonical_features", canonical_stage, ("ohlcv",)),
+        _DailyStage("spread_depth", spread_depth_stage),
+        _DailyStage("microstructure_profile", microstructure_profile_stage, ("spread_depth",)),
+        _DailyStage("data_readiness_dashboard", dashboard_stage, ("ohlcv", "microstructure_profile")),
+        # The memory-heavy readers below wait for canonical_features, so an
+        # out-of-memory failure in one of them cannot discard canonical output
+        # (see config/research_data_collection.yaml).
+        _DailyStage("high_conviction_walk_forward", high_conviction_stage, ("ohlcv", "canonical_features")),
+        # Both reports re-read the whole OHLCV archive; chaining them keeps a
+        # single full-archive reader in memory at a time.
+        _DailyStage(
+            "strategy_orchestrator",
+            strategy_orchestrator_stage,
+            ("ohlcv", "canonical_features", "microstructure_profile", "high_conviction_walk_forward"),
+        ),
+        _DailyStage(
+            "strategy_edge_review",
+            strategy_edge_review_stage,
+            ("high_conviction_walk_forward", "strategy_orchestrator"),
+        ),
+        _DailyStage("shadow_observation_sync", shadow_sync_stage, ("ohlcv", "canonical_features")),
     )
-    shadow_sync_path = _run_shadow_observation_sync(
-        config=config,
-        run_id=run_id,
-        ohlcv_csv_paths=tuple(ohlcv_csv_paths),
-        operations=operations,
+    outcomes, stage_metrics = _run_daily_stage_graph(stages)
+    canonical_manifest_path, feature_snapshot_manifest_path, verified_feature_vector_publication_path = (
+        outcomes["canonical_features"].value
     )
+    micro_result = outcomes["spread_depth"].value
 
     result = DailyResearchDataCollectionResult(
         run_id=run_id,
         generated_at=datetime.now(timezone.utc).isoformat(),
         config_path=str(Path(config_path)),
-        operations=tuple(operations),
+        operations=tuple(operation for stage in stages for operation in outcomes[stage.name].operations),
         microstructure_result=micro_result.to_dict() if micro_result else None,
-        microstructure_profile_path=micro_profile_path,
-        data_readiness_dashboard_path=dashboard_path,
-        high_conviction_walk_forward_report_path=high_conviction_path,
-        strategy_orchestrator_report_path=strategy_orchestrator_path,
-        strategy_edge_review_report_path=strategy_edge_review_path,
-        shadow_observation_sync_report_path=shadow_sync_path,
+        microstructure_profile_path=outcomes["microstructure_profile"].value[1],
+        data_readiness_dashboard_path=outcomes["data_readiness_dashboard"].value,
+        high_conviction_walk_forward_report_path=outcomes["high_conviction_walk_forward"].value,
+        strategy_orchestrator_report_path=outcomes["strategy_orchestrator"].value,
+        strategy_edge_review_report_path=outcomes["strategy_edge_review"].value,
+        shadow_observation_sync_report_path=outcomes["shadow_observation_sync"].value,
         canonical_manifest_path=canonical_manifest_path,
         feature_snapshot_manifest_path=feature_snapshot_manifest_path,
         verified_feature_vector_publication_path=verified_feature_vector_publication_path,
+        stage_metrics=stage_metrics,
     )
     return write_daily_research_data_collection_report(result, run_report_dir)
 
@@ -632,6 +698,7 @@ def write_daily_research_data_collection_report(
         canonical_manifest_path=result.canonical_manifest_path,
         feature_snapshot_manifest_path=result.feature_snapshot_manifest_path,
         verified_feature_vector_publication_path=result.verified_feature_vector_publication_path,
+        stage_metrics=result.stage_metrics,
         manifest_path=str(manifest_path),
         markdown_report_path=str(markdown_path),
         live_promotion_allowed=result.live_promotion_allowed,
@@ -673,10 +740,18 @@ def render_daily_research_data_collection_report(result: DailyResearchDataCollec
             f"- Feature snapshot manifest: `{result.feature_snapshot_manifest_path or 'not generated'}`",
             f"- Verified feature-vector publication: `{result.verified_feature_vector_publication_path or 'not generated'}`",
             "",
-            "## Safety",
+            "## Stages",
             "",
+            "| Stage | Status | Wall time (s) | Output bytes | Reused | Input fingerprint |",
+            "| --- | --- | ---: | ---: | ---: | --- |",
         ]
     )
+    for metric in result.stage_metrics:
+        lines.append(
+            f"| {metric.stage} | {metric.status} | {metric.wall_time_seconds:.3f} | {metric.output_bytes} | "
+            f"{metric.reused_units}/{metric.units} | {(metric.input_fingerprint or '-')[:16]} |"
+        )
+    lines.extend(["", "## Safety", ""])
     lines.extend(f"- {note}" for note in result.safety_notes)
     lines.append("")
     return "\n".join(lines)
@@ -849,6 +924,111 @@ def _materialize_daily_canonical_features(
         return None, None, None
 
 
+def _materialize_daily_canonical_stage(
+    *,
+    config: DailyResearchDataCollectionConfig,
+    run_id: str,
+    ohlcv_csv_paths: Sequence[str],
+    symbol_mappings: Mapping[str, KrakenPublicPairMapping],
+    fingerprints: _StageFingerprintStore,
+) -> _DailyStageOutcome:
+    """Reuse this run's canonical artifacts when the raw OHLCV bytes are unchanged."""
+
+    fingerprint: str | None = None
+    if config.canonical_features.enabled:
+        fingerprint = _stage_fingerprint(
+            {
+                "run_id": run_id,
+                "canonical_features": asdict(config.canonical_features),
+                "output_dirs": asdict(config.output_dirs),
+                "market_mappings": {symbol: mapping.to_dict() for symbol, mapping in symbol_mappings.items()},
+                "raw_sources": [
+                    (path, _file_sha256(Path(path))) for path in sorted(ohlcv_csv_paths) if Path(path).exists()
+                ],
+            }
+        )
+        stored = fingerprints.reusable("canonical_features", fingerprint)
+        if stored is not None:
+            return _DailyStageOutcome(
+                operations=stored.operations,
+                value=tuple(stored.value),
+                fingerprint=fingerprint,
+                reused_units=1,
+            )
+    operations: list[DailyCollectionOperation] = []
+    paths = _materialize_daily_canonical_features(
+        config=config,
+        run_id=run_id,
+        ohlcv_csv_paths=ohlcv_csv_paths,
+        symbol_mappings=symbol_mappings,
+        operations=operations,
+    )
+    if fingerprint is not None and paths[0] is not None:
+        fingerprints.record("canonical_features", fingerprint, operations=operations, value=list(paths))
+    return _DailyStageOutcome(operations=tuple(operations), value=paths, fingerprint=fingerprint)
+
+
+def _record_daily_spread_depth(
+    *,
+    run_id: str,
+    symbols: tuple[str, ...],
+    output_dir: Path,
+    config: DailyResearchDataCollectionConfig,
+    fetcher: DepthFetcher | None,
+    symbol_mappings: Mapping[str, KrakenPublicPairMapping],
+    rate_limiter: SourceRateLimiter | None = None,
+) -> _DailyStageOutcome:
+    # Live order-book samples are not a function of any input, so this stage
+    # is never fingerprinted and always records afresh.
+    try:
+        micro_result = record_spread_depth(
+            SpreadDepthRecorderConfig(
+                run_id=f"{run_id}_spread_depth",
+                symbols=symbols,
+                output_dir=output_dir,
+                depth_count=config.microstructure_depth_count,
+                samples=config.microstructure_samples_per_run,
+                sleep_seconds=config.microstructure_sample_interval_seconds,
+                max_runtime_seconds=config.microstructure_max_runtime_seconds,
+                export_csv=True,
+                continue_on_error=True,
+                max_concurrency=config.microstructure_max_concurrency,
+                min_request_interval_seconds=config.microstructure_min_request_interval_seconds,
+                request_burst=config.microstructure_request_burst,
+            ),
+            fetcher=fetcher,
+            symbol_mappings=symbol_mappings,
+            rate_limiter=rate_limiter,
+        )
+    except Exception as exc:
+        return _DailyStageOutcome(
+            operations=(
+                DailyCollectionOperation(
+                    operation_type="spread_depth",
+                    symbol=None,
+                    timeframe=None,
+                    status="error",
+                    error=str(exc),
+                ),
+            )
+        )
+    return _DailyStageOutcome(
+        operations=(
+            DailyCollectionOperation(
+                operation_type="spread_depth",
+                symbol=None,
+                timeframe=None,
+                status="ok" if not micro_result.errors and not micro_result.stop_reason else "partial",
+                row_count=len(micro_result.snapshots),
+                output_path=micro_result.csv_path,
+                markdown_report_path=micro_result.markdown_report_path,
+                error=_spread_depth_operation_note(micro_result),
+            ),
+        ),
+        value=micro_result,
+    )
+
+
 def _run_high_conviction_walk_forward(
     *,
     config: DailyResearchDataCollectionConfig,
@@ -1158,6 +1338,71 @@ def _operation_output_path(operations: list[DailyCollectionOperation], operation
     return None
 
 
+def _collect_daily_ohlcv(
+    *,
+    run_id: str,
+    symbols: tuple[str, ...],
+    output_dir: Path,
+    config: DailyResearchDataCollectionConfig,
+    fetcher: OHLCFetcher,
+    symbol_mappings: Mapping[str, KrakenPublicPairMapping],
+    fingerprints: _StageFingerprintStore,
+) -> _DailyStageOutcome:
+    """Fetch every symbol/timeframe concurrently, reusing unchanged files.
+
+    Operations keep the declared symbol-then-timeframe order regardless of
+    which fetch lands first, so reports stay stable between runs.
+    """
+
+    jobs = [(symbol, timeframe) for symbol in symbols for timeframe in config.timeframes]
+
+    def collect(job: tuple[str, str]) -> tuple[DailyCollectionOperation, str, bool]:
+        symbol, timeframe = job
+        mapping = symbol_mappings.get(symbol)
+        key = f"ohlcv:{symbol}:{timeframe}"
+        fingerprint = _stage_fingerprint(
+            {
+                "run_id": run_id,
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "mapping": mapping.to_dict() if mapping else None,
+                "output_dir": str(output_dir),
+                "max_pages": config.ohlcv_max_pages,
+                "dedupe": config.ohlcv_dedupe,
+                "fail_on_gaps": config.ohlcv_fail_on_gaps,
+                "export_csv": config.ohlcv_export_csv,
+                "export_parquet": config.ohlcv_export_parquet,
+            }
+        )
+        stored = fingerprints.reusable(key, fingerprint)
+        if stored is not None:
+            return stored.operations[0], fingerprint, True
+        operation = _collect_one_ohlcv(
+            run_id=run_id,
+            symbol=symbol,
+            timeframe=timeframe,
+            output_dir=output_dir,
+            config=config,
+            fetcher=fetcher,
+            symbol_mappings=symbol_mappings,
+        )
+        if operation.status == "ok":
+            fingerprints.record(key, fingerprint, operations=(operation,))
+        return operation, fingerprint, False
+
+    workers = max(1, min(config.ohlcv_max_concurrency, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="daily-research-ohlcv") as pool:
+        collected = list(pool.map(collect, jobs))
+    operations = tuple(operation for operation, _fingerprint, _reused in collected)
+    return _DailyStageOutcome(
+        operations=operations,
+        value=tuple(op.output_path for op in operations if op.status == "ok" and op.output_path),
+        fingerprint=_stage_fingerprint([fingerprint for _operation, fingerprint, _reused in collected]),
+        units=len(jobs),
+        reused_units=sum(1 for _operation, _fingerprint, reused in collected if reused),
+    )
+
+
 def _collect_one_ohlcv(
     *,
     run_id: str,
@@ -1218,6 +1463,206 @@ def _operation_from_ohlcv_result(
     )
 
 
+@dataclass(frozen=True)
+class _DailyStageOutcome:
+    operations: tuple[DailyCollectionOperation, ...] = ()
+    value: Any = None
+    fingerprint: str | None = None
+    units: int = 1
+    reused_units: int = 0
+
+
+@dataclass(frozen=True)
+class _DailyStage:
+    name: str
+    run: Callable[[Mapping[str, _DailyStageOutcome]], _DailyStageOutcome]
+    depends_on: tuple[str, ...] = ()
+
+
+def _run_daily_stage_graph(
+    stages: Sequence[_DailyStage],
+) -> tuple[dict[str, _DailyStageOutcome], tuple[DailyCollectionStageMetric, ...]]:
+    """Run each stage as soon as its dependencies have completed.
+
+    Stages must be declared after their dependencies, which keeps the graph
+    acyclic by construction.  A stage that raises aborts the run once the
+    stages already in flight have finished, as the sequential runner did.
+    """
+
+    declared: set[str] = set()
+    for stage in stages:
+        missing = [name for name in stage.depends_on if name not in declared]
+        if missing:
+            raise ValueError(f"daily stage {stage.name} depends on undeclared stage(s): {', '.join(missing)}")
+        declared.add(stage.name)
+
+    outcomes: dict[str, _DailyStageOutcome] = {}
+    metrics: dict[str, DailyCollectionStageMetric] = {}
+    pending = list(stages)
+    running: dict[Future[tuple[_DailyStageOutcome, float]], _DailyStage] = {}
+    with ThreadPoolExecutor(max_workers=max(1, len(stages)), thread_name_prefix="daily-research-stage") as pool:
+        while pending or running:
+            for stage in [item for item in pending if all(name in outcomes for name in item.depends_on)]:
+                pending.remove(stage)
+                upstream = {name: outcomes[name] for name in stage.depends_on}
+                running[pool.submit(_timed_stage, stage, upstream)] = stage
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                outcome, wall_time_seconds = future.result()
+                outcomes[stage.name] = outcome
+                metrics[stage.name] = DailyCollectionStageMetric(
+                    stage=stage.name,
+                    status="reused" if outcome.units and outcome.reused_units == outcome.units else "completed",
+                    wall_time_seconds=round(wall_time_seconds, 6),
+                    output_bytes=_operation_output_bytes(outcome.operations),
+                    input_fingerprint=outcome.fingerprint,
+                    units=outcome.units,
+                    reused_units=outcome.reused_units,
+                )
+    return outcomes, tuple(metrics[stage.name] for stage in stages)
+
+
+def _timed_stage(
+    stage: _DailyStage,
+    upstream: Mapping[str, _DailyStageOutcome],
+) -> tuple[_DailyStageOutcome, float]:
+    started = time.perf_counter()
+    outcome = stage.run(upstream)
+    return outcome, time.perf_counter() - started
+
+
+def _appending_stage(
+    runner: Callable[..., str | None],
+    *,
+    prior_operations: Sequence[DailyCollectionOperation] = (),
+    **kwargs: Any,
+) -> _DailyStageOutcome:
+    """Adapt a ``_run_*`` helper that appends to a shared operations list."""
+
+    operations = list(prior_operations)
+    value = runner(operations=operations, **kwargs)
+    return _DailyStageOutcome(operations=tuple(operations[len(prior_operations):]), value=value)
+
+
+def _operation_output_bytes(operations: Sequence[DailyCollectionOperation]) -> int:
+    total = 0
+    for path in _operation_paths(operations):
+        try:
+            total += Path(path).stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _operation_paths(operations: Sequence[DailyCollectionOperation]) -> tuple[str, ...]:
+    paths: dict[str, None] = {}
+    for operation in operations:
+        for path in (operation.output_path, operation.manifest_path, operation.markdown_report_path):
+            if path:
+                paths[path] = None
+    return tuple(paths)
+
+
+def _public_source_limiter(config: DailyResearchDataCollectionConfig) -> SourceRateLimiter:
+    """One limiter for every request of the run to the Kraken public host.
+
+    The sustained rate follows the stricter of the two sections' intervals;
+    a depth round may burst up to ``microstructure.request_burst`` requests.
+    """
+    return SourceRateLimiter(
+        max(config.ohlcv_min_request_interval_seconds, config.microstructure_min_request_interval_seconds),
+        burst=config.microstructure_request_burst,
+    )
+
+
+def _rate_limited_ohlc_fetcher(fetcher: OHLCFetcher, limiter: SourceRateLimiter) -> OHLCFetcher:
+    def fetch(pair: str, interval_minutes: int, since: int | None) -> Any:
+        limiter.acquire()
+        return fetcher(pair, interval_minutes, since)
+
+    return fetch
+
+
+@dataclass(frozen=True)
+class _StoredStage:
+    operations: tuple[DailyCollectionOperation, ...]
+    value: Any
+
+
+class _StageFingerprintStore:
+    """Per-run record of stage input fingerprints and the artifacts they produced.
+
+    An entry is only reused when its fingerprint matches and every recorded
+    artifact still exists with the same SHA-256, so a deleted or edited output
+    is recomputed rather than trusted.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+        stages = payload.get("stages") if isinstance(payload, Mapping) else None
+        self._entries: dict[str, dict[str, Any]] = dict(stages) if isinstance(stages, Mapping) else {}
+
+    def reusable(self, key: str, fingerprint: str) -> _StoredStage | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if not isinstance(entry, Mapping) or entry.get("fingerprint") != fingerprint:
+            return None
+        try:
+            for path, digest in dict(entry.get("artifacts") or {}).items():
+                if _file_sha256(Path(path)) != digest:
+                    return None
+            operations = tuple(DailyCollectionOperation(**item) for item in entry.get("operations") or ())
+        except (OSError, TypeError):
+            return None
+        if not operations:
+            return None
+        return _StoredStage(operations=operations, value=entry.get("value"))
+
+    def record(
+        self,
+        key: str,
+        fingerprint: str,
+        *,
+        operations: Sequence[DailyCollectionOperation],
+        value: Any = None,
+    ) -> None:
+        if any(operation.status == "error" for operation in operations):
+            return
+        artifacts = {
+            path: _file_sha256(Path(path)) for path in _operation_paths(operations) if Path(path).is_file()
+        }
+        with self._lock:
+            self._entries[key] = {
+                "fingerprint": fingerprint,
+                "operations": [operation.to_dict() for operation in operations],
+                "value": value,
+                "artifacts": artifacts,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f"{self.path.name}.tmp")
+            temporary.write_text(json.dumps({"stages": self._entries}, indent=2, sort_keys=True), encoding="utf-8")
+            temporary.replace(self.path)
+
+
+def _stage_fingerprint(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1_048_576), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def _load_yaml_mapping(path: str | Path) -> Mapping[str, Any]:
     try:
         import yaml  # type: ignore
@@ -3,17 +3,29 @@
 The scanner inventories research data sources and maps them to alpha families
 that can be tested. It never imports runtime order paths, never starts services,
 and never mutates trading state.
+
+Per-file summaries (header row, row counts, symbol/timeframe ranges,
+availability times) are memoised in a :class:`DataScanCache` keyed by path,
+size, mtime and inode, so a repeated scan only re-reads new or changed files.
+The cache can be persisted between runs; the report is identical to a cold
+scan either way.
 """
 
 from __future__ import annotations
 
 import csv
 import json
+import os
 import sqlite3
+import time
+from contextvars import ContextVar
 from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from .segmented_history_store import history_files
 
 
 DEFAULT_RESEARCH_MEMORY_PATH = "data/research/alpha_research_memory.sqlite3"
@@ -173,6 +185,7 @@ class DataCapabilityScanReport:
     paper_capital_allowed: bool = False
     live_allowed: bool = False
     promotable: bool = False
+    scan_cache: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -194,8 +207,130 @@ class DataCapabilityScanReport:
             "paper_capital_allowed": self.paper_capital_allowed,
             "live_allowed": self.live_allowed,
             "promotable": self.promotable,
+            "scan_cache": self.scan_cache,
+        }
+
+
+class DataScanCache:
+    """Per-file scan summaries keyed by path, size, mtime and inode.
+
+    A summary ("facet") is computed the first time a scan needs it and reused
+    until the file's stat signature changes.  With a *path* the cache is loaded
+    from and saved to a JSON file; without one it only lives as long as the
+    object, which still lets a long-running caller reuse it across scans.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else None
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._stats: dict[str, os.stat_result | None] = {}
+        self._json: dict[str, Any] = {}
+        self._touched: set[str] = set()
+        self._rescanned: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.rescan_seconds = 0.0
+
+    def begin_scan(self) -> None:
+        self._stats.clear()
+        self._json.clear()
+        self._touched.clear()
+        self._rescanned.clear()
+        self.hits = 0
+        self.misses = 0
+        self.rescan_seconds = 0.0
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        """Stat *path* once per scan (following symlinks, like ``Path.stat``)."""
+
+        key = os.path.abspath(path)
+        if key not in self._stats:
+            try:
+                self._stats[key] = os.stat(key)
+            except OSError:
+                self._stats[key] = None
+        return self._stats[key]
+
+    def facet(self, path: Path, name: str, compute: Callable[[], Any]) -> Any:
+        key = os.path.abspath(path)
+        stat = self.stat(path)
+        if stat is None:
+            return compute()
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        entry = self._entries.get(key)
+        if entry is None or entry.get("signature") != signature:
+            entry = self._entries[key] = {"signature": signature, "facets": {}}
+        self._touched.add(key)
+        facets = entry["facets"]
+        if name in facets:
+            self.hits += 1
+            return facets[name]
+        self.misses += 1
+        self._rescanned.add(key)
+        started = time.perf_counter()
+        value = facets[name] = compute()
+        self.rescan_seconds += time.perf_counter() - started
+        return value
+
+    def json_payload(self, path: Path) -> Any:
+        """Parse a manifest at most once per scan; unreadable files yield ``None``."""
+
+        key = os.path.abspath(path)
+        if key not in self._json:
+            try:
+                self._json[key] = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                self._json[key] = None
+        return self._json[key]
+
+    def summary(self, scan_seconds: float) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "persistent": self.path is not None,
+            "cache_path": str(self.path) if self.path else None,
+            "files_seen": len(self._touched),
+            "files_rescanned": len(self._rescanned),
+            "facet_hits": self.hits,
+            "facet_misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 6) if lookups else None,
+            "rescan_seconds": round(self.rescan_seconds, 6),
+            "scan_seconds": round(scan_seconds, 6),
         }
 
+    def save(self, roots: Sequence[Path]) -> None:
+        """Persist entries, dropping files under *roots* this scan no longer saw."""
+
+        if self.path is None:
+            return
+        prefixes = tuple(os.path.join(os.path.abspath(root), "") for root in roots)
+        entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if key in self._touched or not key.startswith(prefixes)
+        }
+        self._entries = entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        temporary.write_text(json.dumps({"version": self.VERSION, "files": entries}), encoding="utf-8")
+        temporary.replace(self.path)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(payload, Mapping) or payload.get("version") != self.VERSION:
+            return {}
+        files = payload.get("files")
+        return dict(files) if isinstance(files, Mapping) else {}
+
+
+_ACTIVE_SCAN_CACHE: ContextVar[DataScanCache | None] = ContextVar("data_capability_scan_cache", default=None)
+
 
 def build_data_capability_scan_report(
     *,
@@ -203,13 +338,36 @@ def build_data_capability_scan_report(
     data_roots: Sequence[str | Path],
     state_db: str | Path | None = None,
     memory_path: str | Path = DEFAULT_RESEARCH_MEMORY_PATH,
+    scan_cache: DataScanCache | str | Path | None = None,
 ) -> DataCapabilityScanReport:
+    """Scan *data_roots*; pass *scan_cache* to reuse per-file summaries across runs."""
+
+    started = time.perf_counter()
     roots = tuple(Path(path) for path in data_roots)
-    root_files = _files_under(roots)
+    cache = scan_cache if isinstance(scan_cache, DataScanCache) else DataScanCache(scan_cache)
+    cache.begin_scan()
+    token = _ACTIVE_SCAN_CACHE.set(cache)
+    try:
+        inventory = _discover_files(roots, cache)
+        report = _build_report(run_id, roots, inventory, state_db, memory_path)
+    finally:
+        _ACTIVE_SCAN_CACHE.reset(token)
+    cache.save(roots)
+    return replace(report, scan_cache=cache.summary(time.perf_counter() - started))
+
+
+def _build_report(
+    run_id: str,
+    roots: tuple[Path, ...],
+    inventory: "_FileInventory",
+    state_db: str | Path | None,
+    memory_path: str | Path,
+) -> DataCapabilityScanReport:
+    root_files = inventory.files
     state_db_path = Path(state_db) if state_db else None
-    canonical_manifest = _latest_canonical_ohlcv_manifest(roots)
-    derivatives_manifest = _latest_kraken_futures_derivatives_manifest(roots)
-    post_trade_manifest = _latest_kraken_spot_post_trade_manifest(roots)
+    canonical_manifest = _latest_canonical_ohlcv_manifest(inventory)
+    derivatives_manifest = _latest_kraken_futures_derivatives_manifest(inventory)
+    post_trade_manifest = _latest_kraken_spot_post_trade_manifest(inventory)
     capabilities = _build_capabilities(
         root_files,
         state_db_path,
@@ -222,7 +380,6 @@ def build_data_capability_scan_report(
     rejected_status = _rejected_family_status(memory_path, capability_by_id)
     ohlcv = capability_by_id["spot_ohlcv"]
     scheduler_data_state = _scheduler_data_state(
-        roots,
         capability_by_id,
         alpha_status,
         canonical_manifest,
@@ -313,6 +470,10 @@ def render_data_capability_scan_report(report: DataCapabilityScanReport) -> str:
         lines.append(f"- `{key}`: `{value}`")
     lines.extend(["", "## Scheduler Notes", ""])
     lines.extend(f"- {item}" for item in report.scheduler_notes)
+    if report.scan_cache:
+        lines.extend(["", "## Scan Cache", ""])
+        for key, value in report.scan_cache.items():
+            lines.append(f"- `{key}`: `{value}`")
     lines.extend(["", "## Safety", ""])
     lines.extend(f"- {item}" for item in report.safety_notes)
     lines.append(f"- paper_capital_allowed: `{report.paper_capital_allowed}`")
@@ -414,29 +575,17 @@ def _scan_ohlcv(files: Sequence[Path], *, canonical_manifest: Mapping[str, Any]
     starts: list[str] = []
     ends: list[str] = []
     available_times: list[str] = []
-    seen: set[tuple[str, str, str]] = set()
     duplicate_count = 0
     row_count = 0
-    for path in csv_files:
-        for row in _read_csv_sample(path, max_rows=None):
-            timestamp = str(row.get("timestamp") or row.get("datetime") or row.get("time") or "").strip()
-            symbol = str(row.get("symbol") or _symbol_from_filename(path)).strip().upper()
-            timeframe = str(row.get("timeframe") or _timeframe_from_filename(path)).strip().lower()
-            if not timestamp or not symbol or not timeframe:
-                continue
-            key = (symbol, timeframe, timestamp)
-            if key in seen:
-                duplicate_count += 1
-                continue
-            seen.add(key)
-            row_count += 1
-            symbols.add(symbol)
-            timeframes.add(timeframe)
-            starts.append(timestamp)
-            ends.append(timestamp)
-            available_time = _parse_aware_dt(row.get("available_time"))
-            if available_time is not None:
-                available_times.append(available_time.isoformat())
+    for (symbol, timeframe), (rows, unique, start_at, end_at, available_time) in _merge_ohlcv_summaries(csv_files).items():
+        duplicate_count += rows - unique
+        row_count += unique
+        symbols.add(symbol)
+        timeframes.add(timeframe)
+        starts.append(start_at)
+        ends.append(end_at)
+        if available_time is not None:
+            available_times.append(available_time)
     available = row_count > 0
     blockers = () if available else ("spot_ohlcv_missing",)
     quality = "ready_for_ohlcv_research" if available and duplicate_count == 0 else ("dedupe_required" if available else "missing")
@@ -588,33 +737,15 @@ def _scan_spread_depth(files: Sequence[Path]) -> dict[str, DataCapability]:
     has_spread = False
     canonical_forward_rows = 0
     for path in csv_files:
-        for row in _read_csv_sample(path, max_rows=None):
-            symbol = str(row.get("symbol") or _symbol_from_filename(path)).strip().upper()
-            timestamp = str(
-                row.get("event_time")
-                or row.get("timestamp_local")
-                or row.get("timestamp")
-                or row.get("time")
-                or ""
-            ).strip()
-            if symbol:
-                symbols.add(symbol)
-            if timestamp:
-                starts.append(timestamp)
-                ends.append(timestamp)
-            if row.get("spread_bps") not in (None, ""):
-                has_spread = True
-            if row.get("bid_depth_quote") not in (None, "") or row.get("ask_depth_quote") not in (None, ""):
-                has_depth = True
-            if row.get("bid_depth_eur") not in (None, "") or row.get("ask_depth_eur") not in (None, ""):
-                has_depth = True
-            if (
-                str(row.get("temporal_status") or "") == "FORWARD_PUBLIC_REST_INGESTED"
-                and str(row.get("market_mapping_status") or "") == "EXPLICIT"
-                and str(row.get("runtime_parity_proven") or "").lower() in {"false", "0"}
-            ):
-                canonical_forward_rows += 1
-            row_count += 1
+        summary = _scan_cache().facet(path, "spread_depth", lambda path=path: _summarize_spread_depth(path))
+        symbols.update(summary["symbols"])
+        if summary["start_at"] is not None:
+            starts.append(summary["start_at"])
+            ends.append(summary["end_at"])
+        has_spread = has_spread or summary["has_spread"]
+        has_depth = has_depth or summary["has_depth"]
+        canonical_forward_rows += summary["canonical_forward_rows"]
+        row_count += summary["row_count"]
     base = {
         "source_paths": tuple(str(path) for path in csv_files[:50]),
         "provider": "kraken_rest_public_depth" if csv_files else "unknown",
@@ -1125,7 +1256,6 @@ def _build_derivatives_plan(capability_by_id: Mapping[str, DataCapability]) -> t
 
 
 def _scheduler_data_state(
-    roots: Sequence[Path],
     capability_by_id: Mapping[str, DataCapability],
     alpha_status: Mapping[str, Mapping[str, Any]],
     canonical_manifest: Mapping[str, Any] | None = None,
@@ -1133,7 +1263,7 @@ def _scheduler_data_state(
     post_trade_manifest: Mapping[str, Any] | None = None,
     rejected_status: Mapping[str, Mapping[str, Any]] | None = None,
 ) -> dict[str, Any]:
-    manifest = dict(canonical_manifest or _latest_canonical_ohlcv_manifest(roots) or {})
+    manifest = dict(canonical_manifest or {})
     final_duplicate_count = sum(
         int(item.get("duplicate_count") or 0)
         for item in manifest.get("files", ())
@@ -1157,8 +1287,8 @@ def _scheduler_data_state(
         for family, payload in alpha_status.items()
         if payload.get("blockers") or payload.get("status") == "DATA_MISSING" or family in rejected
     ]
-    derivatives = dict(derivatives_manifest or _latest_kraken_futures_derivatives_manifest(roots) or {})
-    post_trade = dict(post_trade_manifest or _latest_kraken_spot_post_trade_manifest(roots) or {})
+    derivatives = dict(derivatives_manifest or {})
+    post_trade = dict(post_trade_manifest or {})
     post_trade_temporal_contract = post_trade.get("temporal_contract")
     if not isinstance(post_trade_temporal_contract, Mapping):
         post_trade_temporal_contract = {}
@@ -1240,60 +1370,27 @@ def _scheduler_notes(
     return tuple(notes)
 
 
-def _latest_canonical_ohlcv_manifest(roots: Sequence[Path]) -> dict[str, Any] | None:
-    candidates: list[Path] = []
-    for root in roots:
-        search_roots = [root]
-        if root.name != "manifests":
-            search_roots.extend(
-                candidate
-                for candidate in (root / "manifests", root.parent / "manifests")
-                if candidate.exists()
-            )
-        for search_root in search_roots:
-            if search_root.is_file() and "ohlcv" in search_root.name.lower() and search_root.suffix.lower() == ".json":
-                candidates.append(search_root)
-            elif search_root.exists():
-                candidates.extend(search_root.rglob("*canonical_ohlcv*.json"))
-                candidates.extend(search_root.rglob("*ohlcv*.json"))
-    unique = sorted(set(candidates), key=lambda item: item.stat().st_mtime if item.exists() else 0, reverse=True)
-    for path in unique:
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+def _latest_canonical_ohlcv_manifest(inventory: "_FileInventory") -> dict[str, Any] | None:
+    for path in inventory.manifest_candidates("ohlcv", ("*canonical_ohlcv*.json", "*ohlcv*.json")):
+        payload = _scan_cache().json_payload(path)
+        if not isinstance(payload, Mapping):
             continue
         if payload.get("snapshot_id") and payload.get("fingerprint"):
             return payload
     return None
 
 
-def _latest_kraken_futures_derivatives_manifest(roots: Sequence[Path]) -> dict[str, Any] | None:
-    candidates: list[Path] = []
-    for root in roots:
-        search_roots = [root]
-        if root.name != "manifests":
-            search_roots.extend(
-                candidate
-                for candidate in (root / "manifests", root.parent / "manifests")
-                if candidate.exists()
-            )
-        for search_root in search_roots:
-            if search_root.is_file() and "kraken_futures_derivatives" in search_root.name.lower() and search_root.suffix.lower() == ".json":
-                candidates.append(search_root)
-            elif search_root.exists():
-                candidates.extend(search_root.rglob("*kraken_futures_derivatives*.json"))
-    unique = sorted(set(candidates), key=lambda item: item.stat().st_mtime if item.exists() else 0, reverse=True)
-    for path in unique:
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+def _latest_kraken_futures_derivatives_manifest(inventory: "_FileInventory") -> dict[str, Any] | None:
+    for path in inventory.manifest_candidates("kraken_futures_derivatives", ("*kraken_futures_derivatives*.json",)):
+        payload = _scan_cache().json_payload(path)
+        if not isinstance(payload, Mapping):
             continue
         if payload.get("snapshot_id") and payload.get("fingerprint") and payload.get("mappings") is not None:
             return payload
     return None
 
 
-def _latest_kraken_spot_post_trade_manifest(roots: Sequence[Path]) -> dict[str, Any] | None:
+def _latest_kraken_spot_post_trade_manifest(inventory: "_FileInventory") -> dict[str, Any] | None:
     """Return the newest valid bounded PostTrade manifest, if any.
 
     This deliberately does not merge manifests or rewrite timestamps.  Each
@@ -1301,25 +1398,9 @@ def _latest_kraken_spot_post_trade_manifest(roots: Sequence[Path]) -> dict[str,
     canonical merge job proves its coverage and compatibility.
     """
 
-    candidates: list[Path] = []
-    for root in roots:
-        search_roots = [root]
-        if root.name != "manifests":
-            search_roots.extend(
-                candidate
-                for candidate in (root / "manifests", root.parent / "manifests")
-                if candidate.exists()
-            )
-        for search_root in search_roots:
-            if search_root.is_file() and "kraken_spot_post_trade" in search_root.name.lower() and search_root.suffix.lower() == ".json":
-                candidates.append(search_root)
-            elif search_root.exists():
-                candidates.extend(search_root.rglob("*kraken_spot_post_trade*.json"))
-    unique = sorted(set(candidates), key=lambda item: item.stat().st_mtime if item.exists() else 0, reverse=True)
-    for path in unique:
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+    for path in inventory.manifest_candidates("kraken_spot_post_trade", ("*kraken_spot_post_trade*.json",)):
+        payload = _scan_cache().json_payload(path)
+        if not isinstance(payload, Mapping):
             continue
         temporal_contract = payload.get("temporal_contract")
         if (
@@ -1332,14 +1413,214 @@ def _latest_kraken_spot_post_trade_manifest(roots: Sequence[Path]) -> dict[str,
     return None
 
 
-def _files_under(roots: Iterable[Path]) -> tuple[Path, ...]:
+@dataclass(frozen=True)
+class _FileInventory:
+    """Files found by one walk of the data roots and their manifest directories."""
+
+    roots: tuple[Path, ...]
+    files: tuple[Path, ...]
+    walked: dict[Path, tuple[Path, ...]]
+
+    def manifest_candidates(self, token: str, patterns: Sequence[str]) -> list[Path]:
+        """Manifest files for *token*, newest first, as the per-root glob search found them."""
+
+        candidates: list[Path] = []
+        for search_root in _manifest_search_roots(self.roots):
+            if search_root.is_file():
+                if token in search_root.name.lower() and search_root.suffix.lower() == ".json":
+                    candidates.append(search_root)
+            elif search_root in self.walked:
+                candidates.extend(
+                    path
+                    for path in self.walked[search_root]
+                    if any(fnmatchcase(path.name, pattern) for pattern in patterns)
+                )
+        cache = _scan_cache()
+
+        def mtime(path: Path) -> float:
+            stat = cache.stat(path)
+            return stat.st_mtime if stat is not None else 0
+
+        return sorted(set(candidates), key=mtime, reverse=True)
+
+
+def _manifest_search_roots(roots: Iterable[Path]) -> list[Path]:
+    search_roots: list[Path] = []
+    for root in roots:
+        search_roots.append(root)
+        if root.name != "manifests":
+            search_roots.extend(
+                candidate
+                for candidate in (root / "manifests", root.parent / "manifests")
+                if candidate.exists()
+            )
+    return search_roots
+
+
+def _discover_files(roots: Sequence[Path], cache: DataScanCache) -> _FileInventory:
+    """Walk every data root and manifest directory once, stating each file once."""
+
+    walked: dict[Path, tuple[Path, ...]] = {}
+    for search_root in _manifest_search_roots(roots):
+        if search_root in walked or search_root.is_file() or not search_root.exists():
+            continue
+        ancestor = next((item for item in walked if item in search_root.parents), None)
+        if ancestor is not None:
+            walked[search_root] = tuple(path for path in walked[ancestor] if search_root in path.parents)
+            continue
+        walked[search_root] = tuple(
+            path
+            for path in search_root.rglob("*")
+            if (stat := cache.stat(path)) is not None and _is_regular(stat)
+        )
     files: list[Path] = []
     for root in roots:
         if root.is_file():
             files.append(root)
-        elif root.exists():
-            files.extend(path for path in root.rglob("*") if path.is_file())
-    return tuple(files)
+        elif root in walked:
+            files.extend(walked[root])
+    return _FileInventory(roots=tuple(roots), files=tuple(files), walked=walked)
+
+
+def _is_regular(stat: os.stat_result) -> bool:
+    return (stat.st_mode & 0o170000) == 0o100000
+
+
+def _scan_cache() -> DataScanCache:
+    cache = _ACTIVE_SCAN_CACHE.get()
+    return cache if cache is not None else DataScanCache()
+
+
+def _first_row(path: Path) -> dict[str, str] | None:
+    def compute() -> dict[str, str] | None:
+        for row in _read_csv_sample(path, max_rows=1):
+            # Overflow cells land under a ``None`` key, which JSON cannot round-trip.
+            return {key: value for key, value in row.items() if key is not None}
+        return None
+
+    return _scan_cache().facet(path, "first_row", compute)
+
+
+def _merge_ohlcv_summaries(files: Sequence[Path]) -> dict[tuple[str, str], list[Any]]:
+    """Combine per-file OHLCV summaries as if every row had been read in order.
+
+    Rows only collide across files when a (symbol, timeframe) appears in files
+    whose timestamp ranges overlap; those groups are re-read row by row so
+    duplicate counts and first-seen availability stay exact.
+    """
+
+    cache = _scan_cache()
+    per_group: dict[tuple[str, str], list[tuple[Path, list[Any]]]] = {}
+    for path in files:
+        for symbol, timeframe, *summary in cache.facet(path, "ohlcv", lambda path=path: _summarize_ohlcv(path)):
+            per_group.setdefault((symbol, timeframe), []).append((path, summary))
+    merged: dict[tuple[str, str], list[Any]] = {}
+    for group, parts in per_group.items():
+        ranges = sorted((summary[2], summary[3]) for _path, summary in parts)
+        if all(left[1] < right[0] for left, right in zip(ranges, ranges[1:])):
+            rows = sum(summary[0] for _path, summary in parts)
+            unique = sum(summary[1] for _path, summary in parts)
+            available = [summary[4] for _path, summary in parts if summary[4] is not None]
+            merged[group] = [rows, unique, ranges[0][0], max(item[1] for item in ranges), max(available) if available else None]
+        else:
+            merged[group] = _exact_ohlcv_group(group, [path for path, _summary in parts])
+    return merged
+
+
+def _summarize_ohlcv(path: Path) -> list[list[Any]]:
+    groups: dict[tuple[str, str], list[Any]] = {}
+    seen: set[tuple[str, str, str]] = set()
+    for symbol, timeframe, timestamp, available_time in _ohlcv_rows(path):
+        group = groups.get((symbol, timeframe))
+        if group is None:
+            group = groups[(symbol, timeframe)] = [0, 0, timestamp, timestamp, None]
+        group[0] += 1
+        key = (symbol, timeframe, timestamp)
+        if key in seen:
+            continue
+        seen.add(key)
+        group[1] += 1
+        group[2] = min(group[2], timestamp)
+        group[3] = max(group[3], timestamp)
+        if available_time is not None and (group[4] is None or available_time > group[4]):
+            group[4] = available_time
+    return [[symbol, timeframe, *summary] for (symbol, timeframe), summary in groups.items()]
+
+
+def _exact_ohlcv_group(group: tuple[str, str], files: Sequence[Path]) -> list[Any]:
+    seen: set[str] = set()
+    rows = 0
+    timestamps: list[str] = []
+    available: list[str] = []
+    for path in files:
+        for symbol, timeframe, timestamp, available_time in _ohlcv_rows(path):
+            if (symbol, timeframe) != group:
+                continue
+            rows += 1
+            if timestamp in seen:
+                continue
+            seen.add(timestamp)
+            timestamps.append(timestamp)
+            if available_time is not None:
+                available.append(available_time)
+    return [rows, len(seen), min(timestamps), max(timestamps), max(available) if available else None]
+
+
+def _ohlcv_rows(path: Path) -> Iterator[tuple[str, str, str, str | None]]:
+    for row in _read_csv_sample(path, max_rows=None):
+        timestamp = str(row.get("timestamp") or row.get("datetime") or row.get("time") or "").strip()
+        symbol = str(row.get("symbol") or _symbol_from_filename(path)).strip().upper()
+        timeframe = str(row.get("timeframe") or _timeframe_from_filename(path)).strip().lower()
+        if not timestamp or not symbol or not timeframe:
+            continue
+        available_time = _parse_aware_dt(row.get("available_time"))
+        yield symbol, timeframe, timestamp, available_time.isoformat() if available_time is not None else None
+
+
+def _summarize_spread_depth(path: Path) -> dict[str, Any]:
+    symbols: set[str] = set()
+    start_at: str | None = None
+    end_at: str | None = None
+    row_count = 0
+    has_depth = False
+    has_spread = False
+    canonical_forward_rows = 0
+    for row in _read_csv_sample(path, max_rows=None):
+        symbol = str(row.get("symbol") or _symbol_from_filename(path)).strip().upper()
+        timestamp = str(
+            row.get("event_time")
+            or row.get("timestamp_local")
+            or row.get("timestamp")
+            or row.get("time")
+            or ""
+        ).strip()
+        if symbol:
+            symbols.add(symbol)
+        if timestamp:
+            start_at = timestamp if start_at is None else min(start_at, timestamp)
+            end_at = timestamp if end_at is None else max(end_at, timestamp)
+        if row.get("spread_bps") not in (None, ""):
+            has_spread = True
+        if row.get("bid_depth_quote") not in (None, "") or row.get("ask_depth_quote") not in (None, ""):
+            has_depth = True
+        if row.get("bid_depth_eur") not in (None, "") or row.get("ask_depth_eur") not in (None, ""):
+            has_depth = True
+        if (
+            str(row.get("temporal_status") or "") == "FORWARD_PUBLIC_REST_INGESTED"
+            and str(row.get("market_mapping_status") or "") == "EXPLICIT"
+            and str(row.get("runtime_parity_proven") or "").lower() in {"false", "0"}
+        ):
+            canonical_forward_rows += 1
+        row_count += 1
+    return {
+        "symbols": sorted(symbols),
+        "start_at": start_at,
+        "end_at": end_at,
+        "row_count": row_count,
+        "has_spread": has_spread,
+        "has_depth": has_depth,
+        "canonical_forward_rows": canonical_forward_rows,
+    }
 
 
 def _read_csv_sample(path: Path, *, max_rows: int | None) -> Iterable[dict[str, str]]:
@@ -1369,10 +1650,8 @@ def _looks_like_ohlcv(path: Path) -> bool:
         return False
     if any(token in name for token in ("ohlcv", "kraken_")):
         return True
-    for row in _read_csv_sample(path, max_rows=1):
-        fields = set(row)
-        return {"open", "high", "low", "close"}.issubset(fields)
-    return False
+    row = _first_row(path)
+    return row is not None and {"open", "high", "low", "close"}.issubset(row)
 
 
 def _is_post_trade_historical_ohlcv(path: Path) -> bool:
@@ -1383,50 +1662,44 @@ def _is_post_trade_historical_ohlcv(path: Path) -> bool:
     runtime feed would let a historical import change strategy readiness.
     """
 
-    for row in _read_csv_sample(path, max_rows=1):
-        if str(row.get("source") or "").strip() == "kraken_spot_post_trade":
-            return True
-        if str(row.get("temporal_status") or "").strip() == "HISTORICAL_BACKFILL_AVAILABLE_AT_INGESTION":
-            return True
-    return False
+    row = _first_row(path) or {}
+    return (
+        str(row.get("source") or "").strip() == "kraken_spot_post_trade"
+        or str(row.get("temporal_status") or "").strip() == "HISTORICAL_BACKFILL_AVAILABLE_AT_INGESTION"
+    )
 
 
 def _is_official_archive_historical_ohlcv(path: Path) -> bool:
     """Keep operator-imported OHLCVT history out of runtime capability scans."""
 
-    for row in _read_csv_sample(path, max_rows=1):
-        if str(row.get("source") or "").strip() == "kraken_official_ohlcvt_archive":
-            return True
-        if str(row.get("temporal_status") or "").strip() == "HISTORICAL_ARCHIVE_AVAILABLE_AT_INGESTION":
-            return True
-    return False
+    row = _first_row(path) or {}
+    return (
+        str(row.get("source") or "").strip() == "kraken_official_ohlcvt_archive"
+        or str(row.get("temporal_status") or "").strip() == "HISTORICAL_ARCHIVE_AVAILABLE_AT_INGESTION"
+    )
 
 
 def _looks_like_spread_depth(path: Path) -> bool:
     name = str(path).lower()
     if "spread_depth" in name or "microstructure" in name:
         return True
-    for row in _read_csv_sample(path, max_rows=1):
-        fields = set(row)
-        return "spread_bps" in fields or {"best_bid", "best_ask"}.issubset(fields)
-    return False
+    row = _first_row(path)
+    return row is not None and ("spread_bps" in row or {"best_bid", "best_ask"}.issubset(row))
 
 
 def _is_canonical_microstructure_path(path: Path) -> bool:
     parts = {part.lower() for part in path.parts}
     if "canonical" in parts and "microstructure" in parts:
         return True
-    for row in _read_csv_sample(path, max_rows=1):
-        fields = set(row)
-        return {
-            "schema_version",
-            "source_snapshot_id",
-            "event_time",
-            "available_time",
-            "ingestion_time",
-            "data_quality_status",
-        }.issubset(fields)
-    return False
+    row = _first_row(path)
+    return row is not None and {
+        "schema_version",
+        "source_snapshot_id",
+        "event_time",
+        "available_time",
+        "ingestion_time",
+        "data_quality_status",
+    }.issubset(row)
 
 
 def _symbol_from_filename(path: Path) -> str:
@@ -1446,35 +1719,38 @@ def _timeframe_from_filename(path: Path) -> str:
 
 
 def _rough_csv_row_count(files: Sequence[Path]) -> int:
+    cache = _scan_cache()
     total = 0
     for path in files:
         if path.suffix.lower() != ".csv":
             continue
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                total += max(0, sum(1 for _ in handle) - 1)
+            total += cache.facet(path, "line_count", lambda path=path: _line_count(path))
         except OSError:
             continue
     return total
 
 
+def _line_count(path: Path) -> int:
+    with path.open("r", encoding="utf-8") as handle:
+        return max(0, sum(1 for _ in handle) - 1)
+
+
+def _data_files(files: Iterable[Path]) -> tuple[Path, ...]:
+    """Expand segmented history directories into the segment files behind them."""
+
+    return tuple(data_file for path in files for data_file in history_files(path))
+
+
 def _storage_size(files: Sequence[Path]) -> int:
-    total = 0
-    for path in files:
-        try:
-            total += path.stat().st_size
-        except OSError:
-            continue
-    return total
+    files = _data_files(files)
+    cache = _scan_cache()
+    return sum(stat.st_size for path in files if (stat := cache.stat(path)) is not None)
 
 
 def _artifact_age_seconds(files: Sequence[Path]) -> float | None:
-    mtimes = []
-    for path in files:
-        try:
-            mtimes.append(path.stat().st_mtime)
-        except OSError:
-            continue
+    cache = _scan_cache()
+    mtimes = [stat.st_mtime for path in files if (stat := cache.stat(path)) is not None]
     if not mtimes:
         return None
     return max(0.0, datetime.now(timezone.utc).timestamp() - max(mtimes))
@@ -1485,6 +1761,7 @@ def _freshness_metadata(
     *,
     preferred: Sequence[Any] = (),
 ) -> dict[str, float | str | None]:
+    files = _data_files(files)
     last_available_time = _latest_usable_available_time(files, preferred=preferred)
     event_freshness = _event_freshness_seconds(last_available_time)
     return {
@@ -1510,11 +1787,20 @@ def _latest_usable_available_time(
     """
 
     candidates = [parsed for value in preferred if (parsed := _parse_aware_dt(value)) is not None]
+    cache = _scan_cache()
     for path in files:
-        for row in _read_csv_sample(path, max_rows=None):
-            parsed = _parse_aware_dt(row.get("available_time"))
-            if parsed is not None:
-                candidates.append(parsed)
+        latest = _parse_aware_dt(cache.facet(path, "available_max", lambda path=path: _max_available_time(path)))
+        if latest is not None:
+            candidates.append(latest)
+    return max(candidates).isoformat() if candidates else None
+
+
+def _max_available_time(path: Path) -> str | None:
+    candidates = [
+        parsed
+        for row in _read_csv_sample(path, max_rows=None)
+        if (parsed := _parse_aware_dt(row.get("available_time"))) is not None
+    ]
     return max(candidates).isoformat() if candidates else None
 
 
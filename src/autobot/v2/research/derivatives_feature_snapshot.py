@@ -33,6 +33,7 @@ from .derivatives_basis_contract import (
     is_verified_basis_confidence,
 )
 from .feature_registry import FeatureRegistry, default_feature_registry, validate_historical_shadow_parity
+from .segmented_history_store import iter_history_rows
 
 
 DERIVATIVES_FEATURE_SNAPSHOT_SCHEMA_VERSION = 2
@@ -1077,8 +1078,8 @@ def _dataset_summaries(
 
 
 def _read_csv(path: Path) -> list[dict[str, str]]:
-    with path.open("r", encoding="utf-8", newline="") as handle:
-        return [dict(row) for row in csv.DictReader(handle) if row.get("timestamp")]
+    # History paths are segmented stores; legacy single-file CSVs still load.
+    return list(iter_history_rows(path))
 
 
 def _read_feature_csv(path: Path) -> list[dict[str, str]]:
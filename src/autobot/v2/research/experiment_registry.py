@@ -18,7 +18,14 @@ from pathlib import Path
 import sqlite3
 from itertools import product
 from time import sleep
-from typing import Any, Callable, Iterable, Mapping, Sequence, TypeVar
+from typing import Any, Callable, ContextManager, Iterable, Mapping, Sequence, TypeVar
+
+from autobot.v2.sqlite_access import (
+    SQLitePragmas,
+    busy_retry_delay_seconds,
+    is_sqlite_busy_error,
+    shared_sqlite_pool,
+)
 
 from .alpha_hypothesis_lab import CANONICAL_RESEARCH_STAGES, next_research_stage, normalize_research_stage
 
@@ -249,6 +256,11 @@ class ExperimentRegistry:
         self._write_retries = int(write_retries)
         self._retry_base_delay_seconds = float(retry_base_delay_seconds)
         self._sleeper = sleeper
+        self._pool = shared_sqlite_pool(
+            self.path,
+            timeout_seconds=self._sqlite_timeout_seconds,
+            pragmas=SQLitePragmas.from_env(busy_timeout_ms=self._busy_timeout_ms, foreign_keys=True),
+        )
 
     def register_experiment(self, spec: ExperimentSpec) -> ExperimentState:
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -1488,16 +1500,8 @@ class ExperimentRegistry:
             raise ExperimentRegistryError("artifact path is required")
         return f"artifact_{_fingerprint({'experiment_id': experiment_id, 'stage': stage, 'path': path, 'fingerprint': fingerprint})[:20]}"
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.path, timeout=self._sqlite_timeout_seconds)
-        try:
-            connection.execute("PRAGMA foreign_keys = ON")
-            connection.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
-            connection.execute("PRAGMA journal_mode = WAL")
-            return connection
-        except Exception:
-            connection.close()
-            raise
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return self._pool.transaction()
 
     def _run_write(self, operation_name: str, operation: Callable[[sqlite3.Connection], _T]) -> _T:
         """Run one idempotent registry write with bounded SQLite lock recovery.
@@ -1509,30 +1513,13 @@ class ExperimentRegistry:
 
         last_error: sqlite3.OperationalError | None = None
         for attempt in range(self._write_retries + 1):
-            connection: sqlite3.Connection | None = None
             try:
-                connection = self._connect()
-                # Serialize the read/validate/write sequence across registry
-                # processes. This prevents a second writer from observing an
-                # absent experiment, holdout or claim between the first read
-                # and its immutable insert.
-                connection.execute("BEGIN IMMEDIATE")
-                self._initialize(connection)
-                result = operation(connection)
-                connection.commit()
-                return result
+                return self._write_once(operation_name, operation)
             except sqlite3.OperationalError as exc:
-                if connection is not None:
-                    try:
-                        connection.rollback()
-                    except sqlite3.DatabaseError as rollback_error:
-                        raise ExperimentRegistryError(
-                            f"experiment registry {operation_name} rollback failed"
-                        ) from rollback_error
-                if not _is_transient_lock(exc) or attempt >= self._write_retries:
+                if not is_sqlite_busy_error(exc) or attempt >= self._write_retries:
                     raise
                 last_error = exc
-                delay = self._retry_base_delay_seconds * (2 ** attempt)
+                delay = busy_retry_delay_seconds(self._retry_base_delay_seconds, attempt)
                 logger.warning(
                     "Experiment-registry SQLite busy during %s; retry %s/%s in %.3fs",
                     operation_name,
@@ -1541,22 +1528,31 @@ class ExperimentRegistry:
                     delay,
                 )
                 self._sleeper(delay)
-            except Exception:
-                if connection is not None:
-                    try:
-                        connection.rollback()
-                    except sqlite3.DatabaseError as rollback_error:
-                        raise ExperimentRegistryError(
-                            f"experiment registry {operation_name} rollback failed"
-                        ) from rollback_error
-                raise
-            finally:
-                if connection is not None:
-                    connection.close()
         if last_error is not None:
             raise last_error
         raise AssertionError("unreachable experiment-registry SQLite retry state")
 
+    def _write_once(self, operation_name: str, operation: Callable[[sqlite3.Connection], _T]) -> _T:
+        with self._pool.checkout() as connection:
+            try:
+                # Serialize the read/validate/write sequence across registry
+                # processes. This prevents a second writer from observing an
+                # absent experiment, holdout or claim between the first read
+                # and its immutable insert.
+                connection.execute("BEGIN IMMEDIATE")
+                self._initialize(connection)
+                result = operation(connection)
+                connection.commit()
+                return result
+            except Exception:
+                try:
+                    connection.rollback()
+                except sqlite3.DatabaseError as rollback_error:
+                    raise ExperimentRegistryError(
+                        f"experiment registry {operation_name} rollback failed"
+                    ) from rollback_error
+                raise
+
     @staticmethod
     def _initialize(connection: sqlite3.Connection) -> None:
         connection.execute(
@@ -1791,11 +1787,6 @@ def _fingerprint(value: Any) -> str:
     return sha256(_json(value).encode("utf-8")).hexdigest()
 
 
-def _is_transient_lock(error: sqlite3.OperationalError) -> bool:
-    message = str(error).lower()
-    return "locked" in message or "busy" in message
-
-
 def _validate_passed_stage_evidence(
     *,
     stage: str,
@@ -21,7 +21,12 @@ from .dataset_builder import DatasetBuildConfig, DatasetBuildResult, build_datas
 from .execution_cost_model import ExecutionCostConfig, execution_cost_config_for_profile
 from .loss_attribution import LossAttributionResult, analyze_trade_journal
 from .strategy_scorecard import StrategyEvidence, StrategyScorecardResult, score_strategy
-from .validation_runner import ValidationRunnerConfig, run_validation
+from .validation_runner import (
+    ValidationRunnerConfig,
+    ValidationRunnerResult,
+    run_grid_backtest_sweep,
+    run_validation,
+)
 from .walk_forward import WalkForwardResult
 
 
@@ -414,10 +419,16 @@ def run_grid_experiments(config: GridExperimentConfig) -> GridExperimentReport:
     variants = build_grid_experiment_variants(max_variants=config.max_variants)
     cells: list[GridExperimentCell] = []
     baseline_by_symbol: dict[str, GridExperimentCell] = {}
+    cells_by_key: dict[tuple[str, str], GridExperimentCell] = {}
 
+    # All variants of one symbol share a single pass over its bars; cells are
+    # then reported in the usual variant-major order.
+    for symbol in dict.fromkeys(item.upper() for item in config.symbols):
+        for cell in _run_backtest_cells(config, variants, dataset_csv_path, symbol):
+            cells_by_key[(cell.variant_name, symbol)] = cell
     for variant in variants:
         for symbol in config.symbols:
-            cell, backtest_result = _run_backtest_cell(config, variant, dataset_csv_path, symbol.upper())
+            cell = cells_by_key[(variant.name, symbol.upper())]
             cells.append(cell)
             if variant.family == "baseline_current":
                 baseline_by_symbol[symbol.upper()] = cell
@@ -581,36 +592,64 @@ def render_grid_experiment_report(report: GridExperimentReport) -> str:
     return "\n".join(lines) + "\n"
 
 
-def _run_backtest_cell(
+def _run_backtest_cells(
+    config: GridExperimentConfig,
+    variants: Sequence[GridExperimentVariant],
+    dataset_csv_path: Path,
+    symbol: str,
+) -> list[GridExperimentCell]:
+    strategy_configs = [
+        variant.config_for_symbol(symbol, estimated_round_trip_cost_bps=config.estimated_round_trip_cost_bps)
+        for variant in variants
+    ]
+    runner_results = run_grid_backtest_sweep(
+        [
+            _backtest_runner_config(config, variant, dataset_csv_path, symbol, strategy_config)
+            for variant, strategy_config in zip(variants, strategy_configs)
+        ]
+    )
+    return [
+        _cell_from_runner_result(config, variant, symbol, strategy_config, runner_result)
+        for variant, strategy_config, runner_result in zip(variants, strategy_configs, runner_results)
+    ]
+
+
+def _backtest_runner_config(
     config: GridExperimentConfig,
     variant: GridExperimentVariant,
     dataset_csv_path: Path,
     symbol: str,
-) -> tuple[GridExperimentCell, Any]:
-    run_id = f"{config.run_id}_{variant.name}_{symbol}".replace("/", "_")
-    strategy_config = variant.config_for_symbol(symbol, estimated_round_trip_cost_bps=config.estimated_round_trip_cost_bps)
-    runner_result = run_validation(
-        ValidationRunnerConfig(
-            run_id=run_id,
-            strategy="grid",
-            data_source="csv",
-            data_path=dataset_csv_path,
-            symbol=symbol,
-            dataset_id=f"grid_experiment:{config.timeframe}:{symbol}:{variant.name}",
-            mode="backtest",
-            output_dir=config.output_dir / "cells",
-            initial_capital_eur=config.initial_capital_eur,
-            order_notional_eur=config.order_notional_eur,
-            min_closed_trades=config.min_closed_trades,
-            min_profit_factor=config.candidate_min_profit_factor,
-            max_drawdown_pct=config.candidate_max_drawdown_pct,
-            cost_config=config.cost_config,
-            strategy_config=strategy_config,
-            include_regime_context=config.include_regime_context,
-        )
+    strategy_config: dict[str, Any],
+) -> ValidationRunnerConfig:
+    return ValidationRunnerConfig(
+        run_id=f"{config.run_id}_{variant.name}_{symbol}".replace("/", "_"),
+        strategy="grid",
+        data_source="csv",
+        data_path=dataset_csv_path,
+        symbol=symbol,
+        dataset_id=f"grid_experiment:{config.timeframe}:{symbol}:{variant.name}",
+        mode="backtest",
+        output_dir=config.output_dir / "cells",
+        initial_capital_eur=config.initial_capital_eur,
+        order_notional_eur=config.order_notional_eur,
+        min_closed_trades=config.min_closed_trades,
+        min_profit_factor=config.candidate_min_profit_factor,
+        max_drawdown_pct=config.candidate_max_drawdown_pct,
+        cost_config=config.cost_config,
+        strategy_config=strategy_config,
+        include_regime_context=config.include_regime_context,
     )
+
+
+def _cell_from_runner_result(
+    config: GridExperimentConfig,
+    variant: GridExperimentVariant,
+    symbol: str,
+    strategy_config: dict[str, Any],
+    runner_result: ValidationRunnerResult,
+) -> GridExperimentCell:
     result = runner_result.result
-    attribution = _loss_attribution(result.journal_path, run_id=run_id)
+    attribution = _loss_attribution(result.journal_path, run_id=result.run_id)
     scorecard = score_strategy(
         StrategyEvidence.from_metrics(
             result.strategy_id,
@@ -622,7 +661,7 @@ def _run_backtest_cell(
             out_of_sample_included=False,
         )
     )
-    cell = _cell_from_backtest(
+    return _cell_from_backtest(
         config=config,
         variant=variant,
         symbol=symbol,
@@ -632,7 +671,6 @@ def _run_backtest_cell(
         attribution=attribution,
         scorecard=scorecard,
     )
-    return cell, result
 
 
 def _run_walk_forward_cell(
@@ -12,7 +12,9 @@ from __future__ import annotations
 
 import json
 import math
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -46,6 +48,7 @@ DEFAULT_EXIT_MODES: tuple[ExitMode, ...] = (
     "partial_runner",
     "trend_invalidation",
 )
+_SUPPORT_REVERSION_MAX_ZSCORE = -1.2
 
 
 @dataclass(frozen=True)
@@ -66,12 +69,15 @@ class HighConvictionDiscoveryConfig:
     candidate_min_profit_factor: float = 1.20
     candidate_max_drawdown_bps: float = 1_500.0
     comparison_micro_report_path: Path | None = None
+    scenario_workers: int = 1
 
     def __post_init__(self) -> None:
         if not self.run_id.strip():
             raise ValueError("run_id must not be empty")
         if not self.data_paths:
             raise ValueError("data_paths must not be empty")
+        if self.scenario_workers < 1:
+            raise ValueError("scenario_workers must be positive")
         if self.initial_capital_eur <= 0.0 or self.order_notional_eur <= 0.0:
             raise ValueError("capital and notional must be positive")
         if not self.min_expected_move_bps:
@@ -290,7 +296,7 @@ def build_high_conviction_discovery_report(
         for hold in config.max_hold_hours
         for mode in config.exit_modes
     )
-    results = tuple(_run_discovery_scenario(config, scenario, setups, enriched) for scenario in scenarios)
+    results = _run_discovery_scenarios(config, scenarios, setups, enriched)
     best = _best_scenario(results)
     comparison = _grid_micro_comparison(config.comparison_micro_report_path, best)
     conclusion, recommendations = _build_conclusion(best, setups, comparison)
@@ -494,24 +500,30 @@ def _discover_setups(
         symbols = tuple(symbol for symbol in symbols if symbol in wanted)
     setups: list[DiscoverySetup] = []
     for symbol in symbols:
-        five = groups.get((symbol, "5m"), [])
-        fifteen = groups.get((symbol, "15m"), [])
-        one_hour = groups.get((symbol, "1h"), [])
-        four_hour = groups.get((symbol, "4h"), [])
-        if len(five) < 10 or len(fifteen) < 40 or len(one_hour) < 12:
+        timeframes = _AlignedTimeframes(
+            five=groups.get((symbol, "5m"), []),
+            fifteen=groups.get((symbol, "15m"), []),
+            one_hour=groups.get((symbol, "1h"), []),
+            four_hour=groups.get((symbol, "4h"), []),
+        )
+        fifteen = timeframes.fifteen
+        if len(timeframes.five) < 10 or len(fifteen) < 40 or len(timeframes.one_hour) < 12:
             continue
         for index in range(40, len(fifteen) - 1):
             bar = fifteen[index]
-            history_15m = fifteen[: index + 1]
-            history_1h = _bars_at_or_before(one_hour, bar.timestamp)
-            history_4h = _bars_at_or_before(four_hour, bar.timestamp)
-            if len(history_1h) < 12:
+            one_hour_count = timeframes.one_hour_count(bar.timestamp)
+            if one_hour_count < 12:
                 continue
-            entry = _first_bar_after(five, bar.timestamp)
+            entry = timeframes.first_5m_after(bar.timestamp)
             if entry is None:
                 continue
-            context = _context_for_bar(history_15m, history_1h, history_4h)
-            for setup in _setups_for_context(config, symbol, bar, entry, context):
+            context = timeframes.context(index, one_hour_count)
+            candidates = _setups_for_context(config, symbol, bar, entry, context)
+            if candidates or abs(context["zscore_50_15m"] - _SUPPORT_REVERSION_MAX_ZSCORE) < 1e-9:
+                # Emitted features (and borderline gates) use the exact z-score.
+                context = timeframes.context(index, one_hour_count, exact_zscore=True)
+                candidates = _setups_for_context(config, symbol, bar, entry, context)
+            for setup in candidates:
                 if setup.expected_move_bps >= min(config.min_expected_move_bps):
                     setups.append(setup)
     return _dedupe_setups(setups)
@@ -568,7 +580,7 @@ def _setups_for_context(
     if (
         "major_support_mean_reversion" in families
         and near_support
-        and z50 <= -1.2
+        and z50 <= _SUPPORT_REVERSION_MAX_ZSCORE
         and trend_4h >= -450.0
         and atr_15m >= 6.0
     ):
@@ -673,18 +685,169 @@ def _context_for_bar(
     }
 
 
+class _AlignedTimeframes:
+    """One symbol's 5m/15m/1h/4h series aligned for a linear 15m scan.
+
+    Higher timeframes are located with ``bisect`` over precomputed timestamp
+    arrays instead of filtering whole series per bar.  :meth:`context` yields
+    the same features as :func:`_context_for_bar` on the full histories: true
+    ranges are computed once per series, every indicator reads a bounded tail,
+    and the 1h/4h part is reused until a new higher-timeframe bar closes.  The
+    50-bar z-score uses a float deviation unless ``exact_zscore`` asks for the
+    ``statistics.pstdev`` value the reference computation reports.
+    """
+
+    def __init__(
+        self,
+        *,
+        five: Sequence[MarketBar],
+        fifteen: Sequence[MarketBar],
+        one_hour: Sequence[MarketBar],
+        four_hour: Sequence[MarketBar],
+    ) -> None:
+        self.five = _sorted_by_timestamp(five)
+        self.fifteen = fifteen
+        self.one_hour = _sorted_by_timestamp(one_hour)
+        self.four_hour = _sorted_by_timestamp(four_hour)
+        self._five_times = [bar.timestamp for bar in self.five]
+        self._one_hour_times = [bar.timestamp for bar in self.one_hour]
+        self._four_hour_times = [bar.timestamp for bar in self.four_hour]
+        self._closes_15m = [bar.close for bar in fifteen]
+        self._true_ranges_15m = _true_ranges_bps(fifteen)
+        self._true_ranges_1h = _true_ranges_bps(self.one_hour)
+        self._higher_context: dict[tuple[int, int], dict[str, Any]] = {}
+
+    def one_hour_count(self, timestamp: datetime) -> int:
+        return bisect_right(self._one_hour_times, timestamp)
+
+    def first_5m_after(self, timestamp: datetime) -> MarketBar | None:
+        position = bisect_right(self._five_times, timestamp)
+        return self.five[position] if position < len(self.five) else None
+
+    def context(self, index: int, one_hour_count: int, *, exact_zscore: bool = False) -> dict[str, Any]:
+        current = self.fifteen[index]
+        size = index + 1
+        closes = self._closes_15m
+        atr_15 = _tail_atr_bps(self._true_ranges_15m, max(0, size - 32), size)
+        recent_atr = _tail_atr_bps(self._true_ranges_15m, max(0, size - 16), size)
+        baseline_atr = _tail_atr_bps(self._true_ranges_15m, size - 64, size - 16) if size >= 80 else atr_15
+        sma20_15 = (sum(closes[size - 20 : size]) / 20 if size >= 20 else None) or current.close
+        sma50_15 = (sum(closes[size - 50 : size]) / 50 if size >= 50 else None) or current.close
+        tail_50 = closes[max(0, size - 50) : size]
+        std50 = _std(tail_50) if exact_zscore else _float_pstdev(tail_50)
+        z50 = ((current.close - sma50_15) / std50) if std50 and std50 > 0 else 0.0
+        higher = self._higher_timeframe_context(current, one_hour_count)
+        previous = self.fifteen[max(0, index - 32) : index]
+        return {
+            "atr_15m_bps": atr_15,
+            "atr_1h_bps": higher["atr_1h_bps"],
+            "trend_1h_bps": higher["trend_1h_bps"],
+            "trend_4h_bps": higher["trend_4h_bps"],
+            "sma20_15m": sma20_15,
+            "sma50_15m": sma50_15,
+            "zscore_50_15m": z50,
+            "support_1h": higher["support_1h"] if one_hour_count else current.low,
+            "resistance_1h": higher["resistance_1h"] if one_hour_count else current.high,
+            "previous_high_15m": max((bar.high for bar in previous), default=current.high),
+            "previous_low_15m": min((bar.low for bar in previous), default=current.low),
+            "vol_expansion_ratio": recent_atr / max(baseline_atr, 1e-12),
+        }
+
+    def _higher_timeframe_context(self, current: MarketBar, one_hour_count: int) -> dict[str, Any]:
+        four_hour_count = bisect_right(self._four_hour_times, current.timestamp)
+        key = (one_hour_count, four_hour_count)
+        cached = self._higher_context.get(key)
+        if cached is not None:
+            return cached
+        one_hour = self.one_hour
+        four_hour = self.four_hour
+        last_1h = one_hour[one_hour_count - 1].close if one_hour_count else 0.0
+        if one_hour_count >= 25:
+            trend_1h = _return_bps(one_hour[one_hour_count - 25].close, last_1h)
+        else:
+            trend_1h = _return_bps(one_hour[0].close, last_1h)
+        if four_hour_count >= 7:
+            trend_4h = _return_bps(four_hour[four_hour_count - 7].close, four_hour[four_hour_count - 1].close)
+        elif four_hour_count >= 2:
+            trend_4h = _return_bps(four_hour[0].close, four_hour[four_hour_count - 1].close)
+        else:
+            trend_4h = 0.0
+        recent_1h = one_hour[max(0, one_hour_count - 48) : one_hour_count]
+        cached = {
+            "atr_1h_bps": _tail_atr_bps(self._true_ranges_1h, max(0, one_hour_count - 24), one_hour_count),
+            "trend_1h_bps": trend_1h,
+            "trend_4h_bps": trend_4h,
+            "support_1h": min((bar.low for bar in recent_1h), default=current.low),
+            "resistance_1h": max((bar.high for bar in recent_1h), default=current.high),
+        }
+        if len(self._higher_context) > 4:
+            self._higher_context.clear()
+        self._higher_context[key] = cached
+        return cached
+
+
 def _run_discovery_scenario(
     config: HighConvictionDiscoveryConfig,
     scenario: DiscoveryScenario,
     setups: Sequence[DiscoverySetup],
     groups: dict[tuple[str, str], list[MarketBar]],
+) -> DiscoveryScenarioResult:
+    return _run_discovery_scenarios(config, (scenario,), setups, groups)[0]
+
+
+def _run_discovery_scenarios(
+    config: HighConvictionDiscoveryConfig,
+    scenarios: Sequence[DiscoveryScenario],
+    setups: Sequence[DiscoverySetup],
+    groups: dict[tuple[str, str], list[MarketBar]],
+) -> tuple[DiscoveryScenarioResult, ...]:
+    """Evaluate every scenario against forward paths extracted once per setup."""
+
+    if not scenarios:
+        return ()
+    paths = _setup_paths(setups, groups, max(scenario.max_hold_hours for scenario in scenarios))
+    workers = min(config.scenario_workers, len(scenarios))
+    if workers <= 1:
+        return tuple(_evaluate_scenario(config, scenario, setups, paths) for scenario in scenarios)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scenario_worker,
+        initargs=(config, tuple(setups), paths),
+    ) as executor:
+        return tuple(executor.map(_evaluate_scenario_in_worker, scenarios))
+
+
+_SCENARIO_WORKER_STATE: tuple[HighConvictionDiscoveryConfig, tuple[DiscoverySetup, ...], tuple["_SetupPath | None", ...]] | None = None
+
+
+def _init_scenario_worker(
+    config: HighConvictionDiscoveryConfig,
+    setups: tuple[DiscoverySetup, ...],
+    paths: tuple["_SetupPath | None", ...],
+) -> None:
+    global _SCENARIO_WORKER_STATE
+    _SCENARIO_WORKER_STATE = (config, setups, paths)
+
+
+def _evaluate_scenario_in_worker(scenario: DiscoveryScenario) -> DiscoveryScenarioResult:
+    if _SCENARIO_WORKER_STATE is None:
+        raise RuntimeError("scenario worker was not initialised")
+    config, setups, paths = _SCENARIO_WORKER_STATE
+    return _evaluate_scenario(config, scenario, setups, paths)
+
+
+def _evaluate_scenario(
+    config: HighConvictionDiscoveryConfig,
+    scenario: DiscoveryScenario,
+    setups: Sequence[DiscoverySetup],
+    paths: Sequence["_SetupPath | None"],
 ) -> DiscoveryScenarioResult:
     trades: list[DiscoveryTrade] = []
     skipped_expected = 0
     skipped_rr = 0
     skipped_path = 0
     evaluated = 0
-    for setup in setups:
+    for setup, path in zip(setups, paths):
         evaluated += 1
         if setup.expected_move_bps < scenario.min_expected_move_bps:
             skipped_expected += 1
@@ -692,11 +855,11 @@ def _run_discovery_scenario(
         if setup.risk_reward_estimate < scenario.risk_reward_ratio:
             skipped_rr += 1
             continue
-        path = _future_5m_path(groups.get((setup.symbol, "5m"), []), setup.entry_at, scenario.max_hold_hours)
-        if not path:
+        length = path.length(scenario.max_hold_hours) if path is not None else 0
+        if not length:
             skipped_path += 1
             continue
-        trade = _simulate_trade(config, scenario, setup, path)
+        trade = _resolve_trade(config, scenario, setup, path, length)
         if trade is not None:
             trades.append(trade)
         else:
@@ -704,101 +867,141 @@ def _run_discovery_scenario(
     return _scenario_result(config, scenario, trades, evaluated, skipped_expected, skipped_rr, skipped_path)
 
 
+class _SetupPath:
+    """Forward 5m path of one setup, shared by every discovery scenario.
+
+    Per-bar high/low/close returns and their running extremes are computed
+    once.  Take-profit, activation and logical-stop touches are then found by
+    bisecting the running extremes, and the trailing and invalidation exits
+    only walk the bars before the stop is touched.
+    """
+
+    __slots__ = ("entry_at", "bars", "times", "highs", "lows", "closes", "running_high", "running_low_neg")
+
+    def __init__(self, entry_at: datetime, entry_price: float, bars: Sequence[MarketBar]) -> None:
+        self.entry_at = entry_at
+        self.bars = tuple(bars)
+        self.times = [bar.timestamp for bar in self.bars]
+        self.highs = [_high_return_bps(entry_price, bar) for bar in self.bars]
+        self.lows = [_low_return_bps(entry_price, bar) for bar in self.bars]
+        self.closes = [_close_return_bps(entry_price, bar) for bar in self.bars]
+        self.running_high: list[float] = []
+        self.running_low_neg: list[float] = []
+        best = -math.inf
+        worst = math.inf
+        for high, low in zip(self.highs, self.lows):
+            best = max(best, high)
+            worst = min(worst, low)
+            self.running_high.append(best)
+            self.running_low_neg.append(-worst)
+
+    def length(self, max_hold_hours: float) -> int:
+        return bisect_right(self.times, self.entry_at + timedelta(hours=max_hold_hours))
+
+
+def _setup_paths(
+    setups: Sequence[DiscoverySetup],
+    groups: dict[tuple[str, str], list[MarketBar]],
+    max_hold_hours: float,
+) -> tuple[_SetupPath | None, ...]:
+    by_symbol: dict[str, tuple[Sequence[MarketBar], list[datetime]]] = {}
+    paths: list[_SetupPath | None] = []
+    for setup in setups:
+        if setup.symbol not in by_symbol:
+            bars = _sorted_by_timestamp(groups.get((setup.symbol, "5m"), []))
+            by_symbol[setup.symbol] = (bars, [bar.timestamp for bar in bars])
+        bars, times = by_symbol[setup.symbol]
+        start = _parse_dt(setup.entry_at)
+        first = bisect_right(times, start)
+        last = bisect_right(times, start + timedelta(hours=max_hold_hours))
+        paths.append(_SetupPath(start, setup.entry_price, bars[first:last]) if last > first else None)
+    return tuple(paths)
+
+
 def _simulate_trade(
     config: HighConvictionDiscoveryConfig,
     scenario: DiscoveryScenario,
     setup: DiscoverySetup,
     path: Sequence[MarketBar],
 ) -> DiscoveryTrade | None:
+    if not path:
+        return None
+    return _resolve_trade(config, scenario, setup, _SetupPath(_parse_dt(setup.entry_at), setup.entry_price, path), len(path))
+
+
+def _resolve_trade(
+    config: HighConvictionDiscoveryConfig,
+    scenario: DiscoveryScenario,
+    setup: DiscoverySetup,
+    path: _SetupPath,
+    length: int,
+) -> DiscoveryTrade | None:
+    """Replay ``path.bars[:length]`` bar by bar; a bar touching the stop exits there first."""
+
     entry = setup.entry_price
     if entry <= 0.0:
         return None
     target = max(scenario.min_expected_move_bps, setup.expected_move_bps)
     stop = min(setup.logical_stop_bps, target / scenario.risk_reward_ratio)
     stop = max(10.0, stop)
-    cost_bps = config.cost_config.round_trip_cost_estimate_bps()
-    best_high_bps = -math.inf
-    worst_low_bps = math.inf
-    exit_bar = path[-1]
-    exit_return_bps = _close_return_bps(entry, exit_bar)
+    highs = path.highs
+    lows = path.lows
+    running_high = path.running_high
+    stop_index = bisect_left(path.running_low_neg, stop, 0, length)
+    exit_index = length - 1
+    exit_return_bps = path.closes[exit_index]
     exit_reason = "time_horizon"
-    activated_trailing = False
-    trailing_peak = -math.inf
-    partial_taken = False
-    partial_return = 0.0
-    rolling_closes: list[float] = []
-    for bar in path:
-        high_bps = _high_return_bps(entry, bar)
-        low_bps = _low_return_bps(entry, bar)
-        close_bps = _close_return_bps(entry, bar)
-        best_high_bps = max(best_high_bps, high_bps)
-        worst_low_bps = min(worst_low_bps, low_bps)
-        rolling_closes.append(float(bar.close))
-
-        if low_bps <= -stop:
-            exit_bar = bar
-            exit_return_bps = -stop
-            exit_reason = "logical_stop"
-            break
-        if scenario.exit_mode == "fixed_tp_sl":
-            if high_bps >= target:
-                exit_bar = bar
-                exit_return_bps = target
-                exit_reason = "take_profit"
-                break
-        elif scenario.exit_mode == "trailing":
-            activation = target * 0.45
-            if high_bps >= activation:
-                activated_trailing = True
-                trailing_peak = max(trailing_peak, high_bps)
-            if activated_trailing:
-                trailing_peak = max(trailing_peak, high_bps)
-                trail_level = trailing_peak - stop
-                if low_bps <= trail_level:
-                    exit_bar = bar
-                    exit_return_bps = trail_level
-                    exit_reason = "trailing_stop"
-                    break
-        elif scenario.exit_mode == "partial_runner":
-            if not partial_taken and high_bps >= target:
-                partial_taken = True
-                partial_return = target
-                trailing_peak = high_bps
-                continue
-            if partial_taken:
-                trailing_peak = max(trailing_peak, high_bps)
-                trail_level = trailing_peak - stop
-                if low_bps <= trail_level:
-                    exit_bar = bar
-                    exit_return_bps = (partial_return * 0.5) + (trail_level * 0.5)
-                    exit_reason = "partial_tp_runner_trailing"
+    resolved = False
+
+    if scenario.exit_mode in {"fixed_tp_sl", "trend_invalidation"}:
+        target_index = bisect_left(running_high, target, 0, stop_index)
+        if scenario.exit_mode == "trend_invalidation":
+            bars = path.bars
+            # Invalidation needs eight closes of history before it can fire.
+            for index in range(7, target_index):
+                short_return = _return_bps(float(bars[index - 7].close), float(bars[index].close))
+                close_bps = path.closes[index]
+                if close_bps < max(-stop * 0.70, -120.0) or (running_high[index] < target * 0.40 and short_return < -stop * 0.35):
+                    exit_index, exit_return_bps, exit_reason = index, close_bps, "trend_invalidation"
+                    resolved = True
                     break
-        elif scenario.exit_mode == "trend_invalidation":
-            if high_bps >= target:
-                exit_bar = bar
-                exit_return_bps = target
-                exit_reason = "take_profit"
+        if not resolved and target_index < stop_index:
+            exit_index, exit_return_bps, exit_reason = target_index, target, "take_profit"
+            resolved = True
+    elif scenario.exit_mode == "trailing":
+        # Highs before activation stay below it, so the running high is the trailing peak.
+        for index in range(bisect_left(running_high, target * 0.45, 0, stop_index), stop_index):
+            trail_level = running_high[index] - stop
+            if lows[index] <= trail_level:
+                exit_index, exit_return_bps, exit_reason = index, trail_level, "trailing_stop"
+                resolved = True
                 break
-            if len(rolling_closes) >= 8:
-                short_return = _return_bps(rolling_closes[-8], rolling_closes[-1])
-                if close_bps < max(-stop * 0.70, -120.0) or (best_high_bps < target * 0.40 and short_return < -stop * 0.35):
-                    exit_bar = bar
-                    exit_return_bps = close_bps
-                    exit_reason = "trend_invalidation"
+    elif scenario.exit_mode == "partial_runner":
+        partial_index = bisect_left(running_high, target, 0, stop_index)
+        if partial_index < stop_index:
+            for index in range(partial_index + 1, stop_index):
+                trail_level = running_high[index] - stop
+                if lows[index] <= trail_level:
+                    exit_index = index
+                    exit_return_bps = (target * 0.5) + (trail_level * 0.5)
+                    exit_reason = "partial_tp_runner_trailing"
+                    resolved = True
                     break
-    else:
-        if scenario.exit_mode == "partial_runner" and partial_taken:
-            final_return = _close_return_bps(entry, path[-1])
-            exit_bar = path[-1]
-            exit_return_bps = (partial_return * 0.5) + (final_return * 0.5)
-            exit_reason = "partial_tp_runner_horizon"
-
-    mfe = best_high_bps if math.isfinite(best_high_bps) else 0.0
-    mae = worst_low_bps if math.isfinite(worst_low_bps) else 0.0
+            if not resolved and stop_index >= length:
+                exit_return_bps = (target * 0.5) + (path.closes[exit_index] * 0.5)
+                exit_reason = "partial_tp_runner_horizon"
+                resolved = True
+    if not resolved and stop_index < length:
+        exit_index, exit_return_bps, exit_reason = stop_index, -stop, "logical_stop"
+
+    exit_bar = path.bars[exit_index]
+    mfe = running_high[exit_index] if math.isfinite(running_high[exit_index]) else 0.0
+    worst_low = -path.running_low_neg[exit_index]
+    mae = worst_low if math.isfinite(worst_low) else 0.0
     ratio = mfe / abs(mae) if mae < 0 else None
+    cost_bps = config.cost_config.round_trip_cost_estimate_bps()
     net = exit_return_bps - cost_bps
-    entry_time = _parse_dt(setup.entry_at)
-    duration = max(0.0, (exit_bar.timestamp - entry_time).total_seconds() / 60.0)
+    duration = max(0.0, (exit_bar.timestamp - path.entry_at).total_seconds() / 60.0)
     return DiscoveryTrade(
         setup_id=setup.setup_id,
         family=setup.family,
@@ -1011,15 +1214,10 @@ def _future_5m_path(bars: Sequence[MarketBar], entry_at: str, max_hold_hours: fl
     return [bar for bar in bars if start < bar.timestamp <= end]
 
 
-def _bars_at_or_before(bars: Sequence[MarketBar], timestamp: datetime) -> list[MarketBar]:
-    return [bar for bar in bars if bar.timestamp <= timestamp]
-
-
-def _first_bar_after(bars: Sequence[MarketBar], timestamp: datetime) -> MarketBar | None:
-    for bar in bars:
-        if bar.timestamp > timestamp:
-            return bar
-    return None
+def _sorted_by_timestamp(bars: Sequence[MarketBar]) -> Sequence[MarketBar]:
+    if all(left.timestamp <= right.timestamp for left, right in zip(bars, bars[1:])):
+        return bars
+    return sorted(bars, key=lambda row: row.timestamp)
 
 
 def _expected_move_distribution(setups: Sequence[DiscoverySetup]) -> dict[str, int]:
@@ -1096,6 +1294,28 @@ def _atr_bps(bars: Sequence[MarketBar]) -> float:
     return sum(true_ranges) / len(true_ranges) if true_ranges else 0.0
 
 
+def _true_ranges_bps(bars: Sequence[MarketBar]) -> list[float | None]:
+    """True range of each bar against the previous close, as used by :func:`_atr_bps`."""
+
+    ranges: list[float | None] = [None]
+    for previous, bar in zip(bars, bars[1:]):
+        previous_close = float(previous.close)
+        high = float(bar.high)
+        low = float(bar.low)
+        tr = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        ranges.append((tr / previous_close) * 10_000.0 if previous_close > 0.0 else None)
+    return ranges
+
+
+def _tail_atr_bps(true_ranges: Sequence[float | None], start: int, end: int) -> float:
+    """``_atr_bps(bars[start:end])`` from precomputed :func:`_true_ranges_bps`."""
+
+    if end - start < 2:
+        return 0.0
+    values = [value for value in true_ranges[start + 1 : end] if value is not None]
+    return sum(values) / len(values) if values else 0.0
+
+
 def _sma(values: Sequence[float], window: int) -> float | None:
     if len(values) < window:
         return None
@@ -1110,6 +1330,16 @@ def _std(values: Sequence[float]) -> float | None:
     return value if math.isfinite(value) else None
 
 
+def _float_pstdev(values: Sequence[float]) -> float | None:
+    """Two-pass float population deviation; ``_std`` without exact rationals."""
+
+    if len(values) < 2:
+        return None
+    center = sum(values) / len(values)
+    value = math.sqrt(sum((item - center) * (item - center) for item in values) / len(values))
+    return value if math.isfinite(value) else None
+
+
 def _avg(values: Sequence[float | None]) -> float | None:
     cleaned = [float(value) for value in values if value is not None and math.isfinite(float(value))]
     return sum(cleaned) / len(cleaned) if cleaned else None
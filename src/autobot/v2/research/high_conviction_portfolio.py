@@ -698,7 +698,7 @@ def _run_portfolio_scenario(
         records.append(record)
 
     journal = TradeJournal(records)
-    metrics = MetricsEngine().calculate(journal.records, initial_capital_eur=config.initial_capital_eur)
+    metrics = MetricsEngine().calculate(journal.batch(), initial_capital_eur=config.initial_capital_eur)
     contributors = _contributors(records)
     blockers = _portfolio_blockers(
         config,
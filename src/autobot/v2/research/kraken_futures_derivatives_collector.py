@@ -20,13 +20,14 @@ import uuid
 from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Mapping, Protocol, Sequence
+from typing import Any, Callable, Iterable, Mapping, Protocol, Sequence, Sized
 
 from .derivatives_basis_contract import (
     KRAKEN_FUTURES_FUTURE_BASIS,
     is_verified_basis_confidence,
 )
 from .public_collector_boundary import assert_public_collector_boundary
+from .segmented_history_store import RowFacet, SegmentedHistoryStore, is_segmented_history
 
 
 KRAKEN_FUTURES_BASE_URL = "https://futures.kraken.com"
@@ -691,10 +692,11 @@ def collect_kraken_futures_derivatives(
         ),
     )
 
-    # The collector writes one immutable file per run.  Read the canonical
-    # archive after the current rows have been persisted so readiness reflects
-    # the accumulated forward history, never just the latest snapshot.
-    funding_history_rows, funding_history_path, _funding_history_duplicates = _load_or_compact_canonical_history(
+    # The collector writes one immutable file per run and appends it to the
+    # segmented canonical history.  Readiness comes from the history index
+    # after the append, so it reflects the accumulated forward history, never
+    # just the latest snapshot, without re-reading months of rows.
+    funding_history, _funding_history_duplicates = _open_canonical_history(
         config.canonical_dir / "funding",
         history_filename="funding_history.csv",
         key_fields=("exchange", "futures_symbol", "timestamp"),
@@ -702,10 +704,9 @@ def collect_kraken_futures_derivatives(
             "schema_version", "exchange", "futures_symbol", "base_asset", "timestamp", "event_time", "available_time",
             "ingestion_time", "temporal_status", "funding_rate_absolute", "funding_rate_relative", "source", "source_endpoint",
         ),
-        compact=config.collect_funding,
         incremental_paths=(funding_path,) if config.collect_funding else (),
     )
-    candle_history_rows, candle_history_path, _candle_history_duplicates = _load_or_compact_canonical_history(
+    candle_history, _candle_history_duplicates = _open_canonical_history(
         config.canonical_dir / "candles",
         history_filename="derivatives_candle_history.csv",
         key_fields=("exchange", "futures_symbol", "tick_type", "timeframe", "timestamp"),
@@ -714,10 +715,10 @@ def collect_kraken_futures_derivatives(
             "exchange", "futures_symbol", "base_asset", "quote_asset", "tick_type", "timeframe", "open", "high", "low", "close",
             "volume", "source", "source_endpoint",
         ),
-        compact=config.collect_candles,
         incremental_paths=(candle_path,) if config.collect_candles else (),
+        facets={"tick_type": _field_facet("tick_type")},
     )
-    ticker_history_rows, ticker_history_path, _ticker_history_duplicates = _compact_canonical_history(
+    ticker_history, _ticker_history_duplicates = _open_canonical_history(
         config.canonical_dir / "tickers",
         history_filename="ticker_history.csv",
         key_fields=("exchange", "futures_symbol", "timestamp"),
@@ -728,10 +729,15 @@ def collect_kraken_futures_derivatives(
             "source", "source_endpoint",
         ),
         incremental_paths=(ticker_path,) if config.collect_tickers else (),
+        facets={
+            "open_interest_symbol": _ticker_open_interest_facet,
+            "predicted_funding": _ticker_predicted_funding_facet,
+        },
     )
-    basis_history_rows, basis_history_path, _basis_history_duplicates = _compact_basis_history(
+    basis_history, _basis_history_duplicates = _open_canonical_history(
         config.canonical_dir / "basis",
         history_filename="basis_history.csv",
+        key_fields=("exchange", "futures_symbol", "timestamp"),
         fieldnames=(
             "schema_version", "timestamp", "event_time", "available_time", "ingestion_time", "temporal_status", "exchange",
             "futures_symbol", "base_asset", "quote_asset", "timeframe", "basis_bps", "mark_price", "index_or_reference_price",
@@ -740,10 +746,15 @@ def collect_kraken_futures_derivatives(
         incremental_paths=(basis_path,)
         if (config.collect_tickers or config.collect_candles or config.collect_future_basis_history)
         else (),
+        facets={"futures_symbol": _field_facet("futures_symbol"), "confidence_status": _field_facet("confidence_status")},
+        preference_key=_basis_history_preference_key,
+        row_filter=_is_canonical_basis_row,
     )
-    analytics_open_interest_history_path = config.canonical_dir / "open_interest" / "open_interest_history.csv"
-    if config.collect_open_interest_history or analytics_open_interest_history_path.exists():
-        analytics_open_interest_rows, analytics_open_interest_history_path, _analytics_open_interest_duplicates = _load_or_compact_canonical_history(
+    analytics_open_interest_history: SegmentedHistoryStore | None = None
+    if config.collect_open_interest_history or _canonical_history_exists(
+        config.canonical_dir / "open_interest", "open_interest_history.csv"
+    ):
+        analytics_open_interest_history, _analytics_open_interest_duplicates = _open_canonical_history(
             config.canonical_dir / "open_interest",
             history_filename="open_interest_history.csv",
             key_fields=("exchange", "futures_symbol", "analytics_type", "interval_seconds", "timestamp"),
@@ -753,33 +764,37 @@ def collect_kraken_futures_derivatives(
                 "open_interest", "open_interest_open", "open_interest_high", "open_interest_low", "open_interest_close",
                 "source", "source_endpoint",
             ),
-            compact=config.collect_open_interest_history,
             incremental_paths=(open_interest_path,) if config.collect_open_interest_history else (),
+            facets={"futures_symbol": _field_facet("futures_symbol")},
         )
-    else:
-        analytics_open_interest_rows = []
-    ticker_open_interest_history_rows = [
-        row
-        for row in ticker_history_rows
-        if _safe_float(row.get("open_interest")) is not None and _safe_float(row.get("open_interest")) >= 0.0
-    ]
-    if analytics_open_interest_rows:
-        open_interest_history_rows = analytics_open_interest_rows
-        open_interest_history_path = analytics_open_interest_history_path
+    histories = tuple(
+        store
+        for store in (funding_history, candle_history, ticker_history, basis_history, analytics_open_interest_history)
+        if store is not None
+    )
+    for store in histories:
+        store.compact_in_background()
+    funding_summary = funding_history.summary()
+    candle_summary = candle_history.summary()
+    ticker_summary = ticker_history.summary()
+    basis_summary = basis_history.summary()
+    analytics_open_interest_summary = (
+        analytics_open_interest_history.summary() if analytics_open_interest_history is not None else None
+    )
+    if analytics_open_interest_history is not None and analytics_open_interest_summary:
+        open_interest_coverage = analytics_open_interest_summary.facet("futures_symbol")
+        open_interest_history_path = analytics_open_interest_history.directory
         open_interest_history_source = "kraken_futures_market_analytics"
     else:
-        open_interest_history_rows = ticker_open_interest_history_rows
-        open_interest_history_path = ticker_history_path
-        open_interest_history_source = "ticker_snapshots_forward_only" if ticker_open_interest_history_rows else "missing"
-    valid_basis_history_rows = [
-        row
-        for row in basis_history_rows
-        if is_verified_basis_confidence(row.get("confidence_status"))
-    ]
-    open_interest_history_ready = _forward_history_ready(open_interest_history_rows, mappings)
-    basis_history_ready = _forward_history_ready(valid_basis_history_rows, mappings)
-    ticker_history_is_fresh = _history_is_fresh(ticker_history_rows, collection_time)
-    basis_history_is_fresh = _history_is_fresh(valid_basis_history_rows, collection_time)
+        open_interest_coverage = ticker_summary.facet("open_interest_symbol")
+        open_interest_history_path = ticker_history.directory
+        open_interest_history_source = "ticker_snapshots_forward_only" if open_interest_coverage else "missing"
+    open_interest_history_row_count = sum(count for count, _start, _end in open_interest_coverage.values())
+    open_interest_history_start, open_interest_history_end = _coverage_bounds(open_interest_coverage)
+    open_interest_history_ready = _forward_history_ready(open_interest_coverage, mappings)
+    basis_history_ready = _forward_history_ready(basis_summary.facet("futures_symbol"), mappings)
+    ticker_history_is_fresh = _history_is_fresh(ticker_summary.end_at, collection_time)
+    basis_history_is_fresh = _history_is_fresh(basis_summary.end_at, collection_time)
 
     datasets = (
         _dataset_summary("funding_rates", funding_rows, funding_dupes, _invalid_count(invalid_rows, "funding_rates"), funding_path, "historical_funding_ready" if funding_rows else "missing"),
@@ -814,45 +829,46 @@ def collect_kraken_futures_derivatives(
         datasets=datasets,
         errors=tuple([*errors, *invalid_rows]),
         raw_response_count=raw_response_count,
-        funding_history_ready=bool(funding_history_rows),
-        funding_history_start=_min_timestamp(funding_history_rows),
-        funding_history_end=_max_timestamp(funding_history_rows),
-        mark_candles_ready=any(row.get("tick_type") == "mark" for row in candle_history_rows),
-        trade_candles_ready=any(row.get("tick_type") == "trade" for row in candle_history_rows),
-        spot_reference_candles_ready=any(row.get("tick_type") == "spot" for row in candle_history_rows),
+        funding_history_ready=bool(funding_summary),
+        funding_history_start=funding_summary.start_at,
+        funding_history_end=funding_summary.end_at,
+        mark_candles_ready="mark" in candle_summary.facet("tick_type"),
+        trade_candles_ready="trade" in candle_summary.facet("tick_type"),
+        spot_reference_candles_ready="spot" in candle_summary.facet("tick_type"),
         current_open_interest_ready=(
             any(_safe_float(row.get("open_interest")) is not None for row in ticker_rows)
-            or (ticker_history_is_fresh and bool(open_interest_history_rows))
+            or (ticker_history_is_fresh and open_interest_history_row_count > 0)
         ),
         open_interest_history_ready=open_interest_history_ready,
         predicted_funding_ready=(
             any(_safe_float(row.get("predicted_funding_rate")) is not None for row in ticker_rows)
-            or (
-                ticker_history_is_fresh
-                and any(_safe_float(row.get("predicted_funding_rate")) is not None for row in ticker_history_rows)
-            )
+            or (ticker_history_is_fresh and bool(ticker_summary.facet("predicted_funding")))
         ),
-        basis_current_ready=bool(current_ticker_basis_rows) or (basis_history_is_fresh and bool(valid_basis_history_rows)),
+        basis_current_ready=bool(current_ticker_basis_rows) or (basis_history_is_fresh and bool(basis_summary)),
         basis_history_ready=basis_history_ready,
-        basis_confidence_status=_aggregate_basis_confidence(basis_rows or valid_basis_history_rows),
+        basis_confidence_status=(
+            _aggregate_basis_confidence(basis_rows)
+            if basis_rows
+            else _aggregate_confidence_statuses(basis_summary.facet("confidence_status"))
+        ),
         derivatives_data_quality=_quality_label(
-            funding_history_rows,
-            ticker_rows or ticker_history_rows,
-            candle_history_rows,
-            basis_rows or valid_basis_history_rows,
+            funding_summary,
+            ticker_rows or ticker_summary,
+            candle_summary,
+            basis_rows or basis_summary,
             basis_history_ready=basis_history_ready,
         ),
-        funding_history_row_count=len(funding_history_rows),
-        funding_history_path=str(funding_history_path),
-        derivatives_candle_history_row_count=len(candle_history_rows),
-        derivatives_candle_history_path=str(candle_history_path),
-        basis_history_row_count=len(valid_basis_history_rows),
-        basis_history_start=_min_timestamp(valid_basis_history_rows),
-        basis_history_end=_max_timestamp(valid_basis_history_rows),
-        basis_history_path=str(basis_history_path),
-        open_interest_history_row_count=len(open_interest_history_rows),
-        open_interest_history_start=_min_timestamp(open_interest_history_rows),
-        open_interest_history_end=_max_timestamp(open_interest_history_rows),
+        funding_history_row_count=funding_summary.row_count,
+        funding_history_path=str(funding_history.directory),
+        derivatives_candle_history_row_count=candle_summary.row_count,
+        derivatives_candle_history_path=str(candle_history.directory),
+        basis_history_row_count=basis_summary.row_count,
+        basis_history_start=basis_summary.start_at,
+        basis_history_end=basis_summary.end_at,
+        basis_history_path=str(basis_history.directory),
+        open_interest_history_row_count=open_interest_history_row_count,
+        open_interest_history_start=open_interest_history_start,
+        open_interest_history_end=open_interest_history_end,
         open_interest_history_path=str(open_interest_history_path),
         open_interest_history_source=open_interest_history_source,
     )
@@ -2019,99 +2035,92 @@ def _dedupe_rows(rows: Sequence[dict[str, Any]], key_fields: Sequence[str]) -> t
     return sorted(seen.values(), key=lambda item: tuple(str(item.get(field, "")) for field in key_fields)), duplicate_count
 
 
-def _compact_canonical_history(
+def _open_canonical_history(
     dataset_dir: Path,
     *,
     history_filename: str,
     key_fields: Sequence[str],
     fieldnames: Sequence[str],
-    incremental_paths: Sequence[Path] | None = None,
-) -> tuple[list[dict[str, Any]], Path, int]:
-    """Build one atomically-published, deduplicated forward-history dataset.
-
-    Per-run CSVs remain immutable audit artifacts.  The compacted history is
-    the only input used for readiness; it excludes itself to prevent a retry
-    or a previous compaction from multiplying observations.  Once a history
-    exists, an incremental run reads only that history and its newly written
-    paths.  This bounds scheduled collector memory as the immutable archive
-    grows.
+    incremental_paths: Sequence[Path] = (),
+    facets: Mapping[str, RowFacet] | None = None,
+    preference_key: Callable[[Mapping[str, Any]], Any] = _dedupe_preference_key,
+    row_filter: Callable[[Mapping[str, Any]], bool] | None = None,
+) -> tuple[SegmentedHistoryStore, int]:
+    """Append this run's files to one deduplicated forward-history store.
+
+    Per-run CSVs remain immutable audit artifacts.  The segmented history is
+    the only input used for readiness, and an append only reads the history
+    segments whose time range overlaps the new rows, so a scheduled run stays
+    cheap however long the archive grows.  A missing store is seeded once:
+    from the legacy single-file history plus the current run when that file
+    exists, otherwise from every per-run file in the dataset directory.
     """
 
     dataset_dir.mkdir(parents=True, exist_ok=True)
-    history_path = dataset_dir / history_filename
-    if history_path.exists() and incremental_paths is not None:
-        run_paths = [history_path]
-        seen_paths = {history_path.resolve()}
-        for path in incremental_paths:
-            resolved = path.resolve()
-            if path.exists() and resolved not in seen_paths:
-                run_paths.append(path)
-                seen_paths.add(resolved)
+    legacy_path = dataset_dir / history_filename
+    store = SegmentedHistoryStore(
+        dataset_dir / legacy_path.stem,
+        key_fields=key_fields,
+        fieldnames=fieldnames,
+        preference_key=preference_key,
+        facets=facets,
+    )
+    if store.exists():
+        run_paths = list(incremental_paths)
+    elif legacy_path.exists():
+        run_paths = [legacy_path, *incremental_paths]
     else:
         run_paths = sorted(path for path in dataset_dir.glob("*.csv") if path.name != history_filename)
     rows: list[dict[str, Any]] = []
+    seen_paths: set[Path] = set()
     for path in run_paths:
+        resolved = path.resolve()
+        if resolved in seen_paths or not path.exists():
+            continue
+        seen_paths.add(resolved)
         with path.open("r", encoding="utf-8", newline="") as handle:
-            rows.extend(dict(row) for row in csv.DictReader(handle) if row.get("timestamp"))
-    deduped_rows, duplicate_count = _dedupe_rows(rows, key_fields)
-    _write_csv(deduped_rows, history_path, fieldnames)
-    return deduped_rows, history_path, duplicate_count
+            rows.extend(
+                dict(row)
+                for row in csv.DictReader(handle)
+                if row.get("timestamp") and (row_filter is None or row_filter(row))
+            )
+    duplicate_count = store.append(rows)
+    return store, duplicate_count
 
 
-def _compact_basis_history(
-    dataset_dir: Path,
-    *,
-    history_filename: str,
-    fieldnames: Sequence[str],
-    incremental_paths: Sequence[Path] | None = None,
-) -> tuple[list[dict[str, Any]], Path, int]:
-    """Publish one canonical basis observation per contract and timestamp.
-
-    The immutable per-run files remain the audit record.  The compact history
-    is a feature input, so it must not contain competing basis definitions at
-    the same timestamp.  Exchange-provided ``future-basis`` analytics win over
-    a locally derived mark/index value; both still require an explicit
-    same-quote contract.  Unverified rows are retained only in the immutable
-    run artifacts and are never selected for canonical feature history.
+def _canonical_history_exists(dataset_dir: Path, history_filename: str) -> bool:
+    legacy_path = dataset_dir / history_filename
+    return legacy_path.exists() or is_segmented_history(dataset_dir / legacy_path.stem)
+
+
+def _is_canonical_basis_row(row: Mapping[str, Any]) -> bool:
+    """Keep one verified, same-quote basis definition in the canonical history.
+
+    Unverified rows are retained only in the immutable run artifacts and are
+    never selected for canonical feature history.
     """
 
-    dataset_dir.mkdir(parents=True, exist_ok=True)
-    history_path = dataset_dir / history_filename
-    if history_path.exists() and incremental_paths is not None:
-        run_paths = [history_path]
-        seen_paths = {history_path.resolve()}
-        for path in incremental_paths:
-            resolved = path.resolve()
-            if path.exists() and resolved not in seen_paths:
-                run_paths.append(path)
-                seen_paths.add(resolved)
-    else:
-        run_paths = sorted(path for path in dataset_dir.glob("*.csv") if path.name != history_filename)
+    return is_verified_basis_confidence(row.get("confidence_status")) and all(
+        row.get(field) for field in ("exchange", "futures_symbol", "timestamp")
+    )
 
-    selected: dict[tuple[str, str, str], dict[str, Any]] = {}
-    duplicate_count = 0
-    for path in run_paths:
-        with path.open("r", encoding="utf-8", newline="") as handle:
-            for row in csv.DictReader(handle):
-                if not row.get("timestamp") or not is_verified_basis_confidence(row.get("confidence_status")):
-                    continue
-                key = (
-                    str(row.get("exchange") or ""),
-                    str(row.get("futures_symbol") or ""),
-                    str(row.get("timestamp") or ""),
-                )
-                if not all(key):
-                    continue
-                candidate = dict(row)
-                previous = selected.get(key)
-                if previous is not None:
-                    duplicate_count += 1
-                    selected[key] = min(previous, candidate, key=_basis_history_preference_key)
-                else:
-                    selected[key] = candidate
-    rows = [selected[key] for key in sorted(selected)]
-    _write_csv(rows, history_path, fieldnames)
-    return rows, history_path, duplicate_count
+
+def _field_facet(field: str) -> RowFacet:
+    def facet(row: Mapping[str, Any]) -> str | None:
+        return str(row.get(field) or "") or None
+
+    return facet
+
+
+def _ticker_open_interest_facet(row: Mapping[str, Any]) -> str | None:
+    open_interest = _safe_float(row.get("open_interest"))
+    if open_interest is None or open_interest < 0.0:
+        return None
+    return str(row.get("futures_symbol") or "") or None
+
+
+def _ticker_predicted_funding_facet(row: Mapping[str, Any]) -> str | None:
+    return "present" if _safe_float(row.get("predicted_funding_rate")) is not None else None
 
 
 def _basis_history_preference_key(row: Mapping[str, Any]) -> tuple[int, int, int, str, str, str]:
@@ -2131,63 +2140,25 @@ def _basis_history_preference_key(row: Mapping[str, Any]) -> tuple[int, int, int
     )
 
 
-def _load_or_compact_canonical_history(
-    dataset_dir: Path,
-    *,
-    history_filename: str,
-    key_fields: Sequence[str],
-    fieldnames: Sequence[str],
-    compact: bool,
-    incremental_paths: Sequence[Path] = (),
-) -> tuple[list[dict[str, Any]], Path, int]:
-    """Reuse an existing immutable-history compaction when a run skips it.
-
-    Ticker-only forward collection must not make previously backfilled funding
-    or candle capability disappear.  Recompacting those large datasets every
-    fifteen minutes would also waste CPU and disk I/O, so they are refreshed
-    only when their source is collected or when no compact history exists yet.
-    """
-
-    history_path = dataset_dir / history_filename
-    if compact or not history_path.exists():
-        return _compact_canonical_history(
-            dataset_dir,
-            history_filename=history_filename,
-            key_fields=key_fields,
-            fieldnames=fieldnames,
-            incremental_paths=incremental_paths if history_path.exists() else None,
-        )
-    with history_path.open("r", encoding="utf-8", newline="") as handle:
-        rows = [dict(row) for row in csv.DictReader(handle) if row.get("timestamp")]
-    deduped_rows, duplicate_count = _dedupe_rows(rows, key_fields)
-    if duplicate_count:
-        _write_csv(deduped_rows, history_path, fieldnames)
-    return deduped_rows, history_path, duplicate_count
-
-
 def _forward_history_ready(
-    rows: Sequence[Mapping[str, Any]],
+    coverage: Mapping[str, tuple[int, str, str]],
     mappings: Sequence[KrakenFuturesInstrumentMapping],
 ) -> bool:
     """Require meaningful coverage for every current mapping before unlocks.
 
-    This is a data-availability gate, deliberately not a strategy-validation
-    gate.  A later experiment still needs its own out-of-sample and cost
-    validation before it can become shadow eligible.
+    *coverage* maps a futures symbol to its ``(row_count, start, end)`` in the
+    history index.  This is a data-availability gate, deliberately not a
+    strategy-validation gate.  A later experiment still needs its own
+    out-of-sample and cost validation before it can become shadow eligible.
     """
 
     if not mappings:
         return False
-    by_symbol: dict[str, list[Mapping[str, Any]]] = {}
-    for row in rows:
-        symbol = str(row.get("futures_symbol") or "")
-        if symbol:
-            by_symbol.setdefault(symbol, []).append(row)
     for mapping in mappings:
-        symbol_rows = by_symbol.get(mapping.futures_symbol, [])
-        if len(symbol_rows) < FORWARD_HISTORY_MIN_OBSERVATIONS_PER_SYMBOL:
+        row_count, start_at, end_at = coverage.get(mapping.futures_symbol, (0, None, None))
+        if row_count < FORWARD_HISTORY_MIN_OBSERVATIONS_PER_SYMBOL:
             return False
-        if _time_coverage_seconds(symbol_rows) < FORWARD_HISTORY_MIN_COVERAGE_SECONDS:
+        if _time_coverage_seconds(start_at, end_at) < FORWARD_HISTORY_MIN_COVERAGE_SECONDS:
             return False
     return True
 
@@ -2234,10 +2205,10 @@ def _basis_quality(rows: Sequence[Mapping[str, Any]]) -> str:
 
 
 def _quality_label(
-    funding_rows: Sequence[Mapping[str, Any]],
-    ticker_rows: Sequence[Mapping[str, Any]],
-    candle_rows: Sequence[Mapping[str, Any]],
-    basis_rows: Sequence[Mapping[str, Any]],
+    funding_rows: Sized,
+    ticker_rows: Sized,
+    candle_rows: Sized,
+    basis_rows: Sized,
     *,
     basis_history_ready: bool,
 ) -> str:
@@ -2251,9 +2222,13 @@ def _quality_label(
 
 
 def _aggregate_basis_confidence(rows: Sequence[Mapping[str, Any]]) -> str:
-    if not rows:
+    return _aggregate_confidence_statuses({str(row.get("confidence_status") or "") for row in rows})
+
+
+def _aggregate_confidence_statuses(statuses: Iterable[str]) -> str:
+    statuses = set(statuses)
+    if not statuses:
         return "BASIS_MISSING"
-    statuses = {str(row.get("confidence_status") or "") for row in rows}
     if statuses == {"MARK_INDEX_SAME_QUOTE"}:
         return "MARK_INDEX_SAME_QUOTE"
     if statuses == {KRAKEN_FUTURES_FUTURE_BASIS}:
@@ -2263,6 +2238,13 @@ def _aggregate_basis_confidence(rows: Sequence[Mapping[str, Any]]) -> str:
     return "BASIS_REFERENCE_UNVERIFIED"
 
 
+def _coverage_bounds(coverage: Mapping[str, tuple[int, str, str]]) -> tuple[str | None, str | None]:
+    return (
+        min((start_at for _count, start_at, _end_at in coverage.values()), default=None),
+        max((end_at for _count, _start_at, end_at in coverage.values()), default=None),
+    )
+
+
 def _invalid_count(invalid_rows: Sequence[Mapping[str, Any]], dataset_id: str) -> int:
     return sum(1 for item in invalid_rows if item.get("dataset") == dataset_id)
 
@@ -2277,9 +2259,9 @@ def _max_timestamp(rows: Sequence[Mapping[str, Any]]) -> str | None:
     return max(timestamps) if timestamps else None
 
 
-def _time_coverage_seconds(rows: Sequence[Mapping[str, Any]]) -> float:
-    start = _parse_timestamp(_min_timestamp(rows))
-    end = _parse_timestamp(_max_timestamp(rows))
+def _time_coverage_seconds(start_at: str | None, end_at: str | None) -> float:
+    start = _parse_timestamp(start_at)
+    end = _parse_timestamp(end_at)
     if start is None or end is None:
         return 0.0
     return max(0.0, (end - start).total_seconds())
@@ -2294,8 +2276,8 @@ def _analytics_timeframe(interval_seconds: int) -> str:
     return f"analytics_{interval_seconds}s"
 
 
-def _history_is_fresh(rows: Sequence[Mapping[str, Any]], now: datetime) -> bool:
-    latest = _parse_timestamp(_max_timestamp(rows))
+def _history_is_fresh(latest_timestamp: str | None, now: datetime) -> bool:
+    latest = _parse_timestamp(latest_timestamp)
     if latest is None:
         return False
     age_seconds = (now - latest).total_seconds()
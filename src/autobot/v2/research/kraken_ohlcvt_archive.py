@@ -12,22 +12,22 @@ from __future__ import annotations
 
 import csv
 import hashlib
+import io
 import json
 import re
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from itertools import chain
 from pathlib import Path, PurePosixPath
-from typing import Any, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 
-from .data_quality_report import analyze_bars
 from .kraken_symbol_mapping import (
     AssetPairsFetcher,
     KrakenPublicPairMapping,
     preflight_kraken_public_symbols,
 )
-from .market_data_repository import MarketBar, MarketDataRepository
 from .public_collector_boundary import assert_public_collector_boundary
 from .symbol_normalization import normalize_research_symbol
 
@@ -44,6 +44,14 @@ KRAKEN_ARCHIVE_TIMEFRAMES = {
     "4h": 240,
     "1d": 1440,
 }
+# Conservative CPython footprint of one buffered parsed row: an 8-slot tuple,
+# two ints and five floats.  Used to enforce ``max_member_buffer_bytes``.
+_BUFFERED_ROW_BYTES = 320
+_NORMALIZED_FIELDS = (
+    "schema_version", "timestamp", "symbol", "timeframe", "base_asset", "quote_asset", "open", "high", "low", "close", "volume",
+    "metadata", "event_time", "available_time", "ingestion_time", "temporal_status", "bar_close_time", "source_timestamp_role",
+    "availability_basis", "source", "source_support_url", "archive_member", "member_sha256",
+)
 
 
 class KrakenOhlcvtArchiveError(ValueError):
@@ -66,6 +74,8 @@ class KrakenOhlcvtArchiveImportConfig:
     max_archive_bytes: int = 8 * 1024 * 1024 * 1024
     max_selected_uncompressed_bytes: int = 2 * 1024 * 1024 * 1024
     max_rows_per_member: int = 500_000
+    workers: int = 1
+    max_member_buffer_bytes: int = 256 * 1024 * 1024
 
     def __post_init__(self) -> None:
         if not str(self.run_id).strip():
@@ -76,6 +86,8 @@ class KrakenOhlcvtArchiveImportConfig:
             raise KrakenOhlcvtArchiveError("at least one timeframe is required")
         if self.max_archive_bytes <= 0 or self.max_selected_uncompressed_bytes <= 0 or self.max_rows_per_member <= 0:
             raise KrakenOhlcvtArchiveError("archive size and row limits must be positive")
+        if self.workers <= 0 or self.max_member_buffer_bytes <= 0:
+            raise KrakenOhlcvtArchiveError("workers and max_member_buffer_bytes must be positive")
         unsupported = sorted({str(item).strip().lower() for item in self.timeframes} - set(KRAKEN_ARCHIVE_TIMEFRAMES))
         if unsupported:
             raise KrakenOhlcvtArchiveError(f"unsupported Kraken archive timeframes: {unsupported}")
@@ -120,6 +132,9 @@ class KrakenOhlcvtArchiveImportResult:
     members: tuple[ImportedOhlcvtMember, ...]
     status: str
     blockers: tuple[str, ...]
+    workers: int = 1
+    memory_ceiling_bytes: int = 0
+    peak_member_buffer_bytes: int = 0
     manifest_path: str | None = None
     report_path: str | None = None
     research_only: bool = True
@@ -143,6 +158,11 @@ class KrakenOhlcvtArchiveImportResult:
             "members": [member.to_dict() for member in self.members],
             "status": self.status,
             "blockers": list(self.blockers),
+            "import_resources": {
+                "workers": self.workers,
+                "memory_ceiling_bytes": self.memory_ceiling_bytes,
+                "peak_member_buffer_bytes": self.peak_member_buffer_bytes,
+            },
             "history_available_for_research": bool(self.members),
             "temporal_contract": {
                 "event_time": "UTC bar close",
@@ -179,6 +199,12 @@ def import_kraken_ohlcvt_archive(
     rows are written separately for the canonical OHLCV store.  Both output
     families are bounded before any member is read, which prevents a large
     exchange archive from silently consuming the VPS disk.
+
+    Members are independent, so ``config.workers`` processes each reopen the
+    archive and import one member at a time.  Rows are streamed from the raw
+    member to the normalized file; only a member whose rows are out of
+    timestamp order is buffered for sorting, within ``max_member_buffer_bytes``
+    per worker.
     """
 
     assert_public_collector_boundary(("kraken_ohlcvt_archive",))
@@ -205,60 +231,31 @@ def import_kraken_ohlcvt_archive(
                 "selected archive members exceed max_selected_uncompressed_bytes; reduce symbols/timeframes or increase the limit explicitly"
             )
 
-        imported_members: list[ImportedOhlcvtMember] = []
-        for mapping, timeframe, info in selected:
-            raw_path, member_hash = _stream_member_to_raw(
-                archive,
-                info,
-                root=config.raw_dir,
-                run_id=config.run_id,
-                symbol=mapping.autobot_symbol,
-                timeframe=timeframe,
-            )
-            bars, trade_counts = _parse_member_bars(
-                raw_path,
-                mapping=mapping,
-                timeframe=timeframe,
-                member_name=info.filename,
-                max_rows=config.max_rows_per_member,
-            )
-            bars, duplicate_count = _dedupe_bars(bars)
-            normalized_path = _normalized_member_path(config.normalized_dir, config.run_id, mapping.autobot_symbol, timeframe)
-            _write_normalized_rows(
-                normalized_path,
-                bars=bars,
-                trade_counts=trade_counts,
-                mapping=mapping,
-                timeframe=timeframe,
-                imported_at=timestamp,
-                archive_member=info.filename,
-                member_hash=member_hash,
-                source_url=config.source_url,
-            )
-            quality = analyze_bars(
-                bars,
-                source_path=str(normalized_path),
-                source_type="kraken_official_ohlcvt_archive",
-                expected_interval_seconds=KRAKEN_ARCHIVE_TIMEFRAMES[timeframe] * 60,
-            )
-            imported_members.append(
-                ImportedOhlcvtMember(
-                    symbol=mapping.autobot_symbol,
-                    timeframe=timeframe,
-                    archive_member=info.filename,
-                    raw_path=str(raw_path),
-                    normalized_path=str(normalized_path),
-                    row_count=len(bars),
-                    duplicate_count=duplicate_count,
-                    gap_count=quality.gap_count,
-                    start_at=bars[0].timestamp.isoformat() if bars else None,
-                    end_at=bars[-1].timestamp.isoformat() if bars else None,
-                    compressed_size_bytes=info.compress_size,
-                    uncompressed_size_bytes=info.file_size,
-                    member_sha256=member_hash,
-                    zip_crc32=info.CRC,
-                )
-            )
+
+    tasks = [
+        _MemberImportTask(
+            archive_path=archive_path,
+            member_name=info.filename,
+            header_offset=info.header_offset,
+            mapping=mapping,
+            timeframe=timeframe,
+            run_id=config.run_id,
+            raw_dir=config.raw_dir,
+            normalized_dir=config.normalized_dir,
+            imported_at=timestamp,
+            source_url=config.source_url,
+            max_rows=config.max_rows_per_member,
+            max_buffer_bytes=config.max_member_buffer_bytes,
+        )
+        for mapping, timeframe, info in selected
+    ]
+    workers = max(1, min(config.workers, len(tasks)))
+    if workers == 1:
+        outcomes = [_import_member(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_import_member, tasks))
+    imported_members = [member for member, _peak_buffer_bytes in outcomes]
 
     ordered_members = tuple(sorted(imported_members, key=lambda item: (item.symbol, item.timeframe, item.archive_member)))
     fingerprint = _fingerprint(
@@ -280,6 +277,9 @@ def import_kraken_ohlcvt_archive(
         members=ordered_members,
         status=status,
         blockers=blockers,
+        workers=workers,
+        memory_ceiling_bytes=workers * config.max_member_buffer_bytes,
+        peak_member_buffer_bytes=max((peak for _member, peak in outcomes), default=0),
     )
     return _persist_result(result, config)
 
@@ -380,14 +380,148 @@ def _compact(value: Any) -> str:
     return re.sub(r"[^A-Z0-9]", "", str(value).upper())
 
 
-def _parse_member_bars(
+@dataclass(frozen=True)
+class _MemberImportTask:
+    archive_path: Path
+    member_name: str
+    header_offset: int
+    mapping: KrakenPublicPairMapping
+    timeframe: str
+    run_id: str
+    raw_dir: Path
+    normalized_dir: Path
+    imported_at: datetime
+    source_url: str
+    max_rows: int
+    max_buffer_bytes: int
+
+
+@dataclass(frozen=True)
+class _NormalizedMemberSummary:
+    row_count: int
+    duplicate_count: int
+    gap_count: int
+    start_at: str | None
+    end_at: str | None
+    peak_buffer_bytes: int
+
+
+class _UnsortedMemberRows(Exception):
+    """Internal signal that a member must be buffered and sorted."""
+
+
+# (row_number, open_time epoch seconds, open, high, low, close, volume, trade count)
+_ParsedRow = tuple[int, int, float, float, float, float, float, "int | None"]
+
+
+def _import_member(task: _MemberImportTask) -> tuple[ImportedOhlcvtMember, int]:
+    """Import one selected member; runs in-process or in a worker process."""
+
+    with zipfile.ZipFile(task.archive_path) as archive:
+        info = next(
+            (item for item in archive.infolist() if item.header_offset == task.header_offset),
+            None,
+        )
+        if info is None or info.filename != task.member_name:
+            raise KrakenOhlcvtArchiveError(f"archive member changed during import: {task.member_name}")
+        raw_path, member_hash = _stream_member_to_raw(
+            archive,
+            info,
+            root=task.raw_dir,
+            run_id=task.run_id,
+            symbol=task.mapping.autobot_symbol,
+            timeframe=task.timeframe,
+        )
+    normalized_path = _normalized_member_path(task.normalized_dir, task.run_id, task.mapping.autobot_symbol, task.timeframe)
+    summary = _normalize_member(
+        raw_path,
+        normalized_path,
+        mapping=task.mapping,
+        timeframe=task.timeframe,
+        member_name=info.filename,
+        imported_at=task.imported_at,
+        member_hash=member_hash,
+        source_url=task.source_url,
+        max_rows=task.max_rows,
+        max_buffer_bytes=task.max_buffer_bytes,
+    )
+    member = ImportedOhlcvtMember(
+        symbol=task.mapping.autobot_symbol,
+        timeframe=task.timeframe,
+        archive_member=info.filename,
+        raw_path=str(raw_path),
+        normalized_path=str(normalized_path),
+        row_count=summary.row_count,
+        duplicate_count=summary.duplicate_count,
+        gap_count=summary.gap_count,
+        start_at=summary.start_at,
+        end_at=summary.end_at,
+        compressed_size_bytes=info.compress_size,
+        uncompressed_size_bytes=info.file_size,
+        member_sha256=member_hash,
+        zip_crc32=info.CRC,
+    )
+    return member, summary.peak_buffer_bytes
+
+
+def _normalize_member(
     raw_path: Path,
+    path: Path,
     *,
     mapping: KrakenPublicPairMapping,
     timeframe: str,
     member_name: str,
+    imported_at: datetime,
+    member_hash: str,
+    source_url: str,
     max_rows: int,
-) -> tuple[list[MarketBar], dict[datetime, int | None]]:
+    max_buffer_bytes: int,
+) -> _NormalizedMemberSummary:
+    """Write normalized rows, sorted and deduplicated by bar open time.
+
+    Official archives are chronological, so rows normally stream straight
+    through with only the pending bar held in memory.  An out-of-order member
+    is re-read into a bounded buffer and stably sorted; either way a
+    duplicated timestamp keeps its first OHLCV values and its last trade
+    count, and gaps are counted against the member's nominal interval.
+    """
+
+    write = dict(
+        mapping=mapping,
+        timeframe=timeframe,
+        member_name=member_name,
+        imported_at=imported_at,
+        member_hash=member_hash,
+        source_url=source_url,
+    )
+    try:
+        return _write_normalized_rows(
+            path,
+            _iter_member_rows(raw_path, member_name=member_name, max_rows=max_rows),
+            peak_buffer_bytes=_BUFFERED_ROW_BYTES,
+            **write,
+        )
+    except _UnsortedMemberRows:
+        pass
+    buffered: list[_ParsedRow] = []
+    for row in _iter_member_rows(raw_path, member_name=member_name, max_rows=max_rows):
+        if (len(buffered) + 1) * _BUFFERED_ROW_BYTES > max_buffer_bytes:
+            raise KrakenOhlcvtArchiveError(
+                f"out-of-order archive member exceeds max_member_buffer_bytes ({max_buffer_bytes}): {member_name}"
+            )
+        buffered.append(row)
+    buffered.sort(key=lambda row: row[1])
+    return _write_normalized_rows(
+        path,
+        buffered,
+        peak_buffer_bytes=len(buffered) * _BUFFERED_ROW_BYTES,
+        **write,
+    )
+
+
+def _iter_member_rows(raw_path: Path, *, member_name: str, max_rows: int) -> Iterator[_ParsedRow]:
+    """Parse one raw member into typed rows without building bar objects."""
+
     try:
         with raw_path.open("r", encoding="utf-8-sig", newline="") as handle:
             reader = csv.reader(handle)
@@ -406,61 +540,54 @@ def _parse_member_bars(
             )
             if appears_headered:
                 timestamp_index = _first_index(fields, "TIMESTAMP", "TIME", "DATE", "DATETIME")
-                required = {
-                    "OPEN": _first_index(fields, "OPEN"),
-                    "HIGH": _first_index(fields, "HIGH"),
-                    "LOW": _first_index(fields, "LOW"),
-                    "CLOSE": _first_index(fields, "CLOSE"),
-                    "VOLUME": _first_index(fields, "VOLUME", "VOL"),
-                }
-                if timestamp_index is None or any(value is None for value in required.values()):
+                value_indexes = (
+                    _first_index(fields, "OPEN"),
+                    _first_index(fields, "HIGH"),
+                    _first_index(fields, "LOW"),
+                    _first_index(fields, "CLOSE"),
+                    _first_index(fields, "VOLUME", "VOL"),
+                )
+                if timestamp_index is None or any(value is None for value in value_indexes):
                     raise KrakenOhlcvtArchiveError(f"archive member has unsupported OHLCVT columns: {member_name}")
                 trades_index = _first_index(fields, "TRADES", "TRADECOUNT", "COUNT")
-                rows = enumerate(reader, start=2)
+                rows: Iterable[tuple[int, list[str]]] = enumerate(reader, start=2)
             else:
                 if len(first_row) != 7:
                     raise KrakenOhlcvtArchiveError(
                         f"archive member has unsupported headerless OHLCVT format: {member_name}"
                     )
                 timestamp_index = 0
-                required = {"OPEN": 1, "HIGH": 2, "LOW": 3, "CLOSE": 4, "VOLUME": 5}
+                value_indexes = (1, 2, 3, 4, 5)
                 trades_index = 6
                 rows = chain(((1, first_row),), enumerate(reader, start=2))
 
-            bars: list[MarketBar] = []
-            trade_counts: dict[datetime, int | None] = {}
+            open_index, high_index, low_index, close_index, volume_index = value_indexes
             for row_number, row in rows:
                 if row_number > max_rows:
                     raise KrakenOhlcvtArchiveError(
                         f"archive member exceeds max_rows_per_member ({max_rows}): {member_name}"
                     )
                 try:
-                    open_time = _parse_timestamp(row[timestamp_index])
-                    values = {key: float(str(row[index])) for key, index in required.items() if index is not None}
+                    raw_timestamp = row[timestamp_index]
+                    # Ten digits or fewer is a plain epoch-seconds value; every
+                    # other form goes through the full timestamp parser.
+                    if len(raw_timestamp) <= 10 and raw_timestamp.isdigit():
+                        open_time = int(raw_timestamp)
+                    else:
+                        open_time = int(_parse_timestamp(raw_timestamp).timestamp())
+                    open_ = float(row[open_index])
+                    high = float(row[high_index])
+                    low = float(row[low_index])
+                    close = float(row[close_index])
+                    volume = float(row[volume_index])
                 except (IndexError, TypeError, ValueError) as exc:
                     raise KrakenOhlcvtArchiveError(f"invalid OHLCVT row {row_number} in {member_name}") from exc
-                if min(values["OPEN"], values["HIGH"], values["LOW"], values["CLOSE"]) <= 0.0 or values["VOLUME"] < 0.0:
+                if min(open_, high, low, close) <= 0.0 or volume < 0.0:
                     raise KrakenOhlcvtArchiveError(f"invalid non-positive OHLCVT values at row {row_number} in {member_name}")
                 trade_count = _optional_nonnegative_int(row[trades_index]) if trades_index is not None else None
-                bars.append(
-                    MarketBar(
-                        timestamp=open_time,
-                        symbol=mapping.autobot_symbol,
-                        timeframe=timeframe,
-                        open=values["OPEN"],
-                        high=values["HIGH"],
-                        low=values["LOW"],
-                        close=values["CLOSE"],
-                        volume=values["VOLUME"],
-                        metadata={},
-                    )
-                )
-                trade_counts[open_time] = trade_count
+                yield row_number, open_time, open_, high, low, close, volume, trade_count
     except UnicodeDecodeError as exc:
         raise KrakenOhlcvtArchiveError(f"archive member is not UTF-8 CSV: {member_name}") from exc
-    if not bars:
-        raise KrakenOhlcvtArchiveError(f"archive member has no OHLCVT rows: {member_name}")
-    return bars, trade_counts
 
 
 def _first_index(fields: Mapping[str, int], *candidates: str) -> int | None:
@@ -497,86 +624,130 @@ def _optional_nonnegative_int(value: Any) -> int | None:
     return parsed
 
 
-def _dedupe_bars(bars: Sequence[MarketBar]) -> tuple[list[MarketBar], int]:
-    deduped: list[MarketBar] = []
-    seen: set[tuple[str, str, datetime]] = set()
-    for bar in MarketDataRepository.normalize(bars):
-        key = bar.key()
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(bar)
-    return deduped, len(bars) - len(deduped)
-
-
 def _write_normalized_rows(
     path: Path,
+    rows: Iterable[_ParsedRow],
     *,
-    bars: Sequence[MarketBar],
-    trade_counts: Mapping[datetime, int | None],
     mapping: KrakenPublicPairMapping,
     timeframe: str,
+    member_name: str,
     imported_at: datetime,
-    archive_member: str,
     member_hash: str,
     source_url: str,
-) -> None:
+    peak_buffer_bytes: int,
+) -> _NormalizedMemberSummary:
+    """Stream time-ordered rows to ``path``; raise ``_UnsortedMemberRows`` otherwise."""
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    fields = (
-        "schema_version", "timestamp", "symbol", "timeframe", "base_asset", "quote_asset", "open", "high", "low", "close", "volume",
-        "metadata", "event_time", "available_time", "ingestion_time", "temporal_status", "bar_close_time", "source_timestamp_role",
-        "availability_basis", "source", "source_support_url", "archive_member", "member_sha256",
-    )
     temporary = path.with_suffix(f"{path.suffix}.tmp")
-    interval = timedelta(minutes=KRAKEN_ARCHIVE_TIMEFRAMES[timeframe])
-    with temporary.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fields)
-        writer.writeheader()
-        for bar in bars:
-            close_time = bar.timestamp + interval
-            if close_time > imported_at:
-                raise KrakenOhlcvtArchiveError(
-                    f"archive member contains a bar not closed at import time: {archive_member} {bar.timestamp.isoformat()}"
-                )
-            metadata = {
-                "source": "kraken_official_ohlcvt_archive",
-                "source_support_url": source_url,
-                "archive_member": archive_member,
-                "member_sha256": member_hash,
-                "trade_count": trade_counts.get(bar.timestamp),
-                "volume_source": "kraken_official_ohlcvt",
-                "bid_ask_source": "absent",
-                "depth_source": "absent",
-                "historical_archive": True,
-            }
-            writer.writerow(
-                {
-                    "schema_version": "1",
-                    "timestamp": bar.timestamp.isoformat(),
-                    "symbol": mapping.autobot_symbol,
-                    "timeframe": timeframe,
-                    "base_asset": mapping.base_asset or "",
-                    "quote_asset": mapping.quote_asset or "",
-                    "open": bar.open,
-                    "high": bar.high,
-                    "low": bar.low,
-                    "close": bar.close,
-                    "volume": bar.volume,
-                    "metadata": json.dumps(metadata, sort_keys=True),
-                    "event_time": close_time.isoformat(),
-                    "available_time": close_time.isoformat(),
-                    "ingestion_time": imported_at.isoformat(),
-                    "temporal_status": HISTORICAL_ARCHIVE_STATUS,
-                    "bar_close_time": close_time.isoformat(),
-                    "source_timestamp_role": "bar_open",
-                    "availability_basis": "OFFICIAL_ARCHIVE_COMPLETED_BAR_ASSUMPTION",
-                    "source": "kraken_official_ohlcvt_archive",
-                    "source_support_url": source_url,
-                    "archive_member": archive_member,
-                    "member_sha256": member_hash,
-                }
+    interval_seconds = KRAKEN_ARCHIVE_TIMEFRAMES[timeframe] * 60
+    interval = timedelta(seconds=interval_seconds)
+    gap_threshold = interval_seconds * 1.5
+    metadata = {
+        "source": "kraken_official_ohlcvt_archive",
+        "source_support_url": source_url,
+        "archive_member": member_name,
+        "member_sha256": member_hash,
+        "trade_count": None,
+        "volume_source": "kraken_official_ohlcvt",
+        "bid_ask_source": "absent",
+        "depth_source": "absent",
+        "historical_archive": True,
+    }
+    # Only the bar times, prices and ``trade_count`` vary per row.  Every
+    # constant field is rendered once with the CSV dialect, and the sorted
+    # metadata JSON is split around ``trade_count`` (already CSV-quoted), so
+    # each line is a plain string join instead of a quoted csv.writer call.
+    metadata_head, separator, metadata_tail = json.dumps(metadata, sort_keys=True).partition('"trade_count": null')
+    metadata_head = '"' + (metadata_head + separator[:-4]).replace('"', '""')
+    metadata_tail = metadata_tail.replace('"', '""') + '"'
+    market_fields = _csv_fields(
+        (mapping.autobot_symbol, timeframe, mapping.base_asset or "", mapping.quote_asset or "")
+    )
+    ingestion_fields = _csv_fields((imported_at.isoformat(), HISTORICAL_ARCHIVE_STATUS))
+    source_fields = _csv_fields(
+        (
+            "bar_open",
+            "OFFICIAL_ARCHIVE_COMPLETED_BAR_ASSUMPTION",
+            "kraken_official_ohlcvt_archive",
+            source_url,
+            member_name,
+            member_hash,
+        )
+    )
+    row_count = 0
+    duplicate_count = 0
+    gap_count = 0
+    start_at: str | None = None
+    end_at: str | None = None
+    pending: _ParsedRow | None = None
+    pending_trade_count: int | None = None
+    previous_open_time: int | None = None
+
+    def flush(handle: Any, row: _ParsedRow, trade_count: int | None) -> str:
+        _row_number, open_time, open_, high, low, close, volume, _trade_count = row
+        opened_at = datetime.fromtimestamp(open_time, tz=timezone.utc)
+        close_time = opened_at + interval
+        if close_time > imported_at:
+            raise KrakenOhlcvtArchiveError(
+                f"archive member contains a bar not closed at import time: {member_name} {opened_at.isoformat()}"
             )
+        opened = opened_at.isoformat()
+        closed = close_time.isoformat()
+        handle.write(
+            f"1,{opened},{market_fields},{open_!r},{high!r},{low!r},{close!r},{volume!r},"
+            f"{metadata_head}{'null' if trade_count is None else trade_count}{metadata_tail},"
+            f"{closed},{closed},{ingestion_fields},{closed},{source_fields}\r\n"
+        )
+        return opened
+
+    try:
+        with temporary.open("w", newline="", encoding="utf-8") as handle:
+            handle.write(_csv_fields(_NORMALIZED_FIELDS) + "\r\n")
+            for row in rows:
+                open_time = row[1]
+                if pending is not None and open_time == pending[1]:
+                    duplicate_count += 1
+                    pending_trade_count = row[7]
+                    continue
+                if pending is not None:
+                    if open_time < pending[1]:
+                        raise _UnsortedMemberRows()
+                    end_at = flush(handle, pending, pending_trade_count)
+                    start_at = start_at or end_at
+                    row_count += 1
+                    if previous_open_time is not None and pending[1] - previous_open_time > gap_threshold:
+                        gap_count += 1
+                    previous_open_time = pending[1]
+                pending = row
+                pending_trade_count = row[7]
+            if pending is None:
+                raise KrakenOhlcvtArchiveError(f"archive member has no OHLCVT rows: {member_name}")
+            end_at = flush(handle, pending, pending_trade_count)
+            start_at = start_at or end_at
+            row_count += 1
+            if previous_open_time is not None and pending[1] - previous_open_time > gap_threshold:
+                gap_count += 1
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
     temporary.replace(path)
+    return _NormalizedMemberSummary(
+        row_count=row_count,
+        duplicate_count=duplicate_count,
+        gap_count=gap_count,
+        start_at=start_at,
+        end_at=end_at,
+        peak_buffer_bytes=peak_buffer_bytes,
+    )
+
+
+def _csv_fields(values: Sequence[str]) -> str:
+    """Render fields exactly as the default CSV dialect writes them mid-row."""
+
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow(values)
+    return buffer.getvalue()
 
 
 def _persist_result(result: KrakenOhlcvtArchiveImportResult, config: KrakenOhlcvtArchiveImportConfig) -> KrakenOhlcvtArchiveImportResult:
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import math
 from dataclasses import asdict, dataclass, field
-from statistics import mean, pstdev
 from typing import Any, Sequence
 
-from .trade_journal import TradeRecord
+from .trade_journal import TradeBatch, TradeRecord
 
 
 @dataclass(frozen=True)
@@ -50,12 +49,75 @@ class MetricsResult:
         return data
 
 
+@dataclass(frozen=True)
+class ReturnMoments:
+    """Population moments of a return series computed in two array passes."""
+
+    count: int
+    mean: float
+    deviation: float
+    skewness: float
+    kurtosis: float
+    downside_deviation: float | None
+
+
+def return_moments(returns: Sequence[float]) -> ReturnMoments:
+    """Return mean, population deviation, skewness, kurtosis and downside.
+
+    Matches ``statistics.mean``/``pstdev`` and the standardized third/fourth
+    moments to floating point tolerance; a constant series yields an exact zero
+    deviation so zero-variance guards behave as before.
+    """
+
+    count = len(returns)
+    if count == 0:
+        return ReturnMoments(0, 0.0, 0.0, 0.0, 3.0, None)
+    center = math.fsum(returns) / count
+    lowest = min(returns)
+    highest = max(returns)
+    square_sum = 0.0
+    cube_sum = 0.0
+    quartic_sum = 0.0
+    downside_square_sum = 0.0
+    downside_count = 0
+    for value in returns:
+        delta = value - center
+        delta_squared = delta * delta
+        square_sum += delta_squared
+        cube_sum += delta_squared * delta
+        quartic_sum += delta_squared * delta_squared
+        if value < 0.0:
+            downside_square_sum += value * value
+            downside_count += 1
+    downside = math.sqrt(downside_square_sum / downside_count) if downside_count else None
+    if lowest == highest:
+        return ReturnMoments(count, lowest, 0.0, 0.0, 3.0, downside)
+    variance = square_sum / count
+    deviation = math.sqrt(variance)
+    if deviation <= 0.0:
+        return ReturnMoments(count, center, 0.0, 0.0, 3.0, downside)
+    return ReturnMoments(
+        count=count,
+        mean=center,
+        deviation=deviation,
+        skewness=(cube_sum / count) / (variance * deviation),
+        kurtosis=(quartic_sum / count) / (variance * variance),
+        downside_deviation=downside,
+    )
+
+
 class MetricsEngine:
-    """Calculate net-of-cost research metrics from closed trade records."""
+    """Calculate net-of-cost research metrics from closed trade records.
+
+    Trades are converted once into a :class:`TradeBatch`; summary, drawdown,
+    Sharpe-like and regime statistics are then accumulated over its columns.
+    Callers holding a :class:`TradeJournal` should pass ``journal.batch()`` to
+    reuse the cached columns.
+    """
 
     def calculate(
         self,
-        trades: Sequence[TradeRecord],
+        trades: Sequence[TradeRecord] | TradeBatch,
         *,
         initial_capital_eur: float,
         baseline_name: str | None = None,
@@ -63,39 +125,61 @@ class MetricsEngine:
     ) -> MetricsResult:
         if initial_capital_eur <= 0.0 or not math.isfinite(initial_capital_eur):
             raise ValueError("initial_capital_eur must be positive and finite")
-        closed_trades = list(trades)
-        total_gross = sum(trade.gross_pnl_eur for trade in closed_trades)
-        total_net = sum(trade.net_pnl_eur for trade in closed_trades)
-        total_fees = sum(trade.fees_eur for trade in closed_trades)
-        total_spread = sum(trade.spread_cost_eur for trade in closed_trades)
-        total_slippage = sum(trade.slippage_eur for trade in closed_trades)
-        total_latency = sum(trade.latency_cost_eur for trade in closed_trades)
-        wins = [trade.net_pnl_eur for trade in closed_trades if trade.net_pnl_eur > 0.0]
-        losses = [trade.net_pnl_eur for trade in closed_trades if trade.net_pnl_eur < 0.0]
+        batch = trades if isinstance(trades, TradeBatch) else TradeBatch.from_records(trades)
+        count = len(batch)
+        total_gross = sum(batch.gross_pnl_eur)
+        total_fees = sum(batch.fees_eur)
+        total_spread = sum(batch.spread_cost_eur)
+        total_slippage = sum(batch.slippage_eur)
+        total_latency = sum(batch.latency_cost_eur)
+        regime_count = len(batch.regime_labels)
+        regime_trades = [0] * regime_count
+        regime_wins = [0] * regime_count
+        regime_net: list[list[float]] = [[] for _ in range(regime_count)]
+        wins: list[float] = []
+        losses: list[float] = []
+        for value, code in zip(batch.net_pnl_eur, batch.regime_codes):
+            regime_trades[code] += 1
+            regime_net[code].append(value)
+            if value > 0.0:
+                wins.append(value)
+                regime_wins[code] += 1
+            elif value < 0.0:
+                losses.append(value)
+        total_net = sum(batch.net_pnl_eur)
         final_equity = initial_capital_eur + total_net
         total_return_pct = (total_net / initial_capital_eur) * 100.0
-        winrate = (len(wins) / len(closed_trades) * 100.0) if closed_trades else None
+        winrate = (len(wins) / count * 100.0) if count else None
         gross_wins = sum(wins)
         gross_losses = abs(sum(losses))
-        profit_factor = self._profit_factor(gross_wins, gross_losses, closed_trades)
-        expectancy = (total_net / len(closed_trades)) if closed_trades else None
-        avg_win = mean(wins) if wins else None
-        avg_loss = mean(losses) if losses else None
-        max_dd_eur, max_dd_pct = self._max_drawdown(closed_trades, initial_capital_eur)
-        durations = [trade.duration_seconds for trade in closed_trades]
-        avg_duration = mean(durations) if durations else None
-        returns = [trade.net_pnl_eur / initial_capital_eur for trade in closed_trades]
-        sharpe = self._sharpe_like(returns)
-        sortino = self._sortino_like(returns)
+        profit_factor = self._profit_factor(gross_wins, gross_losses, count)
+        expectancy = (total_net / count) if count else None
+        avg_win = (gross_wins / len(wins)) if wins else None
+        avg_loss = (math.fsum(losses) / len(losses)) if losses else None
+        max_dd_eur, max_dd_pct = self._max_drawdown(batch, initial_capital_eur)
+        avg_duration = (math.fsum(batch.duration_seconds) / count) if count else None
+        moments = return_moments(batch.returns(initial_capital_eur))
+        sharpe = self._sharpe_like(moments)
+        sortino = self._sortino_like(moments)
         baseline_delta = None
         if baseline_return_pct is not None:
             baseline_delta = total_return_pct - baseline_return_pct
+        performance_by_regime: dict[str, dict[str, Any]] = {}
+        for code, regime in enumerate(batch.regime_labels):
+            subset_count = regime_trades[code]
+            net = sum(regime_net[code])
+            performance_by_regime[regime] = {
+                "trade_count": subset_count,
+                "net_pnl_eur": net,
+                "winrate_pct": (regime_wins[code] / subset_count * 100.0) if subset_count else None,
+                "expectancy_eur": (net / subset_count) if subset_count else None,
+            }
         return MetricsResult(
             initial_capital_eur=initial_capital_eur,
             final_equity_eur=final_equity,
             total_return_pct=total_return_pct,
-            trade_count=len(closed_trades),
-            closed_trade_count=len(closed_trades),
+            trade_count=count,
+            closed_trade_count=count,
             total_gross_pnl_eur=total_gross,
             total_net_pnl_eur=total_net,
             total_fees_eur=total_fees,
@@ -115,64 +199,51 @@ class MetricsEngine:
             baseline_name=baseline_name,
             baseline_return_pct=baseline_return_pct,
             baseline_delta_pct=baseline_delta,
-            performance_by_regime=self._performance_by_regime(closed_trades),
+            performance_by_regime=performance_by_regime,
         )
 
     @staticmethod
-    def _profit_factor(gross_wins: float, gross_losses: float, trades: Sequence[TradeRecord]) -> float | None:
-        if not trades:
+    def _profit_factor(gross_wins: float, gross_losses: float, trade_count: int) -> float | None:
+        if not trade_count:
             return None
         if gross_losses == 0.0:
             return None
         return gross_wins / gross_losses
 
     @staticmethod
-    def _max_drawdown(trades: Sequence[TradeRecord], initial_capital_eur: float) -> tuple[float, float]:
+    def _max_drawdown(batch: TradeBatch, initial_capital_eur: float) -> tuple[float, float]:
         equity = initial_capital_eur
         peak = initial_capital_eur
         max_drawdown = 0.0
         max_drawdown_pct = 0.0
-        for trade in sorted(trades, key=lambda item: item.closed_at):
-            equity += trade.net_pnl_eur
-            peak = max(peak, equity)
-            drawdown = max(0.0, peak - equity)
-            max_drawdown = max(max_drawdown, drawdown)
+        net = batch.net_pnl_eur
+        ordered = net if batch.close_order is None else (net[index] for index in batch.close_order)
+        for value in ordered:
+            equity += value
+            if equity > peak:
+                peak = equity
+                continue
+            drawdown = peak - equity
+            if drawdown > max_drawdown:
+                max_drawdown = drawdown
             if peak > 0.0:
-                max_drawdown_pct = max(max_drawdown_pct, (drawdown / peak) * 100.0)
+                drawdown_pct = (drawdown / peak) * 100.0
+                if drawdown_pct > max_drawdown_pct:
+                    max_drawdown_pct = drawdown_pct
         return max_drawdown, max_drawdown_pct
 
     @staticmethod
-    def _sharpe_like(returns: Sequence[float]) -> float | None:
-        if len(returns) < 2:
+    def _sharpe_like(moments: ReturnMoments) -> float | None:
+        if moments.count < 2:
             return None
-        deviation = pstdev(returns)
-        if deviation == 0.0:
+        if moments.deviation == 0.0:
             return None
-        return (mean(returns) / deviation) * math.sqrt(len(returns))
+        return (moments.mean / moments.deviation) * math.sqrt(moments.count)
 
     @staticmethod
-    def _sortino_like(returns: Sequence[float]) -> float | None:
-        if len(returns) < 2:
+    def _sortino_like(moments: ReturnMoments) -> float | None:
+        if moments.count < 2:
             return None
-        downside = [value for value in returns if value < 0.0]
-        if not downside:
+        if not moments.downside_deviation:
             return None
-        downside_deviation = math.sqrt(mean([value * value for value in downside]))
-        if downside_deviation == 0.0:
-            return None
-        return (mean(returns) / downside_deviation) * math.sqrt(len(returns))
-
-    def _performance_by_regime(self, trades: Sequence[TradeRecord]) -> dict[str, dict[str, Any]]:
-        regimes = sorted({trade.regime or "unknown" for trade in trades})
-        result: dict[str, dict[str, Any]] = {}
-        for regime in regimes:
-            subset = [trade for trade in trades if (trade.regime or "unknown") == regime]
-            net = sum(trade.net_pnl_eur for trade in subset)
-            wins = sum(1 for trade in subset if trade.net_pnl_eur > 0.0)
-            result[regime] = {
-                "trade_count": len(subset),
-                "net_pnl_eur": net,
-                "winrate_pct": (wins / len(subset) * 100.0) if subset else None,
-                "expectancy_eur": (net / len(subset)) if subset else None,
-            }
-        return result
+        return (moments.mean / moments.downside_deviation) * math.sqrt(moments.count)
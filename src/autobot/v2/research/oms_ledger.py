@@ -14,7 +14,7 @@ import json
 import math
 from pathlib import Path
 import sqlite3
-from typing import Any, Mapping, Sequence
+from typing import Any, ContextManager, Mapping, Sequence
 
 from autobot.v2.contracts import (
     FillEvent,
@@ -26,6 +26,7 @@ from autobot.v2.contracts import (
     contract_fingerprint,
     contract_to_dict,
 )
+from autobot.v2.sqlite_access import SQLitePragmas, shared_sqlite_pool
 
 
 DEFAULT_OMS_LEDGER_PATH = Path("data/research/oms_shadow_ledger.sqlite3")
@@ -192,6 +193,11 @@ class ShadowOMSLedger:
 
     def __init__(self, path: str | Path = DEFAULT_OMS_LEDGER_PATH) -> None:
         self.path = Path(path)
+        self._pool = shared_sqlite_pool(
+            self.path,
+            timeout_seconds=30.0,
+            pragmas=SQLitePragmas.from_env(busy_timeout_ms=30_000, foreign_keys=True),
+        )
 
     def register_intent(self, intent: OrderIntent) -> bool:
         if intent.execution_mode != "shadow":
@@ -717,12 +723,8 @@ class ShadowOMSLedger:
         if stored_fill_json != fill_json or stored_costs_json != costs_json:
             raise OMSLedgerError("fill_id is already bound to different immutable fill evidence")
 
-    def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.path, timeout=30.0)
-        connection.execute("PRAGMA foreign_keys = ON")
-        connection.execute("PRAGMA busy_timeout = 30000")
-        connection.execute("PRAGMA journal_mode = WAL")
-        return connection
+    def _connect(self) -> ContextManager[sqlite3.Connection]:
+        return self._pool.transaction()
 
     @staticmethod
     def _initialize(connection: sqlite3.Connection) -> None:
@@ -9,6 +9,7 @@ it does not import collectors, read runtime state or create any network client.
 from __future__ import annotations
 
 import ast
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Mapping
@@ -25,6 +26,11 @@ PUBLIC_COLLECTOR_MODULES = (
     "kraken_post_trade_backfill",
 )
 
+# CPython 3.11 keeps the AST constructor's recursion bookkeeping in shared
+# state, so concurrent ast.parse calls (parallel OHLCV fetches each audit
+# their collector) can fail with "AST constructor recursion depth mismatch".
+_PARSE_LOCK = threading.Lock()
+
 _FORBIDDEN_IMPORT_PREFIXES = (
     "krakenex",
     "order_executor",
@@ -125,7 +131,8 @@ def audit_public_collector_sources(
     for module, source_path in source_paths.items():
         try:
             source = source_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(source_path))
+            with _PARSE_LOCK:
+                tree = ast.parse(source, filename=str(source_path))
         except (OSError, SyntaxError) as exc:
             raise PublicCollectorBoundaryError(
                 f"cannot inspect public collector {module}: {exc}"
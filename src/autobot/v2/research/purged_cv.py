@@ -4,17 +4,30 @@ This module only defines temporal folds.  It does not fit a model, score a
 strategy, or communicate with AUTOBOT's runtime.  Walk-forward remains the
 authoritative out-of-sample method; purged CV is supplementary evidence for
 future parameter/model research where labels can overlap in time.
+
+Planning runs on :class:`PurgedCVIndex`, sorted start/end arrays in epoch
+microseconds.  Purge and embargo boundaries are found by binary search, and
+splits carry compact index arrays rather than observation IDs.
+:func:`build_combinatorial_purged_cv_plan` emits every C(groups, k) split
+together with the backtest paths that recombine them.
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
+from itertools import accumulate, combinations, compress, islice
+from operator import le, sub
 from statistics import median
 from typing import Any, Iterable, Sequence
 
 from .trade_journal import TradeRecord
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 def _as_utc(value: datetime) -> datetime:
     return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -102,67 +115,312 @@ def build_purged_cv_plan(
         raise ValueError("folds must be at least two")
     if embargo_bars < 0:
         raise ValueError("embargo_bars cannot be negative")
-    ordered = tuple(sorted(observations, key=lambda item: (item.start_at, item.end_at, item.observation_id)))
+    index = PurgedCVIndex.from_observations(observations)
+    ordered = index.observations
     if len(ordered) < folds * 2:
         return PurgedCVPlan(
             observation_count=len(ordered),
             requested_folds=folds,
             embargo_bars=embargo_bars,
-            estimated_bar_seconds=_estimated_bar_seconds(ordered),
+            estimated_bar_seconds=index.bar_seconds,
             folds=(),
             status="insufficient_observations",
         )
-    chunk_size = len(ordered) // folds
-    bar_seconds = _estimated_bar_seconds(ordered)
+    bounds = index.group_bounds(folds)
+    ids = index.ids
     plan: list[PurgedCVFold] = []
-    for index in range(folds):
-        test_start = index * chunk_size
-        test_end = len(ordered) if index == folds - 1 else min(len(ordered), (index + 1) * chunk_size)
-        test = ordered[test_start:test_end]
-        test_start_at = test[0].start_at
-        test_end_at = max(item.end_at for item in test)
-        embargo_end = test_end_at + timedelta(seconds=(bar_seconds or 0.0) * embargo_bars)
-        train: list[str] = []
-        purged: list[str] = []
-        embargoed: list[str] = []
-        test_ids = {item.observation_id for item in test}
-        for item in ordered:
-            if item.observation_id in test_ids:
-                continue
-            overlaps_test = item.start_at <= test_end_at and item.end_at >= test_start_at
-            is_embargoed = test_end_at < item.start_at <= embargo_end
-            if overlaps_test:
-                purged.append(item.observation_id)
-            elif is_embargoed:
-                embargoed.append(item.observation_id)
-            else:
-                train.append(item.observation_id)
+    for group, (test_start, test_end) in enumerate(bounds):
+        split = index.split((group,), bounds, embargo_bars=embargo_bars, split_index=group)
         plan.append(
             PurgedCVFold(
-                fold_index=index + 1,
-                test_observation_ids=tuple(item.observation_id for item in test),
-                train_observation_ids=tuple(train),
-                purged_observation_ids=tuple(purged),
-                embargoed_observation_ids=tuple(embargoed),
-                test_start_at=test_start_at.isoformat(),
-                test_end_at=test_end_at.isoformat(),
+                fold_index=group + 1,
+                test_observation_ids=ids[test_start:test_end],
+                train_observation_ids=tuple(ids[item] for item in split.train_indices()),
+                purged_observation_ids=tuple(ids[item] for item in split.purged_indices),
+                embargoed_observation_ids=tuple(ids[item] for item in split.embargoed_indices),
+                test_start_at=ordered[test_start].start_at.isoformat(),
+                test_end_at=max(item.end_at for item in ordered[test_start:test_end]).isoformat(),
             )
         )
     return PurgedCVPlan(
         observation_count=len(ordered),
         requested_folds=folds,
         embargo_bars=embargo_bars,
-        estimated_bar_seconds=bar_seconds,
+        estimated_bar_seconds=index.bar_seconds,
         folds=tuple(plan),
         status="research_planning_only",
     )
 
 
-def _estimated_bar_seconds(observations: Sequence[PurgedObservation]) -> float | None:
-    starts = [item.start_at for item in observations]
-    gaps = [
-        max(0.0, (right - left).total_seconds())
-        for left, right in zip(starts, starts[1:])
-        if right > left
-    ]
-    return float(median(gaps)) if gaps else None
+@dataclass(frozen=True)
+class PurgedSplit:
+    """One train/test split; every index refers to :class:`PurgedCVIndex` order."""
+
+    split_index: int
+    test_groups: tuple[int, ...]
+    test_ranges: tuple[tuple[int, int], ...]
+    purged_indices: array
+    embargoed_indices: array
+    observation_count: int
+
+    @property
+    def test_count(self) -> int:
+        return sum(end - start for start, end in self.test_ranges)
+
+    @property
+    def train_count(self) -> int:
+        return self.observation_count - self.test_count - len(self.purged_indices) - len(self.embargoed_indices)
+
+    def test_indices(self) -> array:
+        result = array("q")
+        for start, end in self.test_ranges:
+            result.extend(range(start, end))
+        return result
+
+    def train_indices(self) -> array:
+        keep = bytearray(b"\x01") * self.observation_count
+        for start, end in self.test_ranges:
+            keep[start:end] = bytes(end - start)
+        for item in self.purged_indices:
+            keep[item] = 0
+        for item in self.embargoed_indices:
+            keep[item] = 0
+        return array("q", compress(range(self.observation_count), keep))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "split_index": self.split_index,
+            "test_groups": list(self.test_groups),
+            "test_ranges": [list(item) for item in self.test_ranges],
+            "test_count": self.test_count,
+            "train_count": self.train_count,
+            "purged_count": len(self.purged_indices),
+            "embargoed_count": len(self.embargoed_indices),
+        }
+
+
+@dataclass(frozen=True)
+class CombinatorialPurgedCVPlan:
+    observation_count: int
+    group_count: int
+    test_group_count: int
+    embargo_bars: int
+    estimated_bar_seconds: float | None
+    group_bounds: tuple[tuple[int, int], ...]
+    splits: tuple[PurgedSplit, ...]
+    paths: tuple[tuple[int, ...], ...]
+    status: str
+    research_only: bool = True
+    live_promotion_allowed: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "observation_count": self.observation_count,
+            "group_count": self.group_count,
+            "test_group_count": self.test_group_count,
+            "embargo_bars": self.embargo_bars,
+            "estimated_bar_seconds": self.estimated_bar_seconds,
+            "group_bounds": [list(item) for item in self.group_bounds],
+            "splits": [split.to_dict() for split in self.splits],
+            "paths": [list(path) for path in self.paths],
+            "status": self.status,
+            "research_only": True,
+            "live_promotion_allowed": False,
+        }
+
+
+@dataclass(frozen=True)
+class PurgedCVIndex:
+    """Observation intervals sorted by (start, end) as epoch-microsecond arrays.
+
+    ``positions[i]`` is the caller's position of sorted observation ``i``.
+    ``observations`` and ``ids`` are only populated when built from
+    :class:`PurgedObservation` rows.
+    """
+
+    starts: array
+    ends: array
+    positions: array
+    ids: tuple[str, ...] = ()
+    observations: tuple[PurgedObservation, ...] = ()
+    _running_end_max: array = field(init=False, repr=False, compare=False)
+    _span_end_max: dict[tuple[int, int], int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not (len(self.starts) == len(self.ends) == len(self.positions)):
+            raise ValueError("starts, ends and positions must have the same length")
+        # Ends are not sorted; their running maximum is, which bounds the purge search.
+        object.__setattr__(self, "_running_end_max", array("q", accumulate(self.ends, max)))
+        object.__setattr__(self, "_span_end_max", {})
+
+    @classmethod
+    def from_observations(cls, observations: Iterable[PurgedObservation]) -> "PurgedCVIndex":
+        ordered = tuple(sorted(observations, key=lambda item: (item.start_at, item.end_at, item.observation_id)))
+        return cls(
+            starts=array("q", (_epoch_microseconds(item.start_at) for item in ordered)),
+            ends=array("q", (_epoch_microseconds(item.end_at) for item in ordered)),
+            positions=array("q", range(len(ordered))),
+            ids=tuple(item.observation_id for item in ordered),
+            observations=ordered,
+        )
+
+    @classmethod
+    def from_arrays(cls, starts: Sequence[int], ends: Sequence[int]) -> "PurgedCVIndex":
+        """Index intervals given as epoch microseconds, sorting them if needed."""
+
+        if len(starts) != len(ends):
+            raise ValueError("starts and ends must have the same length")
+        if min(map(sub, ends, starts), default=0) < 0:
+            raise ValueError("end cannot be before start")
+        if all(map(le, zip(starts, ends), islice(zip(starts, ends), 1, None))):
+            return cls(array("q", starts), array("q", ends), array("q", range(len(starts))))
+        order = sorted(range(len(starts)), key=lambda item: (starts[item], ends[item]))
+        return cls(
+            array("q", (starts[item] for item in order)),
+            array("q", (ends[item] for item in order)),
+            array("q", order),
+        )
+
+    @property
+    def observation_count(self) -> int:
+        return len(self.starts)
+
+    @property
+    def bar_seconds(self) -> float | None:
+        gaps = list(filter(None, map(sub, islice(self.starts, 1, None), self.starts)))
+        return float(median(gaps)) / 1_000_000.0 if gaps else None
+
+    def group_bounds(self, groups: int) -> tuple[tuple[int, int], ...]:
+        """Contiguous groups of ``n // groups`` rows; the last takes the remainder."""
+
+        size = self.observation_count // groups
+        return tuple(
+            (group * size, self.observation_count if group == groups - 1 else (group + 1) * size)
+            for group in range(groups)
+        )
+
+    def split(
+        self,
+        test_groups: Sequence[int],
+        bounds: Sequence[tuple[int, int]],
+        *,
+        embargo_bars: int,
+        split_index: int = 0,
+        bar_seconds: float | None = None,
+    ) -> PurgedSplit:
+        """Purge and embargo around each contiguous run of *test_groups*."""
+
+        if bar_seconds is None:
+            bar_seconds = self.bar_seconds
+        embargo = timedelta(seconds=(bar_seconds or 0.0) * embargo_bars) // _MICROSECOND
+        ranges: list[list[int]] = []
+        for group in sorted(test_groups):
+            start, end = bounds[group]
+            end_max = self._end_max(start, end)
+            if ranges and ranges[-1][1] == start:
+                ranges[-1][1:] = [end, max(ranges[-1][2], end_max)]
+            else:
+                ranges.append([start, end, end_max])
+        test_ranges = tuple((start, end) for start, end, _end_max in ranges)
+        starts, ends, running = self.starts, self.ends, self._running_end_max
+        purged: set[int] = set()
+        embargo_spans: list[tuple[int, int]] = []
+        for start, end, test_end_at in ranges:
+            test_start_at = starts[start]
+            # Earlier rows overlap when their label ends inside or after the test span.
+            first = bisect_left(running, test_start_at, 0, start)
+            purged.update(item for item in range(first, start) if ends[item] >= test_start_at)
+            # Later rows overlap while they start before the test labels end.
+            overlap_end = bisect_right(starts, test_end_at, end)
+            purged.update(range(end, overlap_end))
+            embargo_spans.append((overlap_end, bisect_right(starts, test_end_at + embargo, overlap_end)))
+        excluded = _in_ranges(test_ranges)
+        purged_indices = array("q", sorted(item for item in purged if not excluded(item)))
+        embargoed = {
+            item
+            for first, last in embargo_spans
+            for item in range(first, last)
+            if item not in purged and not excluded(item)
+        }
+        return PurgedSplit(
+            split_index=split_index,
+            test_groups=tuple(sorted(test_groups)),
+            test_ranges=test_ranges,
+            purged_indices=purged_indices,
+            embargoed_indices=array("q", sorted(embargoed)),
+            observation_count=self.observation_count,
+        )
+
+    def _end_max(self, start: int, end: int) -> int:
+        key = (start, end)
+        value = self._span_end_max.get(key)
+        if value is None:
+            value = self._span_end_max[key] = max(islice(self.ends, start, end))
+        return value
+
+
+def build_combinatorial_purged_cv_plan(
+    source: PurgedCVIndex | Sequence[PurgedObservation],
+    *,
+    groups: int = 6,
+    test_groups: int = 2,
+    embargo_bars: int = 1,
+) -> CombinatorialPurgedCVPlan:
+    """Combinatorial purged CV: every choice of *test_groups* out of *groups*.
+
+    Each group is tested in C(groups - 1, test_groups - 1) splits, which
+    recombine into that many full backtest paths; ``paths[p][g]`` is the
+    split whose test set covers group ``g`` on path ``p``.
+    """
+
+    if groups < 2:
+        raise ValueError("groups must be at least two")
+    if not 1 <= test_groups < groups:
+        raise ValueError("test_groups must be between one and groups - 1")
+    if embargo_bars < 0:
+        raise ValueError("embargo_bars cannot be negative")
+    index = source if isinstance(source, PurgedCVIndex) else PurgedCVIndex.from_observations(source)
+    bar_seconds = index.bar_seconds
+    if index.observation_count < groups * 2:
+        return CombinatorialPurgedCVPlan(
+            observation_count=index.observation_count,
+            group_count=groups,
+            test_group_count=test_groups,
+            embargo_bars=embargo_bars,
+            estimated_bar_seconds=bar_seconds,
+            group_bounds=(),
+            splits=(),
+            paths=(),
+            status="insufficient_observations",
+        )
+    bounds = index.group_bounds(groups)
+    splits = tuple(
+        index.split(chosen, bounds, embargo_bars=embargo_bars, split_index=position, bar_seconds=bar_seconds)
+        for position, chosen in enumerate(combinations(range(groups), test_groups))
+    )
+    by_group: list[list[int]] = [[] for _ in range(groups)]
+    for split in splits:
+        for group in split.test_groups:
+            by_group[group].append(split.split_index)
+    return CombinatorialPurgedCVPlan(
+        observation_count=index.observation_count,
+        group_count=groups,
+        test_group_count=test_groups,
+        embargo_bars=embargo_bars,
+        estimated_bar_seconds=bar_seconds,
+        group_bounds=bounds,
+        splits=splits,
+        paths=tuple(zip(*by_group)),
+        status="research_planning_only",
+    )
+
+
+def _in_ranges(ranges: Sequence[tuple[int, int]]):
+    def contains(item: int) -> bool:
+        return any(start <= item < end for start, end in ranges)
+
+    return contains
+
+
+def _epoch_microseconds(value: datetime) -> int:
+    return (_as_utc(value) - _EPOCH) // _MICROSECOND
@@ -9,7 +9,8 @@ strategy.
 The signal is intentionally simple and reproducible:
 
 * rolling log-price OLS hedge ratio against one reference or a small basket;
-* rolling return correlation and an optional Engle-Granger p-value;
+* rolling return correlation and an optional Engle-Granger p-value, refreshed
+  every ``cointegration_refresh_bars`` and cached per window;
 * a negative residual z-score identifies a potentially under-valued target;
 * a portfolio replay applies RiskManagerV2, ExecutionCostModel, TradeJournal,
   and MetricsEngine before producing a research-only verdict.
@@ -22,6 +23,7 @@ import math
 from collections import Counter, defaultdict
 from dataclasses import asdict, dataclass, field, replace
 from datetime import date, datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
 from statistics import mean, pstdev
 from typing import Any, Iterable, Sequence
@@ -334,6 +336,24 @@ class _RelationSeries:
     target_bars: tuple[MarketBar, ...]
     reference_log_prices: tuple[float, ...]
 
+    @cached_property
+    def target_log_prices(self) -> tuple[float, ...]:
+        return tuple(math.log(max(item.close, 1e-12)) for item in self.target_bars)
+
+    @cached_property
+    def _rolling_metrics(self) -> dict[int, "_RollingRelationMetrics"]:
+        return {}
+
+    @cached_property
+    def _cointegration_pvalues(self) -> dict[tuple[int, int], float | None]:
+        return {}
+
+    def rolling_metrics(self, window: int) -> "_RollingRelationMetrics":
+        table = self._rolling_metrics.get(window)
+        if table is None:
+            table = self._rolling_metrics[window] = _RollingRelationMetrics(self, window)
+        return table
+
 
 @dataclass(frozen=True)
 class _Candidate:
@@ -554,8 +574,9 @@ def _discover_signals(
     rejected: Counter[str] = Counter()
     statsmodels_available = _statsmodels_available()
     for series in series_items:
+        rolling = series.rolling_metrics(config.rolling_window_bars)
         for index in range(config.rolling_window_bars, len(series.timestamps) - 1):
-            metrics = _relation_metrics(series, index, config.rolling_window_bars)
+            metrics = rolling.at(index)
             if metrics is None:
                 rejected["insufficient_relation_history"] += 1
                 continue
@@ -565,7 +586,15 @@ def _discover_signals(
                 continue
             if zscore > config.entry_zscore:
                 continue
-            pvalue = _cointegration_pvalue(series, index, config.rolling_window_bars) if statsmodels_available else None
+            pvalue = (
+                _cached_cointegration_pvalue(
+                    series,
+                    _cointegration_anchor(index, config.rolling_window_bars, config.cointegration_refresh_bars),
+                    config.rolling_window_bars,
+                )
+                if statsmodels_available
+                else None
+            )
             if (
                 config.require_cointegration_when_available
                 and pvalue is not None
@@ -599,15 +628,138 @@ def _discover_signals(
     return tuple(sorted(signals, key=lambda item: (item.entry_at, item.target_symbol))), rejected, statsmodels_available
 
 
+class _RollingRelationMetrics:
+    """Per-bar relation metrics for one series, built in a single O(n) pass.
+
+    Window sums of log prices and log returns are updated in O(1) per bar and
+    re-seeded from scratch around a fresh anchor every ``window`` bars, which
+    keeps cancellation error below ~1e-9 on the z-score, correlation and hedge
+    ratio, well inside the 8-decimal rounding applied to signals.  Windows
+    whose centered sums are too small to trust (near-perfect fits, flat
+    prices) are recomputed exactly with :func:`_relation_metrics`.
+    """
+
+    _CANCELLATION_RATIO = 1e-9
+
+    def __init__(self, series: _RelationSeries, window: int) -> None:
+        self._series = series
+        self._window = window
+        self._rows = self._build()
+
+    def at(self, index: int) -> tuple[float, float, float, float, float, float] | None:
+        if index < self._window - 1 or index >= len(self._rows):
+            return None
+        return self._rows[index]
+
+    def _build(self) -> list[tuple[float, float, float, float, float, float] | None]:
+        targets = self._series.target_log_prices
+        references = self._series.reference_log_prices
+        window = self._window
+        rows: list[tuple[float, float, float, float, float, float] | None] = [None] * len(targets)
+        anchor_x = anchor_y = 0.0
+        sx = sy = sxx = syy = sxy = 0.0
+        rx = ry = rxx = ryy = rxy = 0.0
+        for index in range(window - 1, len(targets)):
+            start = index - window + 1
+            if (index - window + 1) % window == 0:
+                anchor_x, anchor_y = references[start], targets[start]
+                sx = sy = sxx = syy = sxy = 0.0
+                rx = ry = rxx = ryy = rxy = 0.0
+                for position in range(start, index + 1):
+                    x = references[position] - anchor_x
+                    y = targets[position] - anchor_y
+                    sx += x
+                    sy += y
+                    sxx += x * x
+                    syy += y * y
+                    sxy += x * y
+                    if position > start:
+                        dx = references[position] - references[position - 1]
+                        dy = targets[position] - targets[position - 1]
+                        rx += dx
+                        ry += dy
+                        rxx += dx * dx
+                        ryy += dy * dy
+                        rxy += dx * dy
+            else:
+                x_in = references[index] - anchor_x
+                y_in = targets[index] - anchor_y
+                x_out = references[start - 1] - anchor_x
+                y_out = targets[start - 1] - anchor_y
+                sx += x_in - x_out
+                sy += y_in - y_out
+                sxx += x_in * x_in - x_out * x_out
+                syy += y_in * y_in - y_out * y_out
+                sxy += x_in * y_in - x_out * y_out
+                dx_in = references[index] - references[index - 1]
+                dy_in = targets[index] - targets[index - 1]
+                dx_out = references[start] - references[start - 1]
+                dy_out = targets[start] - targets[start - 1]
+                rx += dx_in - dx_out
+                ry += dy_in - dy_out
+                rxx += dx_in * dx_in - dx_out * dx_out
+                ryy += dy_in * dy_in - dy_out * dy_out
+                rxy += dx_in * dy_in - dx_out * dy_out
+            rows[index] = self._row(
+                index,
+                anchor_x,
+                anchor_y,
+                (sx, sy, sxx, syy, sxy),
+                (rx, ry, rxx, ryy, rxy),
+            )
+        return rows
+
+    def _row(
+        self,
+        index: int,
+        anchor_x: float,
+        anchor_y: float,
+        levels: tuple[float, float, float, float, float],
+        returns: tuple[float, float, float, float, float],
+    ) -> tuple[float, float, float, float, float, float] | None:
+        ratio = self._CANCELLATION_RATIO
+        count = self._window
+        sx, sy, sxx, syy, sxy = levels
+        cxx = sxx - sx * sx / count
+        cyy = syy - sy * sy / count
+        cxy = sxy - sx * sy / count
+        return_count = count - 1
+        rx, ry, rxx, ryy, rxy = returns
+        vx = rxx - rx * rx / return_count
+        vy = ryy - ry * ry / return_count
+        if cxx <= ratio * sxx or cxx <= 1e-12 or vx <= ratio * rxx or vy <= ratio * ryy or return_count < 2:
+            return _relation_metrics(self._series, index, self._window)
+        beta = cxy / cxx
+        ssr = cyy - beta * cxy
+        if ssr <= ratio * cyy:
+            return _relation_metrics(self._series, index, self._window)
+        residual_std = math.sqrt(ssr / count)
+        if residual_std <= 1e-12:
+            return None
+        mean_x = sx / count
+        mean_y = sy / count
+        intercept = (mean_y + anchor_y) - beta * (mean_x + anchor_x)
+        last_residual = (self._series.target_log_prices[index] - anchor_y - mean_y) - beta * (
+            self._series.reference_log_prices[index] - anchor_x - mean_x
+        )
+        target_std = math.sqrt(vy / return_count)
+        reference_std = math.sqrt(vx / return_count)
+        covariance = (rxy - rx * ry / return_count) / return_count
+        correlation = covariance / (target_std * reference_std)
+        return last_residual / residual_std, correlation, beta, intercept, residual_std, target_std * 10_000.0
+
+
 def _relation_metrics(
     series: _RelationSeries,
     index: int,
     window: int,
 ) -> tuple[float, float, float, float, float, float] | None:
+    """Exact reference computation for one window; see :class:`_RollingRelationMetrics`."""
+
     start = index - window + 1
     if start < 0:
         return None
-    target_logs = [math.log(max(item.close, 1e-12)) for item in series.target_bars[start : index + 1]]
+    target_logs = list(series.target_log_prices[start : index + 1])
     references = list(series.reference_log_prices[start : index + 1])
     beta, intercept = _ols(target_logs, references)
     residuals = [target - (intercept + beta * reference) for target, reference in zip(target_logs, references)]
@@ -659,13 +811,28 @@ def _statsmodels_available() -> bool:
     return True
 
 
+def _cointegration_anchor(index: int, window: int, refresh_bars: int) -> int:
+    """Window end whose p-value stands in for ``index`` between refreshes."""
+
+    anchor = index - index % refresh_bars
+    return anchor if anchor >= window - 1 else index
+
+
+def _cached_cointegration_pvalue(series: _RelationSeries, index: int, window: int) -> float | None:
+    cache = series._cointegration_pvalues
+    key = (window, index)
+    if key not in cache:
+        cache[key] = _cointegration_pvalue(series, index, window)
+    return cache[key]
+
+
 def _cointegration_pvalue(series: _RelationSeries, index: int, window: int) -> float | None:
     try:
         from statsmodels.tsa.stattools import coint  # type: ignore
     except Exception:
         return None
     start = index - window + 1
-    target = [math.log(max(item.close, 1e-12)) for item in series.target_bars[start : index + 1]]
+    target = list(series.target_log_prices[start : index + 1])
     reference = list(series.reference_log_prices[start : index + 1])
     try:
         _stat, pvalue, _critical = coint(target, reference)
@@ -703,6 +870,7 @@ def _simulate_outcome(
     exit_bar = series.target_bars[last_index]
     exit_price = float(exit_bar.close)
     exit_reason = "time_stop"
+    rolling = series.rolling_metrics(config.rolling_window_bars)
     # The signal is observed on the prior bar and the position enters at this
     # bar's open. Start exit evaluation on the following bar to avoid using the
     # entry candle's completed high/low/close as if it were known at entry.
@@ -730,7 +898,7 @@ def _simulate_outcome(
                 exit_price = entry * (1.0 + trail_bps / 10_000.0)
                 exit_reason = "trailing_stop"
                 break
-        metrics = _relation_metrics(series, index, config.rolling_window_bars)
+        metrics = rolling.at(index)
         if metrics is not None:
             zscore, correlation, _beta, _intercept, _std, _volatility = metrics
             if zscore >= config.exit_zscore:
@@ -744,7 +912,7 @@ def _simulate_outcome(
                 and index % config.cointegration_refresh_bars == 0
                 and config.require_cointegration_when_available
             ):
-                pvalue = _cointegration_pvalue(series, index, config.rolling_window_bars)
+                pvalue = _cached_cointegration_pvalue(series, index, config.rolling_window_bars)
                 if pvalue is not None and pvalue > config.max_cointegration_pvalue:
                     exit_bar, exit_price, exit_reason = bar, float(bar.close), "relationship_invalidated"
                     break
@@ -947,7 +1115,7 @@ def _run_portfolio(
         exit_reasons[record.exit_reason] += 1
 
     journal = TradeJournal(records)
-    metrics = MetricsEngine().calculate(journal.records, initial_capital_eur=config.initial_capital_eur)
+    metrics = MetricsEngine().calculate(journal.batch(), initial_capital_eur=config.initial_capital_eur)
     pnl_by_relation = _attribution(records, "relationship_id")
     pnl_by_symbol = _attribution(records, "symbol")
     concentration = _single_relationship_concentration(metrics.total_net_pnl_eur, pnl_by_relation)
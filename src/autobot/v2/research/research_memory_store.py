@@ -11,6 +11,8 @@ import sqlite3
 from time import sleep
 from typing import Any, Callable, Iterable, Mapping, TypeVar
 
+from autobot.v2.sqlite_access import SQLitePragmas, is_sqlite_busy_error, shared_sqlite_pool
+
 
 logger = logging.getLogger(__name__)
 _T = TypeVar("_T")
@@ -38,6 +40,22 @@ class ResearchMemoryStore:
         self._retry_base_delay_seconds = float(retry_base_delay_seconds)
         self._sleeper = sleeper
         self._read_only = bool(read_only)
+        if self._read_only:
+            # Isolated report consumers mount a completed research snapshot
+            # read-only. ``immutable=1`` prevents SQLite from creating a WAL
+            # shared-memory sidecar beside that bind mount.
+            self._pool = shared_sqlite_pool(
+                self.path,
+                timeout_seconds=self._sqlite_timeout_seconds,
+                pragmas=SQLitePragmas.from_env(busy_timeout_ms=self._busy_timeout_ms, journal_mode=None),
+                uri=f"{self.path.resolve().as_uri()}?mode=ro&immutable=1",
+            )
+        else:
+            self._pool = shared_sqlite_pool(
+                self.path,
+                timeout_seconds=self._sqlite_timeout_seconds,
+                pragmas=SQLitePragmas.from_env(busy_timeout_ms=self._busy_timeout_ms),
+            )
 
     def append(self, record: Mapping[str, Any]) -> bool:
         if self._read_only:
@@ -58,7 +76,7 @@ class ResearchMemoryStore:
                 # durable and should still be reported as successful.
                 return inserted or attempt > 0
             except sqlite3.OperationalError as exc:
-                if not _is_transient_lock(exc) or attempt >= self._write_retries:
+                if not is_sqlite_busy_error(exc) or attempt >= self._write_retries:
                     raise
                 delay = self._retry_base_delay_seconds * (2 ** attempt)
                 logger.warning(
@@ -127,27 +145,12 @@ class ResearchMemoryStore:
         return target
 
     def _connect(self) -> sqlite3.Connection:
-        if self._read_only:
-            if not self.path.is_file():
-                raise FileNotFoundError(f"research memory SQLite database is unavailable: {self.path}")
-            # Isolated report consumers mount a completed research snapshot
-            # read-only. ``immutable=1`` prevents SQLite from creating a WAL
-            # shared-memory sidecar beside that bind mount.
-            connection = sqlite3.connect(
-                f"{self.path.resolve().as_uri()}?mode=ro&immutable=1",
-                uri=True,
-                timeout=self._sqlite_timeout_seconds,
-            )
-            connection.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
-            return connection
-        connection = sqlite3.connect(self.path, timeout=self._sqlite_timeout_seconds)
-        connection.execute("PRAGMA journal_mode = WAL")
-        connection.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
-        return connection
+        if self._read_only and not self.path.is_file():
+            raise FileNotFoundError(f"research memory SQLite database is unavailable: {self.path}")
+        return self._pool.connection()
 
     def _append_once(self, *, run_id: str, serialized: str, content_hash: str) -> bool:
-        connection = self._connect()
-        try:
+        with self._pool.transaction() as connection:
             self._initialize(connection)
             cursor = connection.execute(
                 """
@@ -157,13 +160,12 @@ class ResearchMemoryStore:
                 """,
                 (run_id, datetime.now(timezone.utc).isoformat(), serialized, content_hash),
             )
-            connection.commit()
-            return cursor.rowcount == 1
-        except Exception:
-            connection.rollback()
-            raise
-        finally:
-            connection.close()
+            inserted = cursor.rowcount == 1
+        # Pooled connections stay open, so SQLite no longer checkpoints the
+        # WAL on close.  Fold it back now so immutable read-only snapshots of
+        # the main file see every committed event.
+        self._pool.connection().execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+        return inserted
 
     @staticmethod
     def _initialize(connection: sqlite3.Connection) -> None:
@@ -187,8 +189,3 @@ class ResearchMemoryStore:
     def _validate_research_only(record: Mapping[str, Any]) -> None:
         if any(bool(record.get(field)) for field in ("paper_capital_allowed", "live_allowed", "promotable")):
             raise ValueError("research memory events cannot enable paper/live/promotion")
-
-
-def _is_transient_lock(error: sqlite3.OperationalError) -> bool:
-    message = str(error).lower()
-    return "locked" in message or "busy" in message
@@ -0,0 +1,478 @@
+"""Append-only segmented storage for canonical research histories.
+
+A history is a directory of immutable CSV segments plus ``index.json``.  Rows
+inside a segment are sorted by the history key and no key is stored in two
+segments.  The index keeps each segment's row count, timestamp bounds and
+per-facet counts, so readiness summaries never have to read the rows.
+
+New rows can only collide with stored rows at the same timestamp, so an
+append reads just the segments whose timestamp range overlaps the new rows.
+A fifteen-minute forward capture therefore touches no history at all, and
+its cost stays flat as months of history accumulate.  Runs of small
+segments are merged later by :meth:`SegmentedHistoryStore.compact`, usually
+on a background thread.
+
+Segments and the index are published with an atomic rename; superseded
+segments are removed only after the new index is in place, and files the
+index does not reference are swept on the next write.
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+try:  # pragma: no cover - POSIX is the supported collector platform.
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+
+HISTORY_STORE_VERSION = 1
+INDEX_FILENAME = "index.json"
+LOCK_FILENAME = ".lock"
+SEGMENT_TARGET_ROWS = 50_000
+BACKGROUND_COMPACTION_MIN_SEGMENTS = 16
+
+RowFacet = Callable[[Mapping[str, Any]], "str | None"]
+PreferenceKey = Callable[[Mapping[str, Any]], Any]
+
+_THREAD_LOCKS: dict[str, threading.Lock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+@dataclass(frozen=True)
+class HistorySegment:
+    filename: str
+    row_count: int
+    start_at: str
+    end_at: str
+    # facet name -> facet value -> [row_count, start_at, end_at]
+    facets: dict[str, dict[str, list[Any]]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "filename": self.filename,
+            "row_count": self.row_count,
+            "start_at": self.start_at,
+            "end_at": self.end_at,
+            "facets": self.facets,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "HistorySegment":
+        return cls(
+            filename=str(payload["filename"]),
+            row_count=int(payload["row_count"]),
+            start_at=str(payload["start_at"]),
+            end_at=str(payload["end_at"]),
+            facets={str(name): dict(values) for name, values in dict(payload.get("facets") or {}).items()},
+        )
+
+
+@dataclass(frozen=True)
+class HistorySummary:
+    """Index-level view of a history; ``len()`` is its row count."""
+
+    row_count: int
+    segment_count: int
+    start_at: str | None
+    end_at: str | None
+    facets: dict[str, dict[str, tuple[int, str, str]]]
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def facet(self, name: str) -> dict[str, tuple[int, str, str]]:
+        """``value -> (row_count, start_at, end_at)`` for one facet."""
+
+        return self.facets.get(name, {})
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "row_count": self.row_count,
+            "segment_count": self.segment_count,
+            "start_at": self.start_at,
+            "end_at": self.end_at,
+            "facets": {name: {value: list(stats) for value, stats in values.items()} for name, values in self.facets.items()},
+        }
+
+
+class SegmentedHistoryStore:
+    """Deduplicated, append-only history kept as key-disjoint CSV segments."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        key_fields: Sequence[str],
+        fieldnames: Sequence[str],
+        preference_key: PreferenceKey,
+        facets: Mapping[str, RowFacet] | None = None,
+        timestamp_field: str = "timestamp",
+        segment_target_rows: int = SEGMENT_TARGET_ROWS,
+    ) -> None:
+        if not key_fields:
+            raise ValueError("key_fields must not be empty")
+        if timestamp_field not in key_fields:
+            raise ValueError("timestamp_field must be part of the history key")
+        if segment_target_rows <= 0:
+            raise ValueError("segment_target_rows must be positive")
+        self.directory = Path(directory)
+        self.key_fields = tuple(key_fields)
+        self.fieldnames = tuple(fieldnames)
+        self.preference_key = preference_key
+        self.facet_functions = dict(facets or {})
+        self.timestamp_field = timestamp_field
+        self.segment_target_rows = segment_target_rows
+
+    def exists(self) -> bool:
+        return (self.directory / INDEX_FILENAME).exists()
+
+    def append(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Merge *rows* into the history and return how many keys collided.
+
+        A collision keeps whichever row ranks first under ``preference_key``,
+        exactly like a full re-deduplication of history plus new rows.
+        """
+
+        incoming: dict[tuple[str, ...], dict[str, Any]] = {}
+        duplicate_count = 0
+        for row in rows:
+            if not row.get(self.timestamp_field):
+                continue
+            candidate = dict(row)
+            key = self._key(candidate)
+            previous = incoming.get(key)
+            if previous is not None:
+                duplicate_count += 1
+                incoming[key] = min(previous, candidate, key=self.preference_key)
+            else:
+                incoming[key] = candidate
+        with self._locked():
+            index = self._load_index()
+            self._sweep(index)
+            if not incoming:
+                if not self.exists():
+                    self._save_index(index)
+                return duplicate_count
+            timestamps = [key[self._timestamp_position] for key in incoming]
+            start_at, end_at = min(timestamps), max(timestamps)
+            overlapping = [
+                segment for segment in index["segments"] if segment.start_at <= end_at and segment.end_at >= start_at
+            ]
+            merged = incoming
+            for segment in overlapping:
+                for row in self._read_segment(segment):
+                    key = self._key(row)
+                    previous = merged.get(key)
+                    if previous is not None:
+                        duplicate_count += 1
+                        merged[key] = min(row, previous, key=self.preference_key)
+                    else:
+                        merged[key] = row
+            self._replace_segments(index, overlapping, merged.values())
+        return duplicate_count
+
+    def iter_rows(self) -> Iterator[dict[str, str]]:
+        """Stream every row in history-key order."""
+
+        return iter_history_rows(self.directory)
+
+    def summary(self) -> HistorySummary:
+        index = self._load_index()
+        if self._facets_stale(index):
+            with self._locked():
+                index = self._load_index()
+                if self._facets_stale(index):
+                    index = self._refresh_facets(index)
+        return _summarize(index["segments"])
+
+    def compact(self) -> int:
+        """Merge runs of adjacent small segments; return the segments removed."""
+
+        with self._locked():
+            index = self._load_index()
+            self._sweep(index)
+            ordered = sorted(index["segments"], key=lambda item: (item.start_at, item.end_at, item.filename))
+            runs: list[list[HistorySegment]] = []
+            current: list[HistorySegment] = []
+            current_rows = 0
+            for segment in ordered:
+                if current and current_rows + segment.row_count > self.segment_target_rows:
+                    runs.append(current)
+                    current, current_rows = [], 0
+                current.append(segment)
+                current_rows += segment.row_count
+            runs.append(current)
+            removed = 0
+            for run in runs:
+                if len(run) < 2:
+                    continue
+                # Segments are key-disjoint, so merging never needs a dedupe.
+                rows = [row for segment in run for row in self._read_segment(segment)]
+                written = self._replace_segments(index, run, rows)
+                removed += len(run) - written
+            return removed
+
+    def compact_in_background(
+        self,
+        *,
+        min_segments: int = BACKGROUND_COMPACTION_MIN_SEGMENTS,
+    ) -> threading.Thread | None:
+        """Start :meth:`compact` on a worker thread once enough segments piled up.
+
+        The thread is not a daemon, so a short-lived collector process still
+        finishes the merge before exiting; writers queue behind its lock.
+        """
+
+        if len(self._load_index()["segments"]) < min_segments:
+            return None
+        thread = threading.Thread(
+            target=self.compact,
+            name=f"history-compaction-{self.directory.name}",
+        )
+        thread.start()
+        return thread
+
+    @property
+    def _timestamp_position(self) -> int:
+        return self.key_fields.index(self.timestamp_field)
+
+    def _key(self, row: Mapping[str, Any]) -> tuple[str, ...]:
+        return tuple(str(row.get(name, "")) for name in self.key_fields)
+
+    def _replace_segments(
+        self,
+        index: dict[str, Any],
+        superseded: Sequence[HistorySegment],
+        rows: Iterable[Mapping[str, Any]],
+    ) -> int:
+        # Chunk in time order so each segment covers a narrow timestamp range,
+        # then sort each chunk by key for ordered streaming reads.
+        position = self._timestamp_position
+        keyed = sorted(((self._key(row), row) for row in rows), key=lambda item: (item[0][position], item[0]))
+        written: list[HistorySegment] = []
+        for offset in range(0, len(keyed), self.segment_target_rows):
+            chunk = sorted(keyed[offset : offset + self.segment_target_rows], key=lambda item: item[0])
+            filename = f"seg_{index['next_sequence']:010d}.csv"
+            index["next_sequence"] += 1
+            written.append(self._write_segment(filename, [row for _key, row in chunk]))
+        removed = {segment.filename for segment in superseded}
+        index["segments"] = [segment for segment in index["segments"] if segment.filename not in removed] + written
+        self._save_index(index)
+        for filename in removed:
+            (self.directory / filename).unlink(missing_ok=True)
+        return len(written)
+
+    def _write_segment(self, filename: str, rows: Sequence[Mapping[str, Any]]) -> HistorySegment:
+        path = self.directory / filename
+        temporary_path = self.directory / f".{filename}.{uuid.uuid4().hex}.tmp"
+        with temporary_path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=self.fieldnames)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({name: row.get(name, "") for name in self.fieldnames})
+        temporary_path.replace(path)
+        timestamps = [str(row.get(self.timestamp_field)) for row in rows]
+        return HistorySegment(
+            filename=filename,
+            row_count=len(rows),
+            start_at=min(timestamps),
+            end_at=max(timestamps),
+            facets=self._facets_for(rows),
+        )
+
+    def _facets_for(self, rows: Iterable[Mapping[str, Any]]) -> dict[str, dict[str, list[Any]]]:
+        facets: dict[str, dict[str, list[Any]]] = {name: {} for name in self.facet_functions}
+        for row in rows:
+            timestamp = str(row.get(self.timestamp_field))
+            for name, function in self.facet_functions.items():
+                value = function(row)
+                if value is None:
+                    continue
+                stats = facets[name].get(value)
+                if stats is None:
+                    facets[name][value] = [1, timestamp, timestamp]
+                else:
+                    stats[0] += 1
+                    stats[1] = min(stats[1], timestamp)
+                    stats[2] = max(stats[2], timestamp)
+        return facets
+
+    def _facets_stale(self, index: Mapping[str, Any]) -> bool:
+        return set(index.get("facet_names") or ()) != set(self.facet_functions)
+
+    def _refresh_facets(self, index: dict[str, Any]) -> dict[str, Any]:
+        index["segments"] = [
+            HistorySegment(
+                filename=segment.filename,
+                row_count=segment.row_count,
+                start_at=segment.start_at,
+                end_at=segment.end_at,
+                facets=self._facets_for(self._read_segment(segment)),
+            )
+            for segment in index["segments"]
+        ]
+        self._save_index(index)
+        return index
+
+    def _read_segment(self, segment: HistorySegment) -> list[dict[str, Any]]:
+        with (self.directory / segment.filename).open("r", encoding="utf-8", newline="") as handle:
+            return [dict(row) for row in csv.DictReader(handle)]
+
+    def _load_index(self) -> dict[str, Any]:
+        payload = _read_index(self.directory)
+        if payload is None:
+            return {
+                "version": HISTORY_STORE_VERSION,
+                "key_fields": list(self.key_fields),
+                "fieldnames": list(self.fieldnames),
+                "facet_names": sorted(self.facet_functions),
+                "next_sequence": 0,
+                "segments": [],
+            }
+        if tuple(payload.get("key_fields") or ()) != self.key_fields:
+            raise ValueError(f"history key mismatch for {self.directory}: {payload.get('key_fields')}")
+        payload["segments"] = [HistorySegment.from_dict(item) for item in payload.get("segments") or ()]
+        payload["next_sequence"] = int(payload.get("next_sequence") or 0)
+        return payload
+
+    def _save_index(self, index: Mapping[str, Any]) -> None:
+        payload = {
+            "version": HISTORY_STORE_VERSION,
+            "key_fields": list(self.key_fields),
+            "fieldnames": list(self.fieldnames),
+            "facet_names": sorted(self.facet_functions),
+            "next_sequence": index["next_sequence"],
+            "segments": [segment.to_dict() for segment in index["segments"]],
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.directory / f".{INDEX_FILENAME}.{uuid.uuid4().hex}.tmp"
+        temporary_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        temporary_path.replace(self.directory / INDEX_FILENAME)
+
+    def _sweep(self, index: Mapping[str, Any]) -> None:
+        """Remove leftovers of an interrupted write: unindexed segments and temp files."""
+
+        if not self.directory.exists():
+            return
+        referenced = {segment.filename for segment in index["segments"]}
+        for path in self.directory.iterdir():
+            if path.name.endswith(".tmp") or (path.name.startswith("seg_") and path.name not in referenced):
+                path.unlink(missing_ok=True)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        key = os.path.abspath(self.directory)
+        with _THREAD_LOCKS_GUARD:
+            thread_lock = _THREAD_LOCKS.setdefault(key, threading.Lock())
+        with thread_lock, (self.directory / LOCK_FILENAME).open("a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def is_segmented_history(path: str | Path) -> bool:
+    return (Path(path) / INDEX_FILENAME).is_file()
+
+
+def history_files(path: str | Path) -> tuple[Path, ...]:
+    """Data files behind a history path: its segments, or the path itself."""
+
+    path = Path(path)
+    if not is_segmented_history(path):
+        return (path,)
+    index = _read_index(path) or {}
+    return tuple(path / str(item["filename"]) for item in index.get("segments") or ())
+
+
+def iter_history_rows(path: str | Path) -> Iterator[dict[str, str]]:
+    """Stream rows with a timestamp from a segmented history or a legacy CSV.
+
+    Segmented histories are read in key order, which matches the ordering of
+    the single compacted CSV they replace.
+    """
+
+    path = Path(path)
+    if not is_segmented_history(path):
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            yield from (dict(row) for row in csv.DictReader(handle) if row.get("timestamp"))
+        return
+    key_fields, handles = _open_segments(path)
+    try:
+        readers = [
+            ((tuple(str(row.get(name, "")) for name in key_fields), dict(row)) for row in csv.DictReader(handle))
+            for handle in handles
+        ]
+        for _key, row in heapq.merge(*readers, key=lambda item: item[0]):
+            if row.get("timestamp"):
+                yield row
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _open_segments(path: Path, attempts: int = 5) -> tuple[tuple[str, ...], list[Any]]:
+    """Open every indexed segment; retry if a compaction swapped them meanwhile.
+
+    Open handles keep their file readable after a concurrent compaction
+    unlinks it, so the stream is a consistent snapshot.
+    """
+
+    for _attempt in range(attempts):
+        index = _read_index(path) or {}
+        handles: list[Any] = []
+        try:
+            for item in index.get("segments") or ():
+                handles.append((path / str(item["filename"])).open("r", encoding="utf-8", newline=""))
+        except FileNotFoundError:
+            for handle in handles:
+                handle.close()
+            continue
+        return tuple(index.get("key_fields") or ()), handles
+    raise RuntimeError(f"history segments kept changing while opening {path}")
+
+
+def _read_index(directory: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads((directory / INDEX_FILENAME).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    if not isinstance(payload, dict) or int(payload.get("version") or 0) != HISTORY_STORE_VERSION:
+        raise ValueError(f"unsupported history index: {directory / INDEX_FILENAME}")
+    return payload
+
+
+def _summarize(segments: Sequence[HistorySegment]) -> HistorySummary:
+    facets: dict[str, dict[str, tuple[int, str, str]]] = {}
+    for segment in segments:
+        for name, values in segment.facets.items():
+            merged = facets.setdefault(name, {})
+            for value, (count, start_at, end_at) in values.items():
+                previous = merged.get(value)
+                merged[value] = (
+                    (count, start_at, end_at)
+                    if previous is None
+                    else (previous[0] + count, min(previous[1], start_at), max(previous[2], end_at))
+                )
+    return HistorySummary(
+        row_count=sum(segment.row_count for segment in segments),
+        segment_count=len(segments),
+        start_at=min((segment.start_at for segment in segments), default=None),
+        end_at=max((segment.end_at for segment in segments), default=None),
+        facets=facets,
+    )
@@ -2,6 +2,12 @@
 
 This module reads public Kraken top-of-book/depth data only. It never reads
 private keys, never submits orders, and is not wired into runtime trading.
+
+Each sampling round requests every symbol's book concurrently through a
+bounded worker pool, so snapshots of one round are taken within a few
+milliseconds of each other instead of drifting across a sequential loop.
+Rounds start on a fixed-rate grid (``sleep_seconds`` apart, measured from
+round start), which absorbs the time the fetches themselves take.
 """
 
 from __future__ import annotations
@@ -10,9 +16,11 @@ import csv
 import hashlib
 import json
 import statistics
+import threading
 import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -76,10 +84,19 @@ class SpreadDepthRecorderConfig:
     provider: str = "kraken_rest_public_depth"
     depth_count: int = 10
     samples: int = 1
+    # Round period: rounds start ``sleep_seconds`` apart on a fixed-rate
+    # clock, so a slow round shortens the following pause instead of
+    # shifting every later round.
     sleep_seconds: float = 0.0
     max_runtime_seconds: float | None = None
     export_csv: bool = True
     continue_on_error: bool = False
+    max_concurrency: int = 8
+    # Kraken public endpoints share one per-IP budget: requests are refilled at
+    # one per min_request_interval_seconds, and up to request_burst of them
+    # (one round of symbols) may go out at once.
+    min_request_interval_seconds: float = 1.0
+    request_burst: int = 8
 
     def __post_init__(self) -> None:
         if not self.run_id.strip():
@@ -94,6 +111,12 @@ class SpreadDepthRecorderConfig:
             raise ValueError("sleep_seconds cannot be negative")
         if self.max_runtime_seconds is not None and self.max_runtime_seconds <= 0.0:
             raise ValueError("max_runtime_seconds must be positive when configured")
+        if self.max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if self.min_request_interval_seconds < 0.0:
+            raise ValueError("min_request_interval_seconds cannot be negative")
+        if self.request_burst <= 0:
+            raise ValueError("request_burst must be positive")
 
 
 @dataclass(frozen=True)
@@ -141,7 +164,13 @@ def record_spread_depth(
     symbol_mappings: Mapping[str, KrakenPublicPairMapping] | None = None,
     monotonic_clock: Callable[[], float] = time.monotonic,
     sleep: Callable[[float], None] = time.sleep,
+    rate_limiter: SourceRateLimiter | None = None,
 ) -> SpreadDepthRecorderResult:
+    """Record ``config.samples`` rounds of depth books for every symbol.
+
+    Requests go through ``rate_limiter`` when the caller shares one with other
+    collectors of the same host; otherwise a limiter is built from the config.
+    """
     assert_public_collector_boundary(("spread_depth_recorder",))
     fetch = fetcher or fetch_kraken_depth_page
     mapping_by_symbol, collection_symbols = _resolve_collection_symbols(
@@ -149,73 +178,81 @@ def record_spread_depth(
         asset_pairs_fetcher=asset_pairs_fetcher,
         symbol_mappings=symbol_mappings,
     )
+    mappings = tuple(_required_symbol_mapping(mapping_by_symbol, symbol) for symbol in collection_symbols)
+    limiter = rate_limiter or SourceRateLimiter(
+        config.min_request_interval_seconds,
+        burst=config.request_burst,
+        clock=monotonic_clock,
+        sleep=sleep,
+    )
     snapshots: list[SpreadDepthSnapshot] = []
+    captures: list[_DepthCapture] = []
     errors: list[dict[str, Any]] = []
-    deadline = (
-        monotonic_clock() + config.max_runtime_seconds
-        if config.max_runtime_seconds is not None
-        else None
-    )
+    started_at = monotonic_clock()
+    deadline = started_at + config.max_runtime_seconds if config.max_runtime_seconds is not None else None
     stop_reason: str | None = None
-    for sample_index in range(config.samples):
+
+    def capture(mapping: KrakenPublicPairMapping, sample_index: int) -> _DepthCapture | None:
         if _deadline_reached(deadline, monotonic_clock):
-            stop_reason = "max_runtime_seconds_elapsed"
-            break
-        for symbol in collection_symbols:
+            return None
+        limiter.acquire()
+        started = time.perf_counter()
+        try:
+            payload = fetch(mapping.kraken_ohlcv_symbol, config.depth_count)
+            received = time.perf_counter()
+            snapshot = _snapshot_from_depth_payload(
+                payload,
+                mapping=mapping,
+                provider=config.provider,
+                latency_ms=(received - started) * 1000.0,
+            )
+        except Exception as exc:
+            return _DepthCapture(sample_index, mapping.autobot_symbol, started, time.perf_counter(), error=exc)
+        return _DepthCapture(sample_index, mapping.autobot_symbol, started, received, snapshot=snapshot)
+
+    workers = max(1, min(config.max_concurrency, len(mappings)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="spread-depth") as pool:
+        for sample_index in range(config.samples):
             if _deadline_reached(deadline, monotonic_clock):
                 stop_reason = "max_runtime_seconds_elapsed"
                 break
-            requested_symbol = str(symbol).strip().upper()
-            canonical_requested = normalize_research_symbol(symbol)
-            mapping = (
-                mapping_by_symbol.get(requested_symbol)
-                or mapping_by_symbol.get(requested_symbol.replace("/", "").replace("-", "").replace("_", ""))
-                or mapping_by_symbol.get(canonical_requested)
-            )
-            if mapping is None:
-                raise ValueError(f"missing Kraken public symbol mapping for {requested_symbol or canonical_requested}")
-            canonical_symbol = mapping.autobot_symbol
-            try:
-                started = time.perf_counter()
-                payload = fetch(mapping.kraken_ohlcv_symbol, config.depth_count)
-                latency_ms = (time.perf_counter() - started) * 1000.0
-                snapshots.append(
-                    _snapshot_from_depth_payload(
-                        payload,
-                        mapping=mapping,
-                        provider=config.provider,
-                        latency_ms=latency_ms,
+            futures = [pool.submit(capture, mapping, sample_index) for mapping in mappings]
+            for item in (future.result() for future in futures):
+                if item is None:
+                    stop_reason = "max_runtime_seconds_elapsed"
+                    continue
+                if item.error is not None:
+                    if not config.continue_on_error:
+                        raise item.error
+                    errors.append(
+                        {
+                            "symbol": item.symbol,
+                            "sample_index": sample_index,
+                            "error": str(item.error),
+                            "source": config.provider,
+                        }
                     )
-                )
-            except Exception as exc:
-                if not config.continue_on_error:
-                    raise
-                errors.append(
-                    {
-                        "symbol": canonical_symbol,
-                        "sample_index": sample_index,
-                        "error": str(exc),
-                        "source": config.provider,
-                    }
-                )
-        if stop_reason:
-            break
-        if sample_index < config.samples - 1 and config.sleep_seconds:
-            remaining_seconds = _remaining_seconds(deadline, monotonic_clock)
-            if remaining_seconds is not None and remaining_seconds <= 0.0:
-                stop_reason = "max_runtime_seconds_elapsed"
+                    continue
+                snapshots.append(item.snapshot)
+                captures.append(item)
+            if stop_reason:
                 break
-            sleep(
-                min(config.sleep_seconds, remaining_seconds)
-                if remaining_seconds is not None
-                else config.sleep_seconds
-            )
+            if sample_index < config.samples - 1 and config.sleep_seconds:
+                remaining_seconds = _remaining_seconds(deadline, monotonic_clock)
+                if remaining_seconds is not None and remaining_seconds <= 0.0:
+                    stop_reason = "max_runtime_seconds_elapsed"
+                    break
+                wait_seconds = started_at + (sample_index + 1) * config.sleep_seconds - monotonic_clock()
+                if remaining_seconds is not None:
+                    wait_seconds = min(wait_seconds, remaining_seconds)
+                if wait_seconds > 0.0:
+                    sleep(wait_seconds)
     result = SpreadDepthRecorderResult(
         run_id=config.run_id,
         generated_at=datetime.now(timezone.utc).isoformat(),
         provider=config.provider,
         snapshots=tuple(snapshots),
-        summary_by_symbol=_summary_by_symbol(snapshots),
+        summary_by_symbol=_summary_by_symbol(snapshots, captures),
         errors=tuple(errors),
         stop_reason=stop_reason,
     )
@@ -301,15 +338,16 @@ def render_spread_depth_report(result: SpreadDepthRecorderResult) -> str:
         "",
         "## Summary By Symbol",
         "",
-        "| Symbol | Samples | Spread Mean | Spread Median | Spread P95 | Spread P99 | Bid Depth Median | Ask Depth Median | Latency Median ms |",
-        "| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+        "| Symbol | Samples | Spread Mean | Spread Median | Spread P95 | Spread P99 | Bid Depth Median | Ask Depth Median | Latency Median ms | Latency P95 ms | Round Skew P95 ms |",
+        "| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
     ]
     for symbol, summary in sorted(result.summary_by_symbol.items()):
         lines.append(
             f"| {symbol} | {int(summary['samples'])} | {summary['spread_mean_bps']:.6f} | "
             f"{summary['spread_median_bps']:.6f} | {summary['spread_p95_bps']:.6f} | "
             f"{summary['spread_p99_bps']:.6f} | {summary['bid_depth_median_eur']:.6f} | "
-            f"{summary['ask_depth_median_eur']:.6f} | {summary['latency_median_ms']:.6f} |"
+            f"{summary['ask_depth_median_eur']:.6f} | {summary['latency_median_ms']:.6f} | "
+            f"{summary.get('latency_p95_ms', 0.0):.6f} | {summary.get('round_skew_p95_ms', 0.0):.6f} |"
         )
     if result.errors:
         lines.extend(["", "## Errors", ""])
@@ -468,7 +506,28 @@ def _source_snapshot_id(
     return f"kraken_depth_{hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:24]}"
 
 
-def _summary_by_symbol(snapshots: Sequence[SpreadDepthSnapshot]) -> dict[str, dict[str, float]]:
+def _summary_by_symbol(
+    snapshots: Sequence[SpreadDepthSnapshot],
+    captures: Sequence["_DepthCapture"] = (),
+) -> dict[str, dict[str, float]]:
+    """Per-symbol spread/depth statistics plus capture timing.
+
+    ``round_skew_*`` is the spread between the first and last book received
+    in each round the symbol took part in; ``round_offset_*`` is how long
+    after the round's first book this symbol's book arrived.
+    """
+
+    first_received: dict[int, float] = {}
+    last_received: dict[int, float] = {}
+    for item in captures:
+        first_received[item.sample_index] = min(first_received.get(item.sample_index, item.received), item.received)
+        last_received[item.sample_index] = max(last_received.get(item.sample_index, item.received), item.received)
+    skews: dict[str, list[float]] = {}
+    offsets: dict[str, list[float]] = {}
+    for item in captures:
+        first = first_received[item.sample_index]
+        skews.setdefault(item.symbol, []).append((last_received[item.sample_index] - first) * 1000.0)
+        offsets.setdefault(item.symbol, []).append((item.received - first) * 1000.0)
     summary: dict[str, dict[str, float]] = {}
     for symbol in sorted({snapshot.symbol for snapshot in snapshots}):
         rows = [snapshot for snapshot in snapshots if snapshot.symbol == symbol]
@@ -485,6 +544,12 @@ def _summary_by_symbol(snapshots: Sequence[SpreadDepthSnapshot]) -> dict[str, di
             "bid_depth_median_eur": statistics.median(bid_depths) if bid_depths else 0.0,
             "ask_depth_median_eur": statistics.median(ask_depths) if ask_depths else 0.0,
             "latency_median_ms": statistics.median(latencies) if latencies else 0.0,
+            "latency_p95_ms": _quantile(latencies, 0.95),
+            "latency_p99_ms": _quantile(latencies, 0.99),
+            "round_skew_median_ms": statistics.median(skews[symbol]) if skews.get(symbol) else 0.0,
+            "round_skew_p95_ms": _quantile(skews.get(symbol, ()), 0.95),
+            "round_offset_median_ms": statistics.median(offsets[symbol]) if offsets.get(symbol) else 0.0,
+            "round_offset_p95_ms": _quantile(offsets.get(symbol, ()), 0.95),
         }
     return summary
 
@@ -497,6 +562,59 @@ def _quantile(values: Sequence[float], q: float) -> float:
     return ordered[index]
 
 
+@dataclass(frozen=True)
+class _DepthCapture:
+    """Timing of one depth request within a sampling round (``perf_counter`` seconds)."""
+
+    sample_index: int
+    symbol: str
+    started: float
+    received: float
+    snapshot: SpreadDepthSnapshot | None = None
+    error: Exception | None = None
+
+
+class SourceRateLimiter:
+    """Token bucket for one public source, shared across threads.
+
+    Tokens refill at one per ``min_interval_seconds`` up to ``burst``, so a
+    round of up to ``burst`` requests goes out at once while the sustained
+    rate stays at one request per interval.  With ``burst=1`` calls are
+    simply spaced by the interval.  A caller without a token reserves the next
+    one and sleeps until it is due, outside the lock.
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._min_interval_seconds = max(0.0, float(min_interval_seconds))
+        self._burst = max(1, int(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self._burst)
+        self._updated_at: float | None = None
+
+    def acquire(self) -> None:
+        if self._min_interval_seconds <= 0.0:
+            return
+        with self._lock:
+            now = self._clock()
+            if self._updated_at is not None:
+                refill = (now - self._updated_at) / self._min_interval_seconds
+                self._tokens = min(float(self._burst), self._tokens + refill)
+            self._updated_at = now
+            self._tokens -= 1.0
+            wait_seconds = -self._tokens * self._min_interval_seconds
+        if wait_seconds > 0.0:
+            self._sleep(wait_seconds)
+
+
 def _deadline_reached(deadline: float | None, monotonic_clock: Callable[[], float]) -> bool:
     return deadline is not None and monotonic_clock() >= deadline
 
@@ -535,6 +653,19 @@ def _resolve_collection_symbols(
     return mapping_by_symbol, collection_symbols
 
 
+def _required_symbol_mapping(
+    mapping_by_symbol: Mapping[str, KrakenPublicPairMapping],
+    symbol: str,
+) -> KrakenPublicPairMapping:
+    mapping = _lookup_symbol_mapping(mapping_by_symbol, symbol)
+    if mapping is None:
+        requested_symbol = str(symbol).strip().upper()
+        raise ValueError(
+            f"missing Kraken public symbol mapping for {requested_symbol or normalize_research_symbol(symbol)}"
+        )
+    return mapping
+
+
 def _lookup_symbol_mapping(
     mapping_by_symbol: Mapping[str, KrakenPublicPairMapping],
     symbol: str,
@@ -9,10 +9,11 @@ from __future__ import annotations
 
 import math
 from dataclasses import asdict, dataclass
-from statistics import NormalDist, mean, pstdev
+from statistics import NormalDist
 from typing import Any, Mapping, Sequence
 
-from .trade_journal import TradeRecord
+from .metrics_engine import return_moments
+from .trade_journal import TradeBatch, TradeRecord
 
 
 RESEARCH_DECISIONS = (
@@ -156,7 +157,7 @@ class PFQualityAssessment:
 
 
 def assess_deflated_sharpe(
-    trades: Sequence[TradeRecord],
+    trades: Sequence[TradeRecord] | TradeBatch,
     config: DeflatedSharpeConfig = DeflatedSharpeConfig(),
 ) -> DeflatedSharpeResult:
     """Estimate DSR-like overfitting risk from closed research trades.
@@ -166,11 +167,7 @@ def assess_deflated_sharpe(
     academic certification or live promotion.
     """
 
-    returns = [
-        float(trade.net_pnl_eur) / config.initial_capital_eur
-        for trade in trades
-        if math.isfinite(float(trade.net_pnl_eur))
-    ]
+    returns = _trade_returns(trades, initial_capital_eur=config.initial_capital_eur)
     if len(returns) < 2:
         return DeflatedSharpeResult(
             sample_count=len(returns),
@@ -185,7 +182,8 @@ def assess_deflated_sharpe(
             acceptable=False,
         )
 
-    deviation = pstdev(returns)
+    moments = return_moments(returns)
+    deviation = moments.deviation
     if deviation <= 0.0:
         return DeflatedSharpeResult(
             sample_count=len(returns),
@@ -200,10 +198,9 @@ def assess_deflated_sharpe(
             acceptable=False,
         )
 
-    sample_mean = mean(returns)
-    sharpe = sample_mean / deviation * math.sqrt(len(returns))
-    skew = _skewness(returns)
-    kurt = _kurtosis(returns)
+    sharpe = moments.mean / deviation * math.sqrt(len(returns))
+    skew = moments.skewness
+    kurt = moments.kurtosis
     expected_max = _expected_max_sharpe(config.assumed_trial_count)
     standard_error = _sharpe_standard_error(
         sharpe=sharpe,
@@ -239,7 +236,7 @@ def assess_deflated_sharpe(
 
 
 def assess_probabilistic_sharpe(
-    trades: Sequence[TradeRecord],
+    trades: Sequence[TradeRecord] | TradeBatch,
     config: ProbabilisticSharpeConfig = ProbabilisticSharpeConfig(),
 ) -> ProbabilisticSharpeResult:
     """Estimate probability that per-trade Sharpe exceeds a fixed benchmark.
@@ -262,7 +259,8 @@ def assess_probabilistic_sharpe(
             status="insufficient_sample",
             acceptable=False,
         )
-    deviation = pstdev(returns)
+    moments = return_moments(returns)
+    deviation = moments.deviation
     if deviation <= 0.0:
         return ProbabilisticSharpeResult(
             sample_count=len(returns),
@@ -277,9 +275,9 @@ def assess_probabilistic_sharpe(
         )
     # PSR uses the Sharpe per observed trade.  Do not reuse the DSR proxy's
     # sqrt(n)-scaled ranking statistic here.
-    sharpe = mean(returns) / deviation
-    skew = _skewness(returns)
-    kurt = _kurtosis(returns)
+    sharpe = moments.mean / deviation
+    skew = moments.skewness
+    kurt = moments.kurtosis
     standard_error = _sharpe_standard_error(
         sharpe=sharpe,
         skewness=skew,
@@ -641,7 +639,9 @@ def _expected_max_sharpe(assumed_trial_count: int) -> float:
     return ((1.0 - euler_gamma) * left) + (euler_gamma * right)
 
 
-def _trade_returns(trades: Sequence[TradeRecord], *, initial_capital_eur: float) -> list[float]:
+def _trade_returns(trades: Sequence[TradeRecord] | TradeBatch, *, initial_capital_eur: float) -> Sequence[float]:
+    if isinstance(trades, TradeBatch):
+        return trades.returns(initial_capital_eur, finite_only=True)
     return [
         float(trade.net_pnl_eur) / initial_capital_eur
         for trade in trades
@@ -661,19 +661,11 @@ def _sharpe_standard_error(
 
 
 def _skewness(values: Sequence[float]) -> float:
-    deviation = pstdev(values)
-    if deviation <= 0.0:
-        return 0.0
-    center = mean(values)
-    return mean(((value - center) / deviation) ** 3 for value in values)
+    return return_moments(values).skewness
 
 
 def _kurtosis(values: Sequence[float]) -> float:
-    deviation = pstdev(values)
-    if deviation <= 0.0:
-        return 3.0
-    center = mean(values)
-    return mean(((value - center) / deviation) ** 4 for value in values)
+    return return_moments(values).kurtosis
 
 
 def _float(value: Any, default: float = 0.0) -> float:
@@ -1163,7 +1163,7 @@ def simulate_instance_treasury(
         realized_pnl_eur=realized_pnl,
         unrealized_pnl_eur=0.0,
     )
-    metrics = MetricsEngine().calculate(TradeJournal(records).records, initial_capital_eur=treasury.instance_treasury_eur)
+    metrics = MetricsEngine().calculate(TradeJournal(records).batch(), initial_capital_eur=treasury.instance_treasury_eur)
     return InstanceTreasurySimulation(
         instance=treasury,
         cost_profile=cost_profile,
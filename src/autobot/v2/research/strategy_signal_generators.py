@@ -8,12 +8,14 @@ the existing grid/trend/mean-reversion hypotheses measurable through the common
 from __future__ import annotations
 
 import math
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import datetime
 from statistics import mean, pstdev
 from typing import Iterable, Literal, Mapping, Sequence
 
 from .backtest_engine import BacktestSignal
-from .market_data_repository import MarketBar
+from .market_data_repository import MarketBar, MarketDataRepository
 
 
 def _bps_to_rate(value: float) -> float:
@@ -81,6 +83,89 @@ def _metadata_float(metadata: Mapping[str, object], *keys: str) -> float | None:
     return None
 
 
+class _GridBarContext(ABC):
+    """Bar-level grid inputs, computed lazily and at most once per bar.
+
+    A parameter sweep hands the same context to every variant so ATR, spread
+    and regime lookups are shared instead of being recomputed per variant.
+    """
+
+    __slots__ = ("bar", "_regime", "_spread_bps", "_spread_ready", "_atr_by_window")
+
+    def __init__(self, bar: MarketBar) -> None:
+        self.bar = bar
+        self._regime: str | None = None
+        self._spread_bps: float | None = None
+        self._spread_ready = False
+        self._atr_by_window: dict[int, float] = {}
+
+    @property
+    def regime(self) -> str:
+        if self._regime is None:
+            self._regime = _bar_regime(self.bar)
+        return self._regime
+
+    def spread_bps(self) -> float | None:
+        if not self._spread_ready:
+            self._spread_bps = _bar_spread_bps(self.bar)
+            self._spread_ready = True
+        return self._spread_bps
+
+    def atr_bps(self, window: int) -> float:
+        atr = self._atr_by_window.get(window)
+        if atr is None:
+            atr = self._atr_by_window[window] = self._compute_atr_bps(window)
+        return atr
+
+    @abstractmethod
+    def prior_lows(self, count: int) -> Sequence[float]:
+        """Lows of up to ``count`` bars before the current one, oldest first."""
+
+    @abstractmethod
+    def _compute_atr_bps(self, window: int) -> float:
+        """ATR of the bars up to the current one, in basis points."""
+
+
+class _HistoryGridContext(_GridBarContext):
+    __slots__ = ("_history", "_prices")
+
+    def __init__(self, bar: MarketBar, history: Sequence[MarketBar]) -> None:
+        super().__init__(bar)
+        self._history = history
+        self._prices: list[float] | None = None
+
+    def prior_lows(self, count: int) -> Sequence[float]:
+        return [float(item.low) for item in list(self._history[:-1])[-count:]]
+
+    def _compute_atr_bps(self, window: int) -> float:
+        if self._prices is None:
+            self._prices = [float(item.close) for item in self._history]
+        return _atr_bps(self._prices, window)
+
+
+class _SeriesGridContext(_GridBarContext):
+    """Context backed by per-symbol series that grow with the sweep."""
+
+    __slots__ = ("_abs_returns_bps", "_lows")
+
+    def __init__(self, bar: MarketBar, abs_returns_bps: Sequence[float], lows: Sequence[float]) -> None:
+        super().__init__(bar)
+        self._abs_returns_bps = abs_returns_bps
+        self._lows = lows
+
+    def prior_lows(self, count: int) -> Sequence[float]:
+        end = len(self._lows) - 1
+        return self._lows[max(0, end - count) : end]
+
+    def _compute_atr_bps(self, window: int) -> float:
+        # Same tail and summation order as ``_atr_bps`` so features match the
+        # scalar generator bit for bit.
+        if not self._abs_returns_bps:
+            return 0.0
+        tail = self._abs_returns_bps[-max(1, int(window)) :]
+        return sum(tail) / len(tail)
+
+
 @dataclass(frozen=True)
 class GridResearchConfig:
     strategy_id: str = "dynamic_grid"
@@ -180,6 +265,10 @@ class GridResearchSignalGenerator:
         self._bars_in_position = 0
 
     def __call__(self, bar: MarketBar, history: Sequence[MarketBar]) -> Iterable[BacktestSignal]:
+        return self._evaluate(_HistoryGridContext(bar, history))
+
+    def _evaluate(self, context: _GridBarContext) -> list[BacktestSignal]:
+        bar = context.bar
         price = float(bar.close)
         if self._center_price is None:
             self._center_price = price
@@ -232,7 +321,7 @@ class GridResearchSignalGenerator:
             return []
         touch_bps = ((level / max(price, 1e-12)) - 1.0) * 10_000.0
         if abs(touch_bps) <= self.config.entry_touch_bps or price <= level:
-            features = self._entry_features(bar, history, level=level, touch_bps=touch_bps)
+            features = self._entry_features(context, level=level, touch_bps=touch_bps)
             blocker = self._entry_filter_blocker(features)
             if blocker is not None:
                 return []
@@ -313,20 +402,18 @@ class GridResearchSignalGenerator:
 
     def _entry_features(
         self,
-        bar: MarketBar,
-        history: Sequence[MarketBar],
+        context: _GridBarContext,
         *,
         level: float,
         touch_bps: float,
     ) -> dict[str, object]:
-        prices = [float(item.close) for item in history]
-        atr_bps = _atr_bps(prices, self.config.atr_window)
-        spread_bps = _bar_spread_bps(bar)
+        atr_bps = context.atr_bps(self.config.atr_window)
+        spread_bps = context.spread_bps()
         expected_mfe_bps = self._expected_mfe_bps()
         cost_bps = max(float(self.config.estimated_round_trip_cost_bps), 1e-12)
         return {
             "exit_mode": self.config.exit_mode,
-            "regime": _bar_regime(bar),
+            "regime": context.regime,
             "entry_touch_bps": touch_bps,
             "grid_entry_level": level,
             "atr_bps": atr_bps,
@@ -335,7 +422,7 @@ class GridResearchSignalGenerator:
             "estimated_round_trip_cost_bps": self.config.estimated_round_trip_cost_bps,
             "estimated_mfe_to_cost": expected_mfe_bps / cost_bps,
             "support_confirmation_bars": self.config.support_confirmation_bars,
-            "support_confirmed": self._support_confirmed(level, history),
+            "support_confirmed": self._support_confirmed(level, context),
             "blocked_regimes": list(self.config.blocked_regimes),
             "allowed_regimes": list(self.config.allowed_regimes),
         }
@@ -367,15 +454,15 @@ class GridResearchSignalGenerator:
             expected = max(expected, self.config.estimated_round_trip_cost_bps + self.config.cost_buffer_bps)
         return expected
 
-    def _support_confirmed(self, level: float, history: Sequence[MarketBar]) -> bool:
+    def _support_confirmed(self, level: float, context: _GridBarContext) -> bool:
         required = int(self.config.support_confirmation_bars)
         if required <= 0:
             return True
-        previous = list(history[:-1])[-required:]
+        previous = context.prior_lows(required)
         if len(previous) < required:
             return False
         tolerance = 1.0 + _bps_to_rate(self.config.entry_touch_bps)
-        return sum(1 for item in previous if float(item.low) <= level * tolerance) >= required
+        return sum(1 for low in previous if low <= level * tolerance) >= required
 
     def _reset_position(self) -> None:
         self._in_position = False
@@ -414,6 +501,86 @@ class GridResearchSignalGenerator:
         )
 
 
+class PrecomputedSignalReplay:
+    """Signal generator replaying one sweep variant into :class:`BacktestEngine`.
+
+    The engine calls its generator once per normalized bar, so the replay walks
+    the sweep's bar keys in lockstep and refuses a different bar stream.
+    """
+
+    def __init__(
+        self,
+        signals_by_position: Mapping[int, tuple[BacktestSignal, ...]],
+        bar_keys: Sequence[tuple[str, datetime]],
+    ) -> None:
+        self._signals_by_position = signals_by_position
+        self._bar_keys = bar_keys
+        self._position = 0
+
+    def __call__(self, bar: MarketBar, history: Sequence[MarketBar]) -> Iterable[BacktestSignal]:
+        position = self._position
+        if position >= len(self._bar_keys) or self._bar_keys[position] != (bar.symbol, bar.timestamp):
+            raise ValueError("bar stream does not match the grid sweep input")
+        self._position += 1
+        return list(self._signals_by_position.get(position, ()))
+
+
+@dataclass(frozen=True)
+class GridSweepResult:
+    """Signals of several grid configs evaluated in one pass over the same bars."""
+
+    configs: tuple[GridResearchConfig, ...]
+    bar_keys: tuple[tuple[str, datetime], ...]
+    signals: tuple[dict[int, tuple[BacktestSignal, ...]], ...]
+
+    def signal_count(self, index: int) -> int:
+        return sum(len(signals) for signals in self.signals[index].values())
+
+    def replay(self, index: int) -> PrecomputedSignalReplay:
+        return PrecomputedSignalReplay(self.signals[index], self.bar_keys)
+
+
+def sweep_grid_signals(
+    bars: Sequence[MarketBar],
+    configs: Sequence[GridResearchConfig],
+) -> GridSweepResult:
+    """Evaluate many grid configs in a single pass over ``bars``.
+
+    Every variant keeps its own generator state, while bar-level features
+    (ATR per window, spread, regime, prior lows) are computed once per bar and
+    shared.  Replaying variant ``i`` through ``BacktestEngine`` yields the same
+    signals, and therefore the same trade journal, as running
+    ``GridResearchSignalGenerator(configs[i])`` over ``bars`` directly.
+    """
+
+    ordered = MarketDataRepository.normalize(bars)
+    generators = [GridResearchSignalGenerator(config) for config in configs]
+    signals: list[dict[int, tuple[BacktestSignal, ...]]] = [{} for _ in generators]
+    abs_returns_by_symbol: dict[str, list[float]] = {}
+    lows_by_symbol: dict[str, list[float]] = {}
+    last_close_by_symbol: dict[str, float] = {}
+    for position, bar in enumerate(ordered):
+        symbol = bar.symbol.upper()
+        close = float(bar.close)
+        abs_returns = abs_returns_by_symbol.setdefault(symbol, [])
+        lows = lows_by_symbol.setdefault(symbol, [])
+        previous = last_close_by_symbol.get(symbol)
+        if previous is not None and previous > 0.0 and close > 0.0:
+            abs_returns.append(abs(((close / previous) - 1.0) * 10_000.0))
+        last_close_by_symbol[symbol] = close
+        lows.append(float(bar.low))
+        context = _SeriesGridContext(bar, abs_returns, lows)
+        for index, generator in enumerate(generators):
+            emitted = generator._evaluate(context)
+            if emitted:
+                signals[index][position] = tuple(emitted)
+    return GridSweepResult(
+        configs=tuple(generator.config for generator in generators),
+        bar_keys=tuple((bar.symbol, bar.timestamp) for bar in ordered),
+        signals=tuple(signals),
+    )
+
+
 @dataclass(frozen=True)
 class TrendResearchConfig:
     strategy_id: str = "trend_momentum"
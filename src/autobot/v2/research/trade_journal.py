@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import csv
 import json
+import math
+from array import array
+from bisect import insort
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -82,6 +85,61 @@ class TradeRecord:
         )
 
 
+@dataclass(frozen=True)
+class TradeBatch:
+    """Columnar view of closed trades consumed by the metrics engines.
+
+    Columns keep the order of the source records.  ``close_order`` holds the
+    permutation sorting trades by ``closed_at`` and is ``None`` when the
+    source was already in close order, which is always the case for batches
+    produced by :class:`TradeJournal`.
+    """
+
+    gross_pnl_eur: array
+    net_pnl_eur: array
+    fees_eur: array
+    slippage_eur: array
+    spread_cost_eur: array
+    latency_cost_eur: array
+    duration_seconds: array
+    regime_codes: array
+    regime_labels: tuple[str, ...]
+    close_order: tuple[int, ...] | None = None
+
+    def __len__(self) -> int:
+        return len(self.net_pnl_eur)
+
+    @classmethod
+    def from_records(cls, records: Iterable[TradeRecord]) -> "TradeBatch":
+        trades = list(records)
+        regime_labels = tuple(sorted({trade.regime or "unknown" for trade in trades}))
+        codes = {label: index for index, label in enumerate(regime_labels)}
+        order = sorted(range(len(trades)), key=lambda index: trades[index].closed_at)
+        return cls(
+            gross_pnl_eur=array("d", (trade.gross_pnl_eur for trade in trades)),
+            net_pnl_eur=array("d", (trade.net_pnl_eur for trade in trades)),
+            fees_eur=array("d", (trade.fees_eur for trade in trades)),
+            slippage_eur=array("d", (trade.slippage_eur for trade in trades)),
+            spread_cost_eur=array("d", (trade.spread_cost_eur for trade in trades)),
+            latency_cost_eur=array("d", (trade.latency_cost_eur for trade in trades)),
+            duration_seconds=array("d", (trade.duration_seconds for trade in trades)),
+            regime_codes=array("i", (codes[trade.regime or "unknown"] for trade in trades)),
+            regime_labels=regime_labels,
+            close_order=None if order == list(range(len(trades))) else tuple(order),
+        )
+
+    def returns(self, initial_capital_eur: float, *, finite_only: bool = False) -> array:
+        """Per-trade net returns relative to ``initial_capital_eur``."""
+
+        if finite_only:
+            return array("d", (value / initial_capital_eur for value in self.net_pnl_eur if math.isfinite(value)))
+        return array("d", (value / initial_capital_eur for value in self.net_pnl_eur))
+
+
+def _journal_sort_key(trade: TradeRecord) -> tuple[datetime, datetime, str]:
+    return (trade.closed_at, trade.opened_at, trade.symbol)
+
+
 class TradeJournal:
     """In-memory journal with deterministic JSON/CSV export helpers."""
 
@@ -110,6 +168,7 @@ class TradeJournal:
 
     def __init__(self, records: Iterable[TradeRecord] | None = None) -> None:
         self._records: list[TradeRecord] = []
+        self._batch: TradeBatch | None = None
         if records:
             self.extend(records)
 
@@ -119,13 +178,20 @@ class TradeJournal:
 
     def add(self, record: TradeRecord) -> None:
         self._validate(record)
-        self._records.append(record)
-        self._records.sort(key=lambda trade: (trade.closed_at, trade.opened_at, trade.symbol))
+        insort(self._records, record, key=_journal_sort_key)
+        self._batch = None
 
     def extend(self, records: Iterable[TradeRecord]) -> None:
         for record in records:
             self.add(record)
 
+    def batch(self) -> TradeBatch:
+        """Return the columnar view of the journal, built once per change."""
+
+        if self._batch is None:
+            self._batch = TradeBatch.from_records(self._records)
+        return self._batch
+
     def filter(
         self,
         *,
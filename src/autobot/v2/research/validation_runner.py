@@ -13,7 +13,7 @@ import json
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Literal, Sequence
 
 from autobot.v2.cost_profiles import COST_PROFILE_NAMES, DEFAULT_RESEARCH_COST_PROFILE
 from autobot.v2.contracts import MarketIdentity
@@ -30,6 +30,7 @@ from .strategy_signal_generators import (
     MeanReversionResearchSignalGenerator,
     TrendResearchConfig,
     TrendResearchSignalGenerator,
+    sweep_grid_signals,
 )
 from .symbol_normalization import normalize_research_symbol
 from .walk_forward import WalkForwardConfig, WalkForwardResult, WalkForwardValidator
@@ -182,20 +183,7 @@ def run_validation(config: ValidationRunnerConfig) -> ValidationRunnerResult:
         config.strategy_config,
         cost_config=config.cost_config,
     )
-    backtest_config = BacktestConfig(
-        run_id=config.run_id,
-        strategy_id=_strategy_id(config.strategy),
-        dataset_id=config.dataset_id,
-        hypothesis=f"{config.strategy} research validation on {config.symbol}",
-        initial_capital_eur=config.initial_capital_eur,
-        default_order_notional_eur=config.order_notional_eur,
-        output_dir=config.output_dir / "backtests",
-        cost_config=config.cost_config,
-        min_closed_trades=config.min_closed_trades,
-        min_profit_factor=config.min_profit_factor,
-        max_drawdown_pct=config.max_drawdown_pct,
-        min_signal_net_edge_bps=config.min_signal_net_edge_bps,
-    )
+    backtest_config = _backtest_config(config)
     _validate_alpha_provenance(alpha_provenance, backtest_config)
     if config.mode == "backtest":
         result = BacktestEngine(backtest_config, alpha_provenance=alpha_provenance).run(bars, factory())
@@ -217,6 +205,69 @@ def run_validation(config: ValidationRunnerConfig) -> ValidationRunnerResult:
     raise ValueError(f"unsupported mode: {config.mode}")
 
 
+def run_grid_backtest_sweep(configs: Sequence[ValidationRunnerConfig]) -> list[ValidationRunnerResult]:
+    """Backtest many grid parameter sets that share one dataset.
+
+    Bars are loaded and regime-enriched once, every grid config is evaluated
+    in a single pass with :func:`sweep_grid_signals`, and each variant is then
+    replayed through its own ``BacktestEngine``.  Results, journals and
+    reports are identical to calling :func:`run_validation` per config.
+    """
+
+    if not configs:
+        return []
+    first = configs[0]
+    for config in configs:
+        if config.strategy != "grid" or config.mode != "backtest":
+            raise ValueError("grid sweep supports only grid backtest configs")
+        if config.alpha_provenance is not None:
+            raise ValueError("grid sweep does not support alpha provenance")
+        if _sweep_data_key(config) != _sweep_data_key(first):
+            raise ValueError("grid sweep configs must share the same data selection")
+    bars = load_bars_for_validation(first)
+    if first.include_regime_context:
+        bars = enrich_bars_with_regime_context(bars)
+    grid_configs = [
+        make_signal_generator_factory("grid", config.strategy_config, cost_config=config.cost_config)().config
+        for config in configs
+    ]
+    sweep = sweep_grid_signals(bars, grid_configs)
+    results: list[ValidationRunnerResult] = []
+    for index, config in enumerate(configs):
+        result = BacktestEngine(_backtest_config(config)).run(bars, sweep.replay(index))
+        results.append(ValidationRunnerResult(mode=config.mode, bar_count=len(bars), result=result))
+    return results
+
+
+def _sweep_data_key(config: ValidationRunnerConfig) -> tuple[Any, ...]:
+    return (
+        config.data_source,
+        Path(config.data_path),
+        config.symbol,
+        config.start_at,
+        config.end_at,
+        config.limit,
+        config.include_regime_context,
+    )
+
+
+def _backtest_config(config: ValidationRunnerConfig) -> BacktestConfig:
+    return BacktestConfig(
+        run_id=config.run_id,
+        strategy_id=_strategy_id(config.strategy),
+        dataset_id=config.dataset_id,
+        hypothesis=f"{config.strategy} research validation on {config.symbol}",
+        initial_capital_eur=config.initial_capital_eur,
+        default_order_notional_eur=config.order_notional_eur,
+        output_dir=config.output_dir / "backtests",
+        cost_config=config.cost_config,
+        min_closed_trades=config.min_closed_trades,
+        min_profit_factor=config.min_profit_factor,
+        max_drawdown_pct=config.max_drawdown_pct,
+        min_signal_net_edge_bps=config.min_signal_net_edge_bps,
+    )
+
+
 def _strategy_id(strategy: StrategyName) -> str:
     return {
         "grid": "dynamic_grid",
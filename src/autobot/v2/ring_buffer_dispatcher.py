@@ -10,6 +10,8 @@ Design goals:
     - Zero allocation on hot path: TickerData references stored by the
       ring buffer; readers return the same references (zero-copy).
     - No asyncio.Lock / threading.Lock anywhere in the dispatch chain.
+    - No idle spinning: a consumer with nothing to read parks on a future
+      in its pair's waiter list; the next write resolves the whole list once.
 
 Architecture::
 
@@ -19,12 +21,13 @@ Architecture::
     _write_ticker(pair, TickerData)          ← O(1) write, ~200–400 ns
          │
     RingBuffer[pair]._slots[seq & mask] = data
-         │
+         │  resolve pair waiters (only if a consumer is parked)
     ┌────┴────────────────────────────────────────┐
     │  Per-instance asyncio.Task (run_consumer)   │
     │                                             │
-    │  reader.poll_batch(64)                      │ ← O(1)/msg, ~50 ns/msg
+    │  reader.poll_batch(64..1024)                │ ← O(1)/msg, ~50 ns/msg
     │  → await instance.on_price_update(msg)      │
+    │  empty → park on a pair waiter future       │
     └─────────────────────────────────────────────┘
 
 Comparison with WebSocketMultiplexerAsync::
@@ -44,7 +47,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Callable, Coroutine, Dict, Optional, Set, Tuple
+from collections import deque
+from time import perf_counter_ns
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Set, Tuple
 
 from .ring_buffer import RingBuffer, RingBufferReader, DEFAULT_BUFFER_SIZE
 from .websocket_async import KrakenWebSocketAsync, TickerData
@@ -124,12 +129,22 @@ logger = logging.getLogger(__name__)
 AsyncCallback = Callable[[TickerData], Coroutine[Any, Any, None]]
 
 # Hot-path tuning
-_POLL_BATCH: int = 64        # Messages per poll_batch call
-_SLEEP_EMPTY: float = 0.0    # asyncio.sleep(0) yields without real delay
+_POLL_BATCH: int = 64        # Initial messages per poll_batch call
+_MAX_POLL_BATCH: int = 1024  # Batch ceiling while a consumer catches up on a burst
+_SLEEP_EMPTY: float = 0.0    # 0.0 parks until the next write; >0 also re-checks on a timer
+_LATENCY_SAMPLES: int = 4096 # Wake-up latency samples kept for stats()
 
 __all__ = ["RingBufferDispatcher"]
 
 
+def _percentile_us(samples: Deque[int], quantile: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(quantile * len(ordered)))
+    return round(ordered[index] / 1000.0, 3)
+
+
 class RingBufferDispatcher:
     """
     Lock-free WebSocket dispatcher backed by per-pair ring buffers.
@@ -173,9 +188,22 @@ class RingBufferDispatcher:
         # Per-instance reader: instance_id → (pair, reader)
         self._readers: Dict[str, Tuple[str, RingBufferReader]] = {}
 
+        # Per-pair futures of parked consumers.  The list is created by the
+        # first consumer that parks and popped whole by the next write, so a
+        # burst wakes each consumer once and writes with nobody parked cost
+        # one dict miss.
+        self._pair_waiters: Dict[str, List[asyncio.Future]] = {}
+
         # Approximate counters — no lock needed (single-threaded asyncio).
         self._write_count: int = 0
         self._overflow_skips: int = 0
+        self._consumer_parks: int = 0
+        self._parked_consumers: int = 0
+        self._consumer_wakeups: int = 0
+        self._consumer_busy_ns: int = 0
+        self._consumer_parked_ns: int = 0
+        self._max_batch_used: int = _POLL_BATCH
+        self._wakeup_latency_ns: Deque[int] = deque(maxlen=_LATENCY_SAMPLES)
 
         logger.info(
             "🔁 RingBufferDispatcher init "
@@ -246,6 +274,20 @@ class RingBufferDispatcher:
         )
         return reader
 
+    async def add_ticker_listener(self, pair: str, callback: AsyncCallback) -> None:
+        """
+        Forward raw tickers for *pair* to *callback* without a ring buffer.
+
+        Used by consumers that fan ticks out themselves (the sharded runtime).
+        """
+        ws_pair = _convert_to_ws_pair(pair)
+        self._ws.add_ticker_callback(ws_pair, callback)
+        if pair not in self._ws_subscribed:
+            await self._ws.subscribe_ticker(ws_pair)
+
+    def remove_ticker_listener(self, pair: str, callback: AsyncCallback) -> None:
+        self._ws.remove_ticker_callback(_convert_to_ws_pair(pair), callback)
+
     async def subscribe_book(self, pair: str, callback: Callable) -> None:
         """Subscribe to the Kraken order book for microstructure features."""
         ws_pair = _convert_to_ws_pair(pair)
@@ -284,12 +326,20 @@ class RingBufferDispatcher:
 
         Called from the WebSocket receive task (the single producer).
         No locks.  O(1).  ~200–400 ns including Python call overhead.
+        Wakes every consumer parked on *pair*; the futures resolve to the
+        write time so consumers can measure their wake-up latency.
         """
         buf = self._buffers.get(pair)
         if buf is None:
             return
         buf.write(data)           # O(1) — pre-allocated slot, atomic store
         self._write_count += 1    # Approximate (no lock needed in asyncio)
+        waiters = self._pair_waiters.pop(pair, None)
+        if waiters:
+            signalled_ns = perf_counter_ns()
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(signalled_ns)
 
     # ------------------------------------------------------------------
     # Hot path: consumer loop
@@ -308,27 +358,34 @@ class RingBufferDispatcher:
         :class:`TickerData`.  Designed to run as one
         ``asyncio.Task`` per instance.
 
-        The loop yields to the event loop (``asyncio.sleep(0)``) when
-        the buffer is empty, preventing CPU spin.
+        When the buffer is empty the consumer parks on a future registered
+        for its pair instead of re-polling, so idle consumers cost nothing.  The
+        batch size doubles (up to ``_MAX_POLL_BATCH``) while batches come
+        back full and shrinks back to ``_POLL_BATCH`` once the burst drains.
 
         Args:
             instance_id:    Instance to serve.
             callback:       Async coroutine ``(TickerData) → None``.
-            poll_interval:  Seconds to sleep when buffer is empty.
-                            Default ``0.0`` yields without wall-clock delay.
+            poll_interval:  When positive, a parked consumer also re-checks
+                            the buffer after this many seconds.  Default
+                            ``0.0`` waits for the next write only.
         """
         entry = self._readers.get(instance_id)
         if entry is None:
             logger.error(f"❌ Pas de reader pour {instance_id}")
             return
 
-        _, reader = entry
+        pair, reader = entry
         poll_batch = reader.poll_batch  # Cache bound method (avoid attr lookup)
+        pair_waiters = self._pair_waiters
+        create_future = asyncio.get_running_loop().create_future
+        batch = _POLL_BATCH
+        busy_since = perf_counter_ns()
 
         logger.debug(f"🔁 Consumer démarré: {instance_id}")
         try:
             while True:
-                messages = poll_batch(_POLL_BATCH)
+                messages = poll_batch(batch)
 
                 if messages:
                     # Warn if consumer is falling behind
@@ -346,9 +403,55 @@ class RingBufferDispatcher:
                             logger.error(
                                 f"❌ Erreur callback {instance_id}: {exc}"
                             )
+
+                    # Adaptive batch: grow while the backlog fills whole
+                    # batches, shrink once the burst is drained.
+                    if len(messages) == batch and batch < _MAX_POLL_BATCH:
+                        batch <<= 1
+                        if batch > self._max_batch_used:
+                            self._max_batch_used = batch
+                    elif batch > _POLL_BATCH and len(messages) < batch >> 1:
+                        batch >>= 1
+                    continue
+
+                # Buffer empty — park until the producer writes to this pair.
+                # No await since poll_batch(), so no write can be missed.
+                waiter = create_future()
+                waiters = pair_waiters.get(pair)
+                if waiters is None:
+                    pair_waiters[pair] = [waiter]
                 else:
-                    # Buffer empty — yield to event loop
-                    await asyncio.sleep(poll_interval)
+                    waiters.append(waiter)
+                parked_at = perf_counter_ns()
+                self._consumer_busy_ns += parked_at - busy_since
+                self._consumer_parks += 1
+                self._parked_consumers += 1
+                try:
+                    if poll_interval > 0.0:
+                        try:
+                            await asyncio.wait_for(waiter, poll_interval)
+                        except asyncio.TimeoutError:
+                            pass
+                    else:
+                        await waiter
+                finally:
+                    self._parked_consumers -= 1
+                    busy_since = perf_counter_ns()
+                    self._consumer_parked_ns += busy_since - parked_at
+                    # A timed-out or cancelled park was not popped by write();
+                    # drop its future so idle pairs do not accumulate them.
+                    if waiter.cancelled():
+                        waiters = pair_waiters.get(pair)
+                        if waiters is not None:
+                            try:
+                                waiters.remove(waiter)
+                            except ValueError:
+                                pass
+                            if not waiters:
+                                del pair_waiters[pair]
+                if not waiter.cancelled():
+                    self._consumer_wakeups += 1
+                    self._wakeup_latency_ns.append(busy_since - waiter.result())
 
         except asyncio.CancelledError:
             logger.debug(f"🔁 Consumer arrêté: {instance_id}")
@@ -394,6 +497,10 @@ class RingBufferDispatcher:
         for pair, _ in self._readers.values():
             pairs_listener_counts[pair] = pairs_listener_counts.get(pair, 0) + 1
 
+        busy_ns = self._consumer_busy_ns
+        observed_ns = busy_ns + self._consumer_parked_ns
+        latencies = self._wakeup_latency_ns
+
         return {
             "pairs_subscribed": len(self._buffers),
             "total_listeners": len(self._readers),
@@ -404,4 +511,12 @@ class RingBufferDispatcher:
             "ws_connected": self._ws.is_connected(),
             "connections": 1,
             "listeners_per_pair": pairs_listener_counts,
+            "parked_consumers": self._parked_consumers,
+            "consumer_parks": self._consumer_parks,
+            "consumer_wakeups": self._consumer_wakeups,
+            # Share of consumer time spent dispatching rather than parked.
+            "consumer_utilization": round(busy_ns / observed_ns, 6) if observed_ns else 0.0,
+            "max_poll_batch": self._max_batch_used,
+            "wakeup_latency_p50_us": _percentile_us(latencies, 0.50),
+            "wakeup_latency_p99_us": _percentile_us(latencies, 0.99),
         }
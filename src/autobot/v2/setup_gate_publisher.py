@@ -0,0 +1,234 @@
+"""Off-tick publication of the grid setup-optimizer execution gate.
+
+``GridStrategyAsync`` used to evaluate its setup-optimizer gate inline whenever
+its per-instance cache expired: a synchronous SQLite read through
+``PairStrategyHealthEngine.build_snapshot_from_state_db``, a shadow-lab
+evidence snapshot and one optimizer run.  Instances expired independently, so
+every so often a tick carried a multi-millisecond database read.
+
+:class:`SetupGatePublisher` evaluates every registered grid setup in one pass
+from the cold path (one health snapshot, one shadow snapshot, then the
+optimizer per setup) and publishes an immutable :class:`SetupGateSnapshot`.
+Strategies read their gate with a dictionary lookup.  Each gate carries the
+time it was computed, so staleness is reported per gate: a setup whose
+evaluation fails keeps its previous gate and visibly ages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Optional, Tuple
+
+from .pair_strategy_health import symbol_key
+
+
+logger = logging.getLogger(__name__)
+
+# (symbol, range_percent, num_levels, max_capital_per_level)
+SetupKey = Tuple[str, float, int, float]
+
+_EMPTY: Mapping[Any, Any] = MappingProxyType({})
+
+
+def setup_gate_key(symbol: Any, range_percent: Any, num_levels: Any, max_capital_per_level: Any) -> SetupKey:
+    return (
+        symbol_key(symbol),
+        round(float(range_percent), 8),
+        int(num_levels),
+        round(float(max_capital_per_level), 8),
+    )
+
+
+@dataclass(frozen=True)
+class SetupGate:
+    """Optimizer verdict for one grid setup, as of ``computed_at`` (monotonic)."""
+
+    status: str
+    computed_at: float
+    plan: Any = None
+    health: Mapping[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        return max(0.0, (time.monotonic() if now is None else now) - self.computed_at)
+
+
+@dataclass(frozen=True)
+class SetupGateSnapshot:
+    version: int
+    published_at: float
+    gates: Mapping[SetupKey, SetupGate] = field(default_factory=lambda: _EMPTY)
+    health_by_symbol: Mapping[str, Mapping[str, Any]] = field(default_factory=lambda: _EMPTY)
+
+    def gate(self, key: SetupKey) -> Optional[SetupGate]:
+        return self.gates.get(key)
+
+    def staleness(self, now: Optional[float] = None) -> dict[str, float]:
+        """Age in seconds of every published gate, keyed ``SYMBOL:range:levels:cpl``."""
+        now = time.monotonic() if now is None else now
+        return {
+            ":".join(str(part) for part in key): round(gate.age_seconds(now), 3)
+            for key, gate in self.gates.items()
+        }
+
+
+class SetupGatePublisher:
+    """Recompute setup gates off the tick path and publish them atomically.
+
+    ``register`` is called from strategy ticks and only records the setup; a
+    newly seen setup asks ``schedule`` (the cold-path scheduler) for an early
+    refresh so it does not wait a full interval.  ``refresh`` does the blocking
+    work and is meant to run in a worker thread via :meth:`refresh_async`.
+    """
+
+    def __init__(
+        self,
+        orchestrator: Any,
+        *,
+        schedule: Optional[Callable[[Awaitable[Any]], Any]] = None,
+    ) -> None:
+        self.orchestrator = orchestrator
+        self._schedule = schedule
+        self._keys: set[SetupKey] = set()
+        self._keys_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_requested = False
+        self._snapshot = SetupGateSnapshot(version=0, published_at=time.monotonic())
+        self.refresh_count = 0
+        self.last_refresh_ms = 0.0
+
+    @property
+    def snapshot(self) -> SetupGateSnapshot:
+        return self._snapshot
+
+    def register(self, key: SetupKey) -> None:
+        with self._keys_lock:
+            if key in self._keys:
+                return
+            self._keys.add(key)
+            request = self._schedule is not None and not self._refresh_requested
+            if request:
+                self._refresh_requested = True
+        if request:
+            coro = self.refresh_async()
+            try:
+                self._schedule(coro)  # type: ignore[misc]
+            except RuntimeError:
+                # No running loop: the periodic refresh will pick the setup up.
+                coro.close()
+                with self._keys_lock:
+                    self._refresh_requested = False
+
+    async def refresh_async(self) -> SetupGateSnapshot:
+        return await asyncio.to_thread(self.refresh)
+
+    def refresh(self) -> SetupGateSnapshot:
+        with self._refresh_lock:
+            with self._keys_lock:
+                self._refresh_requested = False
+                keys = sorted(self._keys)
+            started = time.perf_counter()
+            snapshot = self._build(keys, previous=self._snapshot)
+            self._snapshot = snapshot
+            self.refresh_count += 1
+            self.last_refresh_ms = (time.perf_counter() - started) * 1000.0
+            return snapshot
+
+    def status(self) -> dict[str, Any]:
+        snapshot = self._snapshot
+        now = time.monotonic()
+        return {
+            "version": snapshot.version,
+            "published_age_s": round(max(0.0, now - snapshot.published_at), 3),
+            "registered_setups": len(self._keys),
+            "published_gates": len(snapshot.gates),
+            "refresh_count": self.refresh_count,
+            "last_refresh_ms": round(self.last_refresh_ms, 3),
+            "gate_staleness_s": snapshot.staleness(now),
+        }
+
+    def _build(self, keys: list[SetupKey], *, previous: SetupGateSnapshot) -> SetupGateSnapshot:
+        from .pair_strategy_health import PairStrategyHealthEngine
+        from .setup_optimizer import PairSetupOptimizer
+
+        orchestrator = self.orchestrator
+        now = time.monotonic()
+        optimizer = getattr(orchestrator, "setup_optimizer", None)
+        if optimizer is None:
+            optimizer = PairSetupOptimizer()
+            setattr(orchestrator, "setup_optimizer", optimizer)
+        health_engine = getattr(orchestrator, "pair_strategy_health_engine", None)
+        if health_engine is None:
+            health_engine = PairStrategyHealthEngine()
+            setattr(orchestrator, "pair_strategy_health_engine", health_engine)
+
+        try:
+            persistence = getattr(orchestrator, "persistence", None)
+            db_path = getattr(persistence, "db_path", "data/autobot_state.db")
+            health_snapshot = health_engine.build_snapshot_from_state_db(db_path, paper_mode=True)
+            health_by_symbol = health_snapshot.get("by_symbol", {}) if isinstance(health_snapshot, dict) else {}
+        except Exception as exc:
+            logger.warning("Setup gate refresh kept previous gates: health unavailable (%s)", exc)
+            return SetupGateSnapshot(
+                version=previous.version + 1,
+                published_at=now,
+                gates=previous.gates,
+                health_by_symbol=previous.health_by_symbol,
+            )
+
+        gates: dict[SetupKey, SetupGate] = {}
+        if not getattr(optimizer.config, "enabled", True):
+            gates = {key: SetupGate(status="optimizer_disabled", computed_at=now) for key in keys}
+        elif not getattr(optimizer.config, "apply_to_execution", False):
+            gates = {key: SetupGate(status="optimizer_observe_only", computed_at=now) for key in keys}
+        else:
+            shadow_by_symbol: Mapping[str, Any] = {}
+            shadow_lab = getattr(orchestrator, "setup_shadow_lab", None)
+            if shadow_lab is not None and hasattr(shadow_lab, "evidence_by_symbol"):
+                try:
+                    shadow_by_symbol = shadow_lab.evidence_by_symbol()
+                except Exception as exc:
+                    logger.debug("Setup gate refresh without shadow evidence: %s", exc)
+            for key in keys:
+                symbol, range_percent, num_levels, max_capital_per_level = key
+                health = health_by_symbol.get(symbol, {})
+                shadow = shadow_by_symbol.get(symbol, {})
+                try:
+                    plan = optimizer.analyze_symbol(
+                        symbol=symbol,
+                        instances=[
+                            {
+                                "symbol": symbol,
+                                "strategy": "grid",
+                                "range_percent": range_percent,
+                                "num_levels": num_levels,
+                                "max_capital_per_level": max_capital_per_level,
+                            }
+                        ],
+                        opportunity={},
+                        health=health if isinstance(health, dict) else {},
+                        shadow=shadow if isinstance(shadow, dict) else {},
+                        paper_mode=True,
+                    )
+                except Exception as exc:
+                    logger.debug("Setup gate unavailable for %s: %s", symbol, exc)
+                    kept = previous.gates.get(key)
+                    gates[key] = kept or SetupGate(status="unavailable", computed_at=now, error=str(exc))
+                    continue
+                gates[key] = SetupGate(
+                    status="ok",
+                    computed_at=now,
+                    plan=plan,
+                    health=dict(health) if isinstance(health, dict) else {},
+                )
+        return SetupGateSnapshot(
+            version=previous.version + 1,
+            published_at=now,
+            gates=MappingProxyType(gates),
+            health_by_symbol=MappingProxyType(dict(health_by_symbol)),
+        )
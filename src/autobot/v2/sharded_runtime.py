@@ -0,0 +1,753 @@
+"""
+Sharded multi-process runtime — symbol partitions on CPU-pinned workers.
+
+``OrchestratorAsync`` runs every trading instance on one event loop, and
+``OSTuner.apply_cpu_pinning`` can only pin that one process, so adding
+symbols eventually saturates a single core.  This module spreads the
+per-tick work over N worker processes:
+
+    parent process
+      WebSocket ticker ─► ShardedRuntime.publish()
+                            │  one SharedTickRing per shard
+                            │  (multiprocessing.shared_memory, SPSC)
+                            ▼
+    worker process × N   (pinned via OSTuner.apply_cpu_pinning)
+      drain ring ─► TickerData ─► handler.on_tick()
+      handler output ─► ONE multiprocessing.Queue ─► parent event pump
+                                                    ─► router / persistence
+
+Shard handlers:
+    Workers cannot share Python objects with the parent, so each worker
+    builds its own handler from ``handler_factory(spec)``.  The factory is a
+    picklable top-level callable or a ``"module:attribute"`` string resolved
+    inside the worker.  ``handler.on_tick(tick)`` (sync or async) returns an
+    iterable of ``(kind, payload)`` pairs, e.g. ``("order", {...})`` or
+    ``("state", {...})``; optional ``start()`` / ``stop()`` hooks are awaited
+    when the worker starts and stops.  :class:`ObservationShardHandler`
+    (``REFERENCE_HANDLER``) is the reference implementation.
+
+    A sharded symbol is owned by its worker: the orchestrator skips symbols
+    that already have a local instance and refuses local instances for
+    sharded ones, so no tick is processed twice.  The runtime is
+    experimental and off unless ``SHARDED_RUNTIME_WORKERS`` is set.
+
+Ring protocol:
+    The header holds ``write_seq``, ``read_seq`` and a ``parked`` flag as
+    aligned 64-bit integers; every slot is stamped with its sequence number.
+    The producer writes the slot, then advances ``write_seq``.  A consumer
+    that falls a full ring behind skips ahead and counts the gap as dropped
+    (the same overwrite policy as :class:`RingBuffer`).  An idle
+    worker sets ``parked`` and blocks on a pipe; ``publish`` rings that
+    doorbell only for parked workers, and the park timeout bounds a missed
+    wakeup.
+
+Ordering:
+    Events from one shard reach the sink in the order the shard emitted
+    them; :meth:`ShardedRuntime.run_event_pump` awaits the sink serially.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import logging
+import multiprocessing
+import os
+import queue
+import struct
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .os_tuning import OSTuner
+from .websocket_client import TickerData
+
+__all__ = [
+    "DEFAULT_RING_SIZE",
+    "REFERENCE_HANDLER",
+    "ObservationShardHandler",
+    "SharedTickRing",
+    "ShardEvent",
+    "ShardSpec",
+    "ShardedRuntime",
+    "build_observation_handler",
+    "plan_shards",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RING_SIZE: int = 8192  # Slots per shard; must be a power of 2
+
+# write_seq, read_seq, parked — each on its own 8-byte word.
+_HEADER = struct.Struct("<qqq")
+# seq, symbol_id, price, bid, ask, volume_24h, timestamp, published_at
+_SLOT = struct.Struct("<qidddddd")
+_SLOT_SIZE: int = _SLOT.size
+_WRITE_SEQ_OFFSET = 0
+_READ_SEQ_OFFSET = 8
+_PARKED_OFFSET = 16
+_INT64 = struct.Struct("<q")
+
+_READ_BATCH: int = 256
+_PARK_TIMEOUT_S: float = 0.05
+
+HandlerFactory = Union[str, Callable[["ShardSpec"], Any]]
+
+REFERENCE_HANDLER = "autobot.v2.sharded_runtime:build_observation_handler"
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory tick ring
+# ---------------------------------------------------------------------------
+
+
+class SharedTickRing:
+    """
+    Single-producer / single-consumer tick ring in shared memory.
+
+    Ticks are stored as fixed-size records (symbol as an index into the
+    shard's symbol list), so neither side pickles or allocates per tick
+    beyond the unpacked tuple.
+    """
+
+    __slots__ = ("_shm", "_buf", "_size", "_mask", "_owner")
+
+    def __init__(self, size: int = DEFAULT_RING_SIZE, *, name: Optional[str] = None) -> None:
+        """
+        Create a ring, or attach to an existing one when *name* is given.
+
+        Raises:
+            ValueError: If size is not a positive power of 2.
+        """
+        if size <= 0 or (size & (size - 1)) != 0:
+            raise ValueError(f"Ring size must be a positive power of 2, got {size}")
+        self._size = size
+        self._mask = size - 1
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=_HEADER.size + size * _SLOT_SIZE
+            )
+            self._shm.buf[: _HEADER.size] = bytes(_HEADER.size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._buf = self._shm.buf
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def write_seq(self) -> int:
+        return _INT64.unpack_from(self._buf, _WRITE_SEQ_OFFSET)[0]
+
+    @property
+    def read_seq(self) -> int:
+        return _INT64.unpack_from(self._buf, _READ_SEQ_OFFSET)[0]
+
+    @read_seq.setter
+    def read_seq(self, value: int) -> None:
+        _INT64.pack_into(self._buf, _READ_SEQ_OFFSET, value)
+
+    @property
+    def parked(self) -> bool:
+        return _INT64.unpack_from(self._buf, _PARKED_OFFSET)[0] != 0
+
+    @parked.setter
+    def parked(self, value: bool) -> None:
+        _INT64.pack_into(self._buf, _PARKED_OFFSET, 1 if value else 0)
+
+    def write(
+        self,
+        symbol_id: int,
+        price: float,
+        bid: float,
+        ask: float,
+        volume_24h: float,
+        timestamp: float,
+    ) -> int:
+        """Store one tick and publish it.  Producer side only; returns its seq."""
+        buf = self._buf
+        seq = _INT64.unpack_from(buf, _WRITE_SEQ_OFFSET)[0]
+        _SLOT.pack_into(
+            buf,
+            _HEADER.size + (seq & self._mask) * _SLOT_SIZE,
+            seq, symbol_id, price, bid, ask, volume_24h, timestamp, time.time(),
+        )
+        _INT64.pack_into(buf, _WRITE_SEQ_OFFSET, seq + 1)
+        return seq
+
+    def read_batch(self, cursor: int, max_items: int = _READ_BATCH) -> Tuple[List[tuple], int, int]:
+        """
+        Read up to *max_items* records from *cursor*.  Consumer side only.
+
+        Returns ``(records, new_cursor, dropped)`` where *dropped* counts
+        records overwritten before they could be read.
+        """
+        buf = self._buf
+        write_seq = _INT64.unpack_from(buf, _WRITE_SEQ_OFFSET)[0]
+        dropped = 0
+        # The oldest slot of a full ring is the next one the producer
+        # rewrites, so at most size - 1 unread records are safe to keep.
+        if write_seq - cursor >= self._size:
+            dropped = write_seq - self._size + 1 - cursor
+            cursor = write_seq - self._size + 1
+        end = min(write_seq, cursor + max_items)
+        records: List[tuple] = []
+        mask = self._mask
+        for seq in range(cursor, end):
+            record = _SLOT.unpack_from(buf, _HEADER.size + (seq & mask) * _SLOT_SIZE)
+            if record[0] != seq:
+                dropped += 1
+                continue
+            records.append(record)
+        # A slot is rewritten while write_seq == its seq + size, so anything
+        # at or below this bound may have been torn while we were copying.
+        unsafe_upto = _INT64.unpack_from(buf, _WRITE_SEQ_OFFSET)[0] - self._size
+        if records and records[0][0] <= unsafe_upto:
+            kept = [record for record in records if record[0] > unsafe_upto]
+            dropped += len(records) - len(kept)
+            records = kept
+        return records, end, dropped
+
+    def close(self) -> None:
+        self._buf = None
+        try:
+            self._shm.close()
+        except BufferError:  # pragma: no cover - exported memoryview still alive
+            logger.debug("SharedTickRing %s still referenced at close", self._shm.name)
+
+    def unlink(self) -> None:
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Shard plan and events
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """One worker's partition: the symbols it hosts and the cores it is pinned to."""
+
+    shard_id: int
+    symbols: Tuple[str, ...]
+    cores: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class ShardEvent:
+    """One item on the worker → parent channel (``seq`` is per shard)."""
+
+    shard_id: int
+    seq: int
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+def plan_shards(
+    symbols: Sequence[str],
+    workers: int,
+    cores: Optional[Sequence[int]] = None,
+) -> List[ShardSpec]:
+    """
+    Partition *symbols* round-robin over at most *workers* shards.
+
+    Duplicate symbols are ignored.  When *cores* is given, shard ``i`` is
+    pinned to ``cores[i % len(cores)]``; otherwise workers are not pinned.
+    """
+    unique = list(dict.fromkeys(s for s in symbols if s))
+    count = max(1, min(int(workers), len(unique))) if unique else 0
+    partitions: List[List[str]] = [[] for _ in range(count)]
+    for index, symbol in enumerate(unique):
+        partitions[index % count].append(symbol)
+    core_list = list(cores or ())
+    return [
+        ShardSpec(
+            shard_id=shard_id,
+            symbols=tuple(partition),
+            cores=(core_list[shard_id % len(core_list)],) if core_list else (),
+        )
+        for shard_id, partition in enumerate(partitions)
+    ]
+
+
+class ObservationShardHandler:
+    """
+    Reference shard handler: observes ticks and never emits orders.
+
+    Each symbol is reported as its own instance (``shard-<shard>-<symbol>``)
+    with a zero budget; a ``state`` snapshot is emitted every *state_every*
+    ticks in the schema the orchestrator persists.
+    """
+
+    def __init__(self, spec: ShardSpec, state_every: int = 1000) -> None:
+        self.spec = spec
+        self.state_every = max(1, int(state_every))
+        self.ticks: Dict[str, int] = {}
+        self.last_price: Dict[str, float] = {}
+
+    def instance_id(self, symbol: str) -> str:
+        return f"shard-{self.spec.shard_id}-{symbol}"
+
+    def on_tick(self, tick: TickerData) -> Optional[List[Tuple[str, Dict[str, Any]]]]:
+        count = self.ticks.get(tick.symbol, 0) + 1
+        self.ticks[tick.symbol] = count
+        self.last_price[tick.symbol] = tick.price
+        if count % self.state_every:
+            return None
+        return [("state", {
+            "instance_id": self.instance_id(tick.symbol),
+            "status": "running",
+            "current_capital": 0.0,
+            "allocated_capital": 0.0,
+            "win_count": 0,
+            "loss_count": 0,
+        })]
+
+
+def build_observation_handler(spec: ShardSpec) -> ObservationShardHandler:
+    return ObservationShardHandler(spec, int(os.getenv("SHARDED_RUNTIME_STATE_EVERY", "1000")))
+
+
+def _resolve_factory(factory: HandlerFactory) -> Callable[[ShardSpec], Any]:
+    if callable(factory):
+        return factory
+    module_name, _, attribute = str(factory).partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Shard handler must be 'module:attribute', got {factory!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+# ---------------------------------------------------------------------------
+
+
+def _run_shard_worker(
+    spec: ShardSpec,
+    ring_name: str,
+    ring_size: int,
+    doorbell: Any,
+    events: Any,
+    stop_event: Any,
+    handler_factory: HandlerFactory,
+    heartbeat_interval: float,
+) -> None:
+    """Worker entry point: pin, attach the ring and drive the handler."""
+    pinned = bool(spec.cores) and OSTuner().apply_cpu_pinning(set(spec.cores))
+    ring = SharedTickRing(ring_size, name=ring_name)
+    try:
+        asyncio.run(
+            _shard_worker_loop(
+                spec, ring, doorbell, events, stop_event,
+                handler_factory, heartbeat_interval, pinned,
+            )
+        )
+    finally:
+        ring.close()
+
+
+async def _shard_worker_loop(
+    spec: ShardSpec,
+    ring: SharedTickRing,
+    doorbell: Any,
+    events: Any,
+    stop_event: Any,
+    handler_factory: HandlerFactory,
+    heartbeat_interval: float,
+    pinned: bool,
+) -> None:
+    loop = asyncio.get_running_loop()
+    symbols = spec.symbols
+    seq = 0
+    stats = {"processed": 0, "dropped": 0, "errors": 0, "events": 0, "busy_ns": 0, "last_lag_ms": 0.0}
+
+    def emit(kind: str, payload: Dict[str, Any]) -> None:
+        nonlocal seq
+        events.put(ShardEvent(spec.shard_id, seq, kind, payload))
+        seq += 1
+
+    handler = _resolve_factory(handler_factory)(spec)
+    if hasattr(handler, "start"):
+        await _maybe_await(handler.start())
+
+    wakeup: Optional[asyncio.Future] = None
+
+    def _on_doorbell() -> None:
+        while doorbell.poll():
+            doorbell.recv_bytes()
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    loop.add_reader(doorbell.fileno(), _on_doorbell)
+    cursor = ring.read_seq
+    started_at = time.perf_counter_ns()
+    next_heartbeat = time.monotonic()
+    try:
+        while not stop_event.is_set():
+            records, cursor, dropped = ring.read_batch(cursor)
+            stats["dropped"] += dropped
+            if records:
+                batch_start = time.perf_counter_ns()
+                for _, symbol_id, price, bid, ask, volume, ts, published_at in records:
+                    tick = TickerData(
+                        symbol=symbols[symbol_id],
+                        price=price,
+                        bid=bid,
+                        ask=ask,
+                        volume_24h=volume,
+                        timestamp=datetime.fromtimestamp(ts, timezone.utc),
+                    )
+                    try:
+                        outputs = await _maybe_await(handler.on_tick(tick))
+                    except Exception as exc:
+                        stats["errors"] += 1
+                        emit("error", {"symbol": tick.symbol, "error": f"{type(exc).__name__}: {exc}"})
+                        continue
+                    for kind, payload in outputs or ():
+                        emit(kind, payload)
+                        stats["events"] += 1
+                stats["processed"] += len(records)
+                stats["last_lag_ms"] = round((time.time() - published_at) * 1000.0, 3)
+                stats["busy_ns"] += time.perf_counter_ns() - batch_start
+                ring.read_seq = cursor
+            else:
+                ring.parked = True
+                if ring.write_seq == cursor:
+                    wakeup = loop.create_future()
+                    try:
+                        await asyncio.wait_for(wakeup, _PARK_TIMEOUT_S)
+                    except asyncio.TimeoutError:
+                        pass
+                    wakeup = None
+                ring.parked = False
+            now = time.monotonic()
+            if now >= next_heartbeat:
+                next_heartbeat = now + heartbeat_interval
+                elapsed_ns = max(1, time.perf_counter_ns() - started_at)
+                emit("heartbeat", {
+                    **stats,
+                    "pid": os.getpid(),
+                    "pinned": pinned,
+                    "utilization": round(stats["busy_ns"] / elapsed_ns, 4),
+                })
+    finally:
+        loop.remove_reader(doorbell.fileno())
+        if hasattr(handler, "stop"):
+            await _maybe_await(handler.stop())
+        emit("heartbeat", {**stats, "pid": os.getpid(), "pinned": pinned, "stopped": True})
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _ShardHandle:
+    spec: ShardSpec
+    ring: SharedTickRing
+    doorbell: Any
+    process: Any
+    symbol_ids: Dict[str, int]
+    published: int = 0
+    doorbells: int = 0
+    heartbeat: Dict[str, Any] = field(default_factory=dict)
+    last_heartbeat: Optional[float] = None
+    events_received: int = 0
+
+
+class ShardedRuntime:
+    """
+    Parent-side owner of the shard workers.
+
+    Usage::
+
+        runtime = ShardedRuntime(symbols, "my_pkg.shards:build_handler", workers=4,
+                                 cores=[2, 3, 4, 5])
+        runtime.start()
+        await runtime.attach(orchestrator.ring_dispatcher)   # ticks in
+        await runtime.run_event_pump(sink)                   # orders / state out
+        runtime.stop()
+
+    ``publish`` is the hot path: one dict lookup, one ring write and, only
+    when the worker is parked, one doorbell byte.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        handler_factory: HandlerFactory,
+        *,
+        workers: int = 2,
+        cores: Optional[Sequence[int]] = None,
+        ring_size: int = DEFAULT_RING_SIZE,
+        heartbeat_interval: float = 1.0,
+        start_method: str = "spawn",
+    ) -> None:
+        self.plan = plan_shards(symbols, workers, cores)
+        if not self.plan:
+            raise ValueError("ShardedRuntime needs at least one symbol")
+        self._hosted = frozenset(s.upper() for spec in self.plan for s in spec.symbols)
+        self.handler_factory = handler_factory
+        self.ring_size = ring_size
+        self.heartbeat_interval = max(0.05, float(heartbeat_interval))
+        self._ctx = multiprocessing.get_context(start_method)
+        self._events = self._ctx.Queue()
+        self._stop_event = self._ctx.Event()
+        self._shards: List[_ShardHandle] = []
+        self._route: Dict[str, Tuple[_ShardHandle, int]] = {}
+        self._unrouted = 0
+        self._listeners: List[Tuple[Any, str, Callable]] = []
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Create the rings and spawn one worker process per shard."""
+        if self._running:
+            return
+        self._stop_event.clear()
+        self._shards = []
+        self._route = {}
+        for spec in self.plan:
+            ring = SharedTickRing(self.ring_size)
+            reader, writer = self._ctx.Pipe(duplex=False)
+            process = self._ctx.Process(
+                target=_run_shard_worker,
+                args=(
+                    spec, ring.name, self.ring_size, reader, self._events,
+                    self._stop_event, self.handler_factory, self.heartbeat_interval,
+                ),
+                name=f"autobot-shard-{spec.shard_id}",
+                daemon=True,
+            )
+            process.start()
+            reader.close()
+            handle = _ShardHandle(
+                spec=spec,
+                ring=ring,
+                doorbell=writer,
+                process=process,
+                symbol_ids={symbol: index for index, symbol in enumerate(spec.symbols)},
+            )
+            self._shards.append(handle)
+            for symbol, index in handle.symbol_ids.items():
+                self._route[symbol] = (handle, index)
+        self._running = True
+        logger.info(
+            "🧩 ShardedRuntime démarré: %d workers, %d symbols",
+            len(self._shards), len(self._route),
+        )
+
+    def stop(self, timeout: float = 5.0) -> List[ShardEvent]:
+        """
+        Stop the workers and free the rings.
+
+        Returns the events still queued when the pump stopped, so the caller
+        can decide whether to replay or log them.
+        """
+        if not self._running:
+            return []
+        self._running = False
+        self._stop_event.set()
+        for handle in self._shards:
+            self._ring_doorbell(handle)
+        # Keep draining while joining: a worker cannot exit until its queue
+        # feeder thread has flushed into the pipe.
+        leftover: List[ShardEvent] = []
+        deadline = time.monotonic() + timeout
+        while any(h.process.is_alive() for h in self._shards) and time.monotonic() < deadline:
+            leftover.extend(self.poll_events(timeout=0.05))
+        for handle in self._shards:
+            if handle.process.is_alive():
+                logger.warning("Shard %d did not stop in time; terminating", handle.spec.shard_id)
+                handle.process.terminate()
+            handle.process.join(1.0)
+        leftover.extend(self.poll_events(timeout=0.0))
+        if leftover:
+            logger.warning("ShardedRuntime arrêté avec %d événement(s) non livrés", len(leftover))
+        for handle in self._shards:
+            handle.doorbell.close()
+            handle.ring.close()
+            handle.ring.unlink()
+        self._route.clear()
+        logger.info("🧩 ShardedRuntime arrêté")
+        return leftover
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def hosts(self, symbol: str) -> bool:
+        """True if *symbol* is planned on a shard (whether or not it is running)."""
+        return str(symbol).upper() in self._hosted
+
+    # ------------------------------------------------------------------
+    # Ticks in
+    # ------------------------------------------------------------------
+
+    def publish(self, tick: TickerData, symbol: Optional[str] = None) -> bool:
+        """
+        Route *tick* to the shard hosting *symbol* (default ``tick.symbol``).
+        Returns False if unrouted.
+
+        Market-data tickers carry the WebSocket pair name ("XBT/EUR") while
+        shards are planned on configured symbols ("XXBTZEUR"); listeners
+        installed by :meth:`attach` pass the configured symbol explicitly.
+        """
+        route = self._route.get(symbol or tick.symbol)
+        if route is None:
+            self._unrouted += 1
+            return False
+        handle, symbol_id = route
+        handle.ring.write(
+            symbol_id, tick.price, tick.bid, tick.ask, tick.volume_24h,
+            tick.timestamp.timestamp(),
+        )
+        handle.published += 1
+        if handle.ring.parked:
+            self._ring_doorbell(handle)
+        return True
+
+    async def on_ticker(self, tick: TickerData) -> None:
+        """Async adapter for WebSocket ticker callbacks."""
+        self.publish(tick)
+
+    async def attach(self, dispatcher: Any) -> None:
+        """Forward *dispatcher*'s raw tickers for every sharded symbol."""
+        for symbol in self._route:
+            callback = self._listener_for(symbol)
+            await dispatcher.add_ticker_listener(symbol, callback)
+            self._listeners.append((dispatcher, symbol, callback))
+
+    def _listener_for(self, symbol: str) -> Callable[[TickerData], Any]:
+        async def _on_ticker(tick: TickerData) -> None:
+            self.publish(tick, symbol)
+
+        return _on_ticker
+
+    def detach(self) -> None:
+        for dispatcher, symbol, callback in self._listeners:
+            dispatcher.remove_ticker_listener(symbol, callback)
+        self._listeners.clear()
+
+    def _ring_doorbell(self, handle: _ShardHandle) -> None:
+        handle.ring.parked = False
+        try:
+            handle.doorbell.send_bytes(b"\0")
+            handle.doorbells += 1
+        except (BrokenPipeError, OSError):
+            pass
+
+    # ------------------------------------------------------------------
+    # Events out
+    # ------------------------------------------------------------------
+
+    def poll_events(self, max_items: int = 256, timeout: float = 0.1) -> List[ShardEvent]:
+        """
+        Return up to *max_items* non-heartbeat events, waiting at most
+        *timeout* seconds for the first one.  Heartbeats update :meth:`health`.
+        """
+        collected: List[ShardEvent] = []
+        block = timeout > 0
+        while len(collected) < max_items:
+            try:
+                event = self._events.get(block, timeout) if block else self._events.get_nowait()
+            except queue.Empty:
+                break
+            except (EOFError, OSError):  # pragma: no cover - queue torn down
+                break
+            block = False
+            handle = self._shards[event.shard_id] if event.shard_id < len(self._shards) else None
+            if handle is not None:
+                handle.events_received += 1
+            if event.kind == "heartbeat":
+                if handle is not None:
+                    handle.heartbeat = event.payload
+                    handle.last_heartbeat = time.monotonic()
+                continue
+            collected.append(event)
+        return collected
+
+    async def run_event_pump(self, sink: Callable[[ShardEvent], Any]) -> None:
+        """Deliver worker events to *sink* one at a time, in arrival order."""
+        while self._running:
+            events = await asyncio.to_thread(self.poll_events, 256, 0.1)
+            for event in events:
+                try:
+                    await _maybe_await(sink(event))
+                except Exception as exc:
+                    logger.error(
+                        "Shard event sink failed for %s from shard %d: %s",
+                        event.kind, event.shard_id, exc,
+                    )
+
+    # ------------------------------------------------------------------
+    # Health
+    # ------------------------------------------------------------------
+
+    def health(self) -> Dict[str, Any]:
+        """Per-shard liveness, backlog and throughput (cheap; dashboard-safe)."""
+        now = time.monotonic()
+        shards = []
+        for handle in self._shards:
+            beat = handle.heartbeat
+            backlog = 0
+            if self._running:
+                backlog = handle.ring.write_seq - handle.ring.read_seq
+            shards.append({
+                "shard_id": handle.spec.shard_id,
+                "pid": handle.process.pid,
+                "alive": handle.process.is_alive(),
+                "exitcode": handle.process.exitcode,
+                "symbols": list(handle.spec.symbols),
+                "cores": list(handle.spec.cores),
+                "pinned": bool(beat.get("pinned", False)),
+                "published": handle.published,
+                "processed": int(beat.get("processed", 0)),
+                "dropped": int(beat.get("dropped", 0)),
+                "errors": int(beat.get("errors", 0)),
+                "events": int(beat.get("events", 0)),
+                "backlog": backlog,
+                "last_lag_ms": beat.get("last_lag_ms"),
+                "utilization": beat.get("utilization"),
+                "doorbells": handle.doorbells,
+                "heartbeat_age_s": (
+                    round(now - handle.last_heartbeat, 3) if handle.last_heartbeat is not None else None
+                ),
+            })
+        stale_after = 5 * self.heartbeat_interval
+        healthy = self._running and all(
+            shard["alive"]
+            and shard["heartbeat_age_s"] is not None
+            and shard["heartbeat_age_s"] <= stale_after
+            for shard in shards
+        )
+        return {
+            "running": self._running,
+            "healthy": healthy,
+            "workers": len(shards),
+            "unrouted_ticks": self._unrouted,
+            "shards": shards,
+        }
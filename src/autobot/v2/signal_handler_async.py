@@ -10,7 +10,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-import sqlite3
 import time
 import uuid
 import hashlib
@@ -36,6 +35,8 @@ from .reconciliation_strict import StrictReconciliation
 from .modules.fee_optimizer import FeeOptimizer
 from .market_analyzer import get_market_analyzer
 from .opportunity_scoring import OpportunityScorer
+from .paper_buy_window import shared_buy_window
+from .account_reconciler import AccountSnapshot, fetch_account_snapshot
 from .research.runtime_shadow_decision_bridge import build_runtime_shadow_decision
 
 logger = logging.getLogger(__name__)
@@ -79,6 +80,8 @@ class SignalHandlerAsync:
         self.order_executor = order_executor
         self.validator = create_default_validator_engine()
         self._last_signal_time: Optional[datetime] = None
+        self._buy_window_catch_up: Optional[asyncio.Task] = None
+        self._paper_active_symbols_cache: Optional[tuple[tuple[str, ...], int]] = None
         self._cooldown_seconds = 5
         self._atr_period = 14
         self._risk_per_trade_pct = self._load_positive_float(
@@ -619,6 +622,12 @@ class SignalHandlerAsync:
         instances = getattr(orchestrator, "_instances", None)
         if not isinstance(instances, dict):
             return 1
+        # Instances keep their symbol for life, so the count only changes when
+        # the instance set does.
+        instance_ids = tuple(instances)
+        cached = self._paper_active_symbols_cache
+        if cached is not None and cached[0] == instance_ids:
+            return cached[1]
         symbols: set[str] = set()
         for inst in instances.values():
             try:
@@ -627,7 +636,9 @@ class SignalHandlerAsync:
                 continue
             if symbol:
                 symbols.add(symbol)
-        return max(1, len(symbols))
+        count = max(1, len(symbols))
+        self._paper_active_symbols_cache = (instance_ids, count)
+        return count
 
     def _state_db_path_for_diversification(self) -> Optional[str]:
         persistence = getattr(self.instance, "_persistence", None)
@@ -639,7 +650,7 @@ class SignalHandlerAsync:
             return str(getattr(persistence, "db_path"))
         return None
 
-    def _paper_symbol_concentration_guard(self, symbol: str) -> tuple[bool, dict[str, Any]]:
+    async def _paper_symbol_concentration_guard(self, symbol: str) -> tuple[bool, dict[str, Any]]:
         """Prevent one official paper symbol from monopolizing new entries."""
         if not self._is_paper_mode() or not self._paper_diversification_enabled:
             return False, {"enabled": False}
@@ -655,32 +666,26 @@ class SignalHandlerAsync:
             return False, {"enabled": True, "reason": "state_db_unavailable"}
         normalized_symbol = self._convert_symbol(symbol).upper()
         window = max(1, int(self._paper_symbol_buy_window_minutes))
-        try:
-            with sqlite3.connect(db_path, timeout=2.0) as conn:
-                conn.row_factory = sqlite3.Row
-                table_exists = conn.execute(
-                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='trade_ledger'"
-                ).fetchone()
-                if not table_exists:
+        # Counts come from the shared in-memory window fed by the ledger
+        # append path.  SQLite is read off the event loop: once to seed the
+        # window, then at most every catch_up_seconds in the background for
+        # rows written by other processes.
+        buy_window = shared_buy_window(db_path, window * 60.0)
+        if not buy_window.seeded:
+            try:
+                if not await asyncio.to_thread(buy_window.refresh, db_path):
                     return False, {"enabled": True, "reason": "trade_ledger_unavailable"}
-                rows = conn.execute(
-                    """
-                    SELECT symbol, COUNT(*) AS n
-                    FROM trade_ledger
-                    WHERE lower(side) = 'buy'
-                      AND julianday(replace(substr(created_at, 1, 19), 'T', ' '))
-                          >= julianday('now', ?)
-                    GROUP BY symbol
-                    """,
-                    (f"-{window} minutes",),
-                ).fetchall()
-        except Exception as exc:
-            logger.debug("Paper diversification guard unavailable for %s: %s", normalized_symbol, exc)
-            return False, {"enabled": True, "reason": "query_failed", "error": str(exc)[:160]}
+            except Exception as exc:
+                logger.debug("Paper diversification guard unavailable for %s: %s", normalized_symbol, exc)
+                return False, {"enabled": True, "reason": "query_failed", "error": str(exc)[:160]}
+        elif buy_window.claim_catch_up():
+            self._buy_window_catch_up = asyncio.create_task(
+                self._catch_up_buy_window(buy_window, db_path),
+                name="paper-buy-window-catch-up",
+            )
 
-        counts = {str(row["symbol"] or "").upper(): int(row["n"] or 0) for row in rows}
+        counts, total_buys = buy_window.counts()
         symbol_buys = int(counts.get(normalized_symbol, 0))
-        total_buys = int(sum(counts.values()))
         details = {
             "enabled": True,
             "action": self._paper_symbol_concentration_action,
@@ -698,6 +703,13 @@ class SignalHandlerAsync:
         details["reason"] = "ok"
         return False, details
 
+    @staticmethod
+    async def _catch_up_buy_window(buy_window: Any, db_path: str) -> None:
+        try:
+            await asyncio.to_thread(buy_window.refresh, db_path)
+        except Exception as exc:
+            logger.debug("Paper buy window catch-up failed for %s: %s", db_path, exc)
+
     async def _try_paper_signal_budget_top_up(
         self,
         *,
@@ -1411,7 +1423,7 @@ class SignalHandlerAsync:
                 volume = min(volume, target_volume)
 
         symbol = self._convert_symbol(signal.symbol)
-        concentration_blocked, concentration_details = self._paper_symbol_concentration_guard(symbol)
+        concentration_blocked, concentration_details = await self._paper_symbol_concentration_guard(symbol)
         if concentration_blocked:
             self._record_runtime_event(
                 "_last_decision_event",
@@ -1919,7 +1931,7 @@ class SignalHandlerAsync:
                         execution_engine=signal_engine,
                         source=signal_source,
                     )
-                    await self._post_trade_reconcile()
+                    await self._post_trade_reconcile(immediate=True)
                     continue
                 if executed_volume <= 0.0:
                     await self._maybe_await(self._osm.transition(
@@ -1942,7 +1954,7 @@ class SignalHandlerAsync:
                         source=signal_source,
                     )
                     logger.warning("SELL zero fill held for reconciliation: %s/%s", self.instance.id, pos_id)
-                    await self._post_trade_reconcile()
+                    await self._post_trade_reconcile(immediate=True)
                     continue
                 if executed_volume + 1e-12 < requested_volume:
                     await self._maybe_await(self._osm.transition(
@@ -1975,7 +1987,7 @@ class SignalHandlerAsync:
                         requested_volume,
                         executed_volume,
                     )
-                    await self._post_trade_reconcile()
+                    await self._post_trade_reconcile(immediate=True)
                     continue
                 if executed_volume > requested_volume + 1e-12:
                     await self._maybe_await(self._osm.transition(
@@ -2008,7 +2020,7 @@ class SignalHandlerAsync:
                         requested_volume,
                         executed_volume,
                     )
-                    await self._post_trade_reconcile()
+                    await self._post_trade_reconcile(immediate=True)
                     continue
                 realized_pnl = await self.instance.close_position(
                     pos_id,
@@ -2045,7 +2057,7 @@ class SignalHandlerAsync:
                         self.instance.id,
                         pos_id,
                     )
-                    await self._post_trade_reconcile()
+                    await self._post_trade_reconcile(immediate=True)
                     continue
                 await self._osm.transition(
                     rec.client_order_id,
@@ -2174,15 +2186,32 @@ class SignalHandlerAsync:
                 return parsed
         return 0.0
 
-    async def _post_trade_reconcile(self) -> None:
-        """Compare local vs exchange balance snapshots and trigger kill switch on critical drift."""
+    async def _post_trade_reconcile(self, *, immediate: bool = False) -> None:
+        """Compare local vs exchange balance snapshots and trigger kill switch on critical drift.
+
+        With a shared ``account_reconciler`` on the orchestrator a normal fill
+        only posts a hint: one balance fetch per debounce window serves every
+        handler, and the check below runs against that snapshot.  Anomalies
+        (``immediate=True``: zero/partial/over-fills, lost persistence) flush
+        the reconciler so the kill switch can trip before the next order.
+        """
         if self.order_executor is None:
             return
-        exchange_balance = await self.order_executor.get_balance()
+        orchestrator = getattr(self.instance, "orchestrator", None)
+        reconciler = getattr(orchestrator, "account_reconciler", None)
+        if reconciler is not None and reconciler.order_executor is self.order_executor:
+            reconciler.post_fill(self, self._reconcile_against)
+            if immediate:
+                await reconciler.flush()
+            return
+        await self._reconcile_against(await fetch_account_snapshot(self.order_executor))
+
+    async def _reconcile_against(self, snapshot: AccountSnapshot) -> None:
+        exchange_balance = snapshot.balance
         if exchange_balance:
-            self._kill_switch.record_balance_freshness(time.time())
+            self._kill_switch.record_balance_freshness(snapshot.fetched_at)
         local_total = self._local_total_for_reconciliation()
-        tb = await self.order_executor.get_trade_balance("EUR")
+        tb = snapshot.trade_balance
         if isinstance(tb, dict) and "equivalent_balance" in tb:
             exchange_total = float(tb.get("equivalent_balance") or 0.0)
         else:
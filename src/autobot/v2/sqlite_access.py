@@ -0,0 +1,421 @@
+"""Shared SQLite access layer for synchronous AUTOBOT stores.
+
+Stores such as the experiment registry, the research memory, the shadow OMS
+ledger, the global kill switch and the nonce manager used to open a fresh
+``sqlite3`` connection for every operation and re-issue their PRAGMAs each
+time.  This module keeps one persistent connection per thread and database,
+applies the PRAGMA set once when that connection is opened and relies on the
+``sqlite3`` per-connection statement cache so repeated SQL is prepared once.
+
+Connections are never shared between threads.  A pooled connection is
+re-opened transparently when it was closed by its caller, when the process
+forked, or when the database file was replaced on disk (a different inode), so
+stores keep the semantics they had with short-lived connections.
+
+Busy handling is unified with ``_PersistenceRepositoryBase._with_write_retries``
+through :func:`is_sqlite_busy_error` and :func:`busy_retry_delay_seconds`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from time import sleep
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+
+logger = logging.getLogger(__name__)
+_T = TypeVar("_T")
+
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+_RECENT_POOL_LIMIT = 32
+
+
+def _env_optional_int(name: str, minimum: int, maximum: int) -> Optional[int]:
+    raw = os.getenv(name)
+    if raw in (None, ""):
+        return None
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return None
+    return max(minimum, min(maximum, value))
+
+
+@dataclass(frozen=True)
+class SQLitePragmas:
+    """PRAGMA set applied once when a pooled connection is opened.
+
+    ``mmap_size_bytes`` and ``cache_size_kib`` default to SQLite's own values
+    unless ``SQLITE_MMAP_SIZE_BYTES`` / ``SQLITE_CACHE_SIZE_KIB`` are set.
+    """
+
+    busy_timeout_ms: int = 30_000
+    journal_mode: Optional[str] = "WAL"
+    synchronous: Optional[str] = None
+    foreign_keys: Optional[bool] = None
+    mmap_size_bytes: Optional[int] = None
+    cache_size_kib: Optional[int] = None
+
+    @classmethod
+    def from_env(cls, **overrides: Any) -> "SQLitePragmas":
+        values: dict[str, Any] = {
+            "mmap_size_bytes": _env_optional_int("SQLITE_MMAP_SIZE_BYTES", 0, 1 << 40),
+            "cache_size_kib": _env_optional_int("SQLITE_CACHE_SIZE_KIB", 0, 1 << 30),
+        }
+        values.update(overrides)
+        return cls(**values)
+
+    def statements(self) -> tuple[str, ...]:
+        statements: list[str] = []
+        if self.foreign_keys is not None:
+            statements.append(f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}")
+        statements.append(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        if self.journal_mode is not None:
+            statements.append(f"PRAGMA journal_mode = {self.journal_mode}")
+        if self.synchronous is not None:
+            statements.append(f"PRAGMA synchronous = {self.synchronous}")
+        if self.mmap_size_bytes is not None:
+            statements.append(f"PRAGMA mmap_size = {int(self.mmap_size_bytes)}")
+        if self.cache_size_kib is not None:
+            # Negative cache_size values are expressed in KiB.
+            statements.append(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+        return tuple(statements)
+
+
+def is_sqlite_busy_error(exc: BaseException) -> bool:
+    """Return True for transient writer contention worth a bounded retry."""
+
+    if not isinstance(exc, sqlite3.OperationalError):
+        return False
+    message = str(exc).lower()
+    return "locked" in message or "busy" in message
+
+
+def busy_retry_delay_seconds(base_delay_seconds: float, attempt: int) -> float:
+    """Exponential backoff shared by sync stores and async repositories."""
+
+    return float(base_delay_seconds) * (2 ** attempt)
+
+
+class _PooledSlot:
+    __slots__ = ("connection", "pid", "file_identity", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection, pid: int, file_identity: Optional[tuple[int, ...]]) -> None:
+        self.connection = connection
+        self.pid = pid
+        self.file_identity = file_identity
+
+
+class SQLiteConnectionPool:
+    """Per-thread persistent connections to one SQLite database."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        timeout_seconds: float = 30.0,
+        pragmas: Optional[SQLitePragmas] = None,
+        uri: Optional[str] = None,
+        row_factory: Any = None,
+        cached_statements: int = DEFAULT_STATEMENT_CACHE_SIZE,
+    ) -> None:
+        if timeout_seconds <= 0.0:
+            raise ValueError("SQLite timeout must be positive")
+        self.path = Path(path)
+        self.timeout_seconds = float(timeout_seconds)
+        self.pragmas = pragmas or SQLitePragmas(busy_timeout_ms=max(1, int(self.timeout_seconds * 1000)))
+        self.uri = uri
+        self._immutable = uri is not None and "immutable=1" in uri
+        self.row_factory = row_factory
+        self.cached_statements = int(cached_statements)
+        self._local = threading.local()
+        self._slots: "weakref.WeakSet[_PooledSlot]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._counters = {
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "connections_closed": 0,
+            "reopened_after_file_change": 0,
+            "reopened_after_close": 0,
+            "reopened_after_fork": 0,
+            "reopened_after_leaked_transaction": 0,
+            "overflow_connections": 0,
+            "busy_retries": 0,
+            "busy_failures": 0,
+        }
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it when needed."""
+
+        slot: Optional[_PooledSlot] = getattr(self._local, "slot", None)
+        if slot is not None:
+            reason = self._stale_reason(slot)
+            if reason is None:
+                self._count("connections_reused")
+                return slot.connection
+            self._count(reason)
+            self._discard(slot, close=reason != "reopened_after_fork")
+        return self._open().connection
+
+    @contextmanager
+    def checkout(self) -> Iterator[sqlite3.Connection]:
+        """Borrow this thread's connection for one operation.
+
+        Any transaction still open when the block exits is rolled back.  A
+        nested checkout on the same thread gets its own short-lived connection
+        so it can never commit or roll back the enclosing operation.
+        """
+
+        if getattr(self._local, "checked_out", False):
+            self._count("overflow_connections")
+            connection = self._connect_raw()
+            try:
+                yield connection
+            finally:
+                connection.close()
+            return
+        connection = self.connection()
+        self._local.checked_out = True
+        try:
+            yield connection
+        finally:
+            self._local.checked_out = False
+            try:
+                if connection.in_transaction:
+                    connection.rollback()
+            except sqlite3.ProgrammingError:
+                pass
+            except sqlite3.Error:
+                slot = getattr(self._local, "slot", None)
+                if slot is not None and slot.connection is connection:
+                    self._discard(slot)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Checkout with ``with sqlite3.Connection`` commit/rollback semantics."""
+
+        with self.checkout() as connection:
+            with connection:
+                yield connection
+
+    def run_with_busy_retries(
+        self,
+        operation: Callable[[], _T],
+        *,
+        label: str,
+        retries: int,
+        base_delay_seconds: float,
+        sleeper: Callable[[float], None] = sleep,
+    ) -> _T:
+        """Run ``operation`` and count retries against this pool's metrics."""
+
+        return run_with_busy_retries(
+            operation,
+            label=label,
+            retries=retries,
+            base_delay_seconds=base_delay_seconds,
+            sleeper=sleeper,
+            on_retry=lambda: self._count("busy_retries"),
+            on_failure=lambda: self._count("busy_failures"),
+        )
+
+    def close_thread_connection(self) -> None:
+        slot = getattr(self._local, "slot", None)
+        if slot is not None:
+            self._discard(slot)
+
+    def close_all(self) -> None:
+        """Close every pooled connection; threads re-open lazily afterwards."""
+
+        with self._lock:
+            slots = list(self._slots)
+            self._slots.clear()
+        for slot in slots:
+            self._close_slot(slot)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            payload: dict[str, Any] = dict(self._counters)
+            payload["open_connections"] = len(self._slots)
+        payload["path"] = str(self.path)
+        payload["statement_cache_size"] = self.cached_statements
+        payload["pragmas"] = list(self.pragmas.statements())
+        return payload
+
+    def _connect_raw(self) -> sqlite3.Connection:
+        target: str | Path = self.uri if self.uri is not None else self.path
+        connection = sqlite3.connect(
+            target,
+            timeout=self.timeout_seconds,
+            uri=self.uri is not None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        try:
+            if self.row_factory is not None:
+                connection.row_factory = self.row_factory
+            for statement in self.pragmas.statements():
+                connection.execute(statement)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def _open(self) -> _PooledSlot:
+        connection = self._connect_raw()
+        slot = _PooledSlot(connection, os.getpid(), self._file_identity())
+        self._local.slot = slot
+        with self._lock:
+            self._slots.add(slot)
+            self._counters["connections_opened"] += 1
+        return slot
+
+    def _stale_reason(self, slot: _PooledSlot) -> Optional[str]:
+        if slot.pid != os.getpid():
+            return "reopened_after_fork"
+        try:
+            in_transaction = slot.connection.in_transaction
+        except sqlite3.ProgrammingError:
+            return "reopened_after_close"
+        if in_transaction and not getattr(self._local, "checked_out", False):
+            # A caller left a transaction open; close it like the former
+            # per-operation connections did instead of inheriting its locks.
+            return "reopened_after_leaked_transaction"
+        if slot.file_identity != self._file_identity():
+            return "reopened_after_file_change"
+        return None
+
+    def _file_identity(self) -> Optional[tuple[int, ...]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        if self._immutable:
+            # Immutable readers never notice in-place rewrites, so any content
+            # change must hand out a fresh connection.
+            return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        return (stat.st_dev, stat.st_ino)
+
+    def _discard(self, slot: _PooledSlot, *, close: bool = True) -> None:
+        if getattr(self._local, "slot", None) is slot:
+            self._local.slot = None
+        with self._lock:
+            self._slots.discard(slot)
+        if close:
+            # A connection inherited across fork() belongs to the parent and
+            # must not be closed (or used) by the child.
+            self._close_slot(slot)
+
+    def _close_slot(self, slot: _PooledSlot) -> None:
+        try:
+            slot.connection.close()
+        except sqlite3.Error:
+            pass
+        self._count("connections_closed")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+
+def run_with_busy_retries(
+    operation: Callable[[], _T],
+    *,
+    label: str,
+    retries: int,
+    base_delay_seconds: float,
+    sleeper: Callable[[float], None] = sleep,
+    on_retry: Optional[Callable[[], None]] = None,
+    on_failure: Optional[Callable[[], None]] = None,
+) -> _T:
+    """Run an idempotent SQLite operation with bounded busy recovery."""
+
+    if retries < 0:
+        raise ValueError("SQLite retries cannot be negative")
+    for attempt in range(retries + 1):
+        try:
+            return operation()
+        except sqlite3.OperationalError as exc:
+            if not is_sqlite_busy_error(exc) or attempt >= retries:
+                if on_failure is not None and is_sqlite_busy_error(exc):
+                    on_failure()
+                raise
+            delay = busy_retry_delay_seconds(base_delay_seconds, attempt)
+            logger.warning("SQLite busy during %s; retry %s/%s in %.3fs", label, attempt + 1, retries, delay)
+            if on_retry is not None:
+                on_retry()
+            sleeper(delay)
+    raise AssertionError("unreachable SQLite retry state")
+
+
+_POOLS: "weakref.WeakValueDictionary[tuple[Any, ...], SQLiteConnectionPool]" = weakref.WeakValueDictionary()
+_RECENT_POOLS: "OrderedDict[tuple[Any, ...], SQLiteConnectionPool]" = OrderedDict()
+_POOLS_LOCK = threading.Lock()
+
+
+def shared_sqlite_pool(
+    path: str | Path,
+    *,
+    timeout_seconds: float = 30.0,
+    pragmas: Optional[SQLitePragmas] = None,
+    uri: Optional[str] = None,
+    row_factory: Any = None,
+) -> SQLiteConnectionPool:
+    """Return the process-wide pool for a database and connection profile.
+
+    Pools stay alive while a store references them; the most recently used
+    ones are also kept warm so stores constructed per call still reuse their
+    connections.  Older pools are released and their connections closed.
+    """
+
+    resolved_pragmas = pragmas or SQLitePragmas.from_env(busy_timeout_ms=max(1, int(float(timeout_seconds) * 1000)))
+    key = (str(Path(path).absolute()), float(timeout_seconds), resolved_pragmas, uri, row_factory)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = SQLiteConnectionPool(
+                path,
+                timeout_seconds=timeout_seconds,
+                pragmas=resolved_pragmas,
+                uri=uri,
+                row_factory=row_factory,
+            )
+            _POOLS[key] = pool
+        _RECENT_POOLS[key] = pool
+        _RECENT_POOLS.move_to_end(key)
+        while len(_RECENT_POOLS) > _RECENT_POOL_LIMIT:
+            _RECENT_POOLS.popitem(last=False)
+        return pool
+
+
+def sqlite_access_metrics() -> dict[str, Any]:
+    """Aggregate connection metrics over every live pool."""
+
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    totals: dict[str, int] = {}
+    for pool in pools:
+        for name, value in pool.metrics().items():
+            if isinstance(value, int) and not isinstance(value, bool) and name != "statement_cache_size":
+                totals[name] = totals.get(name, 0) + value
+    return {"pool_count": len(pools), **totals}
+
+
+def close_all_sqlite_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _RECENT_POOLS.clear()
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_all_sqlite_pools)
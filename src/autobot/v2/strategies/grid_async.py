@@ -134,6 +134,15 @@ class GridStrategyAsync(StrategyAsync):
             "cold_start",
             {},
         )
+        # (snapshot version, setup key, blocked, reason, details) of the last
+        # published gate this instance turned into a decision.
+        self._published_setup_gate: tuple[int, Any, bool, str, dict[str, Any]] = (
+            -1,
+            None,
+            False,
+            "cold_start",
+            {},
+        )
         self._paper_execution_router_enabled = self._read_bool_config(
             "paper_execution_router_enabled",
             "PAPER_EXECUTION_ROUTER_ENABLED",
@@ -722,10 +731,15 @@ class GridStrategyAsync(StrategyAsync):
             if engine is None:
                 engine = PairStrategyHealthEngine()
                 setattr(orchestrator, "pair_strategy_health_engine", engine)
-            persistence = getattr(orchestrator, "persistence", None)
-            db_path = getattr(persistence, "db_path", "data/autobot_state.db")
-            snapshot = engine.build_snapshot_from_state_db(db_path, paper_mode=True)
-            by_symbol = snapshot.get("by_symbol", {}) if isinstance(snapshot, dict) else {}
+            publisher = getattr(orchestrator, "setup_gate_publisher", None)
+            published = publisher.snapshot if publisher is not None else None
+            if published is not None and published.version > 0:
+                by_symbol = published.health_by_symbol
+            else:
+                persistence = getattr(orchestrator, "persistence", None)
+                db_path = getattr(persistence, "db_path", "data/autobot_state.db")
+                snapshot = engine.build_snapshot_from_state_db(db_path, paper_mode=True)
+                by_symbol = snapshot.get("by_symbol", {}) if isinstance(snapshot, dict) else {}
             context = by_symbol.get(symbol_key(getattr(self.instance.config, "symbol", None)))
             if not isinstance(context, dict):
                 return False, "no_health_context"
@@ -747,6 +761,12 @@ class GridStrategyAsync(StrategyAsync):
         The optimizer does not blame a market pair. It only blocks the currently
         running grid setup when realized paper evidence says that this setup should
         be paused or adjusted while shadow variants keep learning separately.
+
+        When the orchestrator runs a ``SetupGatePublisher`` the optimizer verdict
+        is read from its published snapshot; otherwise it is computed inline and
+        cached for ``setup_optimizer_gate_ttl_s``.  The publisher refreshes on
+        the same environment TTL by default, so a per-instance
+        ``setup_optimizer_gate_ttl_s`` only applies to the inline path.
         """
         if not self._setup_optimizer_execution_gate:
             return False, "disabled", {}
@@ -755,6 +775,10 @@ class GridStrategyAsync(StrategyAsync):
             if orchestrator is None or not getattr(orchestrator, "paper_mode", False):
                 return False, "not_paper", {}
 
+            publisher = getattr(orchestrator, "setup_gate_publisher", None)
+            if publisher is not None:
+                return self._published_setup_optimizer_gate(publisher, current_price)
+
             now = time.monotonic()
             cached_at, cached_blocked, cached_reason, cached_details = self._setup_optimizer_gate_cache
             if now - cached_at <= self._setup_optimizer_gate_ttl_s:
@@ -806,37 +830,83 @@ class GridStrategyAsync(StrategyAsync):
                 shadow=shadow if isinstance(shadow, dict) else {},
                 paper_mode=True,
             )
-            selected = plan.selected_variant.to_dict() if plan.selected_variant else {}
-            paper_execution = self._maybe_promote_grid_shadow_candidate(
-                plan=plan,
-                selected=selected,
-                current_price=current_price,
-            )
-            details = {
-                "status": plan.status,
-                "action": plan.recommended_action,
-                "selected_variant": selected.get("name"),
-                "selected_score": selected.get("score"),
-                "health_status": (health or {}).get("status") if isinstance(health, dict) else None,
-                "closed_trades": (health or {}).get("closed_trades") if isinstance(health, dict) else None,
-                "net_pnl_eur": (health or {}).get("net_pnl_eur") if isinstance(health, dict) else None,
-                "profit_factor": (health or {}).get("profit_factor") if isinstance(health, dict) else None,
-                "paper_execution": paper_execution,
-            }
-            blocking_actions = {
-                "paper_shadow_variant_outperforms_current_setup",
-                "pause_current_setup_and_test_selected_variant_in_paper",
-                "test_selected_variant_in_paper_shadow",
-            }
-            blocked = plan.status in {"pause_current", "adjust"} or plan.recommended_action in blocking_actions
-            if paper_execution.get("block_new_entries"):
-                blocked = True
-            reason = f"{plan.status}:{plan.recommended_action}"
+            blocked, reason, details = self._setup_optimizer_decision(plan, health, current_price)
             return self._cache_setup_optimizer_gate(now, blocked, reason, details)
         except Exception as exc:
             logger.debug("Setup optimizer gate unavailable: %s", exc)
             return False, "unavailable", {"error": str(exc)}
 
+    def _published_setup_optimizer_gate(
+        self,
+        publisher: Any,
+        current_price: Optional[float],
+    ) -> tuple[bool, str, dict[str, Any]]:
+        """Read this setup's gate from the publisher snapshot (no I/O).
+
+        The decision, including a possible shadow promotion, is taken once per
+        published version; until the first publication covers this setup the
+        gate stays open, like an unavailable optimizer.
+        """
+        from ..pair_strategy_health import symbol_key
+        from ..setup_gate_publisher import setup_gate_key
+
+        symbol = symbol_key(getattr(self.instance.config, "symbol", None))
+        if not symbol or symbol == "UNKNOWN":
+            return False, "unknown_symbol", {}
+        key = setup_gate_key(symbol, self.range_percent, self.num_levels, self.max_capital_per_level)
+        publisher.register(key)
+        snapshot = publisher.snapshot
+        gate = snapshot.gate(key)
+        if gate is None:
+            return False, "gate_pending", {"gate_version": snapshot.version}
+
+        version, seen_key, blocked, reason, details = self._published_setup_gate
+        if version != snapshot.version or seen_key != key:
+            if gate.plan is None:
+                blocked, reason = False, gate.status
+                details = {"error": gate.error} if gate.error else {}
+            else:
+                blocked, reason, details = self._setup_optimizer_decision(gate.plan, gate.health, current_price)
+            self._published_setup_gate = (snapshot.version, key, blocked, reason, details)
+        return blocked, reason, {
+            **details,
+            "gate_version": snapshot.version,
+            "gate_age_s": round(gate.age_seconds(), 3),
+        }
+
+    def _setup_optimizer_decision(
+        self,
+        plan: Any,
+        health: Any,
+        current_price: Optional[float],
+    ) -> tuple[bool, str, dict[str, Any]]:
+        selected = plan.selected_variant.to_dict() if plan.selected_variant else {}
+        paper_execution = self._maybe_promote_grid_shadow_candidate(
+            plan=plan,
+            selected=selected,
+            current_price=current_price,
+        )
+        details = {
+            "status": plan.status,
+            "action": plan.recommended_action,
+            "selected_variant": selected.get("name"),
+            "selected_score": selected.get("score"),
+            "health_status": (health or {}).get("status") if isinstance(health, dict) else None,
+            "closed_trades": (health or {}).get("closed_trades") if isinstance(health, dict) else None,
+            "net_pnl_eur": (health or {}).get("net_pnl_eur") if isinstance(health, dict) else None,
+            "profit_factor": (health or {}).get("profit_factor") if isinstance(health, dict) else None,
+            "paper_execution": paper_execution,
+        }
+        blocking_actions = {
+            "paper_shadow_variant_outperforms_current_setup",
+            "pause_current_setup_and_test_selected_variant_in_paper",
+            "test_selected_variant_in_paper_shadow",
+        }
+        blocked = plan.status in {"pause_current", "adjust"} or plan.recommended_action in blocking_actions
+        if paper_execution.get("block_new_entries"):
+            blocked = True
+        return blocked, f"{plan.status}:{plan.recommended_action}", details
+
     def _strategy_governance_blocks_entry(self, current_price: Optional[float] = None) -> tuple[bool, str, dict[str, Any]]:
         try:
             orchestrator = getattr(self.instance, "orchestrator", None)
@@ -1,9 +1,19 @@
 import pytest
 
+import gzip
 import json
+import os
+import threading
+import time
 from pathlib import Path
 
-from autobot.v2.decision_journal import DecisionJournal, journal_from_env
+from autobot.v2.decision_journal import (
+    DecisionJournal,
+    build_rejected_opportunity_report,
+    iter_journal_records,
+    journal_from_env,
+    journal_segments,
+)
 
 
 pytestmark = pytest.mark.unit
@@ -103,3 +113,102 @@ def test_decision_journal_from_env_respects_flag_off(monkeypatch, tmp_path):
 
     assert wrote is False
     assert not out.exists()
+
+
+def test_decision_journal_flush_makes_queued_records_visible_in_order(tmp_path):
+    out = tmp_path / "ordered.jsonl"
+    journal = DecisionJournal(enabled=True, journal_path=str(out), flush_every=1000)
+
+    for idx in range(50):
+        assert journal.log(decision_type="guard_decision", source="test", context={"idx": idx}) is True
+    assert journal.flush(timeout=5.0) is True
+
+    rows = _read_jsonl(out)
+    assert [row["context"]["idx"] for row in rows] == list(range(50))
+    status = journal.get_status()
+    assert status["written"] == 50
+    assert status["pending"] == 0
+    assert status["dropped"] == 0
+    journal.close()
+    assert journal.log(decision_type="guard_decision", source="test") is False
+
+
+def test_decision_journal_ring_drops_oldest_and_counts_them(tmp_path):
+    out = tmp_path / "bounded.jsonl"
+    journal = DecisionJournal(enabled=True, journal_path=str(out), max_pending=3)
+    gate = threading.Event()
+    original = journal._write_batch
+
+    def blocked_write(batch, *, force_flush):
+        gate.wait(5.0)
+        original(batch, force_flush=force_flush)
+
+    journal._write_batch = blocked_write
+    journal.log(decision_type="guard_decision", source="test", context={"idx": 0})
+    deadline = time.monotonic() + 5.0
+    while not journal._busy and time.monotonic() < deadline:
+        time.sleep(0.001)
+    for idx in range(1, 8):
+        journal.log(decision_type="guard_decision", source="test", context={"idx": idx})
+
+    status = journal.get_status()
+    assert status["pending"] == 3
+    assert status["dropped"] == 4
+    assert status["lag_ms"] >= 0.0
+    gate.set()
+    journal.close()
+
+    assert [row["context"]["idx"] for row in _read_jsonl(out)] == [0, 5, 6, 7]
+
+
+def test_decision_journal_rotates_by_size_into_compressed_segments(tmp_path):
+    out = tmp_path / "rotating.jsonl"
+    journal = DecisionJournal(enabled=True, journal_path=str(out), rotate_max_bytes=600)
+
+    for idx in range(20):
+        journal.log(
+            decision_type="rejected_opportunity",
+            source="test",
+            symbols=["XXBTZEUR"],
+            reasons=["validation_guard_block"],
+            context={"idx": idx},
+        )
+    journal.close()
+
+    segments = sorted(tmp_path.glob("rotating.*.jsonl.gz"))
+    assert segments
+    assert journal.get_status()["rotations"] == len(segments)
+    with gzip.open(segments[0], "rt", encoding="utf-8") as fh:
+        assert json.loads(fh.readline())["context"]["idx"] == 0
+    assert [rec["context"]["idx"] for rec in iter_journal_records(str(out))] == list(range(20))
+    report = build_rejected_opportunity_report(journal_path=str(out), max_records=1)
+    assert report["total_rejections"] == 20
+    assert report["records"][0]["context"]["idx"] == 19
+
+
+def test_decision_journal_rotates_on_utc_day_change(tmp_path):
+    out = tmp_path / "daily.jsonl"
+    out.write_text(json.dumps({"decision_type": "guard_decision", "timestamp": "2020-01-01T00:00:00+00:00"}) + "\n")
+    os.utime(out, (1577836800, 1577836800))
+
+    journal = DecisionJournal(enabled=True, journal_path=str(out))
+    journal.log(decision_type="guard_decision", source="test")
+    journal.close()
+
+    assert len(list(tmp_path.glob("daily.*.jsonl.gz"))) == 1
+    assert len(_read_jsonl(out)) == 1
+    assert len(list(iter_journal_records(str(out)))) == 2
+
+
+def test_journal_reader_skips_segments_closed_before_window(tmp_path):
+    out = tmp_path / "decision_journal.jsonl"
+    old = tmp_path / "decision_journal.20200101T000000Z.0000.jsonl.gz"
+    with gzip.open(old, "wt", encoding="utf-8") as fh:
+        fh.write(json.dumps({"decision_type": "rejected_opportunity", "timestamp": "2019-12-31T23:00:00+00:00"}) + "\n")
+    out.write_text("not json\n", encoding="utf-8")
+
+    assert journal_segments(str(out)) == [old, out]
+    assert journal_segments(str(out), since=time.time() - 3600) == [out]
+    assert list(iter_journal_records(str(out))) == [
+        {"decision_type": "rejected_opportunity", "timestamp": "2019-12-31T23:00:00+00:00"}
+    ]
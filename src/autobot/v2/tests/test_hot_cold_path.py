@@ -8,6 +8,11 @@ Coverage:
         - Pre-allocated array never grows
         - Singleton accessor
 
+    StageLatencyRecorder / LatencyHistogram:
+        - Histogram percentiles within one sub-bucket of the exact value
+        - Chained laps broken down by symbol and strategy, bounded key set
+        - HotPathLatencyExporter writes an atomic JSON snapshot
+
     ColdPathScheduler:
         - Fire-and-forget: schedule() is non-blocking
         - Periodic task: schedule_periodic()
@@ -30,6 +35,8 @@ from __future__ import annotations
 
 import asyncio
 import gc
+import json
+import random
 import statistics
 import time
 from datetime import datetime, timezone, timezone
@@ -41,7 +48,13 @@ pytestmark = pytest.mark.unit
 
 pytest_asyncio = pytest.importorskip("pytest_asyncio")
 
-from ..hot_path_optimizer import HotPathOptimizer, get_hot_path_optimizer
+from ..hot_path_optimizer import (
+    HotPathLatencyExporter,
+    HotPathOptimizer,
+    LatencyHistogram,
+    StageLatencyRecorder,
+    get_hot_path_optimizer,
+)
 from ..cold_path_scheduler import ColdPathScheduler, get_cold_path_scheduler
 
 # ---------------------------------------------------------------------------
@@ -201,6 +214,71 @@ class TestHotPathOptimizerLatency:
         assert a is b
 
 
+class TestStageLatencyRecorder:
+    """Per-stage HDR histograms and their cold-path export."""
+
+    def test_histogram_percentiles_within_bucket_precision(self):
+        rng = random.Random(7)
+        values = sorted(rng.randint(1, 5_000_000) for _ in range(10_000))
+        hist = LatencyHistogram()
+        for value in values:
+            hist.record(value)
+
+        for quantile in (0.5, 0.9, 0.99, 0.999):
+            exact = values[int(quantile * len(values) + 0.5) - 1]
+            estimate = hist.percentile_ns(quantile)
+            assert exact <= estimate <= exact * 1.07
+        assert hist.snapshot()["max_ns"] == values[-1]
+        assert hist.percentile_ns(1.0) == values[-1]
+
+        hist.reset()
+        assert hist.snapshot()["count"] == 0
+        assert hist.percentile_ns(0.99) == 0
+
+    def test_laps_chain_and_break_down_by_symbol_and_strategy(self):
+        stages = StageLatencyRecorder(key_limit=2)
+        t0 = stages.mark()
+        t1 = stages.lap("decode", t0, "XBT/EUR")
+        t2 = stages.lap("strategy", t1, "XBT/EUR", "grid")
+        assert t0 <= t1 <= t2
+        stages.lap("strategy", t2, "ETH/EUR", "trend")
+        stages.lap("strategy", t2, "SOL/EUR", "mean_reversion")
+        stages.record("queue_wait", 1_500, "XBT/EUR", "grid")
+
+        snap = stages.snapshot()
+        assert set(snap["stages"]) == {"decode", "strategy", "queue_wait"}
+        assert snap["stages"]["strategy"]["count"] == 3
+        assert snap["stages"]["queue_wait"]["max_ns"] == 1_500
+        assert set(snap["by_symbol"]["strategy"]) == {"XBT/EUR", "ETH/EUR", "__other__"}
+        assert set(snap["by_strategy"]["strategy"]) == {"grid", "trend", "__other__"}
+        assert "decode" not in snap["by_strategy"]
+
+        stages.enabled = False
+        stages.lap("decode", stages.mark(), "XBT/EUR")
+        assert stages.snapshot()["stages"]["decode"]["count"] == 1
+
+    def test_reset_stats_clears_stage_histograms(self):
+        opt = HotPathOptimizer()
+        opt.stages.lap("decode", opt.stages.mark())
+        opt.reset_stats()
+        assert opt.stages.snapshot()["stages"] == {}
+
+    def test_exporter_writes_json_snapshot(self, tmp_path):
+        opt = HotPathOptimizer(max_samples=64)
+        opt.record_tick(opt.start_tick())
+        opt.stages.record("strategy_on_price", 2_000, "XBT/EUR", "grid")
+        exporter = HotPathLatencyExporter(opt, tmp_path / "latency" / "hot_path.json")
+
+        snapshot = exporter.export()
+
+        assert exporter.last_snapshot is snapshot
+        written = json.loads((tmp_path / "latency" / "hot_path.json").read_text())
+        assert written["tick"]["tick_count"] == 1
+        assert written["stages"]["strategy_on_price"]["p99_ns"] == 2_000
+        assert written["by_strategy"]["strategy_on_price"]["grid"]["count"] == 1
+        assert not (tmp_path / "latency" / "hot_path.json.tmp").exists()
+
+
 # ===========================================================================
 # ColdPathScheduler — Unit tests
 # ===========================================================================
@@ -500,6 +578,19 @@ class TestInstanceHotPath:
         stored_ts, _ = instance._price_history[-1]
         assert stored_ts is ts
 
+    @pytest.mark.asyncio
+    async def test_on_price_update_records_stage_breakdown(self, instance):
+        opt = HotPathOptimizer(max_samples=64)
+        instance.attach_hot_optimizer(opt)
+        instance._strategy = MagicMock()
+
+        await instance.on_price_update(_make_ticker(50_000.0))
+
+        snap = opt.stages.snapshot()
+        assert snap["stages"]["instance_prepare"]["count"] == 1
+        assert snap["by_symbol"]["strategy_on_price"]["XBT/EUR"]["count"] == 1
+        assert snap["by_strategy"]["strategy_on_price"]["grid"]["count"] == 1
+
     @pytest.mark.asyncio
     async def test_on_price_update_records_latency_when_optimizer_attached(
         self, instance
@@ -616,6 +707,33 @@ class TestHotPathLatencyBenchmark:
             f"record_tick P99 overhead {p99_ns} ns exceeds 1 µs"
         )
 
+    def test_stage_breakdown_overhead_per_tick_below_budget(self):
+        """
+        A full tick breakdown (5 laps, 4 of them keyed by symbol / strategy)
+        must stay < 20 µs — CI-safe; roughly 1 µs per lap on a desktop CPU.
+        """
+        symbols = [f"SYM{i}/EUR" for i in range(32)]
+        N = 4_096
+        batch_us = []
+        for _batch in range(5):
+            stages = StageLatencyRecorder()
+            start = time.perf_counter_ns()
+            for i in range(N):
+                symbol = symbols[i & 31]
+                mark = stages.mark()
+                mark = stages.lap("ws_decode", mark)
+                mark = stages.lap("ws_ticker_dispatch", mark, symbol)
+                mark = stages.lap("instance_prepare", mark, symbol)
+                mark = stages.lap("strategy_on_price", mark, symbol, "grid")
+                stages.lap("router_execute", mark, symbol, "grid")
+            batch_us.append((time.perf_counter_ns() - start) / N / 1_000)
+
+        per_tick_us = statistics.median(batch_us)
+        print(f"\n⚡ stage breakdown overhead: {per_tick_us:.3f} µs/tick")
+        assert per_tick_us < 20.0, (
+            f"stage breakdown costs {per_tick_us:.2f} µs per tick (budget 20 µs)"
+        )
+
 
 # ===========================================================================
 # Integration — ColdPathScheduler + hot path together
@@ -31,7 +31,9 @@ Coverage:
 from __future__ import annotations
 
 import asyncio
+import socket
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Any
@@ -489,6 +491,130 @@ async def test_dispatcher_resubscribe_book_converts_symbol() -> None:
     dispatcher._ws.resubscribe_book.assert_awaited_once_with("XBT/EUR")
 
 
+def _mock_ws_dispatcher(buffer_size: int = 256) -> Any:
+    from autobot.v2.ring_buffer_dispatcher import RingBufferDispatcher
+
+    dispatcher = RingBufferDispatcher(buffer_size=buffer_size)
+    dispatcher._ws = MagicMock()
+    dispatcher._ws.add_ticker_callback = MagicMock()
+    dispatcher._ws.subscribe_ticker = AsyncMock()
+    dispatcher._ws.is_connected = MagicMock(return_value=True)
+    return dispatcher
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+async def test_idle_consumer_parks_until_write() -> None:
+    """An empty buffer parks the consumer instead of re-polling it."""
+    dispatcher = _mock_ws_dispatcher()
+    await dispatcher.subscribe("XBT/EUR", "inst-idle")
+    received: list[Any] = []
+
+    async def _cb(data: Any) -> None:
+        received.append(data)
+
+    task = asyncio.create_task(dispatcher.run_consumer("inst-idle", _cb))
+    try:
+        await asyncio.sleep(0.05)
+        assert dispatcher.stats["consumer_parks"] == 1
+        assert dispatcher.stats["parked_consumers"] == 1
+
+        for price in (1.0, 2.0, 3.0):
+            dispatcher._write_ticker("XBT/EUR", _make_ticker(price=price))
+        await _wait_until(lambda: len(received) == 3)
+
+        stats = dispatcher.stats
+        assert [item["price"] for item in received] == [1.0, 2.0, 3.0]
+        assert stats["consumer_wakeups"] == 1
+        assert stats["consumer_parks"] == 2
+        assert stats["wakeup_latency_p99_us"] > 0.0
+        assert 0.0 < stats["consumer_utilization"] < 1.0
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert dispatcher.stats["parked_consumers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_timed_out_parks_do_not_leak_waiters() -> None:
+    dispatcher = _mock_ws_dispatcher()
+    await dispatcher.subscribe("ADA/EUR", "inst-poll")
+    received: list[Any] = []
+
+    async def _cb(data: Any) -> None:
+        received.append(data)
+
+    task = asyncio.create_task(dispatcher.run_consumer("inst-poll", _cb, poll_interval=0.002))
+    try:
+        await _wait_until(lambda: dispatcher.stats["consumer_parks"] >= 20)
+        assert len(dispatcher._pair_waiters.get("ADA/EUR", [])) <= 1
+
+        dispatcher._write_ticker("ADA/EUR", _make_ticker("ADA/EUR"))
+        await _wait_until(lambda: len(received) == 1)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    assert "ADA/EUR" not in dispatcher._pair_waiters
+
+
+@pytest.mark.asyncio
+async def test_write_burst_wakes_each_parked_consumer_once() -> None:
+    dispatcher = _mock_ws_dispatcher()
+    counts = {f"inst-{index}": 0 for index in range(50)}
+    for instance_id in counts:
+        await dispatcher.subscribe("ETH/EUR", instance_id)
+
+    def _counter(instance_id: str):
+        async def _cb(_data: Any) -> None:
+            counts[instance_id] += 1
+
+        return _cb
+
+    tasks = [
+        asyncio.create_task(dispatcher.run_consumer(instance_id, _counter(instance_id)))
+        for instance_id in counts
+    ]
+    try:
+        await _wait_until(lambda: dispatcher.stats["parked_consumers"] == 50)
+        for _ in range(10):
+            dispatcher._write_ticker("ETH/EUR", _make_ticker("ETH/EUR"))
+        await _wait_until(lambda: all(count == 10 for count in counts.values()))
+        assert dispatcher.stats["consumer_wakeups"] == 50
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_consumer_grows_batch_under_burst_and_keeps_order() -> None:
+    dispatcher = _mock_ws_dispatcher(buffer_size=4096)
+    await dispatcher.subscribe("SOL/EUR", "inst-burst")
+    for index in range(1500):
+        dispatcher._write_ticker("SOL/EUR", _make_ticker("SOL/EUR", float(index)))
+    received: list[float] = []
+
+    async def _cb(data: Any) -> None:
+        received.append(data["price"])
+
+    task = asyncio.create_task(dispatcher.run_consumer("inst-burst", _cb))
+    try:
+        await _wait_until(lambda: len(received) == 1500)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert received == [float(index) for index in range(1500)]
+    assert dispatcher.stats["max_poll_batch"] >= 512
+
+
 # ---------------------------------------------------------------------------
 # Performance benchmarks
 # ---------------------------------------------------------------------------
@@ -614,3 +740,91 @@ class TestRingBufferPerformance:
         )
         # At 2000 readers × 1000 ticks, total latency should be reasonable
         assert elapsed_ns < 60_000_000_000, "2000-reader benchmark too slow"
+
+
+async def _polling_consumer(reader: RingBufferReader, callback) -> None:
+    """Former run_consumer loop: re-poll after asyncio.sleep(0) when empty."""
+    while True:
+        messages = reader.poll_batch(64)
+        if messages:
+            for msg in messages:
+                await callback(msg)
+        else:
+            await asyncio.sleep(0)
+
+
+async def _consumer_benchmark(consumers: int, *, event_driven: bool) -> tuple[float, float]:
+    """Return (idle CPU seconds over 0.2 s, p99 arrival-to-callback latency in µs).
+
+    Ticks arrive on a socket from a feeder thread, like WebSocket frames, so
+    the latency includes any delay the consumers impose on the reader.
+    """
+    dispatcher = _mock_ws_dispatcher(buffer_size=1024)
+    loop = asyncio.get_running_loop()
+    latencies: list[int] = []
+
+    async def _cb(data: Any) -> None:
+        latencies.append(time.perf_counter_ns() - data["sent_ns"])
+
+    tasks = []
+    for index in range(consumers):
+        instance_id = f"bench-{index}"
+        reader = await dispatcher.subscribe("XBT/EUR", instance_id)
+        coro = (
+            dispatcher.run_consumer(instance_id, _cb)
+            if event_driven
+            else _polling_consumer(reader, _cb)
+        )
+        tasks.append(asyncio.create_task(coro))
+    await asyncio.sleep(0.05)
+
+    cpu_started = time.process_time()
+    await asyncio.sleep(0.2)
+    idle_cpu = time.process_time() - cpu_started
+
+    ticks = 50
+    sent: list[int] = []
+    receiver, sender = socket.socketpair()
+    receiver.setblocking(False)
+
+    def _on_frame() -> None:
+        receiver.recv(4096)
+        while sent:
+            dispatcher._write_ticker("XBT/EUR", {"sent_ns": sent.pop(0)})
+
+    def _feeder() -> None:
+        for _ in range(ticks):
+            time.sleep(0.01)
+            sent.append(time.perf_counter_ns())
+            sender.send(b"x")
+
+    loop.add_reader(receiver.fileno(), _on_frame)
+    feeder = threading.Thread(target=_feeder)
+    feeder.start()
+    try:
+        await _wait_until(lambda: len(latencies) == ticks * consumers, timeout=60.0)
+    finally:
+        feeder.join()
+        loop.remove_reader(receiver.fileno())
+        receiver.close()
+        sender.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    latencies.sort()
+    return idle_cpu, latencies[int(0.99 * (len(latencies) - 1))] / 1000.0
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("consumers", [10, 100, 1000])
+async def test_event_driven_consumers_idle_cpu_and_p99_latency(consumers: int) -> None:
+    polling_cpu, polling_p99 = await _consumer_benchmark(consumers, event_driven=False)
+    parked_cpu, parked_p99 = await _consumer_benchmark(consumers, event_driven=True)
+
+    print(
+        f"\n  {consumers:>5} consumers  idle CPU polling={polling_cpu * 1000:.1f}ms "
+        f"parked={parked_cpu * 1000:.1f}ms  p99 polling={polling_p99:,.0f}µs parked={parked_p99:,.0f}µs"
+    )
+    assert parked_cpu < polling_cpu / 5
+    assert parked_p99 < 100_000.0
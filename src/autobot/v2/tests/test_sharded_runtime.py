@@ -0,0 +1,418 @@
+"""
+Tests P5 — Sharded multi-process runtime.
+
+Coverage:
+    SharedTickRing:
+        - Round trip of tick records through shared memory
+        - Lapped consumer skips ahead and counts drops
+        - Attaching by name sees the producer's writes
+
+    plan_shards:
+        - Round-robin partition, duplicates ignored, core assignment
+
+    ShardedRuntime (spawned workers):
+        - Ticks reach the shard hosting their symbol, events flow back
+          through the ordered channel, health reports every shard
+        - attach() routes WebSocket tickers ("XBT/EUR") to shards planned
+          on REST symbols ("XXBTZEUR")
+        - The reference handler reports state and never orders
+        - Replay throughput scales with worker count (performance)
+
+    OrchestratorAsync shard ownership:
+        - Symbols with a local instance are not sharded, and sharded
+          symbols get no local instance
+
+    OrchestratorAsync shard sink:
+        - Worker orders pass the kill-switch / risk gate before the router
+          and rejected results are reported
+        - Worker state is whitelisted and validated before persistence
+        - Orders halted by emergency_stop_all resume after the kill-switch
+          acknowledgement
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from .. import orchestrator_async
+from ..api import dashboard
+from ..benchmarks.sharded_replay import HANDLER, run_replay
+from ..order_executor_async import OrderResult
+from ..orchestrator_async import OrchestratorAsync
+from ..ring_buffer_dispatcher import RingBufferDispatcher
+from ..sharded_runtime import (
+    REFERENCE_HANDLER,
+    ShardEvent,
+    SharedTickRing,
+    ShardedRuntime,
+    plan_shards,
+)
+from ..websocket_client import TickerData
+
+pytestmark = pytest.mark.integration
+
+
+def _ticker(symbol: str, price: float) -> TickerData:
+    return TickerData(
+        symbol=symbol,
+        price=price,
+        bid=price - 0.5,
+        ask=price + 0.5,
+        volume_24h=10.0,
+        timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def ring():
+    ring = SharedTickRing(8)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def test_ring_round_trip(ring):
+    ring.write(1, 100.0, 99.5, 100.5, 10.0, 1_700_000_000.0)
+    ring.write(0, 101.0, 100.5, 101.5, 11.0, 1_700_000_001.0)
+
+    records, cursor, dropped = ring.read_batch(0)
+
+    assert cursor == 2 and dropped == 0
+    assert [r[:7] for r in records] == [
+        (0, 1, 100.0, 99.5, 100.5, 10.0, 1_700_000_000.0),
+        (1, 0, 101.0, 100.5, 101.5, 11.0, 1_700_000_001.0),
+    ]
+    assert ring.read_batch(cursor) == ([], 2, 0)
+
+
+def test_lapped_consumer_skips_ahead_and_counts_drops(ring):
+    for i in range(20):
+        ring.write(0, float(i), 0.0, 0.0, 0.0, 0.0)
+
+    records, cursor, dropped = ring.read_batch(0)
+
+    # A full ring keeps size - 1 records: the oldest slot is the next write.
+    assert dropped == 13
+    assert cursor == 20
+    assert [r[0] for r in records] == list(range(13, 20))
+    assert [r[2] for r in records] == [float(i) for i in range(13, 20)]
+
+
+def test_attached_ring_sees_producer_writes(ring):
+    reader = SharedTickRing(8, name=ring.name)
+    try:
+        ring.write(0, 42.0, 41.0, 43.0, 1.0, 0.0)
+        reader.read_seq = 1
+        reader.parked = True
+        assert reader.read_batch(0)[0][0][2] == 42.0
+        assert ring.read_seq == 1
+        assert ring.parked is True
+    finally:
+        reader.close()
+
+    with pytest.raises(ValueError, match="power of 2"):
+        SharedTickRing(6)
+
+
+def test_plan_shards_round_robin_with_cores():
+    plan = plan_shards(["A", "B", "C", "A", "D", "E"], workers=2, cores=[3, 5])
+
+    assert [spec.symbols for spec in plan] == [("A", "C", "E"), ("B", "D")]
+    assert [spec.cores for spec in plan] == [(3,), (5,)]
+    assert len(plan_shards(["A"], workers=4)) == 1
+    assert plan_shards(["A", "B"], workers=2)[0].cores == ()
+    assert plan_shards([], workers=2) == []
+
+
+@pytest.mark.asyncio
+async def test_runtime_routes_ticks_and_returns_events_in_order(monkeypatch):
+    monkeypatch.setenv("SHARDED_REPLAY_WORK", "1")
+    symbols = [f"SYM{i}/EUR" for i in range(4)]
+    runtime = ShardedRuntime(symbols, HANDLER, workers=2, heartbeat_interval=0.05)
+    runtime.start()
+    received = []
+    pump = asyncio.create_task(runtime.run_event_pump(received.append))
+    try:
+        assert runtime.publish(_ticker("UNKNOWN/EUR", 1.0)) is False
+        for i in range(2_000):
+            assert runtime.publish(_ticker(symbols[i % 4], 100.0 + i))
+
+        deadline = time.monotonic() + 60.0
+        while time.monotonic() < deadline:
+            health = runtime.health()
+            if sum(shard["processed"] for shard in health["shards"]) >= 2_000:
+                break
+            await asyncio.sleep(0.05)
+
+        health = runtime.health()
+        assert health["running"] is True
+        assert health["unrouted_ticks"] == 1
+        assert [shard["symbols"] for shard in health["shards"]] == [
+            ["SYM0/EUR", "SYM2/EUR"],
+            ["SYM1/EUR", "SYM3/EUR"],
+        ]
+        for shard in health["shards"]:
+            assert shard["alive"] is True
+            assert shard["pid"] != os.getpid()
+            assert shard["published"] == 1_000
+            assert shard["processed"] == 1_000
+            assert shard["dropped"] == 0
+            assert shard["backlog"] == 0
+        while len(received) < 2 and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+    finally:
+        leftover = await asyncio.to_thread(runtime.stop)
+        await pump
+
+    events = received + leftover
+    assert sorted((e.shard_id, e.kind, e.payload["ticks"]) for e in events) == [
+        (0, "state", 1_000),
+        (1, "state", 1_000),
+    ]
+    assert runtime.health()["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_attach_routes_websocket_pairs_to_rest_symbol_shards(monkeypatch):
+    dispatcher = RingBufferDispatcher()
+    sent = []
+
+    async def fake_subscribe(pair):
+        sent.append(pair)
+
+    monkeypatch.setattr(dispatcher._ws, "_send_subscribe", fake_subscribe)
+    runtime = ShardedRuntime(["XXBTZEUR", "SOLEUR"], HANDLER, workers=1, heartbeat_interval=0.05)
+    runtime.start()
+    try:
+        await runtime.attach(dispatcher)
+        assert sorted(sent) == ["SOL/EUR", "XBT/EUR"]
+        ticker = {"c": ["100.0", "1"], "b": ["99.5", "1", "1"], "a": ["100.5", "1", "1"], "v": ["1", "10"]}
+        await dispatcher._ws._process_ticker("XBT/EUR", ticker)
+        await dispatcher._ws._process_ticker("SOL/EUR", ticker)
+
+        health = runtime.health()
+        assert health["unrouted_ticks"] == 0
+        assert health["shards"][0]["published"] == 2
+        runtime.detach()
+        await dispatcher._ws._process_ticker("XBT/EUR", ticker)
+        assert runtime.health()["shards"][0]["published"] == 2
+    finally:
+        await asyncio.to_thread(runtime.stop)
+
+
+@pytest.mark.asyncio
+async def test_reference_handler_reports_state_and_never_orders(monkeypatch):
+    monkeypatch.setenv("SHARDED_RUNTIME_STATE_EVERY", "5")
+    runtime = ShardedRuntime(["XXBTZEUR", "SOLEUR"], REFERENCE_HANDLER, workers=2, heartbeat_interval=0.05)
+    runtime.start()
+    received = []
+    pump = asyncio.create_task(runtime.run_event_pump(received.append))
+    try:
+        for i in range(10):
+            runtime.publish(_ticker("XXBTZEUR", 100.0 + i))
+            runtime.publish(_ticker("SOLEUR", 20.0 + i))
+        deadline = time.monotonic() + 60.0
+        while len(received) < 4 and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+    finally:
+        leftover = await asyncio.to_thread(runtime.stop)
+        await pump
+
+    events = received + leftover
+    assert {event.kind for event in events} == {"state"}
+    assert sorted(event.payload["instance_id"] for event in events) == [
+        "shard-0-XXBTZEUR", "shard-0-XXBTZEUR", "shard-1-SOLEUR", "shard-1-SOLEUR",
+    ]
+    assert set(events[0].payload) == {
+        "instance_id", "status", "current_capital", "allocated_capital", "win_count", "loss_count",
+    }
+
+
+@pytest.mark.asyncio
+async def test_sharded_symbols_and_local_instances_do_not_overlap(monkeypatch, caplog):
+    started = []
+
+    class _Runtime:
+        def __init__(self, symbols, handler, *, workers, cores):
+            started.append(list(symbols))
+
+        def start(self):
+            pass
+
+        async def attach(self, dispatcher):
+            pass
+
+        async def run_event_pump(self, sink):
+            pass
+
+    monkeypatch.setattr(orchestrator_async, "ShardedRuntime", _Runtime)
+    monkeypatch.setenv("SHARDED_RUNTIME_WORKERS", "2")
+    monkeypatch.setenv("SHARDED_RUNTIME_HANDLER", REFERENCE_HANDLER)
+    monkeypatch.setenv("SHARDED_RUNTIME_SYMBOLS", "XXBTZEUR,SOLEUR")
+    orchestrator = OrchestratorAsync.__new__(OrchestratorAsync)
+    orchestrator._instances = {"local": SimpleNamespace(config=SimpleNamespace(symbol="XXBTZEUR"))}
+    orchestrator.ring_dispatcher = object()
+    orchestrator.background_tasks = SimpleNamespace(start=lambda factories: None)
+
+    with caplog.at_level(logging.WARNING):
+        await orchestrator._start_sharded_runtime()
+
+    assert started == [["SOLEUR"]]
+    assert "XXBTZEUR already has a local instance" in caplog.text
+
+    # Once SOLEUR is sharded, no local instance may consume it too.
+    orchestrator.sharded_runtime = ShardedRuntime(["SOLEUR"], REFERENCE_HANDLER, workers=1)
+    orchestrator.config = {"max_instances": 10}
+    orchestrator.instance_activation_manager = None
+    assert await orchestrator.create_instance(SimpleNamespace(symbol="SOLEUR")) is None
+    assert list(orchestrator._instances) == ["local"]
+
+
+class _Router:
+    def __init__(self, result):
+        self.result = result
+        self.orders = []
+
+    async def submit(self, order, instance_id=None):
+        self.orders.append((order, instance_id))
+        return self.result
+
+
+def _shard_sink(monkeypatch, *, tripped=False, result=None):
+    router = _Router(result or OrderResult(success=True, txid="TX1"))
+
+    async def get_router():
+        return router
+
+    monkeypatch.setattr(orchestrator_async, "get_order_router", get_router)
+    orchestrator = OrchestratorAsync.__new__(OrchestratorAsync)
+    orchestrator.safety_guard = SimpleNamespace(emergency_mode=False)
+    orchestrator._shard_orders_halted = False
+    orchestrator._global_kill_store = SimpleNamespace(
+        get=lambda: SimpleNamespace(tripped=tripped, reason_code="reconciliation_required")
+    )
+    orchestrator._instances = {}
+    orchestrator._last_trade_action_ts = {}
+    orchestrator.trade_action_min_interval_s = 60.0
+    orchestrator.risk = SimpleNamespace(can_emit_trade_action=orchestrator._can_emit_trade_action)
+    return orchestrator, router
+
+
+def _order_event():
+    order = {"type": "market", "symbol": "XXBTZEUR", "side": "buy", "volume": 0.01}
+    return ShardEvent(shard_id=0, seq=1, kind="order", payload={"order": order, "instance_id": "shard-grid-1"})
+
+
+@pytest.mark.asyncio
+async def test_shard_orders_pass_the_kill_switch_and_risk_gate(monkeypatch, caplog):
+    orchestrator, router = _shard_sink(monkeypatch)
+    await orchestrator._handle_shard_event(_order_event())
+    # Second order inside the trade-action interval is throttled like a local one.
+    with caplog.at_level(logging.ERROR):
+        await orchestrator._handle_shard_event(_order_event())
+    assert len(router.orders) == 1
+    assert "trade_action_throttled" in caplog.text
+
+    orchestrator, router = _shard_sink(monkeypatch, tripped=True)
+    await orchestrator._handle_shard_event(_order_event())
+    orchestrator._global_kill_store = None
+    await orchestrator._handle_shard_event(_order_event())
+    assert router.orders == []
+
+    orchestrator, router = _shard_sink(monkeypatch)
+    orchestrator._shard_orders_halted = True
+    await orchestrator._handle_shard_event(_order_event())
+    assert router.orders == []
+
+
+@pytest.mark.asyncio
+async def test_kill_switch_acknowledgement_resumes_halted_shard_orders(monkeypatch):
+    orchestrator, router = _shard_sink(monkeypatch)
+    orchestrator._on_alert = None
+
+    await orchestrator.emergency_stop_all()
+    await orchestrator._handle_shard_event(_order_event())
+    assert router.orders == []
+
+    assert dashboard._acknowledge_runtime_kill_switches(orchestrator, "operator") == 1
+    await orchestrator._handle_shard_event(_order_event())
+    assert len(router.orders) == 1
+    # Nothing left to re-arm on a second acknowledgement.
+    assert dashboard._acknowledge_runtime_kill_switches(orchestrator, "operator") == 0
+
+
+@pytest.mark.asyncio
+async def test_rejected_shard_orders_are_reported(monkeypatch, caplog):
+    orchestrator, router = _shard_sink(monkeypatch, result=OrderResult(success=False, error="insufficient funds"))
+
+    with caplog.at_level(logging.WARNING):
+        await orchestrator._handle_shard_event(_order_event())
+
+    assert len(router.orders) == 1
+    assert "insufficient funds" in caplog.text
+    # A rejected order does not consume the instance's trade-action slot.
+    assert orchestrator._last_trade_action_ts == {}
+
+
+@pytest.mark.asyncio
+async def test_shard_state_is_validated_before_persistence(monkeypatch, caplog):
+    saved = []
+
+    class _Persistence:
+        async def save_instance_state(self, **fields):
+            saved.append(fields)
+            return True
+
+    monkeypatch.setattr(orchestrator_async, "get_persistence", lambda: _Persistence())
+    orchestrator, _ = _shard_sink(monkeypatch)
+    orchestrator._instances = {"local-1": object()}
+    valid = {
+        "instance_id": "shard-0-SOLEUR",
+        "status": "running",
+        "current_capital": 0,
+        "allocated_capital": 0.0,
+        "win_count": 0,
+        "loss_count": 0,
+    }
+    bad_payloads = [
+        {**valid, "updated_at": "2026-01-01"},
+        {key: value for key, value in valid.items() if key != "status"},
+        {**valid, "current_capital": "100"},
+        {**valid, "allocated_capital": float("nan")},
+        {**valid, "win_count": -1},
+        {**valid, "loss_count": True},
+        {**valid, "instance_id": "local-1"},
+        {"shard_id": 0, "ticks": 1000},
+    ]
+
+    with caplog.at_level(logging.WARNING):
+        for payload in [valid, *bad_payloads]:
+            await orchestrator._handle_shard_event(ShardEvent(shard_id=0, seq=1, kind="state", payload=payload))
+
+    assert saved == [{**valid, "current_capital": 0.0}]
+    assert caplog.text.count("État shard 0 ignoré") == len(bad_payloads)
+
+
+@pytest.mark.performance
+def test_replay_throughput_scales_with_workers():
+    """Two pinned workers must absorb ≥ 1.6× the ticks/s of one."""
+    cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+    if len(cores) < 2:
+        pytest.skip("needs at least two CPU cores")
+
+    single = run_replay(1, ticks=40_000, work=400, cores=cores[:1])
+    double = run_replay(2, ticks=40_000, work=400, cores=cores[:2])
+    speedup = double["ticks_per_s"] / single["ticks_per_s"]
+
+    print(
+        f"\n🧩 replay: 1 worker {single['ticks_per_s']:.0f} ticks/s, "
+        f"2 workers {double['ticks_per_s']:.0f} ticks/s ({speedup:.2f}x)"
+    )
+    assert speedup >= 1.6
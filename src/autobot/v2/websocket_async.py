@@ -26,6 +26,7 @@ import orjson
 # Re-export TickerData unchanged (pure dataclass, no threading)
 from .websocket_client import TickerData
 from .os_tuning import get_os_tuner
+from .hot_path_optimizer import get_hot_path_optimizer
 
 
 from .market_analyzer import get_market_analyzer
@@ -217,7 +218,10 @@ class KrakenWebSocketAsync:
 
     async def _on_message(self, raw: str | bytes) -> None:
         """Parse a single WS message."""
+        stages = get_hot_path_optimizer().stages
+        started_ns = stages.mark()
         data = orjson.loads(raw)
+        decoded_ns = stages.lap("ws_decode", started_ns)
 
         # Heartbeat
         if isinstance(data, dict):
@@ -263,9 +267,11 @@ class KrakenWebSocketAsync:
 
             if "ticker" in channel_name:
                 await self._process_ticker(pair, payloads[0])
+                stages.lap("ws_ticker_dispatch", decoded_ns, pair)
             elif "book" in channel_name:
                 for channel_data in payloads:
                     await self._process_book(pair, channel_data)
+                stages.lap("ws_book_dispatch", decoded_ns, pair)
             else:
                 logger.debug(f"📨 WS channel non géré: {channel_name} pair={pair}")
 
@@ -1,5 +1,7 @@
 import json
 import sqlite3
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -45,11 +47,13 @@ def _write_config(path, tmp_path):
                 "  fail_on_gaps: false",
                 "  export_csv: true",
                 "  export_parquet: false",
+                "  min_request_interval_seconds: 0",
                 "microstructure:",
                 "  depth_count: 5",
                 "  sample_interval_seconds: 0",
                 "  samples_per_run: 1",
                 "  max_runtime_seconds: 120",
+                "  min_request_interval_seconds: 0",
                 "output_dirs:",
                 f"  ohlcv: {str(tmp_path / 'ohlcv').replace(chr(92), '/')}",
                 f"  microstructure: {str(tmp_path / 'micro').replace(chr(92), '/')}",
@@ -178,7 +182,7 @@ def test_daily_runner_collects_public_research_data_and_reports_public_errors(tm
     assert result.live_promotion_allowed is False
     assert "secret_key_must_not_leak" not in encoded
     assert "secret_secret_must_not_leak" not in encoded
-    assert ohlc_calls == [("TRXEUR", 5, None), ("XXBTZEUR", 5, None)]
+    assert sorted(ohlc_calls) == [("TRXEUR", 5, None), ("XXBTZEUR", 5, None)]
     assert depth_calls == [("TRXEUR", 5), ("XXBTZEUR", 5)]
     assert any(op["status"] == "ok" and op["operation_type"] == "ohlcv" for op in payload["operations"])
     assert any(op["status"] == "error" and op["symbol"] == "BTCZEUR" for op in payload["operations"])
@@ -212,6 +216,236 @@ def test_daily_runner_collects_public_research_data_and_reports_public_errors(tm
     assert "No paper or live order is created." in payload["safety_notes"]
 
 
+def test_daily_runner_overlaps_stages_and_reuses_unchanged_work_on_rerun(tmp_path):
+    config_path = tmp_path / "research_daily_graph.yaml"
+    _write_config(config_path, tmp_path)
+    text = (
+        config_path.read_text(encoding="utf-8")
+        .replace("  - BTCZEUR", "  - BTCZEUR\n  - XRPZEUR")
+        .replace("  - 5m", "  - 5m\n  - 15m")
+        .replace("  min_request_interval_seconds: 0", "  max_concurrency: 3\n  min_request_interval_seconds: 0")
+    )
+    config_path.write_text(text, encoding="utf-8")
+    lock = threading.Lock()
+    in_flight = {"ohlc": 0, "depth": 0, "ohlc_started": 0}
+    peaks = {"ohlc": 0, "depth_during_ohlc": 0}
+    ohlc_calls = []
+
+    def ohlc_fetcher(pair, interval_minutes, since):
+        with lock:
+            ohlc_calls.append((pair, interval_minutes))
+            in_flight["ohlc"] += 1
+            in_flight["ohlc_started"] += 1
+            peaks["ohlc"] = max(peaks["ohlc"], in_flight["ohlc"])
+        time.sleep(0.1)
+        with lock:
+            in_flight["ohlc"] -= 1
+        return KrakenOHLCPage(
+            pair=pair,
+            rows=(
+                (_epoch_minute(0), "100", "101", "99", "100.5", "100", "10", 1),
+                (_epoch_minute(15), "100.5", "102", "100", "101.0", "101", "11", 2),
+            ),
+            last=None,
+        )
+
+    def depth_fetcher(pair, depth_count):
+        # Depth books are sampled concurrently, so one round can be shorter
+        # than the gap before the first OHLC request: count any overlap.
+        with lock:
+            overlapping = in_flight["ohlc"] > 0
+            started = in_flight["ohlc_started"]
+        time.sleep(0.05)
+        with lock:
+            if overlapping or in_flight["ohlc"] or in_flight["ohlc_started"] != started:
+                peaks["depth_during_ohlc"] += 1
+        return {"error": [], "result": {pair: {"bids": [["100", "1", "1"]], "asks": [["101", "1", "1"]]}}}
+
+    first = run_daily_research_data_collection(
+        config_path=config_path,
+        run_id="pytest_daily_graph",
+        ohlc_fetcher=ohlc_fetcher,
+        depth_fetcher=depth_fetcher,
+        asset_pairs_fetcher=_asset_pairs_fixture,
+    )
+
+    assert len(ohlc_calls) == 6
+    assert 1 < peaks["ohlc"] <= 3
+    assert peaks["depth_during_ohlc"] >= 1
+    assert [op.symbol for op in first.operations if op.operation_type == "ohlcv"] == [
+        "TRXEUR", "TRXEUR", "BTCZEUR", "BTCZEUR", "XRPZEUR", "XRPZEUR"
+    ]
+    metrics = {item.stage: item for item in first.stage_metrics}
+    assert list(metrics)[:4] == ["ohlcv", "canonical_features", "spread_depth", "microstructure_profile"]
+    assert metrics["ohlcv"].status == "completed"
+    assert metrics["ohlcv"].units == 6
+    assert metrics["ohlcv"].output_bytes > 0
+    assert metrics["canonical_features"].input_fingerprint
+    assert first.to_dict()["stage_metrics"][0]["stage"] == "ohlcv"
+    assert "## Stages" in Path(first.markdown_report_path).read_text(encoding="utf-8")
+
+    rerun = run_daily_research_data_collection(
+        config_path=config_path,
+        run_id="pytest_daily_graph",
+        ohlc_fetcher=ohlc_fetcher,
+        depth_fetcher=depth_fetcher,
+        asset_pairs_fetcher=_asset_pairs_fixture,
+    )
+
+    assert len(ohlc_calls) == 6
+    rerun_metrics = {item.stage: item for item in rerun.stage_metrics}
+    assert rerun_metrics["ohlcv"].status == "reused"
+    assert rerun_metrics["ohlcv"].reused_units == 6
+    assert rerun_metrics["canonical_features"].status == "reused"
+    assert rerun_metrics["canonical_features"].input_fingerprint == metrics["canonical_features"].input_fingerprint
+    assert rerun_metrics["spread_depth"].status == "completed"
+    assert rerun.canonical_manifest_path == first.canonical_manifest_path
+    assert [op.to_dict() for op in rerun.operations if op.operation_type != "spread_depth"] == [
+        op.to_dict() for op in first.operations if op.operation_type != "spread_depth"
+    ]
+
+    Path(first.canonical_manifest_path).write_text("{}", encoding="utf-8")
+    repaired = run_daily_research_data_collection(
+        config_path=config_path,
+        run_id="pytest_daily_graph",
+        ohlc_fetcher=ohlc_fetcher,
+        depth_fetcher=depth_fetcher,
+        asset_pairs_fetcher=_asset_pairs_fixture,
+    )
+    repaired_metrics = {item.stage: item for item in repaired.stage_metrics}
+    assert repaired_metrics["ohlcv"].status == "reused"
+    assert repaired_metrics["canonical_features"].status == "completed"
+    assert json.loads(Path(repaired.canonical_manifest_path).read_text(encoding="utf-8"))
+
+
+def test_daily_runner_starts_memory_heavy_readers_after_canonical_features(tmp_path, monkeypatch):
+    config_path = tmp_path / "research_daily_canonical_first.yaml"
+    _write_config(config_path, tmp_path)
+    events = []
+    materialize = daily_runner._materialize_daily_canonical_stage
+
+    def slow_canonical(**kwargs):
+        time.sleep(0.2)
+        outcome = materialize(**kwargs)
+        events.append("canonical_features")
+        return outcome
+
+    def recording(name, runner):
+        def run(**kwargs):
+            events.append(name)
+            return runner(**kwargs)
+
+        return run
+
+    monkeypatch.setattr(daily_runner, "_materialize_daily_canonical_stage", slow_canonical)
+    for name in ("_run_high_conviction_walk_forward", "_run_strategy_orchestrator", "_run_shadow_observation_sync"):
+        monkeypatch.setattr(daily_runner, name, recording(name, getattr(daily_runner, name)))
+
+    def ohlc_fetcher(pair, interval_minutes, since):
+        return KrakenOHLCPage(pair=pair, rows=((_epoch_minute(0), "100", "101", "99", "100", "100", "10", 1),), last=None)
+
+    def depth_fetcher(pair, depth_count):
+        return {"error": [], "result": {pair: {"bids": [["100", "1", "1"]], "asks": [["101", "1", "1"]]}}}
+
+    run_daily_research_data_collection(
+        config_path=config_path,
+        run_id="pytest_daily_canonical_first",
+        ohlc_fetcher=ohlc_fetcher,
+        depth_fetcher=depth_fetcher,
+        asset_pairs_fetcher=_asset_pairs_fixture,
+    )
+
+    assert events[0] == "canonical_features"
+    assert sorted(events[1:]) == [
+        "_run_high_conviction_walk_forward",
+        "_run_shadow_observation_sync",
+        "_run_strategy_orchestrator",
+    ]
+
+
+def test_source_rate_limiter_spaces_concurrent_requests():
+    limiter = daily_runner.SourceRateLimiter(0.05)
+    started = []
+    lock = threading.Lock()
+
+    def call() -> None:
+        limiter.acquire()
+        with lock:
+            started.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    started.sort()
+    assert all(right - left >= 0.045 for left, right in zip(started, started[1:]))
+
+
+def test_source_rate_limiter_lets_a_round_burst_then_refills_at_the_interval():
+    clock = {"now": 0.0}
+    waits = []
+    limiter = daily_runner.SourceRateLimiter(
+        1.0, burst=3, clock=lambda: clock["now"], sleep=waits.append
+    )
+
+    for _ in range(4):
+        limiter.acquire()
+    assert waits == [1.0]
+
+    clock["now"] = 10.0
+    for _ in range(3):
+        limiter.acquire()
+    assert waits == [1.0]
+
+
+def test_daily_runner_shares_one_public_limiter_between_ohlc_and_depth(tmp_path, monkeypatch):
+    config_path = tmp_path / "research_daily_shared_limiter.yaml"
+    _write_config(config_path, tmp_path)
+    acquired = []
+
+    class _CountingLimiter:
+        def acquire(self):
+            acquired.append(threading.current_thread().name)
+
+    limiter = _CountingLimiter()
+    monkeypatch.setattr(daily_runner, "_public_source_limiter", lambda _config: limiter)
+    depth_limiters = []
+    original_record = daily_runner.record_spread_depth
+
+    def record(*args, **kwargs):
+        depth_limiters.append(kwargs.get("rate_limiter"))
+        return original_record(*args, **kwargs)
+
+    monkeypatch.setattr(daily_runner, "record_spread_depth", record)
+
+    def ohlc_fetcher(pair, interval_minutes, since):
+        return KrakenOHLCPage(
+            pair=pair,
+            rows=((_epoch_minute(0), "100", "101", "99", "100.5", "100", "10", 1),),
+            last=None,
+        )
+
+    def depth_fetcher(pair, depth_count):
+        return {
+            "error": [],
+            "result": {pair: {"bids": [["100.0", "2.0", "1"]], "asks": [["100.2", "3.0", "1"]]}},
+        }
+
+    run_daily_research_data_collection(
+        config_path=config_path,
+        run_id="pytest_shared_limiter",
+        ohlc_fetcher=ohlc_fetcher,
+        depth_fetcher=depth_fetcher,
+        asset_pairs_fetcher=_asset_pairs_fixture,
+    )
+
+    assert depth_limiters == [limiter]
+    assert any(name.startswith("spread-depth") for name in acquired)
+    assert any(not name.startswith("spread-depth") for name in acquired)
+
+
 def test_daily_runner_rejects_config_that_is_not_research_only(tmp_path):
     config_path = tmp_path / "unsafe.yaml"
     _write_config(config_path, tmp_path)
@@ -228,6 +462,10 @@ def test_daily_config_preserves_zero_interval_and_rejects_zero_collection_counts
 
     loaded = load_daily_research_data_collection_config(config_path)
     assert loaded.microstructure_sample_interval_seconds == 0.0
+    assert loaded.microstructure_min_request_interval_seconds == 0.0
+    shipped_path = Path(__file__).resolve().parents[2] / "config" / "research_data_collection.yaml"
+    shipped = load_daily_research_data_collection_config(shipped_path)
+    assert shipped.microstructure_min_request_interval_seconds == shipped.ohlcv_min_request_interval_seconds == 1.0
 
     for field in ("depth_count", "samples_per_run"):
         invalid = config_path.read_text(encoding="utf-8").replace(f"  {field}: 5", f"  {field}: 0")
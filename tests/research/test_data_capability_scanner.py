@@ -10,6 +10,7 @@ import pytest
 from autobot.v2.cli import _build_parser
 from autobot.v2.research.data_capability_scanner import (
     DEFAULT_RESEARCH_MEMORY_PATH,
+    DataScanCache,
     build_data_capability_scan_report,
     write_data_capability_scan_report,
 )
@@ -522,6 +523,78 @@ def test_scanner_writes_json_and_markdown_with_storage_policy(tmp_path):
     assert "No live trading" in markdown
 
 
+def test_warm_scan_reuses_unchanged_file_summaries(tmp_path):
+    data_dir = _write_ohlcv(tmp_path)
+    cache_path = tmp_path / "cache" / "scan_cache.json"
+
+    def scan():
+        return build_data_capability_scan_report(
+            run_id="pytest_scan_cache",
+            data_roots=(data_dir,),
+            memory_path=tmp_path / "missing_memory.json",
+            scan_cache=cache_path,
+        )
+
+    cold = scan()
+    warm = scan()
+
+    assert cold.scan_cache["files_seen"] == 6
+    assert cold.scan_cache["files_rescanned"] == 6
+    assert warm.scan_cache["facet_misses"] == 0
+    assert warm.scan_cache["files_rescanned"] == 0
+    assert warm.scan_cache["hit_ratio"] == 1.0
+    assert _stable(warm) == _stable(cold)
+
+    start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    _write_rows(data_dir / "BCHEUR_1h.csv", "BCHEUR", "1h", start, 30, timedelta(hours=1))
+    _write_rows(data_dir / "SOLEUR_1h.csv", "SOLEUR", "1h", start, 10, timedelta(hours=1))
+    (data_dir / "ADAEUR_5m.csv").unlink()
+
+    changed = scan()
+    uncached = build_data_capability_scan_report(
+        run_id="pytest_scan_cache",
+        data_roots=(data_dir,),
+        memory_path=tmp_path / "missing_memory.json",
+    )
+
+    assert changed.scan_cache["files_rescanned"] == 2
+    assert _stable(changed) == _stable(uncached)
+    ohlcv = {item.capability_id: item for item in changed.capabilities}["spot_ohlcv"]
+    assert "SOLEUR" in ohlcv.symbols
+    assert ohlcv.end_at == (start + timedelta(hours=29)).isoformat()
+    persisted = json.loads(cache_path.read_text(encoding="utf-8"))["files"]
+    assert not any(key.endswith("ADAEUR_5m.csv") for key in persisted)
+
+
+def test_cached_ohlcv_scan_keeps_cross_file_duplicates_exact(tmp_path):
+    data_dir = tmp_path / "ohlcv"
+    data_dir.mkdir()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    _write_rows(data_dir / "ADAEUR_1h.csv", "ADAEUR", "1h", start, 20, timedelta(hours=1))
+    _write_rows(data_dir / "ADAEUR_1h_backfill.csv", "ADAEUR", "1h", start + timedelta(hours=15), 10, timedelta(hours=1))
+    _write_rows(data_dir / "ADAEUR_1h_late.csv", "ADAEUR", "1h", start + timedelta(days=5), 4, timedelta(hours=1))
+    _write_rows(data_dir / "BCHEUR_1h.csv", "BCHEUR", "1h", start, 5, timedelta(hours=1))
+    cache = DataScanCache()
+
+    for _ in range(2):
+        report = build_data_capability_scan_report(
+            run_id="pytest_cross_file_duplicates",
+            data_roots=(data_dir, data_dir / "ADAEUR_1h.csv"),
+            memory_path=tmp_path / "missing_memory.json",
+            scan_cache=cache,
+        )
+        ohlcv = {item.capability_id: item for item in report.capabilities}["spot_ohlcv"]
+
+        # 5 backfill rows overlap the base file, and the second root lists the
+        # base file again, so all 20 of its rows repeat.
+        assert ohlcv.row_count == 20 + 5 + 4 + 5
+        assert ohlcv.duplicate_count == 5 + 20
+        assert ohlcv.quality_status == "dedupe_required"
+        assert ohlcv.start_at == start.isoformat()
+        assert ohlcv.end_at == (start + timedelta(days=5, hours=3)).isoformat()
+    assert report.scan_cache["facet_misses"] == 0
+
+
 def test_data_capability_cli_is_registered():
     parser = _build_parser()
     args = parser.parse_args(
@@ -536,6 +609,22 @@ def test_data_capability_cli_is_registered():
 
     assert args.command == "data-capability-scan"
     assert args.memory_path == "data/research/alpha_research_memory.sqlite3"
+    assert args.scan_cache is None
+
+
+def _stable(report) -> dict:
+    """Report payload without wall-clock dependent fields."""
+
+    volatile = {"generated_at", "freshness_seconds", "event_freshness_seconds", "artifact_age_seconds", "scan_cache"}
+
+    def strip(value):
+        if isinstance(value, dict):
+            return {key: strip(item) for key, item in value.items() if key not in volatile}
+        if isinstance(value, (list, tuple)):
+            return [strip(item) for item in value]
+        return value
+
+    return strip(report.to_dict())
 
 
 def _write_ohlcv(tmp_path: Path) -> Path:
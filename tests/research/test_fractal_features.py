@@ -0,0 +1,186 @@
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from statistics import mean, pstdev
+
+import pytest
+
+from autobot.v2.research.fractal_features import (
+    FractalFeatureEngine,
+    _hurst_exponent,
+    _LagOneMoments,
+    _TrailingMoments,
+    build_fractal_volatility_features,
+)
+from autobot.v2.research.market_data_repository import MarketBar
+
+
+pytestmark = pytest.mark.unit
+
+
+def _reference_hurst(returns):
+    # Batch computation the streaming engine replaced, kept as the oracle.
+    if len(returns) < 32:
+        return None
+    xs, ys = [], []
+    for size in [size for size in (8, 16, 32, 64, 128) if size <= len(returns)]:
+        values = []
+        for start in range(0, len(returns) - size + 1, size):
+            segment = returns[start : start + size]
+            deviation = pstdev(segment)
+            if deviation <= 0.0:
+                continue
+            center = mean(segment)
+            cumulative, running = [], 0.0
+            for value in segment:
+                running += value - center
+                cumulative.append(running)
+            rescaled_range = (max(cumulative) - min(cumulative)) / deviation
+            if rescaled_range > 0.0:
+                values.append(rescaled_range)
+        if values:
+            xs.append(math.log(size))
+            ys.append(math.log(mean(values)))
+    if len(xs) < 2:
+        return None
+    x_mean, y_mean = mean(xs), mean(ys)
+    denominator = sum((value - x_mean) ** 2 for value in xs)
+    slope = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / denominator
+    return max(0.0, min(1.0, slope))
+
+
+def _reference_features(closes):
+    prices = [value for value in closes if value > 0.0]
+    returns = [math.log(right / left) for left, right in zip(prices, prices[1:])]
+    volatility = pstdev(returns) * 10_000.0 if len(returns) >= 2 else None
+    ratio = None
+    if len(returns) >= 8 and pstdev(returns) > 0.0:
+        ratio = pstdev(returns[-max(4, len(returns) // 4) :]) / pstdev(returns)
+    clustering = None
+    squares = [value * value for value in returns]
+    if len(squares) >= 4 and pstdev(squares[:-1]) > 0.0 and pstdev(squares[1:]) > 0.0:
+        left, right = squares[:-1], squares[1:]
+        covariance = mean((x - mean(left)) * (y - mean(right)) for x, y in zip(left, right))
+        clustering = covariance / (pstdev(left) * pstdev(right))
+    return _reference_hurst(returns), volatility, ratio, clustering
+
+
+def _closes(count, seed=3):
+    rng = random.Random(seed)
+    price = 100.0
+    closes = []
+    for index in range(count):
+        price *= math.exp(rng.gauss(0.0, 0.002 * (3 if (index // 200) % 2 else 1)))
+        if 40 <= index < 60 and closes:
+            # A flat stretch yields zero-deviation windows that must be skipped.
+            price = closes[-1]
+        closes.append(0.0 if index == 75 else price)
+    return closes
+
+
+def _observed(features):
+    return (
+        features.hurst_exponent,
+        features.volatility_bps,
+        features.volatility_short_to_long_ratio,
+        features.squared_return_autocorrelation,
+    )
+
+
+@pytest.mark.parametrize("count", [0, 2, 5, 9, 33, 129, 300, 1_000, 3_000])
+def test_streaming_engine_matches_the_batch_computation(count):
+    closes = _closes(count)
+    engine = FractalFeatureEngine("TRXEUR", "1m")
+    engine.extend_prices(closes)
+
+    features = engine.features()
+    expected = _reference_features(closes)
+
+    assert features.sample_count == len([value for value in closes if value > 0.0])
+    assert features.return_count == max(features.sample_count - 1, 0)
+    for actual, reference in zip(_observed(features), expected):
+        if reference is None:
+            assert actual is None
+        else:
+            assert actual == pytest.approx(reference, rel=1e-9, abs=1e-12)
+
+
+def test_incremental_appends_match_a_single_pass():
+    closes = _closes(2_000, seed=11)
+    whole = FractalFeatureEngine("TRXEUR", "1m")
+    whole.extend_prices(closes)
+    streamed = FractalFeatureEngine("TRXEUR", "1m")
+    for start in range(0, len(closes), 37):
+        streamed.extend_prices(closes[start : start + 37])
+        if start == 740:
+            midway = _reference_features(closes[: start + 37])
+            assert _observed(streamed.features()) == pytest.approx(midway, rel=1e-9)
+
+    assert _observed(streamed.features()) == pytest.approx(_observed(whole.features()), rel=1e-12)
+
+
+def test_hurst_exponent_handles_constant_and_short_series():
+    assert _hurst_exponent([0.001] * 31) is None
+    assert _hurst_exponent([0.001] * 256) is None
+    trending = [0.001 * (1 + index % 7) for index in range(512)]
+    assert _hurst_exponent(trending) == pytest.approx(_reference_hurst(trending), rel=1e-9)
+
+
+def test_windows_of_equal_values_have_exactly_zero_deviation():
+    rng = random.Random(7)
+    returns = [rng.gauss(0.0, 0.05) for _ in range(100_000)] + [1e-4] * 50_000
+    moments = _TrailingMoments()
+    for start in range(0, len(returns), 30_000):
+        chunk = returns[start : start + 30_000]
+        moments.extend(chunk, [value * value for value in chunk])
+
+    # Prefix sums of the volatile history leave ~1e-7 of cancellation noise here.
+    assert moments.pstdev(37_500) == 0.0
+    assert moments.pstdev(50_000) == 0.0
+    assert moments.pstdev(50_001) == pytest.approx(pstdev(returns[-50_001:]), rel=1e-6)
+
+    clustering = _LagOneMoments()
+    clustering.extend([4.0] * 10)
+    clustering.extend([4.0] * 10 + [9.0])
+    assert clustering.correlation() is None
+    clustering = _LagOneMoments()
+    clustering.extend([9.0] + [4.0] * 20)
+    assert clustering.correlation() is None
+    clustering.extend([9.0])
+    assert clustering.correlation() is not None
+
+
+def test_builder_feeds_each_symbol_through_the_engine():
+    start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    bars = [
+        MarketBar(start + timedelta(minutes=index), close, close, close, close, 1.0, symbol, "1m")
+        for symbol, seed in (("TRXEUR", 1), ("ADAEUR", 2))
+        for index, close in enumerate(_closes(400, seed=seed))
+    ]
+
+    features = build_fractal_volatility_features(reversed(bars), preferred_timeframe="1m")
+
+    assert [item.symbol for item in features] == ["ADAEUR", "TRXEUR"]
+    assert _observed(features[1]) == pytest.approx(_reference_features(_closes(400, seed=1)), rel=1e-9)
+
+
+@pytest.mark.performance
+def test_streaming_engine_benchmark_one_year_of_1m_bars():
+    rng = random.Random(5)
+    price = 100.0
+    closes = []
+    for _ in range(365 * 1440):
+        price *= math.exp(rng.gauss(0.0, 0.001))
+        closes.append(price)
+
+    started = time.perf_counter()
+    engine = FractalFeatureEngine("TRXEUR", "1m")
+    for start in range(0, len(closes), 1440):
+        engine.extend_prices(closes[start : start + 1440])
+    features = engine.features()
+    elapsed = time.perf_counter() - started
+
+    print(f"\nfractal engine: one symbol-year of 1m bars in {elapsed:.2f}s")
+    assert features.hurst_exponent is not None
+    assert elapsed < 3.0
@@ -1,5 +1,8 @@
 import csv
 import json
+import math
+import random
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -8,9 +11,18 @@ import pytest
 from autobot.v2.cli import main as cli_main
 from autobot.v2.research.execution_cost_model import ExecutionCostConfig
 from autobot.v2.research.high_conviction_discovery import (
+    DiscoveryScenario,
+    DiscoverySetup,
     HighConvictionDiscoveryConfig,
+    _AlignedTimeframes,
+    _context_for_bar,
+    _resample_bars,
+    _run_discovery_scenario,
+    _run_discovery_scenarios,
+    _simulate_trade,
     build_high_conviction_discovery_report,
 )
+from autobot.v2.research.market_data_repository import MarketBar
 
 
 pytestmark = pytest.mark.unit
@@ -135,6 +147,147 @@ def test_discovery_strict_expected_move_threshold_skips_smaller_setups(tmp_path)
     assert scenario.live_promotion_allowed is False
 
 
+def _random_walk_timeframes(days: int) -> dict[str, list[MarketBar]]:
+    rng = random.Random(5)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    price = 100.0
+    five: list[MarketBar] = []
+    for index in range(days * 288):
+        opened = price
+        price *= math.exp(rng.gauss(0.0, 0.002))
+        timestamp = start + timedelta(minutes=5 * index)
+        five.append(
+            MarketBar(timestamp, opened, max(opened, price) * 1.001, min(opened, price) * 0.999, price, 10.0, "TRXEUR", "5m")
+        )
+    one_hour = _resample_bars(five, "1h", 60 * 60)
+    return {
+        "5m": five,
+        "15m": _resample_bars(five, "15m", 15 * 60),
+        "1h": one_hour,
+        "4h": _resample_bars(one_hour, "4h", 4 * 60 * 60),
+    }
+
+
+def test_aligned_timeframes_match_full_history_context():
+    series = _random_walk_timeframes(6)
+    timeframes = _AlignedTimeframes(
+        five=list(reversed(series["5m"])),
+        fifteen=series["15m"],
+        one_hour=series["1h"],
+        four_hour=series["4h"],
+    )
+
+    for index in range(40, len(series["15m"]) - 1):
+        bar = series["15m"][index]
+        history_1h = [row for row in series["1h"] if row.timestamp <= bar.timestamp]
+        history_4h = [row for row in series["4h"] if row.timestamp <= bar.timestamp]
+        assert timeframes.one_hour_count(bar.timestamp) == len(history_1h)
+        assert timeframes.first_5m_after(bar.timestamp) == next(row for row in series["5m"] if row.timestamp > bar.timestamp)
+        if not history_1h:
+            continue
+        expected = _context_for_bar(series["15m"][: index + 1], history_1h, history_4h)
+        fast = timeframes.context(index, len(history_1h))
+
+        assert timeframes.context(index, len(history_1h), exact_zscore=True) == expected
+        assert fast.pop("zscore_50_15m") == pytest.approx(expected.pop("zscore_50_15m"), rel=1e-12, abs=1e-12)
+        assert fast == expected
+
+
+def _setup(entry_at: datetime, *, expected: float = 300.0, stop: float = 100.0) -> DiscoverySetup:
+    return DiscoverySetup(
+        setup_id=f"TRXEUR:breakout_1h_4h:{entry_at.isoformat()}",
+        family="breakout_1h_4h",
+        symbol="TRXEUR",
+        side="buy",
+        detected_at=entry_at.isoformat(),
+        entry_at=entry_at.isoformat(),
+        entry_price=100.0,
+        expected_move_bps=expected,
+        logical_stop_bps=stop,
+        risk_reward_estimate=expected / stop,
+        trend_1h_bps=None,
+        trend_4h_bps=None,
+        atr_15m_bps=None,
+        atr_1h_bps=None,
+        support_bps=None,
+        resistance_bps=None,
+        timeframe_signal="15m_structure_with_1h_4h_context",
+        reason="pytest",
+        features={},
+    )
+
+
+def _path(entry_at: datetime, rows: list[tuple[float, float, float]]) -> list[MarketBar]:
+    return [
+        MarketBar(entry_at + timedelta(minutes=5 * (index + 1)), close, high, low, close, 1.0, "TRXEUR", "5m")
+        for index, (high, low, close) in enumerate(rows)
+    ]
+
+
+def _discovery_config(**overrides) -> HighConvictionDiscoveryConfig:
+    return HighConvictionDiscoveryConfig(
+        run_id="pytest_paths",
+        data_paths=(Path("unused.csv"),),
+        cost_config=ExecutionCostConfig(
+            taker_fee_bps=0.0,
+            maker_fee_bps=0.0,
+            fallback_spread_bps=0.0,
+            slippage_bps=0.0,
+            latency_buffer_bps=0.0,
+        ),
+        **overrides,
+    )
+
+
+def test_shared_path_resolves_each_exit_mode_bar_by_bar():
+    entry_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    setup = _setup(entry_at)
+    config = _discovery_config()
+    # Bar 2 touches both take-profit and stop: the stop is evaluated first.
+    both = _path(entry_at, [(100.5, 99.5, 100.2), (103.5, 98.5, 101.0)])
+    trade = _simulate_trade(config, DiscoveryScenario(200.0, 3.0, 24.0, "fixed_tp_sl"), setup, both)
+    assert (trade.exit_reason, trade.gross_return_bps, trade.mfe_bps, trade.mae_bps) == ("logical_stop", -100.0, 350.0, -150.0)
+
+    runner = _path(entry_at, [(101.0, 99.8, 100.8), (103.2, 100.5, 103.0), (104.0, 103.5, 103.8), (104.1, 102.9, 103.0)])
+    trade = _simulate_trade(config, DiscoveryScenario(200.0, 3.0, 24.0, "partial_runner"), setup, runner)
+    assert trade.exit_reason == "partial_tp_runner_trailing"
+    assert trade.gross_return_bps == pytest.approx(0.5 * 300.0 + 0.5 * (410.0 - 100.0))
+
+    trade = _simulate_trade(config, DiscoveryScenario(200.0, 3.0, 24.0, "trailing"), setup, runner)
+    # Activation and the trailing check share the bar that first reaches 45% of target.
+    assert (trade.exit_reason, trade.exit_at, trade.gross_return_bps) == ("trailing_stop", runner[1].timestamp.isoformat(), 220.0)
+
+    # A weak close only invalidates the trend once eight closes are known.
+    drift = _path(entry_at, [(100.1, 99.55 - index * 0.1, 99.6 - index * 0.1) for index in range(10)])
+    trade = _simulate_trade(config, DiscoveryScenario(200.0, 2.0, 24.0, "trend_invalidation"), _setup(entry_at, stop=150.0), drift)
+    assert (trade.exit_reason, trade.exit_at) == ("trend_invalidation", drift[7].timestamp.isoformat())
+
+
+def test_scenario_batch_matches_single_scenarios_and_process_pool():
+    series = _random_walk_timeframes(4)
+    groups = {("TRXEUR", timeframe): bars for timeframe, bars in series.items()}
+    starts = [bar.timestamp for bar in series["15m"][40:300:7]]
+    setups = [_setup(start, expected=250.0 + 10.0 * (index % 5), stop=80.0) for index, start in enumerate(starts)]
+    setups = [replace(setup, entry_price=next(bar.close for bar in series["5m"] if bar.timestamp == _ts)) for setup, _ts in zip(setups, starts)]
+    scenarios = [
+        DiscoveryScenario(min_move, rr, hold, mode)
+        for min_move in (200.0, 300.0)
+        for rr in (2.0, 3.0)
+        for hold in (1.0, 6.0, 24.0)
+        for mode in ("fixed_tp_sl", "trailing", "partial_runner", "trend_invalidation")
+    ]
+    config = _discovery_config()
+
+    batch = _run_discovery_scenarios(config, scenarios, setups, groups)
+
+    assert [result.to_dict() for result in batch] == [
+        _run_discovery_scenario(config, scenario, setups, groups).to_dict() for scenario in scenarios
+    ]
+    assert sum(result.trade_count for result in batch) > 0
+    pooled = _run_discovery_scenarios(replace(config, scenario_workers=2), scenarios[:4], setups, groups)
+    assert [result.to_dict() for result in pooled] == [result.to_dict() for result in batch[:4]]
+
+
 def test_discovery_cli_writes_reports_and_micro_comparison(tmp_path, capsys):
     data_paths = _synthetic_multitimeframe_dataset(tmp_path)
     micro_report = tmp_path / "micro.json"
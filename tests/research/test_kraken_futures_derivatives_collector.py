@@ -25,14 +25,16 @@ from autobot.v2.research.kraken_futures_derivatives_collector import (
     KrakenFuturesCollectorConfig,
     KrakenFuturesPublicClient,
     _basis_rows_from_aligned_candles,
-    _compact_canonical_history,
+    _canonical_history_exists,
     _dedupe_rows,
+    _open_canonical_history,
     _quality_label,
     assert_public_kraken_futures_endpoint,
     calculate_basis_bps,
     collect_kraken_futures_derivatives,
     fingerprint_derivatives_rows,
 )
+from autobot.v2.research.segmented_history_store import iter_history_rows
 
 
 pytestmark = pytest.mark.unit
@@ -688,8 +690,7 @@ def test_forward_capture_marks_only_fresh_completed_analytics_buckets(tmp_path):
 
     for history_path in (result.basis_history_path, result.open_interest_history_path):
         assert history_path is not None
-        with Path(history_path).open("r", encoding="utf-8", newline="") as handle:
-            rows = list(csv.DictReader(handle))
+        rows = list(iter_history_rows(history_path))
         fresh = next(row for row in rows if row["timestamp"] == "2026-07-01T03:00:00+00:00")
         historical = next(row for row in rows if row["timestamp"] == "2026-07-01T02:00:00+00:00")
         assert fresh["temporal_status"] == "AVAILABLE_AFTER_FORWARD_CAPTURE"
@@ -717,8 +718,7 @@ def test_fresh_funding_capture_is_explicit_and_historical_rows_stay_historical(t
     )
 
     assert result.funding_history_path is not None
-    with Path(result.funding_history_path).open("r", encoding="utf-8", newline="") as handle:
-        rows = list(csv.DictReader(handle))
+    rows = list(iter_history_rows(result.funding_history_path))
     fresh = next(row for row in rows if row["timestamp"] == "2026-07-10T00:00:00+00:00")
     historical = next(row for row in rows if row["timestamp"] == "2026-07-09T23:00:00+00:00")
     assert fresh["temporal_status"] == "AVAILABLE_AFTER_FORWARD_CAPTURE"
@@ -828,7 +828,7 @@ def test_derivatives_quality_distinguishes_history_from_a_current_only_smoke():
     assert _quality_label([{}], [{}], [{}], [{}], basis_history_ready=True) == "historical_funding_and_same_quote_basis_ready_research_only"
 
 
-def test_incremental_history_compaction_reads_only_history_and_current_run(tmp_path):
+def test_canonical_history_appends_only_the_current_run_after_seeding(tmp_path):
     dataset_dir = tmp_path / "funding"
     dataset_dir.mkdir()
     fieldnames = ("timestamp", "value")
@@ -843,29 +843,56 @@ def test_incremental_history_compaction_reads_only_history_and_current_run(tmp_p
 
     write_rows("older_a.csv", [{"timestamp": "2026-07-10T00:00:00+00:00", "value": "a"}])
     write_rows("older_b.csv", [{"timestamp": "2026-07-10T01:00:00+00:00", "value": "b"}])
-    initial_rows, history_path, _ = _compact_canonical_history(
+    history, _ = _open_canonical_history(
         dataset_dir,
         history_filename="funding_history.csv",
         key_fields=("timestamp",),
         fieldnames=fieldnames,
     )
-    assert [row["value"] for row in initial_rows] == ["a", "b"]
-    assert history_path.exists()
+    assert [row["value"] for row in history.iter_rows()] == ["a", "b"]
+    assert history.directory == dataset_dir / "funding_history"
 
     # This immutable artifact appears after the initial backfill but was not
     # selected as the current run.  A scheduled refresh must not re-read the
     # whole archive simply because it exists.
     write_rows("unselected_legacy.csv", [{"timestamp": "2026-07-10T02:00:00+00:00", "value": "legacy"}])
     current_path = write_rows("current_refresh.csv", [{"timestamp": "2026-07-10T03:00:00+00:00", "value": "current"}])
-    refreshed_rows, _, _ = _compact_canonical_history(
+    refreshed, duplicate_count = _open_canonical_history(
+        dataset_dir,
+        history_filename="funding_history.csv",
+        key_fields=("timestamp",),
+        fieldnames=fieldnames,
+        incremental_paths=(current_path, current_path),
+    )
+
+    assert duplicate_count == 0
+    assert [row["value"] for row in refreshed.iter_rows()] == ["a", "b", "current"]
+    assert refreshed.summary().end_at == "2026-07-10T03:00:00+00:00"
+
+
+def test_canonical_history_migrates_a_legacy_single_file_history(tmp_path):
+    dataset_dir = tmp_path / "funding"
+    dataset_dir.mkdir()
+    fieldnames = ("timestamp", "value")
+    with (dataset_dir / "funding_history.csv").open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerow({"timestamp": "2026-07-10T00:00:00+00:00", "value": "compacted"})
+    with (dataset_dir / "ignored_run.csv").open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerow({"timestamp": "2026-07-10T05:00:00+00:00", "value": "ignored"})
+
+    history, _ = _open_canonical_history(
         dataset_dir,
         history_filename="funding_history.csv",
         key_fields=("timestamp",),
         fieldnames=fieldnames,
-        incremental_paths=(current_path,),
     )
 
-    assert [row["value"] for row in refreshed_rows] == ["a", "b", "current"]
+    assert [row["value"] for row in history.iter_rows()] == ["compacted"]
+    assert _canonical_history_exists(dataset_dir, "funding_history.csv")
+    assert not _canonical_history_exists(dataset_dir, "basis_history.csv")
 
 
 def test_raw_retention_prunes_only_old_completed_raw_runs_after_canonical_write(tmp_path):
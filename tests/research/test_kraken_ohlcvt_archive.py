@@ -292,3 +292,80 @@ def test_archive_rows_do_not_become_runtime_ohlcv_capability(tmp_path: Path) ->
             ),
             symbol_mappings={"BTCEUR": _mapping()},
         )
+
+
+def _unordered_archive(path: Path) -> Path:
+    content = (
+        "1735690200,103,104,102,103,2,9\n"
+        "1735689600,100,102,99,101,3,12\n"
+        "1735689900,101,103,100,102,4,15\n"
+        "1735689600,100.5,102.5,99.5,101.5,7,30\n"
+        "1735691400,104,105,103,104,1,4\n"
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("Kraken_OHLCVT/XXBTZEUR_5.csv", content)
+        archive.writestr("Kraken_OHLCVT/XXBTZEUR_60.csv", "1735689600,100,102,99,101,3,12\n1735696800,101,103,100,102,4,15\n")
+    return path
+
+
+def _unordered_config(tmp_path: Path, archive: Path, label: str, **overrides) -> KrakenOhlcvtArchiveImportConfig:
+    return KrakenOhlcvtArchiveImportConfig(
+        run_id=f"pytest_{label}",
+        archive_path=archive,
+        symbols=("BTCEUR",),
+        timeframes=("5m", "1h"),
+        raw_dir=tmp_path / label / "raw",
+        normalized_dir=tmp_path / label / "normalized",
+        manifest_dir=tmp_path / label / "manifests",
+        report_dir=tmp_path / label / "reports",
+        **overrides,
+    )
+
+
+def test_archive_import_sorts_unordered_members_and_matches_across_workers(tmp_path: Path) -> None:
+    archive = _unordered_archive(tmp_path / "official.zip")
+    imported_at = datetime(2026, 7, 20, tzinfo=timezone.utc)
+    serial = import_kraken_ohlcvt_archive(
+        _unordered_config(tmp_path, archive, "serial"),
+        imported_at=imported_at,
+        symbol_mappings={"BTCEUR": _mapping()},
+    )
+    parallel = import_kraken_ohlcvt_archive(
+        _unordered_config(tmp_path, archive, "parallel", workers=2),
+        imported_at=imported_at,
+        symbol_mappings={"BTCEUR": _mapping()},
+    )
+
+    five_minute, one_hour = sorted(serial.members, key=lambda item: item.timeframe != "5m")
+    assert (five_minute.row_count, five_minute.duplicate_count, five_minute.gap_count) == (4, 1, 1)
+    assert five_minute.start_at == "2025-01-01T00:00:00+00:00"
+    assert five_minute.end_at == "2025-01-01T00:30:00+00:00"
+    assert (one_hour.row_count, one_hour.gap_count) == (2, 1)
+    with Path(five_minute.normalized_path).open("r", encoding="utf-8", newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["timestamp"][11:16] for row in rows] == ["00:00", "00:05", "00:10", "00:30"]
+    # A duplicated bar keeps its first OHLCV values and its last trade count.
+    assert (rows[0]["open"], rows[0]["volume"]) == ("100.0", "3.0")
+    assert json.loads(rows[0]["metadata"])["trade_count"] == 30
+    assert serial.peak_member_buffer_bytes > 0
+    assert serial.to_dict()["import_resources"]["memory_ceiling_bytes"] == 256 * 1024 * 1024
+    assert parallel.workers == 2
+    for left, right in zip(serial.members, parallel.members):
+        assert Path(left.normalized_path).read_bytes() == Path(right.normalized_path).read_bytes()
+        assert (left.row_count, left.duplicate_count, left.gap_count, left.member_sha256) == (
+            right.row_count,
+            right.duplicate_count,
+            right.gap_count,
+            right.member_sha256,
+        )
+
+
+def test_archive_import_enforces_member_buffer_ceiling_for_unordered_rows(tmp_path: Path) -> None:
+    archive = _unordered_archive(tmp_path / "official.zip")
+    with pytest.raises(KrakenOhlcvtArchiveError, match="max_member_buffer_bytes"):
+        import_kraken_ohlcvt_archive(
+            _unordered_config(tmp_path, archive, "ceiling", max_member_buffer_bytes=1024),
+            imported_at=datetime(2026, 7, 20, tzinfo=timezone.utc),
+            symbol_mappings={"BTCEUR": _mapping()},
+        )
+    assert not list((tmp_path / "ceiling" / "normalized").glob("*.tmp"))
@@ -1,9 +1,12 @@
+import math
+import random
+import statistics
 from datetime import datetime, timezone
 
 import pytest
 
-from autobot.v2.research.metrics_engine import MetricsEngine
-from autobot.v2.research.trade_journal import TradeRecord
+from autobot.v2.research.metrics_engine import MetricsEngine, return_moments
+from autobot.v2.research.trade_journal import TradeJournal, TradeRecord
 
 
 pytestmark = pytest.mark.unit
@@ -68,3 +71,102 @@ def test_metrics_engine_handles_empty_trade_set_without_fake_performance():
     assert metrics.winrate_pct is None
     assert metrics.profit_factor is None
     assert metrics.beats_baseline is False
+
+
+def _reference_metrics(trades, initial_capital_eur):
+    """Scalar list-of-records computation the columnar engine must reproduce."""
+
+    net = [trade.net_pnl_eur for trade in trades]
+    wins = [value for value in net if value > 0.0]
+    losses = [value for value in net if value < 0.0]
+    equity = peak = initial_capital_eur
+    max_dd = max_dd_pct = 0.0
+    for trade in sorted(trades, key=lambda item: item.closed_at):
+        equity += trade.net_pnl_eur
+        peak = max(peak, equity)
+        drawdown = max(0.0, peak - equity)
+        max_dd = max(max_dd, drawdown)
+        max_dd_pct = max(max_dd_pct, drawdown / peak * 100.0)
+    returns = [value / initial_capital_eur for value in net]
+    downside = [value for value in returns if value < 0.0]
+    by_regime = {}
+    for regime in sorted({trade.regime or "unknown" for trade in trades}):
+        subset = [trade.net_pnl_eur for trade in trades if (trade.regime or "unknown") == regime]
+        by_regime[regime] = {
+            "trade_count": len(subset),
+            "net_pnl_eur": sum(subset),
+            "winrate_pct": sum(1 for value in subset if value > 0.0) / len(subset) * 100.0,
+            "expectancy_eur": sum(subset) / len(subset),
+        }
+    return {
+        "total_net_pnl_eur": sum(net),
+        "total_fees_eur": sum(trade.fees_eur for trade in trades),
+        "profit_factor": sum(wins) / abs(sum(losses)),
+        "average_win_eur": statistics.mean(wins),
+        "average_loss_eur": statistics.mean(losses),
+        "average_trade_duration_seconds": statistics.mean(trade.duration_seconds for trade in trades),
+        "max_drawdown_eur": max_dd,
+        "max_drawdown_pct": max_dd_pct,
+        "sharpe_like": statistics.mean(returns) / statistics.pstdev(returns) * math.sqrt(len(returns)),
+        "sortino_like": statistics.mean(returns)
+        / math.sqrt(statistics.mean(value * value for value in downside))
+        * math.sqrt(len(returns)),
+        "performance_by_regime": by_regime,
+    }
+
+
+def _random_trades(count, seed=7):
+    rng = random.Random(seed)
+    regimes = ("range", "trend", None, "high_vol")
+    return [
+        _trade(round(rng.gauss(0.3, 2.5), 6), 1 + rng.randrange(58), regime=rng.choice(regimes))
+        for _ in range(count)
+    ]
+
+
+def test_columnar_metrics_match_scalar_reference_on_unsorted_trades():
+    trades = _random_trades(400)
+    expected = _reference_metrics(trades, 250.0)
+
+    metrics = MetricsEngine().calculate(trades, initial_capital_eur=250.0)
+
+    for name, value in expected.items():
+        if name == "performance_by_regime":
+            continue
+        assert getattr(metrics, name) == pytest.approx(value, rel=1e-12, abs=1e-12), name
+    assert set(metrics.performance_by_regime) == set(expected["performance_by_regime"])
+    for regime, values in expected["performance_by_regime"].items():
+        assert metrics.performance_by_regime[regime] == pytest.approx(values, rel=1e-12)
+
+
+def test_journal_batch_is_cached_and_matches_record_input():
+    journal = TradeJournal(_random_trades(50, seed=11))
+
+    batch = journal.batch()
+
+    assert journal.batch() is batch
+    assert batch.close_order is None
+    assert MetricsEngine().calculate(batch, initial_capital_eur=100.0) == MetricsEngine().calculate(
+        journal.records, initial_capital_eur=100.0
+    )
+    journal.add(_trade(1.0, 59))
+    assert journal.batch() is not batch
+    assert len(journal.batch()) == 51
+
+
+def test_return_moments_match_statistics_module_and_flag_constant_series():
+    returns = [trade.net_pnl_eur / 100.0 for trade in _random_trades(200, seed=3)]
+    center = statistics.mean(returns)
+    deviation = statistics.pstdev(returns)
+
+    moments = return_moments(returns)
+
+    assert moments.mean == pytest.approx(center, rel=1e-12)
+    assert moments.deviation == pytest.approx(deviation, rel=1e-12)
+    assert moments.skewness == pytest.approx(
+        statistics.mean(((value - center) / deviation) ** 3 for value in returns), rel=1e-9
+    )
+    assert moments.kurtosis == pytest.approx(
+        statistics.mean(((value - center) / deviation) ** 4 for value in returns), rel=1e-9
+    )
+    assert return_moments([0.1] * 7).deviation == 0.0
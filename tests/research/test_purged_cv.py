@@ -0,0 +1,152 @@
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from math import comb
+from statistics import median
+
+import pytest
+
+from autobot.v2.research.purged_cv import (
+    PurgedCVIndex,
+    PurgedObservation,
+    build_combinatorial_purged_cv_plan,
+    build_purged_cv_plan,
+)
+
+
+pytestmark = pytest.mark.unit
+
+START = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def _observations(count, seed):
+    rng = random.Random(seed)
+    result = []
+    for index in range(count):
+        start_at = START + timedelta(minutes=rng.randint(0, 600))
+        duration = rng.choice([0, 5, 30, rng.randint(0, 300)])
+        result.append(PurgedObservation(f"obs-{index}", start_at, start_at + timedelta(minutes=duration)))
+    return result
+
+
+def _reference_folds(observations, folds, embargo_bars):
+    # Per-fold full scan the interval index replaced, kept as the oracle.
+    ordered = sorted(observations, key=lambda item: (item.start_at, item.end_at, item.observation_id))
+    starts = [item.start_at for item in ordered]
+    gaps = [(right - left).total_seconds() for left, right in zip(starts, starts[1:]) if right > left]
+    bar_seconds = float(median(gaps)) if gaps else None
+    chunk = len(ordered) // folds
+    result = []
+    for index in range(folds):
+        test = ordered[index * chunk : len(ordered) if index == folds - 1 else (index + 1) * chunk]
+        test_start, test_end = test[0].start_at, max(item.end_at for item in test)
+        embargo_end = test_end + timedelta(seconds=(bar_seconds or 0.0) * embargo_bars)
+        test_ids = {item.observation_id for item in test}
+        train, purged, embargoed = [], [], []
+        for item in ordered:
+            if item.observation_id in test_ids:
+                continue
+            if item.start_at <= test_end and item.end_at >= test_start:
+                purged.append(item.observation_id)
+            elif test_end < item.start_at <= embargo_end:
+                embargoed.append(item.observation_id)
+            else:
+                train.append(item.observation_id)
+        result.append((tuple(item.observation_id for item in test), tuple(train), tuple(purged), tuple(embargoed)))
+    return bar_seconds, result
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_indexed_k_fold_plan_matches_the_full_scan(seed):
+    rng = random.Random(seed)
+    observations = _observations(rng.randint(12, 90), seed)
+    folds, embargo_bars = rng.randint(2, 6), rng.randint(0, 4)
+
+    plan = build_purged_cv_plan(observations, folds=folds, embargo_bars=embargo_bars)
+    bar_seconds, expected = _reference_folds(observations, folds, embargo_bars)
+
+    assert plan.estimated_bar_seconds == bar_seconds
+    assert [
+        (
+            fold.test_observation_ids,
+            fold.train_observation_ids,
+            fold.purged_observation_ids,
+            fold.embargoed_observation_ids,
+        )
+        for fold in plan.folds
+    ] == expected
+
+
+def test_combinatorial_plan_emits_every_split_and_recombines_paths():
+    observations = _observations(240, seed=5)
+    index = PurgedCVIndex.from_observations(observations)
+
+    plan = build_combinatorial_purged_cv_plan(index, groups=6, test_groups=2, embargo_bars=2)
+
+    assert plan.status == "research_planning_only"
+    assert plan.live_promotion_allowed is False
+    assert len(plan.splits) == comb(6, 2)
+    assert len(plan.paths) == comb(5, 1)
+    for path in plan.paths:
+        assert [group in plan.splits[split].test_groups for group, split in enumerate(path)] == [True] * 6
+    for split in plan.splits:
+        test = set(split.test_indices())
+        train = set(split.train_indices())
+        purged, embargoed = set(split.purged_indices), set(split.embargoed_indices)
+        assert len(train) == split.train_count
+        assert len(test) + len(train) + len(purged) + len(embargoed) == index.observation_count
+        assert train.isdisjoint(test | purged | embargoed)
+        for start, end in split.test_ranges:
+            test_start = index.starts[start]
+            test_end = max(index.ends[start:end])
+            for item in train | embargoed:
+                assert not (index.starts[item] <= test_end and index.ends[item] >= test_start)
+    assert plan.to_dict()["splits"][0]["test_groups"] == [0, 1]
+
+
+def test_adjacent_test_groups_are_one_range_without_an_inner_embargo():
+    index = PurgedCVIndex.from_arrays(
+        [minute * 60_000_000 for minute in range(40)],
+        [(minute + 2) * 60_000_000 for minute in range(40)],
+    )
+
+    split = index.split((1, 2), index.group_bounds(4), embargo_bars=3)
+
+    assert split.test_ranges == ((10, 30),)
+    assert list(split.purged_indices) == [8, 9, 30, 31]
+    assert list(split.embargoed_indices) == [32, 33, 34]
+    assert split.train_count == 40 - 20 - 4 - 3
+
+
+def test_from_arrays_sorts_and_keeps_caller_positions():
+    index = PurgedCVIndex.from_arrays([30, 10, 20, 10], [40, 15, 25, 12])
+
+    assert list(index.starts) == [10, 10, 20, 30]
+    assert list(index.ends) == [12, 15, 25, 40]
+    assert list(index.positions) == [3, 1, 2, 0]
+    with pytest.raises(ValueError, match="before start"):
+        PurgedCVIndex.from_arrays([10], [5])
+
+
+def test_combinatorial_plan_rejects_invalid_configuration():
+    with pytest.raises(ValueError, match="test_groups"):
+        build_combinatorial_purged_cv_plan((), groups=4, test_groups=4)
+    assert build_combinatorial_purged_cv_plan(_observations(5, 1), groups=4).status == "insufficient_observations"
+
+
+@pytest.mark.performance
+def test_combinatorial_plan_benchmark_one_million_observations():
+    count = 1_000_000
+    starts = [minute * 60_000_000 for minute in range(count)]
+    ends = [start + (minute % 50) * 60_000_000 for minute, start in enumerate(starts)]
+
+    started = time.perf_counter()
+    plan = build_combinatorial_purged_cv_plan(
+        PurgedCVIndex.from_arrays(starts, ends), groups=10, test_groups=2, embargo_bars=5
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"\npurged CV: {len(plan.splits)} splits over {count} observations in {elapsed:.2f}s")
+    assert len(plan.splits) == 45
+    assert max(len(split.purged_indices) for split in plan.splits) < 200
+    assert elapsed < 5.0
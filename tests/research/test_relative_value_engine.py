@@ -1,5 +1,8 @@
 import csv
 import math
+import random
+import time
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -13,6 +16,7 @@ from autobot.v2.research.relative_value_engine import (
     _discover_signals,
     _group_by_symbol_timeframe,
     _passes_cost_guard,
+    _relation_metrics,
     build_relative_value_report,
     parse_relationships,
 )
@@ -147,3 +151,122 @@ def test_portfolio_report_is_research_only_and_never_trades_reference_symbols(mo
         assert all(record.symbol == "ADAEUR" for record in result.records)
         assert all(record.metadata["reference_execution"] == "none" for record in result.records)
         assert result.max_open_positions_seen <= 3
+
+
+def _random_walk_bars(symbols: tuple[str, ...], count: int, *, seed: int, timeframe: str = "15m") -> list[MarketBar]:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    minutes = 5 if timeframe == "5m" else 15
+    factor = 0.0
+    levels = {symbol: 50_000.0 / (index + 1) for index, symbol in enumerate(symbols)}
+    residuals = dict.fromkeys(symbols, 0.0)
+    bars: list[MarketBar] = []
+    for index in range(count):
+        factor += rng.gauss(0.0, 0.002)
+        timestamp = start + timedelta(minutes=minutes * index)
+        for symbol in symbols:
+            residuals[symbol] = 0.95 * residuals[symbol] + rng.gauss(0.0, 0.001)
+            close = levels[symbol] * math.exp(factor + residuals[symbol])
+            bars.append(MarketBar(timestamp, close, close * 1.001, close * 0.999, close, 10_000.0, symbol, timeframe))
+    return bars
+
+
+def test_rolling_relation_metrics_match_the_exact_window_computation():
+    bars = _random_walk_bars(("XRPZEUR", "ADAEUR"), 700, seed=7)
+    # A flat stretch forces the exact fallback for degenerate return windows.
+    bars = [
+        replace(bar, close=bars[800].close) if bar.symbol == "ADAEUR" and 800 <= index < 900 else bar
+        for index, bar in enumerate(bars)
+    ]
+    groups = _group_by_symbol_timeframe(bars)
+    series = _build_relation_series(RelativeValueRelation("ADAEUR", ("XRPZEUR",)), groups, "15m")
+    assert series is not None
+    window = 48
+    rolling = series.rolling_metrics(window)
+
+    assert series.rolling_metrics(window) is rolling
+    for index in range(len(series.timestamps)):
+        expected = _relation_metrics(series, index, window)
+        actual = rolling.at(index)
+        if expected is None:
+            assert actual is None
+            continue
+        assert actual == pytest.approx(expected, rel=1e-7, abs=1e-9)
+
+
+def test_streaming_discovery_reproduces_exact_signals(monkeypatch, tmp_path):
+    monkeypatch.setattr("autobot.v2.research.relative_value_engine._statsmodels_available", lambda: False)
+    config = _config(tmp_path)
+    groups = _group_by_symbol_timeframe(_bars())
+    series = _build_relation_series(config.relationships[0], groups, "15m")
+    assert series is not None
+
+    signals, _rejected, _available = _discover_signals(config, (series,))
+
+    expected_indices = [
+        index
+        for index in range(config.rolling_window_bars, len(series.timestamps) - 1)
+        if (metrics := _relation_metrics(series, index, config.rolling_window_bars)) is not None
+        and metrics[1] >= config.min_correlation
+        and metrics[0] <= config.entry_zscore
+    ]
+    assert [signal.entry_index - 1 for signal in signals] == expected_indices
+    for signal in signals:
+        zscore, correlation, beta, _intercept, _std, _volatility = _relation_metrics(
+            series, signal.entry_index - 1, config.rolling_window_bars
+        )
+        assert signal.zscore == pytest.approx(zscore, abs=1e-7)
+        assert signal.correlation == pytest.approx(correlation, abs=1e-7)
+        assert signal.hedge_ratio == pytest.approx(beta, abs=1e-7)
+
+
+def test_cointegration_is_refreshed_on_stride_and_cached_per_window(monkeypatch, tmp_path):
+    calls: list[int] = []
+
+    def fake_pvalue(_series, index, _window):
+        calls.append(index)
+        return 0.01
+
+    monkeypatch.setattr("autobot.v2.research.relative_value_engine._statsmodels_available", lambda: True)
+    monkeypatch.setattr("autobot.v2.research.relative_value_engine._cointegration_pvalue", fake_pvalue)
+    config = replace(_config(tmp_path), cointegration_refresh_bars=12)
+    groups = _group_by_symbol_timeframe(_bars())
+    series = _build_relation_series(config.relationships[0], groups, "15m")
+    assert series is not None
+
+    signals, _rejected, _available = _discover_signals(config, (series,))
+    _discover_signals(config, (series,))
+
+    assert signals
+    assert all(index % 12 == 0 for index in calls)
+    assert len(calls) == len(set(calls))
+    assert len(calls) < len(signals)
+    assert all(signal.cointegration_pvalue == 0.01 for signal in signals)
+
+
+@pytest.mark.performance
+def test_streaming_relation_engine_benchmark_50_pairs_one_year_of_5m_bars(monkeypatch, tmp_path):
+    monkeypatch.setattr("autobot.v2.research.relative_value_engine._statsmodels_available", lambda: False)
+    count = 365 * 288
+    symbols = tuple(f"S{index:02d}EUR" for index in range(51))
+    groups = _group_by_symbol_timeframe(_random_walk_bars(symbols, count, seed=11, timeframe="5m"))
+    relations = tuple(RelativeValueRelation(symbol, (symbols[0],)) for symbol in symbols[1:])
+    series = tuple(_build_relation_series(relation, groups, "5m") for relation in relations)
+    config = replace(
+        _config(tmp_path),
+        relationships=relations,
+        timeframe="5m",
+        rolling_window_bars=288,
+        cointegration_refresh_bars=288,
+    )
+
+    started = time.perf_counter()
+    signals, _rejected, _available = _discover_signals(config, series)
+    elapsed = time.perf_counter() - started
+
+    assert signals
+    assert elapsed < 120.0
+    rolling = series[0].rolling_metrics(config.rolling_window_bars)
+    for index in range(config.rolling_window_bars, count, 9_973):
+        expected = _relation_metrics(series[0], index, config.rolling_window_bars)
+        assert rolling.at(index) == pytest.approx(expected, rel=1e-7, abs=1e-9)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autobot.v2.research.segmented_history_store import (
+    INDEX_FILENAME,
+    SegmentedHistoryStore,
+    history_files,
+    iter_history_rows,
+)
+
+
+pytestmark = pytest.mark.unit
+
+START = datetime(2026, 7, 1, tzinfo=timezone.utc)
+
+
+def _store(directory, **kwargs) -> SegmentedHistoryStore:
+    return SegmentedHistoryStore(
+        directory,
+        key_fields=("symbol", "timestamp"),
+        fieldnames=("symbol", "timestamp", "value", "status"),
+        preference_key=lambda row: (row.get("status") != "forward", row.get("value")),
+        facets={"symbol": lambda row: row.get("symbol") or None},
+        **kwargs,
+    )
+
+
+def _rows(start: int, count: int, *, symbols=("BTC", "ETH"), value="v", status="backfill") -> list[dict[str, str]]:
+    return [
+        {
+            "symbol": symbol,
+            "timestamp": (START + timedelta(minutes=15 * step)).isoformat(),
+            "value": f"{value}{step}",
+            "status": status,
+        }
+        for step in range(start, start + count)
+        for symbol in symbols
+    ]
+
+
+def _reference(*batches, preference_key) -> list[dict[str, str]]:
+    """Old behaviour: re-deduplicate the whole history on every run."""
+
+    selected: dict[tuple[str, str], dict[str, str]] = {}
+    for batch in batches:
+        for row in batch:
+            key = (row["symbol"], row["timestamp"])
+            selected[key] = min(selected[key], row, key=preference_key) if key in selected else row
+    return [selected[key] for key in sorted(selected)]
+
+
+def test_append_dedupes_against_overlapping_segments_and_streams_in_key_order(tmp_path):
+    store = _store(tmp_path / "history", segment_target_rows=8)
+    backfill = _rows(0, 20)
+    forward = _rows(18, 4, value="f", status="forward")
+
+    assert store.append(backfill) == 0
+    assert store.append(forward) == 4
+
+    expected = _reference(backfill, forward, preference_key=store.preference_key)
+    assert list(store.iter_rows()) == expected
+    assert list(iter_history_rows(store.directory)) == expected
+    summary = store.summary()
+    assert len(summary) == 44
+    assert summary.start_at == backfill[0]["timestamp"]
+    assert summary.end_at == forward[-1]["timestamp"]
+    assert summary.facet("symbol")["ETH"] == (22, backfill[0]["timestamp"], forward[-1]["timestamp"])
+    assert [path.name for path in history_files(store.directory)] == [
+        item["filename"] for item in json.loads((store.directory / INDEX_FILENAME).read_text())["segments"]
+    ]
+
+
+def test_append_reads_only_segments_overlapping_the_new_rows(tmp_path, monkeypatch):
+    store = _store(tmp_path / "history", segment_target_rows=10)
+    store.append(_rows(0, 50))
+    reads: list[str] = []
+    original = SegmentedHistoryStore._read_segment
+
+    def counting_read(self, segment):
+        reads.append(segment.filename)
+        return original(self, segment)
+
+    monkeypatch.setattr(SegmentedHistoryStore, "_read_segment", counting_read)
+
+    store.append(_rows(50, 1))
+    assert reads == []
+
+    store.append(_rows(49, 1, value="late"))
+    assert len(reads) == 1
+
+
+def test_compaction_merges_small_segments_without_changing_rows(tmp_path):
+    store = _store(tmp_path / "history", segment_target_rows=40)
+    batches = [_rows(step, 1) for step in range(30)]
+    for batch in batches:
+        store.append(batch)
+    before = list(store.iter_rows())
+    assert store.summary().segment_count == 30
+
+    assert store.compact_in_background(min_segments=31) is None
+    thread = store.compact_in_background(min_segments=30)
+    assert thread is not None
+    thread.join()
+
+    summary = store.summary()
+    assert summary.segment_count == 2
+    assert len(summary) == 60
+    assert list(store.iter_rows()) == before
+    assert sorted(path.name for path in store.directory.glob("seg_*.csv")) == sorted(
+        path.name for path in history_files(store.directory)
+    )
+
+
+def test_interrupted_write_leftovers_are_swept_and_new_facets_are_backfilled(tmp_path):
+    store = _store(tmp_path / "history")
+    store.append(_rows(0, 3))
+    (store.directory / "seg_9999999999.csv").write_text("symbol,timestamp\n", encoding="utf-8")
+    (store.directory / ".seg_0000000001.csv.abc.tmp").write_text("", encoding="utf-8")
+
+    store.append(_rows(3, 1))
+
+    assert not list(store.directory.glob("*.tmp"))
+    assert not (store.directory / "seg_9999999999.csv").exists()
+    widened = SegmentedHistoryStore(
+        store.directory,
+        key_fields=store.key_fields,
+        fieldnames=store.fieldnames,
+        preference_key=store.preference_key,
+        facets={**store.facet_functions, "status": lambda row: row.get("status") or None},
+    )
+    assert widened.summary().facet("status") == {
+        "backfill": (8, _rows(0, 1)[0]["timestamp"], _rows(3, 1)[0]["timestamp"]),
+    }
+    with pytest.raises(ValueError, match="history key mismatch"):
+        SegmentedHistoryStore(
+            store.directory,
+            key_fields=("timestamp",),
+            fieldnames=store.fieldnames,
+            preference_key=store.preference_key,
+        ).append(_rows(4, 1))
+
+
+@pytest.mark.performance
+def test_forward_append_cost_stays_flat_as_history_grows(tmp_path):
+    """A 15-minute append must not scale with months of accumulated history."""
+
+    def append_seconds(history_steps: int) -> float:
+        store = _store(tmp_path / f"history_{history_steps}", segment_target_rows=5_000)
+        store.append(_rows(0, history_steps, symbols=("BTC", "ETH", "SOL", "XRP")))
+        started = time.perf_counter()
+        for step in range(history_steps, history_steps + 20):
+            store.append(_rows(step, 1, symbols=("BTC", "ETH", "SOL", "XRP")))
+        return time.perf_counter() - started
+
+    small = append_seconds(500)
+    large = append_seconds(25_000)
+    print(f"\n📼 forward append x20: 2k rows {small * 1000:.1f} ms, 100k rows {large * 1000:.1f} ms")
+    assert large < small * 3
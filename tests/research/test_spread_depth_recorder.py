@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -69,6 +71,127 @@ def test_spread_depth_recorder_uses_public_depth_payload_without_private_keys(tm
     assert os.environ["KRAKEN_API_KEY"] == "must_not_be_used"
 
 
+def test_spread_depth_recorder_samples_symbols_concurrently_and_reports_timing(tmp_path):
+    bases = ("ADA", "DOT", "SOL", "LTC", "TRX", "XLM", "ATOM", "LINK")
+    asset_pairs = {
+        f"{base}EUR": {"altname": f"{base}EUR", "wsname": f"{base}/EUR", "base": base, "quote": "ZEUR"}
+        for base in bases
+    }
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_fetcher(pair, depth_count):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        return {
+            "error": [],
+            "result": {
+                pair: {
+                    "bids": [["100.0", "2.0", "1780272000"]],
+                    "asks": [["100.2", "3.0", "1780272001"]],
+                }
+            },
+        }
+
+    started = time.perf_counter()
+    result = record_spread_depth(
+        SpreadDepthRecorderConfig(
+            run_id="pytest_concurrent_depth",
+            symbols=tuple(asset_pairs),
+            output_dir=tmp_path,
+            samples=3,
+            max_concurrency=4,
+            min_request_interval_seconds=0.0,
+        ),
+        fetcher=slow_fetcher,
+        asset_pairs_fetcher=lambda: asset_pairs,
+    )
+    elapsed = time.perf_counter() - started
+
+    # 24 requests of 50 ms each: sequential capture would need 1.2 s.
+    assert len(result.snapshots) == 24
+    assert active["peak"] == 4
+    assert elapsed < 0.9
+    summary = result.summary_by_symbol["ADAEUR"]
+    assert summary["samples"] == 3.0
+    assert summary["latency_median_ms"] >= 45.0
+    assert summary["latency_p95_ms"] >= summary["latency_median_ms"]
+    # With eight symbols on four workers a round completes in two waves.
+    assert 0.0 < summary["round_skew_median_ms"] < 500.0
+    assert summary["round_offset_p95_ms"] <= summary["round_skew_p95_ms"]
+    assert "Round Skew P95 ms" in Path(result.markdown_report_path).read_text(encoding="utf-8")
+
+
+def test_spread_depth_round_bursts_within_one_request_spacing(tmp_path):
+    bases = ("ADA", "DOT", "SOL", "LTC", "TRX", "XLM", "ATOM", "LINK")
+    asset_pairs = {
+        f"{base}EUR": {"altname": f"{base}EUR", "wsname": f"{base}/EUR", "base": base, "quote": "ZEUR"}
+        for base in bases
+    }
+
+    def fetcher(pair, depth_count):
+        time.sleep(0.01)
+        return {
+            "error": [],
+            "result": {pair: {"bids": [["100.0", "2.0", "1780272000"]], "asks": [["100.2", "3.0", "1780272001"]]}},
+        }
+
+    config = SpreadDepthRecorderConfig(run_id="pytest_burst_depth", symbols=tuple(asset_pairs), output_dir=tmp_path)
+    started = time.perf_counter()
+    result = record_spread_depth(config, fetcher=fetcher, asset_pairs_fetcher=lambda: asset_pairs)
+    elapsed = time.perf_counter() - started
+
+    # Default budget: one request per second, bursting one round of 8 symbols.
+    assert (config.min_request_interval_seconds, config.request_burst) == (1.0, 8)
+    assert len(result.snapshots) == len(bases)
+    assert elapsed < config.min_request_interval_seconds
+    assert result.summary_by_symbol["ADAEUR"]["round_skew_median_ms"] < 500.0
+
+
+def test_spread_depth_recorder_schedules_rounds_on_a_fixed_rate_clock(tmp_path):
+    clock = {"value": 0.0}
+    waits: list[float] = []
+
+    def fetcher(pair, depth_count):
+        clock["value"] += 0.25
+        return {
+            "error": [],
+            "result": {
+                pair: {
+                    "bids": [["100.0", "2.0", "1780272000"]],
+                    "asks": [["100.2", "3.0", "1780272001"]],
+                }
+            },
+        }
+
+    def sleep(seconds):
+        waits.append(seconds)
+        clock["value"] += seconds
+
+    result = record_spread_depth(
+        SpreadDepthRecorderConfig(
+            run_id="pytest_fixed_rate_depth",
+            symbols=("TRXEUR",),
+            output_dir=tmp_path,
+            samples=3,
+            sleep_seconds=1.0,
+        ),
+        fetcher=fetcher,
+        asset_pairs_fetcher=_asset_pairs_fixture,
+        monotonic_clock=lambda: clock["value"],
+        sleep=sleep,
+    )
+
+    # Each pause absorbs the 250 ms fetch, so rounds start at t=0, 1 and 2.
+    assert waits == pytest.approx([0.75, 0.75])
+    assert len(result.snapshots) == 3
+    assert result.stop_reason is None
+
+
 def test_spread_depth_recorder_rejects_invalid_config(tmp_path):
     with pytest.raises(ValueError, match="depth_count must be positive"):
         SpreadDepthRecorderConfig(
@@ -84,6 +207,13 @@ def test_spread_depth_recorder_rejects_invalid_config(tmp_path):
             output_dir=tmp_path,
             max_runtime_seconds=0.0,
         )
+    with pytest.raises(ValueError, match="max_concurrency must be positive"):
+        SpreadDepthRecorderConfig(
+            run_id="pytest_bad_concurrency",
+            symbols=("TRXEUR",),
+            output_dir=tmp_path,
+            max_concurrency=0,
+        )
 
 
 def test_spread_depth_recorder_collapses_alias_duplicates_before_fetch(tmp_path):
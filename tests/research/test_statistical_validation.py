@@ -9,7 +9,7 @@ from autobot.v2.research.statistical_validation import (
     assess_probabilistic_sharpe,
     evaluate_progressive_pf_quality,
 )
-from autobot.v2.research.trade_journal import TradeRecord
+from autobot.v2.research.trade_journal import TradeBatch, TradeRecord
 
 
 pytestmark = pytest.mark.unit
@@ -86,6 +86,19 @@ def test_probabilistic_sharpe_is_research_only_and_requires_track_record():
     assert thin.acceptable is False
 
 
+def test_sharpe_proxies_accept_columnar_trade_batches():
+    trades = _trades()
+    dsr_config = DeflatedSharpeConfig(initial_capital_eur=500.0, assumed_trial_count=8, min_trade_count=50)
+    psr_config = ProbabilisticSharpeConfig(initial_capital_eur=500.0, min_trade_count=50)
+
+    assert assess_deflated_sharpe(TradeBatch.from_records(trades), dsr_config) == assess_deflated_sharpe(
+        trades, dsr_config
+    )
+    assert assess_probabilistic_sharpe(TradeBatch.from_records(trades), psr_config) == assess_probabilistic_sharpe(
+        trades, psr_config
+    )
+
+
 def test_progressive_pf_gate_reaches_candidate_review_without_promotion():
     assessment = evaluate_progressive_pf_quality(
         strategy_name="high_conviction_swing",
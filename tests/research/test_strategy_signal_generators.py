@@ -13,6 +13,7 @@ from autobot.v2.research.strategy_signal_generators import (
     MeanReversionResearchSignalGenerator,
     TrendResearchConfig,
     TrendResearchSignalGenerator,
+    sweep_grid_signals,
 )
 from autobot.v2.research.trade_journal import TradeJournal
 
@@ -160,6 +161,60 @@ def test_grid_research_can_test_mfe_trailing_exit(tmp_path):
     assert result.decision.live_promotion_allowed is False
 
 
+def _sweep_bars():
+    bars = []
+    for index in range(240):
+        wave = ((index % 37) - 18) / 900.0
+        drift = (index // 60) * 0.004
+        close = 100.0 * (1.0 + wave - drift)
+        bar = _bar(index, close)
+        regime = ("range", "trend_down", "range", "high_volatility_breakout")[(index // 25) % 4]
+        metadata = {"regime": regime, "spread_bps": 5.0 + (index % 7)}
+        bars.append(replace(bar, low=close * (0.995 - (index % 5) / 1000.0), metadata=metadata))
+    return bars
+
+
+def test_grid_sweep_replays_identical_journals_to_scalar_generators(tmp_path):
+    configs = [
+        GridResearchConfig(range_percent=4.0, num_levels=5, entry_touch_bps=20.0, take_profit_bps=40.0),
+        GridResearchConfig(range_percent=3.0, num_levels=9, take_profit_bps=70.0, min_atr_bps=12.0, atr_window=7),
+        GridResearchConfig(range_percent=5.0, num_levels=7, max_atr_bps=60.0, max_spread_bps=9.0),
+        GridResearchConfig(entry_touch_bps=4.0, support_confirmation_bars=2),
+        GridResearchConfig(blocked_regimes=("trend_down", "high_volatility_breakout"), min_expected_mfe_to_cost=0.5),
+        GridResearchConfig(allowed_regimes=("range",), exit_mode="cost_buffered_tp", take_profit_bps=20.0),
+        GridResearchConfig(exit_mode="mfe_trailing", mfe_trailing_activation_bps=30.0, mfe_trailing_drawdown_bps=15.0),
+        GridResearchConfig(exit_mode="time_stop_no_mfe", max_hold_bars=6, min_mfe_before_time_stop_bps=50.0),
+        GridResearchConfig(exit_mode="decaying_net_edge", decay_min_profit_bps=5.0, estimated_round_trip_cost_bps=20.0),
+    ]
+    bars = _sweep_bars()
+
+    sweep = sweep_grid_signals(bars, configs)
+
+    for index, grid_config in enumerate(configs):
+        backtest_config = _backtest_config(tmp_path / f"variant_{index}", "dynamic_grid")
+        scalar = BacktestEngine(backtest_config).run(bars, GridResearchSignalGenerator(grid_config))
+        swept = BacktestEngine(replace(backtest_config, output_dir=tmp_path / f"sweep_{index}")).run(
+            bars,
+            sweep.replay(index),
+        )
+
+        assert swept.signal_count == scalar.signal_count == sweep.signal_count(index)
+        assert swept.metrics == scalar.metrics
+        assert [trade.to_dict() for trade in TradeJournal.from_json(swept.journal_path).records] == [
+            trade.to_dict() for trade in TradeJournal.from_json(scalar.journal_path).records
+        ]
+    assert sum(sweep.signal_count(index) for index in range(len(configs))) > 0
+
+
+def test_grid_sweep_replay_rejects_a_different_bar_stream():
+    bars = _sweep_bars()
+    replay = sweep_grid_signals(bars[:10], [GridResearchConfig()]).replay(0)
+
+    with pytest.raises(ValueError, match="bar stream"):
+        for index, bar in enumerate(bars[1:12]):
+            replay(bar, tuple(bars[1 : index + 2]))
+
+
 def test_grid_research_rejects_invalid_experiment_parameters():
     with pytest.raises(ValueError):
         GridResearchConfig(range_percent=0.0)
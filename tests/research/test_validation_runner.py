@@ -1,5 +1,6 @@
 import json
 import sqlite3
+from dataclasses import replace
 
 import pytest
 
@@ -12,6 +13,7 @@ from autobot.v2.research.validation_runner import (
     load_bars_for_validation,
     main,
     make_signal_generator_factory,
+    run_grid_backtest_sweep,
     run_validation,
 )
 
@@ -116,6 +118,48 @@ def test_validation_runner_runs_backtest_from_csv(tmp_path):
     assert (tmp_path / "reports" / "backtests" / "pytest_runner_backtest.md").exists()
 
 
+def test_grid_backtest_sweep_matches_per_config_validation_runs(tmp_path):
+    csv_path = tmp_path / "bars.csv"
+    _write_grid_csv(csv_path)
+    strategy_configs = [
+        {"range_percent": 4.0, "num_levels": 5, "entry_touch_bps": 20.0, "take_profit_bps": 40.0},
+        {"range_percent": 4.0, "num_levels": 5, "entry_touch_bps": 20.0, "take_profit_bps": 400.0},
+        {"range_percent": 4.0, "num_levels": 5, "entry_touch_bps": 20.0, "allowed_regimes": ["never"]},
+    ]
+
+    def configs(output_dir):
+        return [
+            ValidationRunnerConfig(
+                run_id=f"pytest_sweep_{index}",
+                strategy="grid",
+                data_source="csv",
+                data_path=csv_path,
+                symbol="TRXEUR",
+                dataset_id="pytest_csv",
+                output_dir=output_dir,
+                min_closed_trades=1,
+                cost_config=ExecutionCostConfig(taker_fee_bps=0.0, fallback_spread_bps=0.0, slippage_bps=0.0),
+                strategy_config=strategy_config,
+            )
+            for index, strategy_config in enumerate(strategy_configs)
+        ]
+
+    swept = run_grid_backtest_sweep(configs(tmp_path / "sweep"))
+    scalar = [run_validation(config) for config in configs(tmp_path / "scalar")]
+
+    assert [result.result.trade_count for result in swept] == [1, 1, 0]
+    for swept_result, scalar_result in zip(swept, scalar):
+        assert swept_result.bar_count == scalar_result.bar_count
+        assert swept_result.result.signal_count == scalar_result.result.signal_count
+        assert swept_result.result.metrics == scalar_result.result.metrics
+        assert (
+            TradeJournal.from_json(swept_result.result.journal_path).records
+            == TradeJournal.from_json(scalar_result.result.journal_path).records
+        )
+    with pytest.raises(ValueError, match="same data selection"):
+        run_grid_backtest_sweep([configs(tmp_path)[0], replace(configs(tmp_path)[1], symbol="XLMZEUR")])
+
+
 def test_validation_runner_opt_in_contract_boundary_rejects_legacy_grid_entries_without_net_edge(tmp_path):
     csv_path = tmp_path / "bars.csv"
     _write_grid_csv(csv_path)
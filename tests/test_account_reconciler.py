@@ -0,0 +1,221 @@
+import asyncio
+import time
+
+import pytest
+
+from autobot.v2.account_reconciler import AccountReconciler, AccountSnapshot
+from autobot.v2.orchestrator_async import OrchestratorAsync
+
+
+pytestmark = pytest.mark.unit
+
+
+class _CountingExecutor:
+    def __init__(self, latency_s=0.0):
+        self.latency_s = latency_s
+        self.balance_calls = 0
+        self.trade_balance_calls = 0
+
+    async def get_balance(self):
+        self.balance_calls += 1
+        await asyncio.sleep(self.latency_s)
+        return {"ZEUR": 1000.0}
+
+    async def get_trade_balance(self, _asset):
+        self.trade_balance_calls += 1
+        await asyncio.sleep(self.latency_s)
+        return {"equivalent_balance": 1000.0}
+
+
+def _recorder(seen, name):
+    async def check(snapshot):
+        seen.append((name, snapshot))
+
+    return check
+
+
+async def test_burst_of_fills_shares_one_account_fetch():
+    executor = _CountingExecutor()
+    reconciler = AccountReconciler(executor, debounce_s=0.01, max_delay_s=0.5)
+    seen = []
+    owners = [object() for _ in range(20)]
+
+    for idx, owner in enumerate(owners):
+        reconciler.post_fill(owner, _recorder(seen, idx))
+    await asyncio.sleep(0.1)
+
+    assert (executor.balance_calls, executor.trade_balance_calls) == (1, 1)
+    assert sorted(name for name, _ in seen) == list(range(20))
+    assert len({id(snapshot) for _, snapshot in seen}) == 1
+    assert seen[0][1].trade_balance == {"equivalent_balance": 1000.0}
+    assert reconciler.status()["fetch_count"] == 1
+    await reconciler.close()
+
+
+async def test_repeated_fills_of_one_handler_run_its_check_once():
+    executor = _CountingExecutor()
+    reconciler = AccountReconciler(executor, debounce_s=0.0)
+    seen = []
+    owner = object()
+
+    for idx in range(5):
+        reconciler.post_fill(owner, _recorder(seen, idx))
+    assert reconciler.pending == 1
+    snapshot = await reconciler.flush()
+
+    assert isinstance(snapshot, AccountSnapshot)
+    assert [name for name, _ in seen] == [4]
+    assert await reconciler.flush() is None
+    assert executor.balance_calls == 1
+
+
+async def test_max_delay_bounds_a_continuous_stream_of_fills():
+    executor = _CountingExecutor()
+    reconciler = AccountReconciler(executor, debounce_s=0.05, max_delay_s=0.1)
+    seen = []
+    started = time.monotonic()
+
+    # A hint every 20 ms never leaves a 50 ms quiet period.
+    while time.monotonic() - started < 0.35:
+        reconciler.post_fill(object(), _recorder(seen, time.monotonic() - started))
+        await asyncio.sleep(0.02)
+    await asyncio.sleep(0.15)
+
+    assert 2 <= executor.balance_calls <= 5
+    assert reconciler.pending == 0
+    assert reconciler.checks_run == len(seen)
+    await reconciler.close()
+
+
+async def test_failed_fetch_requeues_checks_and_bad_checks_are_contained():
+    class _Down(_CountingExecutor):
+        async def get_balance(self):
+            raise RuntimeError("exchange down")
+
+    reconciler = AccountReconciler(_Down(), debounce_s=0.0, retry_s=0.05)
+    seen = []
+
+    async def broken(_snapshot):
+        raise ValueError("bad check")
+
+    reconciler.post_fill(object(), _recorder(seen, "a"))
+    assert await reconciler.flush() is None
+    assert seen == []
+    assert reconciler.pending == 1
+
+    reconciler.order_executor = _CountingExecutor()
+    reconciler.post_fill(object(), broken)
+    reconciler.post_fill(object(), _recorder(seen, "b"))
+    await reconciler.flush()
+    assert [name for name, _ in seen] == ["a", "b"]
+    assert reconciler.checks_run == 3
+    await reconciler.close()
+
+
+async def test_failed_fetch_is_retried_by_the_background_task():
+    class _Flaky(_CountingExecutor):
+        async def get_balance(self):
+            self.balance_calls += 1
+            if self.balance_calls == 1:
+                raise RuntimeError("exchange down")
+            return {"ZEUR": 1000.0}
+
+    executor = _Flaky()
+    reconciler = AccountReconciler(executor, debounce_s=0.0, retry_s=0.05)
+    seen = []
+
+    reconciler.post_fill(object(), _recorder(seen, "a"))
+    await asyncio.sleep(0.02)
+    assert (executor.balance_calls, seen) == (1, [])
+    await asyncio.sleep(0.1)
+
+    assert executor.balance_calls == 2
+    assert [name for name, _ in seen] == ["a"]
+    await reconciler.close()
+
+
+async def test_close_runs_a_final_flush_of_pending_checks():
+    executor = _CountingExecutor()
+    reconciler = AccountReconciler(executor, debounce_s=60.0)
+    seen = []
+
+    reconciler.post_fill(object(), _recorder(seen, "a"))
+    reconciler.post_fill(object(), _recorder(seen, "b"))
+    await reconciler.close()
+
+    assert sorted(name for name, _ in seen) == ["a", "b"]
+    assert executor.balance_calls == 1
+    assert reconciler.pending == 0
+
+
+async def test_failed_fetch_is_reported_as_last_error_until_a_fetch_succeeds(caplog):
+    class _Down(_CountingExecutor):
+        async def get_balance(self):
+            raise RuntimeError("exchange down")
+
+    reconciler = AccountReconciler(_Down(), debounce_s=60.0, retry_s=60.0)
+    reconciler.post_fill(object(), _recorder([], "a"))
+    await reconciler.flush()
+
+    assert reconciler.status()["pending"] == 1
+    assert reconciler.status()["last_error"] == "RuntimeError: exchange down"
+
+    reconciler.order_executor = _CountingExecutor()
+    await reconciler.flush()
+    assert reconciler.status()["last_error"] is None
+
+    # A final flush that fails drops its checks and says so.
+    reconciler.order_executor = _Down()
+    reconciler.post_fill(object(), _recorder([], "b"))
+    await reconciler.close()
+    assert reconciler.pending == 0
+    assert reconciler.status()["last_error"] == "RuntimeError: exchange down"
+    assert "1 contrôles abandonnés" in caplog.text
+
+
+def test_orchestrator_status_exposes_the_account_reconciler():
+    orchestrator = OrchestratorAsync.__new__(OrchestratorAsync)
+    orchestrator.account_reconciler = AccountReconciler(_CountingExecutor())
+    orchestrator.account_reconciler.last_error = "RuntimeError: exchange down"
+    status = orchestrator._account_reconciler_status()
+
+    assert status["enabled"] is True
+    assert status["pending"] == 0
+    assert status["last_error"] == "RuntimeError: exchange down"
+
+    orchestrator.account_reconciler = None
+    assert orchestrator._account_reconciler_status() == {"enabled": False}
+
+
+@pytest.mark.performance
+async def test_fill_burst_exchange_calls_and_fill_path_latency():
+    """40 handlers filling at once against a 20 ms exchange: per-fill fetch vs one coalesced fetch."""
+
+    async def per_fill(executor):
+        started = time.perf_counter()
+        await asyncio.gather(*(executor.get_balance() for _ in range(40)))
+        await asyncio.gather(*(executor.get_trade_balance("EUR") for _ in range(40)))
+        return time.perf_counter() - started
+
+    inline_executor = _CountingExecutor(latency_s=0.02)
+    inline_s = await per_fill(inline_executor)
+
+    executor = _CountingExecutor(latency_s=0.02)
+    reconciler = AccountReconciler(executor, debounce_s=0.01)
+    seen = []
+    started = time.perf_counter()
+    for idx in range(40):
+        reconciler.post_fill(object(), _recorder(seen, idx))
+    hint_s = time.perf_counter() - started
+    while len(seen) < 40:
+        await asyncio.sleep(0.005)
+    await reconciler.close()
+
+    inline_calls = inline_executor.balance_calls + inline_executor.trade_balance_calls
+    calls = executor.balance_calls + executor.trade_balance_calls
+    print(
+        f"\n⚖️ 40 fills: per-fill reconcile {inline_calls} REST calls, {inline_s * 1000:.1f} ms on the fill path"
+        f" | coalesced {calls} REST calls, {hint_s * 1e6:.1f} µs on the fill path"
+    )
+    assert calls == 2
+    assert hint_s < inline_s
@@ -0,0 +1,173 @@
+import random
+import sqlite3
+import time
+
+import pytest
+
+from autobot.v2.order_lifecycle import ActiveOrderIndex
+from autobot.v2.order_state_machine import PersistedOrderStateMachine
+from autobot.v2.persistence import NonTerminalOrderRecovery, StatePersistence
+
+
+pytestmark = pytest.mark.unit
+
+SYMBOLS = ("TRXEUR", "XETHZEUR", "ATOMEUR")
+
+
+async def _new_order(machine, index, symbol="TRXEUR", side="buy"):
+    return await machine.new_order(
+        instance_id="instance-1",
+        symbol=symbol,
+        side=side,
+        order_type="limit",
+        requested_qty=1.0,
+        strategy_id="trend_momentum",
+        decision_id=f"dec-{index}",
+        signal_id=f"sig-{index}",
+        client_order_id=f"order-{index}",
+    )
+
+
+def _scanned(rows):
+    return {(row["symbol"], row["side"]) for row in rows}
+
+
+async def test_index_tracks_the_non_terminal_orders_query_through_lifecycles(tmp_path):
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    machine = PersistedOrderStateMachine(persistence)
+    index = await persistence.active_order_index()
+    rng = random.Random(5)
+    statuses = {}
+    paths = {
+        "NEW": ("SENT", "CANCELED", "REJECTED"),
+        "SENT": ("ACK", "UNKNOWN", "EXPIRED"),
+        "ACK": ("PARTIAL", "CANCELED"),
+        "UNKNOWN": ("ACK", "REJECTED"),
+        "PARTIAL": ("CANCELED",),
+    }
+    try:
+        for step in range(120):
+            open_orders = [oid for oid, status in statuses.items() if status in paths]
+            if not open_orders or rng.random() < 0.4:
+                record = await _new_order(machine, step, rng.choice(SYMBOLS), rng.choice(("buy", "sell")))
+                statuses[record.client_order_id] = "NEW"
+            else:
+                oid = rng.choice(open_orders)
+                target = rng.choice(paths[statuses[oid]])
+                kwargs = {"filled_qty": 0.5} if target == "PARTIAL" else {}
+                assert await machine.transition(oid, target, "test", **kwargs) is True
+                statuses[oid] = target
+
+            rows = await persistence.get_non_terminal_orders()
+            assert {row["client_order_id"] for row in rows} == {oid for oid in statuses if oid in index}
+            for symbol in SYMBOLS:
+                for side in ("buy", "sell"):
+                    expected = (symbol, side) in _scanned(rows)
+                    assert await machine.is_duplicate_active(symbol, side) is expected
+        assert len(index) > 0
+    finally:
+        await persistence.close()
+
+
+async def test_index_is_rebuilt_from_persisted_orders_at_startup(tmp_path):
+    db_path = tmp_path / "state.db"
+    persistence = StatePersistence(str(db_path))
+    machine = PersistedOrderStateMachine(persistence)
+    await _new_order(machine, 1, "TRXEUR", "buy")
+    await _new_order(machine, 2, "XETHZEUR", "sell")
+    await machine.transition("order-2", "CANCELED", "test")
+    await persistence.close()
+    with sqlite3.connect(db_path) as connection:
+        # Rows written by an older runtime keep the legacy spelling.
+        connection.execute("UPDATE orders SET status = 'CANCELLED', terminal_at = NULL WHERE client_order_id = 'order-2'")
+
+    restarted = StatePersistence(str(db_path))
+    try:
+        index = await restarted.active_order_index()
+        assert await restarted.active_order_index() is index
+        assert index.active_orders("TRXEUR", "buy") == {"order-1"}
+        assert not index.has_active("XETHZEUR", "sell")
+        # Re-upserting an order keeps its persisted status, and the index follows it.
+        await _new_order(PersistedOrderStateMachine(restarted), 2, "XETHZEUR", "sell")
+        assert not index.has_active("XETHZEUR", "sell")
+    finally:
+        await restarted.close()
+
+
+async def test_unreadable_order_table_falls_back_to_a_scan(tmp_path, monkeypatch):
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    machine = PersistedOrderStateMachine(persistence)
+    await _new_order(machine, 1)
+
+    async def unavailable():
+        return NonTerminalOrderRecovery(False, [], reason="order_recovery_ledger_unavailable:OperationalError")
+
+    monkeypatch.setattr(persistence.orders, "get_non_terminal_orders_for_recovery", unavailable)
+    try:
+        assert await persistence.active_order_index() is None
+        assert await machine.is_duplicate_active("TRXEUR", "buy") is True
+        assert await machine.is_duplicate_active("TRXEUR", "sell") is False
+    finally:
+        await persistence.close()
+
+
+def test_index_mirrors_the_query_status_filter():
+    index = ActiveOrderIndex(
+        [
+            {"client_order_id": "a", "symbol": "TRXEUR", "side": "buy", "status": "NEW"},
+            {"client_order_id": "b", "symbol": "TRXEUR", "side": "buy", "status": "CANCELLED"},
+            {"client_order_id": "c", "symbol": "TRXEUR", "side": "sell", "status": "ACK", "terminal_at": "2026"},
+            {"client_order_id": "d", "symbol": "TRXEUR", "side": "sell", "status": None},
+        ]
+    )
+    index.record("a", "ATOMEUR", "buy", "SENT")
+
+    assert len(index) == 1
+    assert index.active_orders("ATOMEUR", "buy") == {"a"}
+    assert not index.has_active("TRXEUR", "buy")
+    index.discard("a")
+    index.discard("missing")
+    assert not index.has_active("ATOMEUR", "buy")
+
+
+class _ScanOnly:
+    """Persistence view without the active-order index (previous behaviour)."""
+
+    def __init__(self, persistence):
+        self._persistence = persistence
+
+    def __getattr__(self, name):
+        if name == "active_order_index":
+            raise AttributeError(name)
+        return getattr(self._persistence, name)
+
+
+@pytest.mark.performance
+async def test_signal_to_submit_latency_with_resting_orders(tmp_path):
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    machine = PersistedOrderStateMachine(persistence)
+    for step in range(500):
+        record = await _new_order(machine, f"resting-{step}", f"PAIR{step % 50}EUR", "sell")
+        await machine.transition(record.client_order_id, "SENT", "resting")
+
+    async def signal_to_submit(osm, label):
+        samples = []
+        for step in range(100):
+            symbol = f"{label.upper()}{step}EUR"
+            started = time.perf_counter()
+            assert await osm.is_duplicate_active(symbol, "buy") is False
+            record = await _new_order(osm, f"{label}-{step}", symbol, "buy")
+            await osm.transition(record.client_order_id, "SENT", "submitted")
+            samples.append(time.perf_counter() - started)
+        return sorted(samples)
+
+    try:
+        scan = await signal_to_submit(PersistedOrderStateMachine(_ScanOnly(persistence)), "scan")
+        indexed = await signal_to_submit(machine, "indexed")
+    finally:
+        await persistence.close()
+    print(
+        f"\n📑 signal->submit, 500+ resting orders: scan p50 {scan[50] * 1000:.2f} ms p99 {scan[98] * 1000:.2f} ms"
+        f" | index p50 {indexed[50] * 1000:.2f} ms p99 {indexed[98] * 1000:.2f} ms"
+    )
+    assert indexed[50] < scan[50]
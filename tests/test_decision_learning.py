@@ -4,7 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from autobot.v2.api import dashboard
-from autobot.v2.decision_learning import DecisionLearningConfig, DecisionLearningEngine
+from autobot.v2.decision_learning import DecisionLearningConfig, DecisionLearningEngine, build_outcome_for_decision
 from autobot.v2.persistence import StatePersistence
 
 
@@ -366,3 +366,148 @@ async def test_decision_learning_endpoint_returns_outcome_summary(monkeypatch, t
         assert body["summary"]["by_source"]["decision_learning_triple_barrier"] == 1
     finally:
         await persistence.close()
+
+
+@pytest.mark.asyncio
+async def test_decision_learning_bulk_refresh_uses_bounded_queries(tmp_path):
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    base = datetime.now(timezone.utc) - timedelta(hours=6)
+    symbols = ("TRXEUR", "ETHEUR", "ADAEUR")
+    try:
+        for index in range(120):
+            symbol = symbols[index % len(symbols)]
+            await persistence.append_decision_ledger_event(
+                event_id=f"dlg_bulk_{index}",
+                decision_id=f"dec_bulk_{index}",
+                signal_id=f"sig_bulk_{index}",
+                instance_id="inst_1",
+                symbol=symbol,
+                strategy="grid",
+                engine="grid",
+                event_type="decision",
+                event_status="buy_rejected" if index % 2 else "buy_accepted",
+                reason="cost_guard",
+                source="signal_handler_runtime",
+                payload={"side": "buy", "signal_price": 100.0, "cost_bps": 10.0},
+                created_at=_ts(base, index),
+            )
+        await persistence.append_market_price_samples([
+            {
+                "symbol": symbol,
+                "price": 100.0 + ((minute * 7 + offset * 13) % 17 - 8) * 0.08,
+                "observed_at": _ts(base, minute),
+                "bucket_start": _ts(base, minute),
+                "source": "test",
+            }
+            for offset, symbol in enumerate(symbols)
+            for minute in range(0, 200)
+        ])
+        config = DecisionLearningConfig(
+            enabled=True,
+            horizons_minutes=(15, 60),
+            max_candidates_per_horizon=500,
+            recent_limit=5,
+        )
+        expected: dict[tuple[int, int], tuple[str, float]] = {}
+        for horizon in config.horizons_minutes:
+            for row in await persistence.get_decision_outcome_candidates(horizon_minutes=horizon, limit=500):
+                created = datetime.fromisoformat(row["created_at"])
+                samples = await persistence.get_market_price_samples(
+                    symbols=[row["symbol"]],
+                    start_at=created.isoformat(),
+                    end_at=(created + timedelta(minutes=horizon)).isoformat(),
+                )
+                outcome, _reason = build_outcome_for_decision(
+                    row, price_by_symbol={}, price_samples=samples, horizon_minutes=horizon, config=config
+                )
+                expected[(row["id"], horizon)] = (outcome["outcome_label"], outcome["net_return_bps"])
+
+        calls = {"prices": 0, "single_upserts": 0}
+        original_prices = persistence.get_market_price_samples
+        original_upsert = persistence.upsert_signal_outcome
+
+        async def counted_prices(**kwargs):
+            calls["prices"] += 1
+            return await original_prices(**kwargs)
+
+        async def counted_upsert(**kwargs):
+            calls["single_upserts"] += 1
+            return await original_upsert(**kwargs)
+
+        persistence.get_market_price_samples = counted_prices
+        persistence.upsert_signal_outcome = counted_upsert
+        snapshot = await DecisionLearningEngine(config).refresh(persistence=persistence, instances=[])
+
+        assert snapshot["refreshed"] == len(expected) == 240
+        assert calls == {"prices": len(symbols), "single_upserts": 0}
+        assert snapshot["query_count"] == len(config.horizons_minutes) + len(symbols) + 1
+        assert set(snapshot["latency_ms"]) == {"candidates", "price_samples", "labelling", "write", "total"}
+        rows = await persistence.get_signal_outcomes(limit=500)
+        assert {
+            (row["decision_ledger_id"], row["horizon_minutes"]): (row["outcome_label"], row["net_return_bps"])
+            for row in rows
+        } == expected
+    finally:
+        await persistence.close()
+
+
+@pytest.mark.asyncio
+async def test_decision_learning_pages_merged_price_slice(monkeypatch, tmp_path):
+    from autobot.v2 import decision_learning
+
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    base = datetime.now(timezone.utc) - timedelta(hours=6)
+    try:
+        for index, minute in enumerate((0, 60, 120)):
+            await persistence.append_decision_ledger_event(
+                event_id=f"dlg_page_{index}",
+                decision_id=f"dec_page_{index}",
+                signal_id=f"sig_page_{index}",
+                instance_id="inst_1",
+                symbol="TRXEUR",
+                strategy="grid",
+                engine="grid",
+                event_type="decision",
+                event_status="buy_rejected",
+                reason="cost_guard",
+                source="signal_handler_runtime",
+                payload={"side": "buy", "signal_price": 100.0, "cost_bps": 10.0},
+                created_at=_ts(base, minute),
+            )
+        # Two samples per timestamp every 30 s: several times denser than the
+        # one-per-bucket sizing, so the merged slice spans many pages.
+        await persistence.append_market_price_samples([
+            {
+                "symbol": "TRXEUR",
+                "price": 100.0 + ((step * 7 + copy) % 11 - 5) * 0.1,
+                "observed_at": (base + timedelta(seconds=30 * step)).isoformat(),
+                "bucket_start": (base + timedelta(seconds=30 * step + copy)).isoformat(),
+                "source": "test",
+            }
+            for step in range(0, 300)
+            for copy in range(2)
+        ])
+        config = DecisionLearningConfig(enabled=True, horizons_minutes=(15,), recent_limit=5)
+        expected = {}
+        for row in await persistence.get_decision_outcome_candidates(horizon_minutes=15, limit=500):
+            created = datetime.fromisoformat(row["created_at"])
+            samples = await persistence.get_market_price_samples(
+                symbols=[row["symbol"]],
+                start_at=created.isoformat(),
+                end_at=(created + timedelta(minutes=15)).isoformat(),
+            )
+            assert len(samples) == 62
+            outcome, _reason = build_outcome_for_decision(
+                row, price_by_symbol={}, price_samples=samples, horizon_minutes=15, config=config
+            )
+            expected[row["id"]] = (outcome["outcome_label"], outcome["net_return_bps"])
+
+        monkeypatch.setattr(decision_learning, "_PRICE_SAMPLE_QUERY_LIMIT", 25)
+        snapshot = await DecisionLearningEngine(config).refresh(persistence=persistence, instances=[])
+
+        assert snapshot["refreshed"] == len(expected) == 3
+        assert snapshot["query_count"] > 3
+        rows = await persistence.get_signal_outcomes(limit=500)
+        assert {row["decision_ledger_id"]: (row["outcome_label"], row["net_return_bps"]) for row in rows} == expected
+    finally:
+        await persistence.close()
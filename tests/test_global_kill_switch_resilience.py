@@ -83,3 +83,130 @@ def test_failed_global_persistence_does_not_cancel_local_halt(monkeypatch, tmp_p
 def test_invalid_retry_configuration_is_rejected_before_opening_a_database(tmp_path):
     with pytest.raises(ValueError, match="retry configuration"):
         GlobalKillSwitchStore(str(tmp_path / "global_kill.db"), retry_attempts=0)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cached_reads_skip_sqlite_until_local_write_invalidates(monkeypatch, tmp_path):
+    store = GlobalKillSwitchStore(str(tmp_path / "global_kill.db"), clock=_Clock())
+    reads = {"count": 0}
+    original = store._read_persisted_state
+
+    def counting_read():
+        reads["count"] += 1
+        return original()
+
+    monkeypatch.setattr(store, "_read_persisted_state", counting_read)
+
+    assert all(store.get().tripped is False for _ in range(20))
+    assert reads["count"] == 1
+
+    assert store.trip("api_failures", "fixture") is True
+    state = store.get()
+    assert state.tripped is True
+    assert state.reason_code == "api_failures"
+    assert reads["count"] == 2
+
+    store.acknowledge_recovery("operator")
+    assert store.get().tripped is False
+    assert reads["count"] == 3
+    assert store.cache_metrics()["hits"] == 19
+
+
+def test_trip_from_another_process_is_seen_through_file_change(tmp_path):
+    path = str(tmp_path / "global_kill.db")
+    clock = _Clock()
+    reader = GlobalKillSwitchStore(path, clock=clock)
+    assert reader.get().tripped is False
+
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE global_kill_state SET tripped=1, reason_code='remote', recovery_required=1 WHERE id=1")
+    conn.commit()
+    conn.close()
+
+    state = reader.get()
+    assert state.tripped is True
+    assert state.reason_code == "remote"
+
+
+def test_stale_cache_is_bounded_by_ttl_when_files_look_unchanged(monkeypatch, tmp_path):
+    path = str(tmp_path / "global_kill.db")
+    clock = _Clock()
+    reader = GlobalKillSwitchStore(path, clock=clock, cache_ttl_seconds=0.5)
+    writer = GlobalKillSwitchStore(path)
+    monkeypatch.setattr(reader, "_file_stamp", lambda: ((1, 1, 1), None))
+
+    assert reader.get().tripped is False
+    assert writer.trip("remote", "other process") is True
+    assert reader.get().tripped is False
+
+    clock.now += 0.5
+    assert reader.get().tripped is True
+
+
+def test_mutating_a_returned_state_does_not_corrupt_the_cache(tmp_path):
+    store = GlobalKillSwitchStore(str(tmp_path / "global_kill.db"), clock=_Clock())
+
+    store.get().tripped = True
+
+    assert store.get().tripped is False
+
+
+def test_store_unavailable_after_cached_healthy_read_fails_closed(monkeypatch, tmp_path):
+    path = tmp_path / "global_kill.db"
+    store = GlobalKillSwitchStore(
+        str(path),
+        retry_attempts=1,
+        sleeper=lambda _: None,
+        clock=_Clock(),
+    )
+    assert store.get().tripped is False
+
+    def broken_read():
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(store, "_read_persisted_state", broken_read)
+    store._pool.close_all()
+    path.unlink()
+
+    for _ in range(2):
+        state = store.get()
+        assert state.tripped is True
+        assert state.storage_healthy is False
+        assert state.reason_code == "kill_switch_store_unavailable"
+    assert store.cache_metrics()["hits"] == 0
+
+
+def test_unhealthy_states_are_never_served_from_cache(monkeypatch, tmp_path):
+    store = GlobalKillSwitchStore(str(tmp_path / "global_kill.db"), retry_attempts=1, clock=_Clock())
+    original = store._read_persisted_state
+    monkeypatch.setattr(store, "_read_persisted_state", lambda: None)
+
+    assert store.get().reason_code == "kill_switch_store_invalid"
+
+    monkeypatch.setattr(store, "_read_persisted_state", original)
+    assert store.get().storage_healthy is True
+
+
+def test_disabled_cache_reads_sqlite_every_time(monkeypatch, tmp_path):
+    store = GlobalKillSwitchStore(str(tmp_path / "global_kill.db"), cache_ttl_seconds=0.0)
+    reads = {"count": 0}
+    original = store._read_persisted_state
+
+    def counting_read():
+        reads["count"] += 1
+        return original()
+
+    monkeypatch.setattr(store, "_read_persisted_state", counting_read)
+    for _ in range(3):
+        store.get()
+
+    assert reads["count"] == 3
+    with pytest.raises(ValueError, match="cache configuration"):
+        GlobalKillSwitchStore(str(tmp_path / "other.db"), cache_ttl_seconds=-1.0)
@@ -0,0 +1,136 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from autobot.v2.paper_buy_window import (
+    SymbolBuyWindow,
+    ledger_epoch,
+    record_ledger_buy,
+    reset_buy_windows,
+    shared_buy_window,
+)
+from autobot.v2.persistence import StatePersistence
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _fresh_windows():
+    reset_buy_windows()
+    yield
+    reset_buy_windows()
+
+
+def _ledger(db_path, rows):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE trade_ledger (symbol TEXT, side TEXT, created_at TEXT)")
+        conn.executemany("INSERT INTO trade_ledger(symbol, side, created_at) VALUES (?, ?, ?)", rows)
+
+
+def test_seed_matches_ledger_filter_and_window_slides(tmp_path):
+    db = tmp_path / "state.db"
+    now = datetime.now(timezone.utc)
+    _ledger(
+        db,
+        [
+            ("trxeur", "BUY", (now - timedelta(minutes=50)).isoformat()),
+            ("TRXEUR", "buy", (now - timedelta(minutes=5)).isoformat()),
+            ("ATOMEUR", "buy", (now - timedelta(minutes=1)).isoformat()),
+            ("ATOMEUR", "sell", (now - timedelta(minutes=1)).isoformat()),
+            ("AVAXEUR", "buy", (now - timedelta(minutes=61)).isoformat()),
+            ("AVAXEUR", "buy", "not-a-timestamp"),
+        ],
+    )
+    window = SymbolBuyWindow(3600)
+
+    assert window.seed(db) is True
+    assert window.counts(now.timestamp()) == ({"TRXEUR": 2, "ATOMEUR": 1}, 3)
+    assert window.counts((now + timedelta(minutes=20)).timestamp()) == ({"TRXEUR": 1, "ATOMEUR": 1}, 2)
+    assert window.counts((now + timedelta(minutes=60)).timestamp()) == ({}, 0)
+
+
+def test_records_before_seed_are_left_to_the_seed_query(tmp_path):
+    db = tmp_path / "state.db"
+    window = shared_buy_window(db, 3600)
+    created_at = datetime.now(timezone.utc).isoformat()
+
+    assert window.seed(db) is False
+    record_ledger_buy(db, "TRXEUR", "buy", created_at)
+    _ledger(db, [("TRXEUR", "buy", created_at)])
+    assert window.seed(db) is True
+
+    record_ledger_buy(str(db), "TRXEUR", "buy", created_at)
+    record_ledger_buy(db, "TRXEUR", "sell", created_at)
+    record_ledger_buy(tmp_path / "other.db", "TRXEUR", "buy", created_at)
+
+    assert window.counts()[0] == {"TRXEUR": 2}
+    assert shared_buy_window(str(db), 3600.0) is window
+    assert shared_buy_window(db, 60) is not window
+    assert ledger_epoch("2026-07-01T00:00:00.123+02:00") == datetime(2026, 7, 1, tzinfo=timezone.utc).timestamp()
+
+
+def test_refresh_catches_up_with_other_writers_without_double_counting(tmp_path):
+    db = tmp_path / "state.db"
+    now = datetime.now(timezone.utc)
+    _ledger(db, [("TRXEUR", "buy", (now - timedelta(minutes=5)).isoformat())])
+    window = shared_buy_window(db, 3600)
+
+    assert window.refresh(db) is True
+    assert window.watermark == 1
+    # A commit that landed while seed() ran is already counted by the seed.
+    record_ledger_buy(db, "TRXEUR", "buy", now.isoformat(), ledger_id=1)
+    assert window.counts()[0] == {"TRXEUR": 1}
+
+    with sqlite3.connect(db) as conn:
+        # Another process: shadow observation sync writing a backfilled buy.
+        conn.execute(
+            "INSERT INTO trade_ledger(symbol, side, created_at) VALUES (?, ?, ?)",
+            ("ATOMEUR", "buy", (now - timedelta(minutes=30)).isoformat()),
+        )
+        conn.execute(
+            "INSERT INTO trade_ledger(symbol, side, created_at) VALUES (?, ?, ?)",
+            ("TRXEUR", "buy", now.isoformat()),
+        )
+    # This process saw its own insert (rowid 3) before the catch-up read.
+    record_ledger_buy(db, "TRXEUR", "buy", now.isoformat(), ledger_id=3)
+
+    assert window.refresh(db) is True
+    assert window.watermark == 3
+    assert window.counts(now.timestamp()) == ({"TRXEUR": 2, "ATOMEUR": 1}, 3)
+    assert window.refresh(db) is True
+    assert window.counts((now + timedelta(minutes=40)).timestamp()) == ({"TRXEUR": 2}, 2)
+
+
+@pytest.mark.asyncio
+async def test_inserted_ledger_buys_feed_the_shared_window(tmp_path):
+    db = tmp_path / "state.db"
+    persistence = StatePersistence(str(db))
+    await persistence.initialize()
+    window = shared_buy_window(db, 3600)
+    assert window.seed(db) is True
+    payload = dict(
+        trade_id="buy-1",
+        position_id="pos",
+        instance_id="inst",
+        symbol="TRXEUR",
+        side="buy",
+        expected_price=1.0,
+        executed_price=1.0,
+        volume=10.0,
+        fees=0.1,
+        slippage_bps=1.0,
+        is_opening_leg=True,
+        strategy_id="trend_momentum",
+        decision_id="dec-window",
+        signal_id="sig-window",
+        execution_mode="shadow_paper",
+    )
+
+    assert await persistence.append_trade_ledger(**payload) is True
+    assert await persistence.append_trade_ledger(**payload) is False
+    assert await persistence.append_trade_ledger(**{**payload, "trade_id": "sell-1", "side": "sell"}) is True
+    await persistence.close()
+
+    assert window.counts() == ({"TRXEUR": 1}, 1)
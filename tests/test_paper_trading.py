@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import sqlite3
+import threading
+import time
 from datetime import datetime, timezone
 
 import pytest
 
+from autobot.v2.paper_execution_store import PaperExecutionStoreError
 from autobot.v2.paper_trading import PaperTradingExecutor
 from autobot.v2.order_executor import OrderSide
 
@@ -480,3 +484,223 @@ async def test_trade_balance_reuses_observed_symbol_for_unmapped_altcoins(tmp_pa
 
     assert requested_symbols == ["ATOMEUR"]
     assert trade_balance["equivalent_balance"] == pytest.approx(1000.0 + 0.5)
+
+
+@pytest.mark.asyncio
+async def test_paper_fills_are_batched_indexed_and_flushed_on_close(tmp_path, monkeypatch):
+    monkeypatch.setenv("PAPER_STORE_FLUSH_INTERVAL_SECONDS", "5")
+    executor = PaperTradingExecutor(db_path=str(tmp_path / "paper_trades.db"), initial_capital=1000.0)
+    results = [
+        await executor.execute_market_order(
+            "XLTCZEUR",
+            OrderSide.BUY,
+            0.01,
+            userref=5000 + index,
+            price_hint=90.0 + index,
+            **_trace(f"batched-{index}"),
+        )
+        for index in range(20)
+    ]
+
+    status = await executor.get_order_status(results[7].txid)
+    found = await executor.find_order_by_userref(5019)
+
+    assert status is not None and status.status == "filled"
+    assert status.price == pytest.approx(97.0)
+    assert found is not None and found[0] == results[19].txid
+    assert executor._store.get_status()["index_hits"] == 2
+    with sqlite3.connect(executor.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+
+    await executor.close()
+
+    store_status = executor._store.get_status()
+    assert store_status["written"] == 20
+    assert store_status["batches"] == 1
+    with sqlite3.connect(executor.db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM trades WHERE status = 'filled'").fetchone()[0] == 20
+
+
+@pytest.mark.asyncio
+async def test_paper_open_orders_index_tracks_cancels_and_reloads_pending(tmp_path):
+    db_path = str(tmp_path / "paper_trades.db")
+    executor = PaperTradingExecutor(db_path=db_path, initial_capital=1000.0)
+    kept = await executor.execute_stop_loss_order(
+        "XETHZEUR", OrderSide.SELL, 0.5, 90.0, userref=11, **_trace("sl-kept")
+    )
+    cancelled = await executor.execute_stop_loss_order(
+        "XETHZEUR", OrderSide.SELL, 0.5, 85.0, userref=12, **_trace("sl-cancelled")
+    )
+
+    assert set(await executor.get_open_orders()) == {kept.txid, cancelled.txid}
+    assert await executor.cancel_order(cancelled.txid) is True
+    assert set(await executor.get_open_orders()) == {kept.txid}
+    assert (await executor.get_order_status(cancelled.txid)).status == "cancelled"
+    await executor.close()
+
+    with sqlite3.connect(db_path) as conn:
+        statuses = dict(conn.execute("SELECT txid, status FROM trades").fetchall())
+    assert statuses == {kept.txid: "pending", cancelled.txid: "cancelled"}
+
+    restarted = PaperTradingExecutor(db_path=db_path, initial_capital=1000.0)
+    assert set(await restarted.get_open_orders()) == {kept.txid}
+    assert (await restarted.find_order_by_userref(11))[0] == kept.txid
+    await restarted.cancel_all_orders()
+    assert await restarted.get_open_orders() == {}
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_paper_aggregate_reads_see_buffered_fills(tmp_path, monkeypatch):
+    monkeypatch.setenv("PAPER_STORE_FLUSH_INTERVAL_SECONDS", "5")
+    executor = PaperTradingExecutor(db_path=str(tmp_path / "paper_trades.db"), initial_capital=1000.0)
+    await executor.execute_market_order(
+        "XLTCZEUR", OrderSide.BUY, 1.0, price_hint=100.0, **_trace("aggregate")
+    )
+
+    balance = await executor.get_balance()
+
+    assert balance["XLTC"] == pytest.approx(1.0)
+    assert executor.get_trade_summary()["total_trades"] == 1
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_paper_async_reads_drain_the_store_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setenv("PAPER_STORE_FLUSH_INTERVAL_SECONDS", "5")
+    executor = PaperTradingExecutor(db_path=str(tmp_path / "paper_trades.db"), initial_capital=1000.0)
+    await executor.execute_market_order(
+        "XLTCZEUR", OrderSide.BUY, 1.0, price_hint=100.0, **_trace("off-loop")
+    )
+    flush_threads = []
+    flush = executor._store.flush
+
+    def recording_flush(timeout=None):
+        flush_threads.append(threading.current_thread())
+        return flush(timeout)
+
+    monkeypatch.setattr(executor._store, "flush", recording_flush)
+
+    await executor.get_balance()
+    await executor.get_closed_orders()
+    await executor.get_trade_balance("EUR")
+
+    assert len(flush_threads) >= 4
+    assert threading.main_thread() not in flush_threads
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_paper_store_keeps_failed_batches_and_refuses_writes_until_committed(tmp_path, monkeypatch):
+    executor = PaperTradingExecutor(db_path=str(tmp_path / "paper_trades.db"), initial_capital=1000.0)
+    store = executor._store
+    store.retry_interval_seconds = 0.05
+    commit = store._commit
+    failures = {"left": 1}
+
+    def flaky_commit(operations):
+        if failures["left"]:
+            failures["left"] -= 1
+            raise sqlite3.OperationalError("disk I/O error")
+        commit(operations)
+
+    monkeypatch.setattr(store, "_commit", flaky_commit)
+    first = await executor.execute_market_order(
+        "XLTCZEUR", OrderSide.BUY, 1.0, price_hint=100.0, **_trace("failed-batch")
+    )
+    deadline = time.monotonic() + 5.0
+    while not store.get_status()["failed"] and time.monotonic() < deadline:
+        await asyncio.sleep(0.005)
+
+    with pytest.raises(PaperExecutionStoreError, match="1 write"):
+        store.flush()
+    with pytest.raises(PaperExecutionStoreError):
+        await executor.execute_market_order(
+            "XLTCZEUR", OrderSide.BUY, 1.0, price_hint=100.0, **_trace("refused")
+        )
+
+    while store.get_status()["failed"] and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    assert store.flush() is True
+    with sqlite3.connect(executor.db_path) as conn:
+        assert conn.execute("SELECT txid FROM trades").fetchall() == [(first.txid,)]
+    status = store.get_status()
+    assert (status["write_errors"], status["retries"], status["written"]) == (1, 1, 1)
+    await executor.close()
+
+
+@pytest.mark.asyncio
+async def test_paper_store_close_reports_writes_it_could_not_commit(tmp_path, monkeypatch):
+    monkeypatch.setenv("PAPER_STORE_FLUSH_INTERVAL_SECONDS", "5")
+    executor = PaperTradingExecutor(db_path=str(tmp_path / "paper_trades.db"), initial_capital=1000.0)
+
+    def failing_commit(_operations):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(executor._store, "_commit", failing_commit)
+    await executor.execute_market_order(
+        "XLTCZEUR", OrderSide.BUY, 1.0, price_hint=100.0, **_trace("lost-on-close")
+    )
+
+    with pytest.raises(PaperExecutionStoreError, match="1 write"):
+        await executor.close()
+
+
+class _PerFillCommitPaperExecutor(PaperTradingExecutor):
+    """Former persistence path: one connection and commit per fill."""
+
+    def _save_trade(self, trade):
+        with sqlite3.connect(self.db_path) as conn:
+            row = trade.to_dict()
+            columns = ", ".join(row)
+            conn.execute(
+                f"INSERT OR REPLACE INTO trades ({columns}) VALUES ({', '.join('?' for _ in row)})",
+                tuple(row.values()),
+            )
+            conn.commit()
+
+
+async def _event_loop_stall_seconds(executor, *, instances: int, orders_per_instance: int) -> float:
+    stalls: list[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0)
+            stalls.append(time.perf_counter() - started)
+
+    async def instance(index: int) -> None:
+        for order in range(orders_per_instance):
+            result = await executor.execute_market_order(
+                "XXBTZEUR",
+                OrderSide.BUY if order % 2 == 0 else OrderSide.SELL,
+                0.001,
+                userref=index,
+                price_hint=50_000.0,
+                **_trace(f"bench-{index}-{order}"),
+            )
+            assert result.success is True
+            await executor.get_order_status(result.txid)
+
+    monitor = asyncio.create_task(heartbeat())
+    await asyncio.gather(*(instance(index) for index in range(instances)))
+    done.set()
+    await monitor
+    await executor.close()
+    return sum(stalls)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_buffered_store_reduces_event_loop_stall_for_100_paper_instances(tmp_path):
+    kwargs = {"instances": 100, "orders_per_instance": 20}
+    before = await _event_loop_stall_seconds(
+        _PerFillCommitPaperExecutor(db_path=str(tmp_path / "before.db")), **kwargs
+    )
+    after = await _event_loop_stall_seconds(
+        PaperTradingExecutor(db_path=str(tmp_path / "after.db")), **kwargs
+    )
+
+    print(f"event loop stall: per-fill commit={before:.3f}s buffered={after:.3f}s")
+    assert after < before / 3
@@ -1,6 +1,18 @@
+import random
+import time
+
 import pytest
 
-from autobot.v2.pattern_learning import PatternLearningConfig, PatternLearningEngine, extract_pattern_features
+from autobot.v2.pattern_learning import (
+    IncrementalPatternLearner,
+    PatternLearningConfig,
+    PatternLearningEngine,
+    extract_pattern_features,
+    fold_new_signal_outcomes,
+    reset_pattern_learners,
+    shared_pattern_learner,
+)
+from autobot.v2.persistence import StatePersistence
 
 
 def _outcome(
@@ -102,3 +114,126 @@ def test_pattern_learning_can_opt_into_proxy_fallback():
 
     assert snapshot["summary"]["outcomes_used"] == 3
     assert snapshot["summary"]["positive_patterns"] > 0
+
+
+def _stored(ledger_id, second, rng):
+    net = rng.choice([-80.0, -20.0, 5.0, 40.0, 90.0]) + rng.random()
+    outcome = _outcome(
+        symbol=rng.choice(["TRXEUR", "ATOMEUR", "AVAXEUR"]),
+        engine=rng.choice(["trend_momentum", "grid"]),
+        net=net,
+        gross=net + 15.0,
+        label=rng.choice(["missed_profit", "saved_loss", "accepted_positive", "expired"]),
+        barrier=rng.choice(["take_profit", "stop_loss", "unknown"]),
+        source=rng.choice(["decision_learning_triple_barrier"] * 2 + ["decision_learning_current_price_proxy"]),
+        regime=rng.choice(["trend", "range"]),
+    )
+    outcome.update(
+        outcome_id=f"out-{ledger_id}",
+        decision_ledger_id=ledger_id,
+        instance_id="inst",
+        reference_price=1.0,
+        evaluation_price=1.0,
+        decision_created_at="2026-07-01T00:00:00+00:00",
+        evaluated_at=f"2026-07-01T{second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}+00:00",
+    )
+    return outcome
+
+
+def _without_timestamp(snapshot):
+    return {key: value for key, value in snapshot.items() if key != "timestamp"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("prefer_triple_barrier", [True, False])
+async def test_incremental_learner_matches_a_full_rebuild(tmp_path, prefer_triple_barrier):
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    await persistence.initialize()
+    config = PatternLearningConfig(min_samples=2, max_outcomes=40, prefer_triple_barrier=prefer_triple_barrier)
+    learner = IncrementalPatternLearner(config)
+    engine = PatternLearningEngine(config)
+    rng = random.Random(7)
+    second = 0
+    try:
+        for _batch in range(12):
+            second += 60
+            rows = []
+            for _ in range(15):
+                # Re-labels existing decisions, with evaluated_at ties inside a batch.
+                second += rng.choice([0, 1])
+                rows.append(_stored(rng.randrange(80), second, rng))
+            await persistence.upsert_signal_outcomes(rows)
+            await learner.catch_up(persistence)
+
+            expected = engine.build_snapshot(await persistence.get_signal_outcomes(limit=config.max_outcomes))
+            assert _without_timestamp(learner.snapshot()) == _without_timestamp(expected)
+        assert learner.snapshot()["summary"]["patterns"] > 0
+    finally:
+        await persistence.close()
+
+
+@pytest.mark.unit
+async def test_learner_catches_up_from_its_watermark_after_restart(tmp_path):
+    reset_pattern_learners()
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    await persistence.initialize()
+    config = PatternLearningConfig(min_samples=2, max_outcomes=100)
+    rng = random.Random(3)
+    try:
+        await persistence.upsert_signal_outcomes([_stored(ledger_id, ledger_id, rng) for ledger_id in range(30)])
+        assert await fold_new_signal_outcomes(persistence) == 0
+
+        learner = shared_pattern_learner(persistence, config)
+        assert shared_pattern_learner(persistence, config) is learner
+        assert await learner.catch_up(persistence) == 30
+        restarted = IncrementalPatternLearner(config)
+        await restarted.catch_up(persistence)
+        assert _without_timestamp(restarted.snapshot()) == _without_timestamp(learner.snapshot())
+
+        await persistence.upsert_signal_outcomes([_stored(ledger_id, 100 + ledger_id, rng) for ledger_id in (3, 40)])
+        assert await fold_new_signal_outcomes(persistence) == 2
+        assert await restarted.catch_up(persistence) == 2
+        assert restarted.watermark == learner.watermark
+        assert _without_timestamp(restarted.snapshot()) == _without_timestamp(learner.snapshot())
+        assert learner.snapshot()["summary"]["outcomes_used"] + learner.snapshot()["summary"][
+            "legacy_proxy_outcomes_ignored"
+        ] == 31
+    finally:
+        await persistence.close()
+        reset_pattern_learners()
+
+
+@pytest.mark.unit
+@pytest.mark.performance
+async def test_incremental_snapshot_cost_tracks_new_outcomes_not_history(tmp_path):
+    persistence = StatePersistence(str(tmp_path / "state.db"))
+    await persistence.initialize()
+    config = PatternLearningConfig(max_outcomes=20_000)
+    rng = random.Random(11)
+    try:
+        await persistence.upsert_signal_outcomes([_stored(ledger_id, ledger_id, rng) for ledger_id in range(20_000)])
+        learner = IncrementalPatternLearner(config)
+        await learner.catch_up(persistence)
+        engine = PatternLearningEngine(config)
+
+        rebuild_s = incremental_s = 0.0
+        for round_index in range(5):
+            second = 30_000 + round_index * 10
+            await persistence.upsert_signal_outcomes(
+                [_stored(20_000 + round_index * 10 + step, second + step, rng) for step in range(10)]
+            )
+            started = time.perf_counter()
+            expected = engine.build_snapshot(await persistence.get_signal_outcomes(limit=config.max_outcomes))
+            rebuild_s += time.perf_counter() - started
+            started = time.perf_counter()
+            await learner.catch_up(persistence)
+            snapshot = learner.snapshot()
+            incremental_s += time.perf_counter() - started
+            assert _without_timestamp(snapshot) == _without_timestamp(expected)
+        print(
+            f"\n🧩 pattern snapshot, 20k outcomes, 10 new per request: rebuild {rebuild_s / 5 * 1000:.1f} ms,"
+            f" incremental {incremental_s / 5 * 1000:.2f} ms"
+        )
+        assert incremental_s * 10 < rebuild_s
+    finally:
+        await persistence.close()
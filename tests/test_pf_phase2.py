@@ -7,6 +7,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from autobot.v2.account_reconciler import AccountReconciler
 from autobot.v2.persistence import StatePersistence
 from autobot.v2.pf_validation import apply_cost_sensitivity, walk_forward_validate
 from autobot.v2.signal_handler_async import SignalHandlerAsync
@@ -290,6 +291,72 @@ async def test_post_trade_reconcile_detects_real_divergence():
     assert handler._kill_switch.triggers[0][0] == "reconciliation_mismatch"
 
 
+@pytest.mark.asyncio
+async def test_post_trade_reconcile_hints_the_shared_account_reconciler():
+    executor = _DummyExecutor(
+        balance_zeur=900.0,  # strong cash drift
+        trade_balance={"n": -20.0, "u": 0.0, "c": 0.1},
+    )
+    calls = []
+    original = executor.get_balance
+
+    async def counting_balance():
+        calls.append("balance")
+        return await original()
+
+    executor.get_balance = counting_balance
+    reconciler = AccountReconciler(executor, debounce_s=60.0)
+    orchestrator = SimpleNamespace(paper_mode=False, account_reconciler=reconciler)
+    handlers = []
+    for name in ("a", "b", "c"):
+        instance = _DummyInstance(id=name)
+        instance._persistence = _DummyPersistence(total_fees=8.0)
+        instance.orchestrator = orchestrator
+        handler = SignalHandlerAsync(instance=instance, order_executor=executor)
+        handler._kill_switch = _DummyKillSwitch()
+        handlers.append(handler)
+
+    for handler in handlers + handlers:
+        await handler._post_trade_reconcile()
+    assert calls == []
+    assert reconciler.pending == 3
+
+    snapshot = await reconciler.flush()
+    await reconciler.close()
+
+    assert calls == ["balance"]
+    for handler in handlers:
+        assert handler._kill_switch.triggers[0][0] == "reconciliation_mismatch"
+        assert handler._kill_switch.freshness_events == [snapshot.fetched_at]
+
+
+@pytest.mark.asyncio
+async def test_post_trade_reconcile_anomaly_checks_without_waiting_for_the_window():
+    executor = _DummyExecutor(
+        balance_zeur=900.0,  # strong cash drift
+        trade_balance={"n": -20.0, "u": 0.0, "c": 0.1},
+    )
+    reconciler = AccountReconciler(executor, debounce_s=60.0)
+    orchestrator = SimpleNamespace(paper_mode=False, account_reconciler=reconciler)
+    handlers = []
+    for name in ("fill", "anomaly"):
+        instance = _DummyInstance(id=name)
+        instance._persistence = _DummyPersistence(total_fees=8.0)
+        instance.orchestrator = orchestrator
+        handler = SignalHandlerAsync(instance=instance, order_executor=executor)
+        handler._kill_switch = _DummyKillSwitch()
+        handlers.append(handler)
+
+    await handlers[0]._post_trade_reconcile()
+    assert handlers[0]._kill_switch.triggers == []
+    await handlers[1]._post_trade_reconcile(immediate=True)
+    await reconciler.close()
+
+    assert reconciler.pending == 0
+    for handler in handlers:
+        assert handler._kill_switch.triggers[0][0] == "reconciliation_mismatch"
+
+
 @pytest.mark.asyncio
 async def test_post_trade_reconcile_paper_uses_global_runtime_capital():
     instance = _DummyInstance()
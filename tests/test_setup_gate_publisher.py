@@ -0,0 +1,242 @@
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from autobot.v2.pair_strategy_health import PairStrategyHealthConfig, PairStrategyHealthEngine
+from autobot.v2.setup_gate_publisher import SetupGatePublisher, setup_gate_key
+from autobot.v2.strategies.grid_async import GridStrategyAsync
+
+
+pytestmark = pytest.mark.unit
+
+BLOCKING = ("pause_current", "pause_current_setup_and_test_selected_variant_in_paper")
+
+
+class _Variant:
+    name = "grid_defensive_observe"
+    score = 31.0
+
+    def to_dict(self):
+        return {"name": self.name, "score": self.score}
+
+
+class _Optimizer:
+    def __init__(self, status=BLOCKING[0], action=BLOCKING[1]):
+        self.config = SimpleNamespace(enabled=True, apply_to_execution=True)
+        self.status = status
+        self.action = action
+        self.calls = []
+        self.fail = False
+
+    def analyze_symbol(self, **kwargs):
+        if self.fail:
+            raise RuntimeError("optimizer down")
+        self.calls.append(kwargs["symbol"])
+        return SimpleNamespace(status=self.status, recommended_action=self.action, selected_variant=_Variant())
+
+
+class _Health:
+    def __init__(self):
+        self.calls = 0
+        self.config = SimpleNamespace(min_closed_trades=20, early_weak_min_closed_trades=8)
+
+    def build_snapshot_from_state_db(self, *_args, **_kwargs):
+        self.calls += 1
+        return {"by_symbol": {"TRXEUR": {"status": "underperforming", "closed_trades": 42, "net_pnl_eur": -4.2}}}
+
+
+class _Shadow:
+    def __init__(self):
+        self.calls = 0
+
+    def evidence_by_symbol(self):
+        self.calls += 1
+        return {}
+
+
+def _orchestrator(optimizer=None, health=None, db_path="unused.db"):
+    orchestrator = SimpleNamespace(
+        paper_mode=True,
+        setup_optimizer=optimizer or _Optimizer(),
+        pair_strategy_health_engine=health or _Health(),
+        setup_shadow_lab=_Shadow(),
+        persistence=SimpleNamespace(db_path=db_path),
+    )
+    orchestrator.setup_gate_publisher = SetupGatePublisher(orchestrator)
+    return orchestrator
+
+
+def _strategy(orchestrator, symbol="TRXEUR", range_percent=2.0):
+    strategy = GridStrategyAsync.__new__(GridStrategyAsync)
+    strategy.instance = SimpleNamespace(config=SimpleNamespace(symbol=symbol), orchestrator=orchestrator)
+    strategy.range_percent = range_percent
+    strategy.num_levels = 15
+    strategy.max_capital_per_level = 50.0
+    strategy._block_underperforming_health = True
+    strategy._underperforming_health_action = "block"
+    strategy._setup_optimizer_execution_gate = True
+    strategy._setup_optimizer_gate_ttl_s = 60.0
+    strategy._setup_optimizer_gate_cache = (0.0, False, "cold_start", {})
+    strategy._published_setup_gate = (-1, None, False, "cold_start", {})
+    strategy._paper_execution_router_enabled = False
+    strategy._paper_execution_profile = {"enabled": False}
+    return strategy
+
+
+def test_one_refresh_publishes_every_registered_setup_from_one_health_read():
+    orchestrator = _orchestrator()
+    strategies = [_strategy(orchestrator, symbol=symbol) for symbol in ("TRXEUR", "ATOMEUR", "AVAXEUR")]
+
+    assert [s._setup_optimizer_blocks_entry()[1] for s in strategies] == ["gate_pending"] * 3
+
+    orchestrator.setup_gate_publisher.refresh()
+    blocked, reason, details = strategies[0]._setup_optimizer_blocks_entry()
+
+    assert orchestrator.pair_strategy_health_engine.calls == 1
+    assert orchestrator.setup_shadow_lab.calls == 1
+    assert sorted(orchestrator.setup_optimizer.calls) == ["ATOMEUR", "AVAXEUR", "TRXEUR"]
+    assert blocked is True
+    assert reason == ":".join(BLOCKING)
+    assert details["health_status"] == "underperforming"
+    assert details["gate_version"] == 1
+    assert details["gate_age_s"] >= 0.0
+    assert strategies[1]._setup_optimizer_blocks_entry()[2]["health_status"] is None
+    assert orchestrator.pair_strategy_health_engine.calls == 1
+
+
+def test_decision_is_taken_once_per_published_version():
+    orchestrator = _orchestrator()
+    strategy = _strategy(orchestrator)
+    decisions = []
+    original = strategy._setup_optimizer_decision
+
+    def counting_decision(*args):
+        decisions.append(orchestrator.setup_gate_publisher.snapshot.version)
+        return original(*args)
+
+    strategy._setup_optimizer_decision = counting_decision
+    strategy._setup_optimizer_blocks_entry()
+    orchestrator.setup_gate_publisher.refresh()
+    for _ in range(5):
+        strategy._setup_optimizer_blocks_entry()
+    orchestrator.setup_gate_publisher.refresh()
+    strategy._setup_optimizer_blocks_entry()
+
+    assert decisions == [1, 2]
+
+
+def test_failed_evaluation_keeps_the_previous_gate_and_reports_its_age():
+    optimizer = _Optimizer()
+    orchestrator = _orchestrator(optimizer=optimizer)
+    publisher = orchestrator.setup_gate_publisher
+    key = setup_gate_key("trxeur", 2, 15, 50)
+    publisher.register(key)
+    first = publisher.refresh().gate(key)
+
+    optimizer.fail = True
+    snapshot = publisher.refresh()
+
+    assert snapshot.version == 2
+    assert snapshot.gate(key) is first
+    assert snapshot.staleness(now=first.computed_at + 45.0) == {"TRXEUR:2.0:15:50.0": 45.0}
+    status = publisher.status()
+    assert status["registered_setups"] == 1
+    assert status["refresh_count"] == 2
+
+    publisher.register(setup_gate_key("ATOMEUR", 2, 15, 50))
+    gate = publisher.refresh().gate(setup_gate_key("ATOMEUR", 2, 15, 50))
+    assert (gate.status, gate.error) == ("unavailable", "optimizer down")
+
+
+def test_new_setups_request_one_coalesced_refresh():
+    scheduled = []
+    orchestrator = _orchestrator()
+    publisher = SetupGatePublisher(orchestrator, schedule=scheduled.append)
+
+    publisher.register(setup_gate_key("TRXEUR", 2, 15, 50))
+    publisher.register(setup_gate_key("ATOMEUR", 2, 15, 50))
+    publisher.register(setup_gate_key("TRXEUR", 2, 15, 50))
+    assert len(scheduled) == 1
+
+    publisher.refresh()
+    publisher.register(setup_gate_key("AVAXEUR", 2, 15, 50))
+    assert len(scheduled) == 2
+    for coro in scheduled:
+        coro.close()
+
+
+def test_publish_interval_defaults_to_the_grid_gate_ttl(monkeypatch):
+    from autobot.v2.orchestrator_async import _setup_gate_publish_interval
+
+    monkeypatch.delenv("SETUP_GATE_PUBLISH_SECONDS", raising=False)
+    monkeypatch.delenv("SETUP_OPTIMIZER_EXECUTION_GATE_TTL_SECONDS", raising=False)
+    assert _setup_gate_publish_interval() == 60.0
+    monkeypatch.setenv("SETUP_OPTIMIZER_EXECUTION_GATE_TTL_SECONDS", "15")
+    assert _setup_gate_publish_interval() == 15.0
+    monkeypatch.setenv("SETUP_GATE_PUBLISH_SECONDS", "5")
+    assert _setup_gate_publish_interval() == 5.0
+
+
+def test_realized_health_gate_reads_the_published_health():
+    orchestrator = _orchestrator()
+    strategy = _strategy(orchestrator)
+    orchestrator.setup_gate_publisher.refresh()
+
+    assert strategy._realized_health_blocks_entry() == (True, "pair_health_underperforming")
+    assert orchestrator.pair_strategy_health_engine.calls == 1
+
+
+def _ledger(db_path, symbols, trades_per_symbol):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE trade_ledger (symbol TEXT, side TEXT, volume REAL, executed_price REAL,"
+            " fees REAL, realized_pnl REAL, is_closing_leg INTEGER, created_at TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO trade_ledger VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (symbol, "sell", 1.0, 1.0, 0.01, -0.05, 1, f"2026-05-12T{idx // 60 % 24:02d}:{idx % 60:02d}:00+00:00")
+                for symbol in symbols
+                for idx in range(trades_per_symbol)
+            ],
+        )
+
+
+@pytest.mark.performance
+def test_published_gate_removes_database_spikes_from_grid_ticks(tmp_path):
+    """50 grid instances: tick-path gate latency, inline evaluation vs published snapshot."""
+
+    symbols = [f"PAIR{idx:02d}EUR" for idx in range(50)]
+    db_path = tmp_path / "state.db"
+    _ledger(db_path, symbols, 100)
+
+    def tick_latencies(published: bool) -> list[float]:
+        # cache_seconds=0 stands for the tick on which the shared health cache expires.
+        health = PairStrategyHealthEngine(PairStrategyHealthConfig(cache_seconds=0))
+        orchestrator = _orchestrator(optimizer=_Optimizer("candidate", "observe"), health=health, db_path=db_path)
+        if not published:
+            del orchestrator.setup_gate_publisher
+        strategies = [_strategy(orchestrator, symbol=symbol) for symbol in symbols]
+        if published:
+            for strategy in strategies:
+                strategy._setup_optimizer_blocks_entry()
+            orchestrator.setup_gate_publisher.refresh()
+        samples = []
+        for _ in range(4):
+            for strategy in strategies:
+                strategy._setup_optimizer_gate_cache = (0.0, False, "expired", {})
+                started = time.perf_counter()
+                strategy._setup_optimizer_blocks_entry()
+                samples.append(time.perf_counter() - started)
+        return sorted(samples)
+
+    inline = tick_latencies(published=False)
+    published = tick_latencies(published=True)
+    p99 = int(len(inline) * 0.99)
+    print(
+        f"\n🧮 setup gate per tick, 50 grids: inline p99 {inline[p99] * 1000:.2f} ms max {inline[-1] * 1000:.2f} ms"
+        f" | published p99 {published[p99] * 1e6:.1f} µs max {published[-1] * 1e6:.1f} µs"
+    )
+    assert published[-1] < inline[0]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from types import SimpleNamespace
@@ -8,6 +9,7 @@ from types import SimpleNamespace
 import pytest
 
 from autobot.v2.order_executor import OrderResult, OrderStatus
+from autobot.v2.paper_buy_window import record_ledger_buy, reset_buy_windows, shared_buy_window
 from autobot.v2.contracts import RiskDecision, RiskMandateReference
 from autobot.v2.research.runtime_shadow_decision_bridge import RuntimeShadowDecision
 from autobot.v2.research.shadow_governance import StrategyArtifact, feature_snapshot_reference_from_mapping
@@ -731,6 +733,67 @@ async def test_execute_buy_quarantines_legacy_path_before_optional_concentration
     assert handler._last_decision_event["reason"] == "legacy_direct_execution_disabled"
 
 
+@pytest.mark.asyncio
+async def test_paper_concentration_guard_reads_the_shared_buy_window_after_seeding(tmp_path, monkeypatch):
+    db = tmp_path / "state.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE trade_ledger (symbol TEXT, side TEXT, created_at TEXT)")
+        conn.execute(
+            "INSERT INTO trade_ledger(symbol, side, created_at) VALUES (?, ?, ?)",
+            ("TRXEUR", "buy", datetime.now(timezone.utc).isoformat()),
+        )
+        conn.commit()
+
+    instance = _Instance()
+    instance.config.paper_symbol_concentration_action = "block"
+    instance.config.paper_max_symbol_buys_per_window = 2
+    instance._persistence = SimpleNamespace(db_path=str(db), append_audit_event=lambda **_: None)
+    instance.orchestrator = SimpleNamespace(
+        paper_mode=True,
+        _instances={
+            "trx": SimpleNamespace(config=SimpleNamespace(symbol="TRXEUR")),
+            "atom": SimpleNamespace(config=SimpleNamespace(symbol="ATOMEUR")),
+        },
+    )
+    handler = SignalHandlerAsync(instance=instance, order_executor=None)
+    handler._is_paper_mode = lambda: True
+    reset_buy_windows()
+    loop_thread = threading.current_thread()
+    connect = sqlite3.connect
+
+    def _off_loop_connect(*args, **kwargs):
+        assert threading.current_thread() is not loop_thread, "guard must not query SQLite on the event loop"
+        return connect(*args, **kwargs)
+
+    monkeypatch.setattr(sqlite3, "connect", _off_loop_connect)
+
+    blocked, details = await handler._paper_symbol_concentration_guard("TRXEUR")
+    assert (blocked, details["reason"], details["recent_symbol_buys"]) == (False, "ok", 1)
+
+    # Another process writes a buy; this process records its own fill directly.
+    with connect(db) as conn:
+        conn.execute(
+            "INSERT INTO trade_ledger(symbol, side, created_at) VALUES (?, ?, ?)",
+            ("ATOMEUR", "buy", datetime.now(timezone.utc).isoformat()),
+        )
+    record_ledger_buy(db, "TRXEUR", "buy", datetime.now(timezone.utc).isoformat(), ledger_id=3)
+
+    blocked, details = await handler._paper_symbol_concentration_guard("TRXEUR")
+    assert blocked is True
+    assert details["reason"] == "symbol_buy_cap_reached"
+    assert details["buy_counts_by_symbol"] == {"TRXEUR": 2}
+    assert details["active_symbols"] == 2
+    assert handler._buy_window_catch_up is None
+
+    window = shared_buy_window(db, 180 * 60.0)
+    window.catch_up_seconds = 0.0
+    await handler._paper_symbol_concentration_guard("ATOMEUR")
+    await handler._buy_window_catch_up
+    _blocked, details = await handler._paper_symbol_concentration_guard("ATOMEUR")
+    assert details["buy_counts_by_symbol"] == {"TRXEUR": 2, "ATOMEUR": 1}
+    reset_buy_windows()
+
+
 @pytest.mark.asyncio
 async def test_execute_buy_quarantines_legacy_opportunity_budget_upsizing():
     executor = _Executor()
@@ -1258,5 +1321,5 @@ async def test_execute_buy_keeps_existing_trace_ids_on_rejection():
     assert handler._last_decision_event["reason"] == "legacy_direct_execution_disabled"
 
 
-async def _noop_reconcile():
+async def _noop_reconcile(*, immediate=False):
     return None
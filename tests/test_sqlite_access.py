@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from autobot.v2.global_kill_switch import GlobalKillSwitchStore
+from autobot.v2.nonce_manager import NonceManager
+from autobot.v2.sqlite_access import (
+    SQLiteConnectionPool,
+    SQLitePragmas,
+    is_sqlite_busy_error,
+    run_with_busy_retries,
+    shared_sqlite_pool,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_pool_reuses_one_connection_per_thread_and_applies_pragmas_once(tmp_path):
+    pool = SQLiteConnectionPool(
+        tmp_path / "pool.sqlite3",
+        pragmas=SQLitePragmas(busy_timeout_ms=1234, foreign_keys=True, cache_size_kib=4096),
+    )
+
+    first = pool.connection()
+    for _ in range(50):
+        with pool.transaction() as connection:
+            assert connection is first
+            connection.execute("CREATE TABLE IF NOT EXISTS t (id INTEGER)")
+
+    assert first.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+    assert first.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert first.execute("PRAGMA cache_size").fetchone()[0] == -4096
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    metrics = pool.metrics()
+    assert metrics["connections_opened"] == 1
+    assert metrics["connections_reused"] == 50
+
+
+def test_pool_hands_each_thread_its_own_connection(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "threads.sqlite3")
+    seen: list[sqlite3.Connection] = []
+
+    def worker() -> None:
+        seen.append(pool.connection())
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(connection) for connection in seen}) == 3
+    assert pool.connection() not in seen
+
+
+def test_pool_reopens_after_caller_close_and_file_replacement(tmp_path):
+    path = tmp_path / "replaced.sqlite3"
+    pool = SQLiteConnectionPool(path)
+    with pool.transaction() as connection:
+        connection.execute("CREATE TABLE marker (value TEXT)")
+        connection.execute("INSERT INTO marker VALUES ('old')")
+    pool.connection().close()
+
+    assert pool.connection().execute("SELECT value FROM marker").fetchone()[0] == "old"
+
+    replacement = tmp_path / "new.sqlite3"
+    with sqlite3.connect(replacement) as connection:
+        connection.execute("CREATE TABLE marker (value TEXT)")
+        connection.execute("INSERT INTO marker VALUES ('new')")
+    connection.close()
+    replacement.replace(path)
+
+    assert pool.connection().execute("SELECT value FROM marker").fetchone()[0] == "new"
+    metrics = pool.metrics()
+    assert metrics["reopened_after_close"] == 1
+    assert metrics["reopened_after_file_change"] == 1
+
+
+def test_nested_checkout_never_shares_the_enclosing_transaction(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "nested.sqlite3")
+    with pool.transaction() as connection:
+        connection.execute("CREATE TABLE t (id INTEGER)")
+
+    with pytest.raises(RuntimeError):
+        with pool.transaction() as outer:
+            outer.execute("INSERT INTO t VALUES (1)")
+            with pool.checkout() as inner:
+                assert inner is not outer
+                assert inner.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+            raise RuntimeError("abort outer")
+
+    assert pool.connection().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    assert pool.connection().in_transaction is False
+    assert pool.metrics()["overflow_connections"] == 1
+
+
+def test_busy_retries_are_bounded_and_counted(tmp_path):
+    pool = SQLiteConnectionPool(tmp_path / "busy.sqlite3")
+    delays: list[float] = []
+    attempts = {"count": 0}
+
+    def locked_twice() -> str:
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise sqlite3.OperationalError("database is locked")
+        return "ok"
+
+    assert pool.run_with_busy_retries(
+        locked_twice, label="pytest", retries=3, base_delay_seconds=0.01, sleeper=delays.append
+    ) == "ok"
+    assert delays == [0.01, 0.02]
+
+    with pytest.raises(sqlite3.OperationalError, match="malformed"):
+        run_with_busy_retries(
+            lambda: (_ for _ in ()).throw(sqlite3.OperationalError("database disk image is malformed")),
+            label="pytest",
+            retries=3,
+            base_delay_seconds=0.0,
+        )
+    assert pool.metrics()["busy_retries"] == 2
+    assert is_sqlite_busy_error(sqlite3.OperationalError("database is busy")) is True
+    assert is_sqlite_busy_error(ValueError("database is locked")) is False
+
+
+def test_pragmas_from_env_configure_mmap_and_cache(monkeypatch):
+    monkeypatch.setenv("SQLITE_MMAP_SIZE_BYTES", "268435456")
+    monkeypatch.setenv("SQLITE_CACHE_SIZE_KIB", "8192")
+
+    statements = SQLitePragmas.from_env(busy_timeout_ms=500).statements()
+
+    assert "PRAGMA mmap_size = 268435456" in statements
+    assert "PRAGMA cache_size = -8192" in statements
+    assert "PRAGMA busy_timeout = 500" in statements
+
+
+def test_shared_pool_is_reused_by_stores_on_the_same_database(tmp_path):
+    path = tmp_path / "kill.db"
+    first = GlobalKillSwitchStore(str(path))
+    second = GlobalKillSwitchStore(str(path))
+
+    assert first._pool is second._pool
+    opened = first._pool.metrics()["connections_opened"]
+    for _ in range(200):
+        assert first.get().tripped is False
+    assert first._pool.metrics()["connections_opened"] == opened
+
+
+def test_nonce_manager_keeps_monotonic_ranges_on_a_pooled_connection(tmp_path):
+    manager = NonceManager(str(tmp_path / "nonce.db"))
+    pool = shared_sqlite_pool(tmp_path / "nonce.db", timeout_seconds=30.0)
+
+    ranges = [manager.reserve_range("key", block_size=4) for _ in range(20)]
+
+    assert all(left[1] < right[0] for left, right in zip(ranges, ranges[1:]))
+    assert manager._pool.metrics()["connections_opened"] == 1
+    assert pool.connection().in_transaction is False